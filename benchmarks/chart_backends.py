@@ -0,0 +1,82 @@
+"""
+Compare first-draw and redraw latency of the matplotlib (MplCanvas) and
+QPainter (PainterChartWidget) backends for the charts that have both.
+
+Run from the directory holding the data files:
+    python benchmarks/chart_backends.py [--year 2025] [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+from controllers.app_controller import AppController
+from models.finance_manager import FinanceManager
+from models.forecast_manager import ForecastManager
+from models.transaction_category_manager import CategoryManager
+from views.mpl_canvas import MplCanvas
+from views.painter_charts import PAINTER_CHARTS, PainterChartWidget
+
+
+def show_chart(widget, dataset):
+    """Render a dataset and paint the widget synchronously, returning the time in ms"""
+    started = time.perf_counter()
+    widget.render_chart(dataset)
+    widget.repaint()
+    QApplication.processEvents()
+    return (time.perf_counter() - started) * 1000
+
+
+def measure(create_widget, datasets, repeat):
+    """First draw on a new widget, then a redraw for every other month"""
+    first_draws, redraws = [], []
+    for _ in range(repeat):
+        widget = create_widget()
+        widget.resize(500, 300)
+        widget.show()
+        QApplication.processEvents()
+
+        first_draws.append(show_chart(widget, datasets[0]))
+        redraws.extend(show_chart(widget, dataset) for dataset in datasets[1:])
+
+        widget.close()
+        widget.deleteLater()
+    return statistics.median(first_draws), statistics.median(redraws)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, default=None, help="year to draw (default: latest with data)")
+    parser.add_argument("--repeat", type=int, default=5, help="new widgets per backend (default: 5)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+
+    finance_manager = FinanceManager("finance_data.json")
+    category_manager = CategoryManager("transaction_categories.json")
+    forecast_manager = ForecastManager("forecast_transactions.json", "forecast_rules.json")
+    controller = AppController(finance_manager, category_manager, forecast_manager)
+
+    year = args.year or controller.get_unique_years()[-1]
+    datasets = [controller.get_dashboard_dataset(year, month) for month in range(1, 13)]
+
+    print(f"{'chart':<28}{'backend':<12}{'first draw':>12}{'redraw':>10}")
+    for chart_class, painter_class in PAINTER_CHARTS.items():
+        backends = [
+            ("matplotlib", lambda: MplCanvas(width=5, height=3, chart_class=chart_class)),
+            ("qpainter", lambda: PainterChartWidget(width=5, height=3, chart_class=painter_class)),
+        ]
+        for backend, create_widget in backends:
+            first_draw, redraw = measure(create_widget, datasets, args.repeat)
+            print(f"{chart_class.__name__:<28}{backend:<12}{first_draw:>10.1f}ms{redraw:>8.1f}ms")
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
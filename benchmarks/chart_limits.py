@@ -0,0 +1,82 @@
+"""
+Check that charts updated in place show the same axis limits as a fresh
+draw: every chart steps through the months (forwards, then backwards) with
+its in-place refresh, and after each month its limits are compared with a
+new chart drawn for that month alone. Exits with status 1 on a mismatch.
+
+Run from the directory holding the data files:
+    python benchmarks/chart_limits.py [--first 2024-01] [--last 2025-12]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from controllers.app_controller import AppController
+from models.finance_manager import FinanceManager
+from models.forecast_manager import ForecastManager
+from models.transaction_category_manager import CategoryManager
+from models.period import months_between
+from views.chart_export import EXPORT_CHARTS
+from views.dashboard_charts import create_chart_figure, draw_chart
+
+
+def parse_month(text):
+    year, month = text.split("-")
+    return int(year), int(month)
+
+
+def get_limits(axes):
+    return np.array([axes.get_xlim(), axes.get_ylim()])
+
+
+def check_chart(chart_class, size, datasets, months):
+    """Step one chart through the months in place; returns the mismatching (month, in place, fresh) triples"""
+    figure, axes = create_chart_figure(*size)
+    FigureCanvasAgg(figure)
+    chart = chart_class(figure, axes)
+
+    mismatches = []
+    for month in months + months[::-1]:
+        chart.update(datasets[month])
+        fresh = draw_chart(chart_class, datasets[month], *size).axes[0]
+        in_place, expected = get_limits(axes), get_limits(fresh)
+        if not np.allclose(in_place, expected, rtol=1e-6, atol=1e-9):
+            mismatches.append((month, in_place, expected))
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--first", type=parse_month, default=None, help="first month, YYYY-MM (default: January of the first year with data)")
+    parser.add_argument("--last", type=parse_month, default=None, help="last month, YYYY-MM (default: December of the last year with data)")
+    args = parser.parse_args()
+
+    finance_manager = FinanceManager("finance_data.json")
+    category_manager = CategoryManager("transaction_categories.json")
+    forecast_manager = ForecastManager("forecast_transactions.json", "forecast_rules.json")
+    controller = AppController(finance_manager, category_manager, forecast_manager)
+
+    years = controller.get_unique_years()
+    first = args.first or (years[0], 1)
+    last = args.last or (years[-1], 12)
+    months = months_between(first, last)
+    datasets = controller.prepare_dashboard_datasets(first, last)()
+
+    failed = False
+    for name, chart_class, size in EXPORT_CHARTS:
+        mismatches = check_chart(chart_class, size, datasets, months)
+        print(f"{name:<28}{'ok' if not mismatches else f'{len(mismatches)} mismatches'}")
+        for (year, month), in_place, expected in mismatches[:5]:
+            print(f"  {year}-{month:02d}: in place {in_place.round(6).tolist()}, fresh {expected.round(6).tolist()}")
+        failed = failed or bool(mismatches)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Measure cold start: each run starts a new interpreter that imports the
+application, builds the main window, shows it and waits for the dashboard's
+first dataset to be drawn.
+
+Run from the directory holding the data files:
+    python benchmarks/startup.py [--runs 5] [--output startup.json] [--compare startup.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Phases of a start, in order, as reported by a child run
+PHASES = ["imports", "application", "window", "shown", "dashboard"]
+
+
+def run_child():
+    """Start the application once and print the time of each phase as JSON"""
+    started = time.perf_counter()
+    timings = {}
+
+    def mark(phase):
+        timings[phase] = (time.perf_counter() - started) * 1000
+
+    sys.path.insert(0, ROOT)
+    import main
+    from PyQt5.QtWidgets import QApplication
+    mark("imports")
+
+    app = main.create_application(sys.argv[:1])
+    mark("application")
+
+    window = main.create_main_window()
+    mark("window")
+
+    window.show()
+    QApplication.processEvents()
+    mark("shown")
+    # Whether the chart library was needed to put the window on screen
+    matplotlib_at_show = "matplotlib" in sys.modules
+
+    # The dashboard's dataset is built on a worker thread and drawn when it arrives
+    deadline = time.perf_counter() + 60
+    while window.dashboard.dataset is None and time.perf_counter() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.001)
+    mark("dashboard")
+
+    window.close()
+    app.quit()
+    print(json.dumps({"timings": timings, "matplotlib_at_show": matplotlib_at_show}))
+
+
+def run_once():
+    """Run one cold start in a new interpreter; returns its report and wall time in ms"""
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), "--child"],
+                            capture_output=True, text=True, check=True)
+    wall = (time.perf_counter() - started) * 1000
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return report, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="cold starts to measure (default: 5)")
+    parser.add_argument("--output", help="write the median timings to a JSON file")
+    parser.add_argument("--compare", help="JSON file of an earlier --output to compare against")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child()
+        return
+
+    runs = [run_once() for _ in range(args.runs)]
+    medians = {phase: statistics.median(report["timings"][phase] for report, _ in runs)
+               for phase in PHASES}
+    medians["process"] = statistics.median(wall for _, wall in runs)
+    matplotlib_at_show = any(report["matplotlib_at_show"] for report, _ in runs)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["timings"]
+
+    # Phase times are cumulative from the start of the interpreter's script
+    print(f"{'phase':<14}{'median':>10}" + (f"{'baseline':>12}{'change':>10}" if baseline else ""))
+    for phase, value in medians.items():
+        line = f"{phase:<14}{value:>8.0f}ms"
+        if baseline and phase in baseline:
+            line += f"{baseline[phase]:>10.0f}ms{value - baseline[phase]:>+8.0f}ms"
+        print(line)
+    print(f"matplotlib imported before the window was shown: {'yes' if matplotlib_at_show else 'no'}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"runs": args.runs, "timings": medians,
+                       "matplotlib_at_show": matplotlib_at_show}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
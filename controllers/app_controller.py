@@ -1,11 +1,19 @@
+from collections import deque
 from datetime import datetime
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional, Tuple
 
-from models.finance_manager import FinanceManager
-from models.transaction import TransactionType
+from models.finance_manager import FinanceManager, UNSET
+from models.transaction import Transaction, TransactionType
 from models.financial_goal import GoalType, FinancialGoal
 from models.transaction_category_manager import CategoryManager
 from models.forecast_manager import ForecastManager, ForecastTransaction
+from models.dashboard_dataset import DashboardDataset
+from models.period import Month
+from models.change_event import ChangeEvent
+from models.batch_entry import BatchRow, validate_rows
+from models.name_index import NameSuggestion
+from models.long_operation import CancellationToken, Operation, run_to_completion
+from controllers.read_cache import ReadCache
 
 
 class AppController:
@@ -13,7 +21,22 @@ class AppController:
         self.finance_manager = finance_manager
         self.category_manager = category_manager
         self.forecast_manager = forecast_manager
+        # Memoized read results; entries are keyed by the data versions they depend on
+        self.read_cache = ReadCache()
+        # Build times of recently built dashboard datasets, in milliseconds
+        self.dataset_build_times = deque(maxlen=50)
 
+    # Change notifications
+    def subscribe(self, callback: Callable[[ChangeEvent], None]):
+        """Call callback with the ChangeEvent of every transaction, goal and forecast change"""
+        self.finance_manager.subscribe(callback)
+        self.forecast_manager.subscribe(callback)
+    
+    def unsubscribe(self, callback: Callable[[ChangeEvent], None]):
+        """Stop sending change events to callback"""
+        self.finance_manager.unsubscribe(callback)
+        self.forecast_manager.unsubscribe(callback)
+    
     # Original transaction methods
     def add_transaction(self, name: str, amount: float, category_name: str, date: datetime) -> bool:
         """Add New Transaction using category name"""
@@ -35,22 +58,159 @@ class AppController:
             print(f"Error adding transaction: {e}")
             return False
 
+    def validate_batch(self, rows: List[List[str]], default_date: datetime) -> List[BatchRow]:
+        """Parse pasted rows (see models.batch_entry) against the current categories"""
+        return validate_rows(rows, self.category_manager.get_category_types(), default_date)
+    
+    def add_transactions(self, rows: List[BatchRow]) -> int:
+        """
+        Add validated batch rows with one save, one forecast-matching pass and
+        one change event per manager; returns how many were added
+        """
+        try:
+            return run_to_completion(self.iter_add_transactions(rows))
+        except Exception as e:
+            print(f"Error adding transactions: {e}")
+            return 0
+    
+    def iter_add_transactions(self, rows: List[BatchRow], token: CancellationToken = None) -> Operation:
+        """add_transactions as a long operation (see models.long_operation)"""
+        transactions = yield from self.finance_manager.iter_add_transactions(
+            [(row.name, row.amount, row.category, row.category_type, row.date) for row in rows], token)
+        
+        # Mark the forecasts the new transactions realize. The transactions are
+        # already saved, so this part runs to the end even if cancelled.
+        matches = yield from self.forecast_manager.iter_match_forecasts(transactions)
+        if matches:
+            self.forecast_manager.mark_forecasts_realized(matches)
+        
+        return len(transactions)
+    
+    def suggest_names(self, prefix: str, limit: int = 8) -> List[NameSuggestion]:
+        """Most used transaction names starting with prefix, with their last amount and category"""
+        try:
+            return self.finance_manager.get_name_index().suggest(prefix, limit)
+        except Exception as e:
+            print(f"Error suggesting names: {e}")
+            return []
+    
+    def get_transaction(self, transaction_id: str) -> Optional[Transaction]:
+        """Get a transaction by ID"""
+        return self.finance_manager.get_transaction(transaction_id)
+
+    # Read cache helpers
+    def _memoize(self, method: str, args: Tuple, versions: Tuple, compute):
+        """
+        Return a cached read result for (method, args, versions), computing it on a miss.
+        Cached results are shared between callers and must be treated as read-only.
+        """
+        return self.read_cache.get_or_compute(method, (method, args, versions), compute)
+    
+    def _transaction_versions(self) -> Tuple:
+        return (self.finance_manager.data_version,)
+    
+    def _goal_versions(self) -> Tuple:
+        return (self.finance_manager.data_version, self.finance_manager.goals_version)
+    
+    def _forecast_versions(self) -> Tuple:
+        return (self.finance_manager.data_version, self.forecast_manager.data_version)
+    
+    def _dashboard_versions(self) -> Tuple:
+        return (self.finance_manager.data_version, self.finance_manager.goals_version,
+                self.forecast_manager.data_version)
+    
+    def get_cache_stats(self) -> Dict:
+        """Get hit/miss statistics for memoized reads and dashboard dataset build times"""
+        stats = self.read_cache.get_stats()
+        builds = list(self.dataset_build_times)
+        stats["dashboard_dataset"] = {
+            "builds": len(builds),
+            "last_build_ms": builds[-1] if builds else 0,
+            "avg_build_ms": sum(builds) / len(builds) if builds else 0,
+            "max_build_ms": max(builds) if builds else 0
+        }
+        return stats
+    
+    # Dashboard data
+    def get_dashboard_dataset(self, year: int, month: int) -> DashboardDataset:
+        """Get all dashboard chart data for a month, built once per data version"""
+        return self._memoize("get_dashboard_dataset", (year, month), self._dashboard_versions(),
+                             lambda: self._build_dashboard_dataset(year, month))
+    
+    def _build_dashboard_dataset(self, year: int, month: int) -> DashboardDataset:
+        dataset = DashboardDataset.build(self.finance_manager, self.forecast_manager, year, month)
+        self.dataset_build_times.append(dataset.build_time_ms)
+        return dataset
+    
+    def peek_dashboard_dataset(self, year: int, month: int) -> Optional[DashboardDataset]:
+        """Get the dashboard dataset for a month if it is already built for the current data"""
+        key = ("get_dashboard_dataset", (year, month), self._dashboard_versions())
+        return self.read_cache.peek("get_dashboard_dataset", key)
+    
+    def prepare_dashboard_dataset(self, year: int, month: int,
+                                  cancel_token: CancellationToken = None) -> Callable[[], Optional[DashboardDataset]]:
+        """
+        Snapshot the data a dashboard dataset needs and return a function that
+        builds it. The function only reads the snapshots, so it can run on a
+        worker thread; pass its result to store_dashboard_dataset on the GUI thread.
+        """
+        versions = self._dashboard_versions()
+        finance_manager = self.finance_manager.snapshot()
+        forecast_manager = self.forecast_manager.snapshot()
+    
+        def build():
+            dataset = DashboardDataset.build(finance_manager, forecast_manager, year, month, cancel_token)
+            if dataset is not None:
+                dataset.versions = versions
+            return dataset
+    
+        return build
+    
+    def prepare_dashboard_datasets(self, first: Month, last: Month,
+                                   cancel_token: CancellationToken = None
+                                   ) -> Callable[[], Optional[Dict[Month, DashboardDataset]]]:
+        """
+        Like prepare_dashboard_dataset for every month from first to last; the
+        returned function builds them all with one pass over the history
+        """
+        versions = self._dashboard_versions()
+        finance_manager = self.finance_manager.snapshot()
+        forecast_manager = self.forecast_manager.snapshot()
+    
+        def build():
+            datasets = DashboardDataset.build_range(finance_manager, forecast_manager, first, last, cancel_token)
+            for dataset in (datasets or {}).values():
+                dataset.versions = versions
+            return datasets
+    
+        return build
+    
+    def store_dashboard_dataset(self, dataset: DashboardDataset):
+        """Cache a dataset built by prepare_dashboard_dataset under the data versions it was built from"""
+        self.dataset_build_times.append(dataset.build_time_ms)
+        key = ("get_dashboard_dataset", (dataset.year, dataset.month), dataset.versions)
+        self.read_cache.put(key, dataset)
+    
     # Financial summary methods
     def get_monthly_summary(self, year: int, month: int) -> Dict:
         """Get monthly summary of finances"""
-        return self.finance_manager.get_monthly_summary(year, month)
+        return self._memoize("get_monthly_summary", (year, month), self._transaction_versions(),
+                             lambda: self.finance_manager.get_monthly_summary(year, month))
     
     def get_monthly_data_for_year(self, year: int) -> Dict:
         """Get financial data for each month in a year"""
-        return self.finance_manager.get_monthly_data_for_year(year)
+        return self._memoize("get_monthly_data_for_year", (year,), self._transaction_versions(),
+                             lambda: self.finance_manager.get_monthly_data_for_year(year))
     
     def get_cumulative_data(self) -> List[Dict]:
         """Get cumulative financial data over time"""
-        return self.finance_manager.get_cumulative_data()
+        return self._memoize("get_cumulative_data", (), self._transaction_versions(),
+                             self.finance_manager.get_cumulative_data)
     
     def get_unique_years(self) -> List[int]:
         """Get list of years that have transaction data"""
-        return self.finance_manager.get_unique_years()
+        return self._memoize("get_unique_years", (), self._transaction_versions(),
+                             self.finance_manager.get_unique_years)
     
     # Category management methods
     def add_category(self, name: str, category_type: TransactionType) -> bool:
@@ -74,10 +234,12 @@ class AppController:
         return self.category_manager.get_categories_by_type(category_type)
     
     # Financial Goals Methods
-    def add_goal(self, name: str, amount: float, goal_type: GoalType, year: int, month: int) -> bool:
-        """Add a new financial goal"""
+    def add_goal(self, name: str, amount: float, goal_type: GoalType, year: int, month: int,
+                 end_year: int = None, end_month: int = None, rolling_months: int = None) -> bool:
+        """Add a new financial goal, optionally spanning a month range or rolling window"""
         try:
-            self.finance_manager.add_goal(name, amount, goal_type, year, month)
+            self.finance_manager.add_goal(name, amount, goal_type, year, month,
+                                          end_year, end_month, rolling_months)
             return True
         except Exception as e:
             print(f"Error adding goal: {e}")
@@ -85,11 +247,13 @@ class AppController:
     
     def update_goal(self, goal_id: str, name: str = None, amount: float = None, 
                    goal_type: GoalType = None, year: int = None, month: int = None,
-                   active: bool = None) -> bool:
-        """Update an existing goal"""
+                   active: bool = None, end_year: Optional[int] = UNSET,
+                   end_month: Optional[int] = UNSET, rolling_months: Optional[int] = UNSET) -> bool:
+        """Update an existing goal; None clears the end month or rolling window (see FinanceManager.update_goal)"""
         try:
             return self.finance_manager.update_goal(
-                goal_id, name, amount, goal_type, year, month, active
+                goal_id, name, amount, goal_type, year, month, active,
+                end_year, end_month, rolling_months
             )
         except Exception as e:
             print(f"Error updating goal: {e}")
@@ -105,11 +269,21 @@ class AppController:
     
     def get_goals_by_month(self, year: int, month: int) -> List[FinancialGoal]:
         """Get all goals for a specific month"""
-        return self.finance_manager.get_goals_by_month(year, month)
+        return self._memoize("get_goals_by_month", (year, month), self._goal_versions(),
+                             lambda: self.finance_manager.get_goals_by_month(year, month))
     
     def get_goal_progress(self, goal_id: str) -> Dict:
         """Get progress information for a specific goal"""
-        return self.finance_manager.get_goal_progress(goal_id)
+        # Keyed by the month progress is measured at: it follows the current
+        # month, which moves a rolling goal's window
+        year, month = self.finance_manager.get_goal_month(goal_id) or (None, None)
+        return self._memoize("get_goal_progress", (goal_id, year, month), self._goal_versions(),
+                             lambda: self.finance_manager.get_goal_progress(goal_id, year, month))
+    
+    def get_goals_progress(self, year: int, month: int) -> List[Dict]:
+        """Get progress information for every goal in a specific month"""
+        return self._memoize("get_goals_progress", (year, month), self._goal_versions(),
+                             lambda: self.finance_manager.get_goals_progress(year, month))
     
     def get_all_goals(self) -> List[FinancialGoal]:
         """Get all financial goals"""
@@ -132,6 +306,38 @@ class AppController:
             print(f"Error adding forecast: {e}")
             return False
     
+    def add_recurring_forecast(self, name: str, amount: float, category_name: str,
+                               start: datetime, installments: int = None,
+                               end_date: datetime = None, interval_months: int = 1,
+                               amount_schedule: List[List] = None, notes: str = "") -> bool:
+        """Add a forecast that repeats every interval_months (e.g. loan installments)"""
+        try:
+            # Get the transaction type from the category
+            category_type = self.category_manager.get_category_type(category_name)
+            if not category_type:
+                return False
+            
+            self.forecast_manager.add_recurring_forecast(
+                name, amount, category_name, category_type, start,
+                installments, end_date, interval_months, amount_schedule, notes
+            )
+            return True
+        except Exception as e:
+            print(f"Error adding recurring forecast: {e}")
+            return False
+    
+    def remove_recurring_forecast(self, rule_id: str) -> bool:
+        """Remove a forecast recurrence rule"""
+        try:
+            return self.forecast_manager.remove_recurring_forecast(rule_id)
+        except Exception as e:
+            print(f"Error removing recurring forecast: {e}")
+            return False
+    
+    def get_recurring_forecasts(self) -> List:
+        """Get all forecast recurrence rules"""
+        return self.forecast_manager.get_all_rules()
+    
     def update_forecast(self, forecast_id: str, name: str = None, amount: float = None,
                        category_name: str = None, date: datetime = None, 
                        notes: str = None) -> bool:
@@ -172,7 +378,17 @@ class AppController:
     
     def compare_forecast_vs_actual(self, year: int, month: int) -> Dict:
         """Compare forecast data with actual data for a specific month"""
-        return self.forecast_manager.compare_with_actual(self.finance_manager, year, month)
+        return self._memoize("compare_forecast_vs_actual", (year, month), self._forecast_versions(),
+                             lambda: self.forecast_manager.compare_with_actual(
+                                 self.finance_manager, year, month))
+    
+    def compare_forecast_vs_actual_range(self, start_month: Tuple[int, int],
+                                         end_month: Tuple[int, int]) -> Dict:
+        """Compare forecast data with actual data for every month in a range"""
+        return self._memoize("compare_forecast_vs_actual_range", (start_month, end_month),
+                             self._forecast_versions(),
+                             lambda: self.forecast_manager.compare_range(
+                                 self.finance_manager, start_month, end_month))
     
     # Extended Forecast Methods
     def mark_forecast_realized(self, forecast_id: str, transaction_id: str) -> bool:
@@ -202,11 +418,27 @@ class AppController:
     def convert_month_to_forecasts(self, year: int, month: int) -> int:
         """Convert all transactions in a month to forecasts"""
         try:
-            # Get all transactions for the month
-            transactions = self.finance_manager.get_transactions_by_month(year, month)
-            
-            # Convert them to forecasts
-            return self.forecast_manager.bulk_convert_to_forecasts(transactions)
+            return run_to_completion(self.iter_convert_month_to_forecasts(year, month))
         except Exception as e:
             print(f"Error converting month to forecasts: {e}")
-            return 0
\ No newline at end of file
+            return 0
+    
+    def iter_convert_month_to_forecasts(self, year: int, month: int,
+                                        token: CancellationToken = None) -> Operation:
+        """convert_month_to_forecasts as a long operation (see models.long_operation)"""
+        # Get all transactions for the month
+        transactions = self.finance_manager.get_transactions_by_month(year, month)
+        
+        # Convert them to forecasts
+        return (yield from self.forecast_manager.iter_bulk_convert_to_forecasts(transactions, token))
+    
+    def iter_reconcile_forecasts(self, token: CancellationToken = None) -> Operation:
+        """
+        Link unrealized forecasts to the actual transactions that realize them,
+        as a long operation (see models.long_operation). Transactions already
+        linked to a forecast are skipped. Returns (matched_count, unrealized_count).
+        """
+        linked = {forecast.actual_transaction_id for forecast in self.forecast_manager.get_all_forecasts()
+                  if forecast.actual_transaction_id}
+        transactions = [t for t in self.finance_manager.get_all_transactions() if t.id not in linked]
+        return (yield from self.forecast_manager.iter_check_realization(transactions, token))
\ No newline at end of file
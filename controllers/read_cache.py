@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class ReadCache:
+    """
+    Bounded LRU cache for controller read results.
+    Keys include the data versions a result depends on, so stale entries are
+    never returned and simply age out of the cache.
+    The cache may be used from worker threads; values are computed outside the lock.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._method_stats = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, method: str, key: Hashable, compute: Callable):
+        """Return the cached value for key, computing and storing it on a miss"""
+        found, value = self._lookup(method, key)
+        if found:
+            return value
+
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def peek(self, method: str, key: Hashable) -> Any:
+        """Return the cached value for key, or None on a miss without computing it"""
+        return self._lookup(method, key)[1]
+
+    def put(self, key: Hashable, value):
+        """Store a value computed elsewhere (e.g. on a worker thread)"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _lookup(self, method: str, key: Hashable):
+        """Find key and count the hit or miss; returns (found, value)"""
+        with self._lock:
+            stats = self._method_stats.setdefault(method, {"hits": 0, "misses": 0})
+
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                stats["hits"] += 1
+                return True, self._entries[key]
+
+            self.misses += 1
+            stats["misses"] += 1
+            return False, None
+
+    def clear(self):
+        """Drop all cached entries (statistics are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """Get hit/miss statistics overall and per method"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_rate": (self.hits / lookups * 100) if lookups > 0 else 0,
+                "methods": {name: dict(counts) for name, counts in self._method_stats.items()}
+            }
@@ -0,0 +1,236 @@
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# Files under the application root count as application code
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIAGNOSTICS = os.path.dirname(os.path.abspath(__file__))
+
+# A stall is attributed to the innermost call on these classes (or on a chart class)
+ATTRIBUTION_CLASSES = ("AppController", "FinanceManager", "ForecastManager", "CategoryManager", "Dashboard")
+
+# Frames kept per sampled stack and samples kept per stall
+MAX_DEPTH = 100
+MAX_SAMPLES = 500
+
+# A sampled frame: (file name, line number, qualified function name)
+Frame = Tuple[str, int, str]
+
+
+def is_application_frame(frame: Frame) -> bool:
+    filename = frame[0]
+    return (filename.startswith(ROOT) and not filename.startswith(DIAGNOSTICS)
+            and "site-packages" not in filename)
+
+
+def is_attribution_target(frame: Frame) -> bool:
+    """Check if a frame is a method of a controller, manager, the dashboard or a chart"""
+    owner = frame[2].rpartition(".")[0]
+    return owner in ATTRIBUTION_CLASSES or owner.endswith("Chart")
+
+
+def qualified_name(frame) -> str:
+    """
+    Class qualified name of a frame's function. Code objects only carry it
+    from Python 3.11; before that the class is taken from the method's self
+    (or cls) argument, which names the instance's class rather than the
+    class defining the method.
+    """
+    code = frame.f_code
+    qualname = getattr(code, "co_qualname", None)
+    if qualname is not None:
+        return qualname
+    if code.co_argcount and code.co_varnames[0] in ("self", "cls"):
+        owner = frame.f_locals.get(code.co_varnames[0])
+        if owner is not None:
+            owner_class = owner if isinstance(owner, type) else type(owner)
+            return f"{owner_class.__name__}.{code.co_name}"
+    return code.co_name
+
+
+def sample_stack(frame) -> List[Frame]:
+    """Frames of a thread's stack, innermost first"""
+    stack = []
+    while frame is not None and len(stack) < MAX_DEPTH:
+        stack.append((frame.f_code.co_filename, frame.f_lineno, qualified_name(frame)))
+        frame = frame.f_back
+    return stack
+
+
+def frame_name(frame: Frame) -> str:
+    """Qualified function name; module level code is named after its file"""
+    filename, _, function = frame
+    if function == "<module>" and filename.startswith(ROOT):
+        return f"<module {os.path.relpath(filename, ROOT)}>"
+    return function
+
+
+def describe_frame(frame: Frame) -> str:
+    filename, line, function = frame
+    if filename.startswith(ROOT):
+        filename = os.path.relpath(filename, ROOT)
+    return f"{function} ({filename}:{line})"
+
+
+def attribute_stall(samples: List[List[Frame]]) -> dict:
+    """
+    Work out what the main thread was doing during a stall: the controller,
+    manager, dashboard or chart call seen most often (the innermost one of
+    each sample), the application call chain leading to it and the
+    innermost frames overall
+    """
+    targets = Counter()
+    chains = {}
+    innermost = Counter()
+    for stack in samples:
+        if stack:
+            innermost[describe_frame(stack[0])] += 1
+        application = [frame for frame in stack if is_application_frame(frame)]
+        target = next((frame for frame in application if is_attribution_target(frame)), None)
+        if target is None:
+            continue
+        targets[target[2]] += 1
+        # Outermost call first
+        chains.setdefault(target[2], [frame_name(frame) for frame in reversed(application)])
+
+    attribution = None
+    share = 0.0
+    if targets:
+        attribution, count = targets.most_common(1)[0]
+        share = count / len(samples)
+    return {
+        "attribution": attribution,
+        "attribution_share": round(share, 2),
+        "chain": chains.get(attribution, []),
+        "innermost": [{"frame": frame, "samples": count} for frame, count in innermost.most_common(5)],
+    }
+
+
+class StallDetector(QObject):
+    """
+    Watches the Qt event loop for stalls. A QTimer heartbeat on the GUI
+    thread measures how late each beat fires (the event loop latency). A
+    watchdog thread checks the last beat; once it is more than threshold_ms
+    overdue the main thread's stack is sampled every sample_ms through
+    sys._current_frames() until the event loop comes back. The stall is then
+    attributed to the call the samples point at, logged and emitted.
+    """
+
+    # Emitted on the GUI thread with the record of each stall
+    stall_detected = pyqtSignal(object)
+
+    def __init__(self, threshold_ms: float = 200, interval_ms: int = 50, sample_ms: int = 10,
+                 log_path: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self.threshold_ms = threshold_ms
+        self.interval_ms = interval_ms
+        self.sample_ms = sample_ms
+        # Stalls are appended to this file as JSON lines
+        self.log_path = log_path
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.beat)
+
+        self.main_thread_id = None
+        self.last_beat = time.perf_counter()
+        self.watchdog = None
+        self.stop_event = threading.Event()
+        # Stacks sampled since the last beat; filled by the watchdog, taken by the beat
+        self.lock = threading.Lock()
+        self.samples = []
+
+        # Latency of recent beats, in ms
+        self.latencies = deque(maxlen=1000)
+        self.stalls = []
+
+    def start(self):
+        """Start watching; must be called on the GUI thread"""
+        if self.watchdog is not None:
+            return
+        self.main_thread_id = threading.get_ident()
+        self.last_beat = time.perf_counter()
+        self.stop_event.clear()
+        self.timer.start()
+        self.watchdog = threading.Thread(target=self.watch, name="stall-watchdog", daemon=True)
+        self.watchdog.start()
+
+    def stop(self):
+        """Stop the heartbeat and the watchdog thread"""
+        self.timer.stop()
+        self.stop_event.set()
+        if self.watchdog is not None:
+            self.watchdog.join(1)
+            self.watchdog = None
+
+    def beat(self):
+        """Heartbeat on the GUI thread; reports a stall once the event loop is back"""
+        now = time.perf_counter()
+        latency = max(0.0, (now - self.last_beat) * 1000 - self.interval_ms)
+        self.last_beat = now
+        self.latencies.append(latency)
+
+        with self.lock:
+            samples = self.samples
+            self.samples = []
+        if latency >= self.threshold_ms:
+            self.report_stall(latency, samples)
+
+    def watch(self):
+        """Watchdog thread: sample the main thread's stack while the heartbeat is overdue"""
+        while not self.stop_event.wait(self.sample_ms / 1000):
+            overdue = (time.perf_counter() - self.last_beat) * 1000 - self.interval_ms
+            if overdue < self.threshold_ms:
+                continue
+            frame = sys._current_frames().get(self.main_thread_id)
+            if frame is None:
+                continue
+            stack = sample_stack(frame)
+            del frame
+            with self.lock:
+                if len(self.samples) < MAX_SAMPLES:
+                    self.samples.append(stack)
+
+    def report_stall(self, latency: float, samples: List[List[Frame]]):
+        """Attribute, log and emit one stall"""
+        record = {
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "duration_ms": round(latency, 1),
+            "threshold_ms": self.threshold_ms,
+            "samples": len(samples),
+        }
+        record.update(attribute_stall(samples))
+        self.stalls.append(record)
+
+        culprit = record["attribution"] or (record["innermost"][0]["frame"] if record["innermost"] else "unknown")
+        print(f"UI stall: {record['duration_ms']:.0f} ms in {culprit} ({len(samples)} samples)")
+        if record["chain"]:
+            print("  " + " -> ".join(record["chain"]))
+
+        if self.log_path:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as file:
+                    file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            except OSError as e:
+                print(f"Error writing stall log: {e}")
+
+        self.stall_detected.emit(record)
+
+    def get_stats(self):
+        """Event loop latency of recent beats and the number of stalls seen"""
+        latencies = sorted(self.latencies)
+        return {
+            "beats": len(latencies),
+            "latency_median_ms": statistics.median(latencies) if latencies else 0.0,
+            "latency_p95_ms": latencies[int(len(latencies) * 0.95)] if latencies else 0.0,
+            "latency_max_ms": latencies[-1] if latencies else 0.0,
+            "stalls": len(self.stalls),
+        }
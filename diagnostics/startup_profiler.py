@@ -0,0 +1,230 @@
+import importlib.abc
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Profiler started by start(); None when startup is not being profiled
+_active = None
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a module's loader to time its creation and execution"""
+
+    def __init__(self, loader, profiler, name: str):
+        self.loader = loader
+        self.profiler = profiler
+        self.name = name
+
+    def create_module(self, spec):
+        create_module = getattr(self.loader, "create_module", None)
+        if create_module is None:
+            return None
+        # Extension modules (PyQt5, numpy's C parts) do their work here
+        with self.profiler.time_import(self.name):
+            return create_module(spec)
+
+    def exec_module(self, module):
+        # The module only ever sees its own loader
+        module.__loader__ = self.loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self.loader
+        with self.profiler.time_import(self.name):
+            self.loader.exec_module(module)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """First finder on sys.meta_path; finds modules with the others and times their loading"""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        # Namespace packages and legacy loaders are left alone
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self.profiler, fullname)
+        return spec
+
+
+class StartupProfiler:
+    """
+    Records where launch time goes: every module import (with the time spent
+    in the module itself and in the imports it triggers), named steps such as
+    loading a manager or building a tab, and milestones such as the first
+    paint. Times are in ms from start().
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.started_at = datetime.now()
+        self.finder = _ImportTimer(self)
+
+        # Module name -> import record; nesting is tracked per thread
+        self.imports: Dict[str, dict] = {}
+        self.import_stacks = threading.local()
+        self.steps: List[dict] = []
+        self.milestones: Dict[str, float] = {}
+        self.stopped = None
+
+    def elapsed(self) -> float:
+        """ms since the profiler started"""
+        return (time.perf_counter() - self.started) * 1000
+
+    @contextmanager
+    def time_import(self, name: str):
+        """Time creating or executing a module; the imports it triggers count as its children"""
+        stack = getattr(self.import_stacks, "stack", None)
+        if stack is None:
+            stack = self.import_stacks.stack = []
+        record = self.imports.get(name)
+        if record is None:
+            record = self.imports[name] = {
+                "module": name,
+                "parent": stack[-1]["module"] if stack else None,
+                "start_ms": self.elapsed(),
+                "cumulative_ms": 0.0,
+                "self_ms": 0.0,
+            }
+
+        frame = {"module": name, "children_ms": 0.0}
+        stack.append(frame)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = (time.perf_counter() - started) * 1000
+            stack.pop()
+            record["cumulative_ms"] += duration
+            record["self_ms"] += duration - frame["children_ms"]
+            if stack:
+                stack[-1]["children_ms"] += duration
+
+    @contextmanager
+    def measure(self, category: str, name: str):
+        """Record the time a named step takes"""
+        start = self.elapsed()
+        try:
+            yield
+        finally:
+            self.steps.append({
+                "category": category,
+                "name": name,
+                "start_ms": start,
+                "duration_ms": self.elapsed() - start,
+                "thread": threading.current_thread().name,
+            })
+
+    def mark(self, name: str):
+        """Record the first time a milestone is reached"""
+        self.milestones.setdefault(name, self.elapsed())
+
+    def get_report(self) -> dict:
+        """Machine-readable report of everything recorded"""
+        modules = sorted(self.imports.values(), key=lambda record: record["start_ms"])
+        packages = {}
+        for record in modules:
+            package = record["module"].split(".")[0]
+            packages[package] = packages.get(package, 0.0) + record["self_ms"]
+
+        return {
+            "started": self.started_at.isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "duration_ms": self.stopped if self.stopped is not None else self.elapsed(),
+            "milestones": dict(sorted(self.milestones.items(), key=lambda item: item[1])),
+            "steps": sorted(self.steps, key=lambda step: step["start_ms"]),
+            "imports": {
+                # Imports not triggered by another timed import
+                "total_ms": sum(record["cumulative_ms"] for record in modules if record["parent"] is None),
+                "count": len(modules),
+                "packages": dict(sorted(packages.items(), key=lambda item: -item[1])),
+                "modules": modules,
+            },
+        }
+
+    def get_summary(self, top: int = 10) -> str:
+        """Readable summary of the report"""
+        report = self.get_report()
+        imports = report["imports"]
+        lines = ["Startup profile (ms from the start of main.py)", "", "Milestones"]
+        for name, at in report["milestones"].items():
+            lines.append(f"  {name:<36}{at:>10.1f}")
+
+        lines += ["", "Steps"]
+        for step in report["steps"]:
+            label = f"{step['category']}: {step['name']}"
+            lines.append(f"  {label:<36}{step['duration_ms']:>10.1f}   at {step['start_ms']:.1f}")
+
+        lines += ["", f"Imports: {imports['total_ms']:.1f} ms in {imports['count']} modules",
+                  "  by package (self time)"]
+        for package, duration in list(imports["packages"].items())[:top]:
+            lines.append(f"    {package:<34}{duration:>10.1f}")
+        lines.append("  slowest modules (self time)")
+        slowest = sorted(imports["modules"], key=lambda record: -record["self_ms"])[:top]
+        for record in slowest:
+            lines.append(f"    {record['module']:<34}{record['self_ms']:>10.1f}")
+        return "\n".join(lines)
+
+    def write_report(self, path: str):
+        """Write the JSON report to path and the summary next to it"""
+        with open(path, "w") as file:
+            json.dump(self.get_report(), file, indent=2)
+        summary_path = path[:-5] + ".txt" if path.endswith(".json") else path + ".txt"
+        with open(summary_path, "w") as file:
+            file.write(self.get_summary() + "\n")
+        return summary_path
+
+
+def start() -> StartupProfiler:
+    """Start profiling; modules imported from now on are timed"""
+    global _active
+    if _active is None:
+        _active = StartupProfiler()
+        sys.meta_path.insert(0, _active.finder)
+    return _active
+
+
+def stop() -> Optional[StartupProfiler]:
+    """Stop profiling and return the profiler with what it recorded"""
+    global _active
+    profiler = _active
+    if profiler is not None:
+        if profiler.finder in sys.meta_path:
+            sys.meta_path.remove(profiler.finder)
+        profiler.stopped = profiler.elapsed()
+        _active = None
+    return profiler
+
+
+def get_active() -> Optional[StartupProfiler]:
+    return _active
+
+
+@contextmanager
+def measure(category: str, name: str):
+    """Record a startup step while profiling; does nothing otherwise"""
+    if _active is None:
+        yield
+        return
+    with _active.measure(category, name):
+        yield
+
+
+def mark(name: str):
+    """Record a startup milestone while profiling; does nothing otherwise"""
+    if _active is not None:
+        _active.mark(name)
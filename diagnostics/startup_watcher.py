@@ -0,0 +1,59 @@
+from PyQt5.QtCore import QObject, QEvent, QTimer
+
+from . import startup_profiler
+
+
+class StartupWatcher(QObject):
+    """
+    Ends a startup profile: waits for the main window's first paint and the
+    dashboard's first drawn dataset, then builds the remaining tabs (each is
+    timed as a deferred step), stops the profiler and writes the report
+    """
+
+    def __init__(self, window, output_path: str, parent=None):
+        super().__init__(parent)
+        self.window = window
+        self.output_path = output_path
+        self.painted = False
+        self.dashboard_drawn = False
+
+        window.installEventFilter(self)
+        # Connected after the dashboard's own slot, so it runs once the charts are drawn
+        window.dashboard.dataset_loader.loaded.connect(self.on_dashboard_loaded)
+        startup_profiler.mark("window shown")
+
+    def eventFilter(self, obj, event):
+        if obj is self.window and event.type() == QEvent.Paint and not self.painted:
+            self.painted = True
+            startup_profiler.mark("first paint")
+            # Finish outside the paint event
+            QTimer.singleShot(0, self.finish)
+        return False
+
+    def on_dashboard_loaded(self, dataset):
+        if self.dashboard_drawn:
+            return
+        self.dashboard_drawn = True
+        startup_profiler.mark("dashboard drawn")
+        QTimer.singleShot(0, self.finish)
+
+    def finish(self):
+        """Write the report once the window is painted and the dashboard drawn"""
+        profiler = startup_profiler.get_active()
+        if profiler is None or not (self.painted and self.dashboard_drawn):
+            return
+
+        self.window.removeEventFilter(self)
+        self.window.dashboard.dataset_loader.loaded.disconnect(self.on_dashboard_loaded)
+
+        # Tabs are built on first use; build them now so their cost is known
+        for index in sorted(self.window.lazy_tabs):
+            self.window.build_tab(index)
+
+        startup_profiler.stop()
+        try:
+            summary_path = profiler.write_report(self.output_path)
+            print(profiler.get_summary())
+            print(f"\nStartup profile written to {self.output_path} and {summary_path}")
+        except OSError as e:
+            print(f"Error writing startup profile: {e}")
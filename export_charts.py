@@ -0,0 +1,69 @@
+import argparse
+import sys
+import time
+
+from controllers.app_controller import AppController
+from models.finance_manager import FinanceManager
+from models.forecast_manager import ForecastManager
+from models.transaction_category_manager import CategoryManager
+from views.chart_export import CHART_NAMES, build_export_datasets, export_charts
+
+
+def parse_month(value):
+    """Parse a YYYY-MM argument into a (year, month) tuple"""
+    try:
+        year, month = (int(part) for part in value.split("-"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM, got {value!r}")
+    if not 1 <= month <= 12:
+        raise argparse.ArgumentTypeError(f"month out of range in {value!r}")
+    return year, month
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render every dashboard chart for a range of months to image files, without the GUI")
+    parser.add_argument("start", type=parse_month, help="first month (YYYY-MM)")
+    parser.add_argument("end", type=parse_month, nargs="?", help="last month (YYYY-MM), defaults to start")
+    parser.add_argument("-o", "--output", default="chart_export",
+                        help="output directory, one sub-directory per month (default: chart_export)")
+    parser.add_argument("-f", "--format", dest="formats", action="append", choices=["png", "svg"],
+                        help="image format, may be repeated (default: png)")
+    parser.add_argument("-c", "--chart", dest="charts", action="append", choices=CHART_NAMES,
+                        help="chart to render, may be repeated (default: all)")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: one per CPU, 1 renders in this process)")
+    parser.add_argument("--dpi", type=int, default=100, help="resolution of PNG files (default: 100)")
+    args = parser.parse_args()
+
+    end = args.end or args.start
+    if end < args.start:
+        parser.error("end month is before start month")
+
+    # Same data files as the application
+    finance_manager = FinanceManager("finance_data.json")
+    category_manager = CategoryManager("transaction_categories.json")
+    forecast_manager = ForecastManager("forecast_transactions.json", "forecast_rules.json")
+    controller = AppController(finance_manager, category_manager, forecast_manager)
+
+    started = time.perf_counter()
+    datasets = build_export_datasets(controller, args.start, end)
+    print(f"Built {len(datasets)} monthly datasets in {time.perf_counter() - started:.1f}s")
+
+    def progress(done, total):
+        print(f"\rRendered {done}/{total} charts", end="", flush=True)
+
+    try:
+        paths = export_charts(datasets, args.output, formats=args.formats or ["png"],
+                              chart_names=args.charts, workers=args.workers,
+                              dpi=args.dpi, progress=progress)
+    except Exception as e:
+        print(f"\nError exporting charts: {e}")
+        return 1
+
+    print(f"\nWrote {len(paths)} files to {args.output} in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,12 @@
+import argparse
 import sys
 
+from diagnostics import startup_profiler
+
+# Imports are only timed if the profiler starts before the application modules load
+if __name__ == "__main__" and "--profile-startup" in sys.argv:
+    startup_profiler.start()
+
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication
 
@@ -9,13 +16,14 @@ from models.forecast_manager import ForecastManager
 from models.transaction_category_manager import CategoryManager
 from views.main_window import MainWindow
 
-def main():
+def create_application(argv):
+    """Create the QApplication with the application style"""
     # Set application attributes
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setStyle("Fusion")
     
     # Create application
-    app = QApplication(sys.argv)
+    app = QApplication(argv)
     
     # Set application stylesheet for a more modern, sleek look
     app.setStyleSheet("""
@@ -214,16 +222,57 @@ def main():
             selection-color: white;
         }
     """)
-    
+    return app
+
+def create_main_window():
+    """Load the data files and build the main window"""
     # Initialize models, controllers, and views
-    finance_manager = FinanceManager("finance_data.json")
-    category_manager = CategoryManager("transaction_categories.json")
-    forecast_manager = ForecastManager("forecast_transactions.json")
-    controller = AppController(finance_manager, category_manager, forecast_manager)
-    main_window = MainWindow(controller)
+    with startup_profiler.measure("manager", "FinanceManager"):
+        finance_manager = FinanceManager("finance_data.json")
+    with startup_profiler.measure("manager", "CategoryManager"):
+        category_manager = CategoryManager("transaction_categories.json")
+    with startup_profiler.measure("manager", "ForecastManager"):
+        forecast_manager = ForecastManager("forecast_transactions.json", "forecast_rules.json")
+    with startup_profiler.measure("manager", "AppController"):
+        controller = AppController(finance_manager, category_manager, forecast_manager)
+    with startup_profiler.measure("window", "MainWindow"):
+        return MainWindow(controller)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Personal Finance Manager")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="time imports, data loading, tab construction and the first paint")
+    parser.add_argument("--profile-output", default="startup_profile.json",
+                        help="JSON report of --profile-startup; a text summary is written next to it "
+                             "(default: startup_profile.json)")
+    parser.add_argument("--detect-stalls", action="store_true",
+                        help="log event loop stalls with the controller, manager or chart call that caused them")
+    parser.add_argument("--stall-threshold", type=float, default=200, metavar="MS",
+                        help="event loop latency reported as a stall (default: 200)")
+    parser.add_argument("--stall-log", default="stalls.jsonl",
+                        help="stalls found by --detect-stalls are appended here as JSON lines "
+                             "(default: stalls.jsonl)")
+    # Anything else is left to Qt
+    return parser.parse_known_args()[0]
+
+def main():
+    args = parse_args()
+    startup_profiler.mark("main")
+    
+    with startup_profiler.measure("application", "QApplication"):
+        app = create_application(sys.argv)
+    main_window = create_main_window()
     
     # Show main window
     main_window.show()
+    if startup_profiler.get_active() is not None:
+        from diagnostics.startup_watcher import StartupWatcher
+        startup_watcher = StartupWatcher(main_window, args.profile_output, parent=main_window)
+    if args.detect_stalls:
+        from diagnostics.stall_detector import StallDetector
+        stall_detector = StallDetector(args.stall_threshold, log_path=args.stall_log, parent=app)
+        stall_detector.start()
+        app.aboutToQuit.connect(stall_detector.stop)
     
     # Run application event loop
     sys.exit(app.exec_())
@@ -0,0 +1,124 @@
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .transaction import TransactionType
+
+# Columns of a pasted row, in order
+BATCH_COLUMNS = ["Date", "Name", "Category", "Amount"]
+DATE_COLUMN, NAME_COLUMN, CATEGORY_COLUMN, AMOUNT_COLUMN = range(len(BATCH_COLUMNS))
+
+# Date formats accepted in the Date column; only the month and year are kept
+DATE_FORMATS = ["%Y-%m-%d", "%Y-%m", "%d.%m.%Y", "%d/%m/%Y", "%m/%Y", "%b %Y", "%B %Y"]
+
+
+@dataclass
+class BatchRow:
+    """One pasted row and what it parsed to; errors pairs a column with a message"""
+    cells: List[str]
+    date: Optional[datetime] = None
+    name: str = ""
+    category: Optional[str] = None
+    category_type: Optional[TransactionType] = None
+    amount: Optional[float] = None
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+
+    def is_valid(self) -> bool:
+        return not self.errors
+
+
+def parse_tsv(text: str) -> List[List[str]]:
+    """Split tab-separated text (as copied from a spreadsheet) into rows of cells"""
+    rows = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        cells = [cell.strip() for cell in line.split("\t")]
+        # Short rows are padded so every row has all columns
+        cells += [""] * (len(BATCH_COLUMNS) - len(cells))
+        rows.append(cells[:len(BATCH_COLUMNS)])
+
+    # A header row copied along with the data is dropped
+    if rows and [cell.casefold() for cell in rows[0]] == [c.casefold() for c in BATCH_COLUMNS]:
+        rows = rows[1:]
+    return rows
+
+
+def parse_amount(text: str) -> float:
+    """
+    Parse an amount as written in statements: "1,234.56", "1.234,56", "5.000"
+    or "-250 ₺". A lone separator followed by exactly three digits groups
+    thousands. The sign is dropped since the category decides income or expense.
+    """
+    cleaned = re.sub(r"[^\d,.\-]", "", text).lstrip("-")
+    if "," in cleaned and "." in cleaned:
+        # The separator that comes last is the decimal one
+        if cleaned.rfind(",") > cleaned.rfind("."):
+            cleaned = cleaned.replace(".", "").replace(",", ".")
+        else:
+            cleaned = cleaned.replace(",", "")
+    elif "," in cleaned:
+        # "12,50" is a decimal comma, "1,250" a thousands separator
+        whole, _, fraction = cleaned.rpartition(",")
+        cleaned = f"{whole.replace(',', '')}.{fraction}" if len(fraction) != 3 else cleaned.replace(",", "")
+    elif "." in cleaned:
+        # Likewise "12.50" is a decimal point, "5.000" (as Turkish statements
+        # write it) a thousands separator
+        whole, _, fraction = cleaned.rpartition(".")
+        cleaned = f"{whole.replace('.', '')}.{fraction}" if len(fraction) != 3 else cleaned.replace(".", "")
+    return float(cleaned)
+
+
+def parse_month(text: str) -> datetime:
+    """Parse a date in one of DATE_FORMATS as the first day of its month"""
+    for date_format in DATE_FORMATS:
+        try:
+            date = datetime.strptime(text, date_format)
+        except ValueError:
+            continue
+        return datetime(date.year, date.month, 1)
+    raise ValueError(f"Unrecognized date '{text}'")
+
+
+def validate_rows(rows: List[List[str]], category_types: Dict[str, TransactionType],
+                  default_date: datetime) -> List[BatchRow]:
+    """
+    Parse and check every row. category_types maps category names to their
+    type; names match case-insensitively. Rows without a date get default_date.
+    """
+    categories = {name.casefold(): (name, category_type) for name, category_type in category_types.items()}
+    return [validate_row(cells, categories, default_date) for cells in rows]
+
+
+def validate_row(cells: List[str], categories: Dict[str, Tuple[str, TransactionType]],
+                 default_date: datetime) -> BatchRow:
+    """Parse one row against categories keyed by casefolded name"""
+    row = BatchRow(cells=list(cells))
+
+    date_text = cells[DATE_COLUMN]
+    if date_text:
+        try:
+            row.date = parse_month(date_text)
+        except ValueError as e:
+            row.errors.append((DATE_COLUMN, str(e)))
+    else:
+        row.date = default_date
+
+    row.name = cells[NAME_COLUMN]
+    if not row.name:
+        row.errors.append((NAME_COLUMN, "Name is empty"))
+
+    category = categories.get(cells[CATEGORY_COLUMN].casefold())
+    if category is None:
+        row.errors.append((CATEGORY_COLUMN, f"Unknown category '{cells[CATEGORY_COLUMN]}'"))
+    else:
+        row.category, row.category_type = category
+
+    try:
+        row.amount = parse_amount(cells[AMOUNT_COLUMN])
+        if row.amount <= 0:
+            raise ValueError
+    except ValueError:
+        row.errors.append((AMOUNT_COLUMN, f"Invalid amount '{cells[AMOUNT_COLUMN]}'"))
+    return row
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, FrozenSet, Iterable, Optional, Tuple
+
+from .transaction import TransactionType
+from .period import Month, month_index
+
+
+class ChangeSource(Enum):
+    TRANSACTIONS = "transactions"
+    GOALS = "goals"
+    FORECASTS = "forecasts"
+
+
+class ChangeKind(Enum):
+    ADDED = "added"
+    UPDATED = "updated"
+    REMOVED = "removed"
+    RELOADED = "reloaded"
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """
+    Describes one mutation of a manager's data so views can tell whether it
+    touches what they show. months is None when the change can affect any
+    month (a reload, a goal or an open-ended recurrence rule).
+    """
+    source: ChangeSource
+    kind: ChangeKind
+    ids: Tuple[str, ...] = ()
+    months: Optional[FrozenSet[Month]] = None
+    categories: FrozenSet[str] = frozenset()
+    types: FrozenSet[TransactionType] = frozenset()
+    # Attributes changed by an update; empty when unknown
+    fields: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def for_items(cls, source: ChangeSource, kind: ChangeKind, items: Iterable,
+                  fields: Iterable[str] = ()) -> "ChangeEvent":
+        """
+        Describe a change of transactions or forecasts from the items themselves.
+        For an update pass the item both before and after the change.
+        """
+        items = list(items)
+        return cls(
+            source=source,
+            kind=kind,
+            # Same item before and after an update is listed once
+            ids=tuple(dict.fromkeys(item.id for item in items)),
+            months=frozenset((item.date.year, item.date.month) for item in items),
+            categories=frozenset(item.category for item in items if item.category),
+            types=frozenset(item.transaction_type for item in items),
+            fields=frozenset(fields)
+        )
+
+    def touches_month(self, year: int, month: int) -> bool:
+        """Check if the change can affect a month"""
+        return self.months is None or (year, month) in self.months
+
+    def touches_range(self, first_index: int, last_index: int) -> bool:
+        """Check if the change can affect any month in a month index range"""
+        if self.months is None:
+            return True
+        return any(first_index <= month_index(*month) <= last_index for month in self.months)
+
+    def touches_fields(self, fields: Iterable[str]) -> bool:
+        """Check if an update can have changed any of the given attributes"""
+        return not self.fields or not self.fields.isdisjoint(fields)
+
+
+class ChangeNotifier:
+    """Mixin for managers that report each mutation to subscribers as a ChangeEvent"""
+
+    def __init__(self):
+        self._subscribers = []
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None]):
+        """Call callback with every ChangeEvent from now on"""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ChangeEvent], None]):
+        """Stop calling a subscribed callback"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def notify(self, event: ChangeEvent):
+        """Send an event to every subscriber; the data is already saved when this runs"""
+        for callback in list(self._subscribers):
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Error handling {event.source.value} change: {e}")
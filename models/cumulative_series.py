@@ -0,0 +1,35 @@
+from array import array
+from typing import Iterable
+
+from .transaction import Transaction, TransactionType
+
+
+class CumulativeSeries:
+    """
+    Running income, expense and net totals after each transaction, in date
+    order. It covers the whole history, so it is the same for every month:
+    the finance manager builds it once per data version and every dashboard
+    dataset references it. The totals are packed float arrays rather than a
+    dict per transaction.
+    """
+
+    def __init__(self, transactions: Iterable[Transaction]):
+        ordered = sorted(transactions, key=lambda t: t.date)
+        self.dates = [transaction.date for transaction in ordered]
+        self.income = array("d")
+        self.expenses = array("d")
+        self.net = array("d")
+
+        cumulative_income = 0.0
+        cumulative_expenses = 0.0
+        for transaction in ordered:
+            if transaction.transaction_type == TransactionType.INCOME:
+                cumulative_income += transaction.amount
+            else:
+                cumulative_expenses += transaction.amount
+            self.income.append(cumulative_income)
+            self.expenses.append(cumulative_expenses)
+            self.net.append(cumulative_income - cumulative_expenses)
+
+    def __len__(self) -> int:
+        return len(self.dates)
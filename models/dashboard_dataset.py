@@ -0,0 +1,178 @@
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .transaction import TransactionType
+from .period import Month, month_index, month_from_index, months_between
+from .cumulative_series import CumulativeSeries
+from .forecast_manager import new_month_buckets, add_to_month_buckets, build_range_comparison
+from .long_operation import CancellationToken
+
+# Months of history shown by the forecast chart and the forecast accuracy chart
+HISTORY_MONTHS = 6
+
+# Transactions processed between checks for a cancelled build
+CANCEL_CHECK_INTERVAL = 1000
+
+
+class DashboardDataset:
+    """
+    Everything the dashboard charts need for one selected month, computed in
+    a single pass over actual transactions, one pass over forecasts and one
+    over goals. Charts read from it instead of querying the managers. The
+    cumulative series covers the whole history, so it is shared with the
+    finance manager rather than built per month.
+    """
+
+    def __init__(self, year: int, month: int):
+        self.year = year
+        self.month = month
+        self.start_index = 0
+        # Per-month actual totals and categories for the covered window
+        self.buckets = new_month_buckets(0)
+        self.transaction_counts = []
+        # Expenses per month grouped by category (or name when uncategorized)
+        self.expense_labels = []
+        self.cumulative = CumulativeSeries([])
+        self.forecast_comparison = {}
+        self.goals_progress = []
+        self.build_time_ms = 0.0
+        # Data versions of the snapshot the dataset was built from, if known
+        self.versions = None
+
+    @staticmethod
+    def get_window(year: int, month: int) -> Tuple[int, int]:
+        """
+        First and last month index a dataset covers: the selected year, the
+        history before the selected month and the month after it
+        """
+        current = month_index(year, month)
+        return (min(month_index(year, 1), current - HISTORY_MONTHS + 1),
+                max(month_index(year, 12), current + 1))
+
+    @classmethod
+    def build(cls, finance_manager, forecast_manager, year: int, month: int,
+              cancel_token: CancellationToken = None) -> Optional["DashboardDataset"]:
+        """
+        Build the dataset for a selected month. Returns None if cancel_token is
+        cancelled before the build finishes (e.g. the user already picked another month).
+        """
+        datasets = cls.build_range(finance_manager, forecast_manager, (year, month), (year, month), cancel_token)
+        return None if datasets is None else datasets[(year, month)]
+
+    @classmethod
+    def build_range(cls, finance_manager, forecast_manager, first: Month, last: Month,
+                    cancel_token: CancellationToken = None) -> Optional[Dict[Month, "DashboardDataset"]]:
+        """
+        Build the dataset of every month from first to last with one pass over
+        actual transactions and one over forecasts: the windows of all the
+        months are bucketed together and each dataset takes its slice. Returns
+        None if cancel_token is cancelled before the build finishes.
+        """
+        started = time.perf_counter()
+        months = months_between(first, last)
+        windows = [cls.get_window(year, month) for year, month in months]
+        start = min(window[0] for window in windows)
+        end = max(window[1] for window in windows)
+        span = end - start + 1
+
+        buckets = new_month_buckets(span)
+        expense_labels = [{} for _ in range(span)]
+        transaction_counts = [0] * span
+
+        # Single pass over actuals; bucketing does not depend on their order
+        for position, transaction in enumerate(finance_manager.get_all_transactions()):
+            if cancel_token is not None and position % CANCEL_CHECK_INTERVAL == 0 \
+                    and cancel_token.is_cancelled():
+                return None
+
+            offset = month_index(transaction.date.year, transaction.date.month) - start
+            if offset < 0 or offset >= span:
+                continue
+            add_to_month_buckets(buckets, offset, transaction)
+            transaction_counts[offset] += 1
+
+            if transaction.transaction_type == TransactionType.EXPENSE:
+                label = transaction.category if transaction.category else transaction.name
+                labels = expense_labels[offset]
+                labels[label] = labels.get(label, 0) + transaction.amount
+
+        if cancel_token is not None and cancel_token.is_cancelled():
+            return None
+
+        cumulative = finance_manager.get_cumulative_series()
+
+        # Forecasts of every month's history window, bucketed together
+        history_first = month_index(*first) - HISTORY_MONTHS + 1
+        forecast_buckets = forecast_manager.bucket_forecasts(history_first,
+                                                             month_index(*last) - history_first + 1)
+
+        datasets = {}
+        for (year, month), (window_start, window_end) in zip(months, windows):
+            dataset = cls(year, month)
+            first_offset = window_start - start
+            window_span = window_end - window_start + 1
+            dataset.start_index = window_start
+            dataset.buckets = slice_month_buckets(buckets, first_offset, window_span)
+            dataset.expense_labels = expense_labels[first_offset:first_offset + window_span]
+            dataset.transaction_counts = transaction_counts[first_offset:first_offset + window_span]
+            dataset.cumulative = cumulative
+
+            # Forecast comparison for the history window, reusing the actual buckets
+            history_start = month_index(year, month) - HISTORY_MONTHS + 1
+            dataset.forecast_comparison = build_range_comparison(
+                history_start,
+                slice_month_buckets(forecast_buckets, history_start - history_first, HISTORY_MONTHS),
+                dataset._slice_buckets(history_start, HISTORY_MONTHS)
+            )
+
+            dataset.goals_progress = finance_manager.get_goals_progress(year, month)
+            datasets[(year, month)] = dataset
+
+        # The shared pass is spread evenly over the months
+        build_time_ms = (time.perf_counter() - started) * 1000 / len(months)
+        for dataset in datasets.values():
+            dataset.build_time_ms = build_time_ms
+        return datasets
+
+    def _offset(self, year: int, month: int) -> int:
+        offset = month_index(year, month) - self.start_index
+        if offset < 0 or offset >= len(self.expense_labels):
+            raise KeyError(f"{year}-{month:02d} is outside the dashboard dataset")
+        return offset
+
+    def _slice_buckets(self, start_index: int, span: int) -> Dict:
+        """Get a view of the actual buckets for span months from start_index"""
+        return slice_month_buckets(self.buckets, start_index - self.start_index, span)
+
+    def get_summary(self, year: int, month: int) -> Dict:
+        """Get income, expenses and net worth for a month in the window"""
+        offset = self._offset(year, month)
+        total_income = self.buckets["income"][offset]
+        total_expenses = self.buckets["expenses"][offset]
+        return {
+            "total_income": total_income,
+            "total_expenses": total_expenses,
+            "net_worth": total_income - total_expenses
+        }
+
+    def get_year_summaries(self) -> Dict:
+        """Get the summary of every month of the selected year, keyed by month"""
+        return {m: self.get_summary(self.year, m) for m in range(1, 13)}
+
+    def get_transaction_count(self, year: int, month: int) -> int:
+        """Get the number of actual transactions in a month"""
+        return self.transaction_counts[self._offset(year, month)]
+
+    def get_expense_labels(self, year: int, month: int) -> Dict:
+        """Get expenses for a month grouped by category, falling back to the name"""
+        return self.expense_labels[self._offset(year, month)]
+
+    def get_history_months(self) -> List[Month]:
+        """Get the months of the forecast history window, oldest first"""
+        current = month_index(self.year, self.month)
+        return [month_from_index(i) for i in range(current - HISTORY_MONTHS + 1, current + 1)]
+
+
+def slice_month_buckets(buckets: Dict, first: int, span: int) -> Dict:
+    """Get span months of month buckets from offset first; the month entries are shared"""
+    return {key: values[first:first + span] for key, values in buckets.items()}
@@ -1,18 +1,42 @@
+import copy
 import json
 import os
+import threading
 import uuid
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from .transaction import Transaction, TransactionType
 from .financial_goal import FinancialGoal, GoalType
+from .monthly_aggregate import MonthlyAggregate
+from .cumulative_series import CumulativeSeries
+from .name_index import NameIndex
+from .long_operation import CancellationToken, Operation, Progress, chunks, run_to_completion
+from .period import Month, month_index, month_from_index
+from .change_event import ChangeEvent, ChangeKind, ChangeNotifier, ChangeSource
 
-class FinanceManager:
+# Default of update_goal's clearable fields: leaves them as they are, while None clears them
+UNSET = object()
+
+class FinanceManager(ChangeNotifier):
     def __init__(self, file_path="finance_data.json", goals_path="financial_goals.json"):
+        super().__init__()
         self.file_path = file_path
         self.goals_path = goals_path
         self.transactions = []
         self.goals = []
+        # Mutation counters so readers can tell when cached results are stale
+        self.data_version = 0
+        self.goals_version = 0
+        self._aggregate = None
+        self._aggregate_version = None
+        self._name_index = None
+        self._name_index_version = None
+        # Cumulative series by data version. Snapshots share this dict and its
+        # lock, so a series built by a snapshot on a worker thread is reused by
+        # the next dataset of the same version.
+        self._cumulative = {}
+        self._cumulative_lock = threading.Lock()
         self.load_data()
         self.load_goals()
     
@@ -28,6 +52,8 @@ class FinanceManager:
                 self.transactions = []
         else:
             self.transactions = []
+        self.data_version += 1
+        self.notify(ChangeEvent(ChangeSource.TRANSACTIONS, ChangeKind.RELOADED))
     
     def load_goals(self):
         """Load financial goals from JSON file"""
@@ -41,6 +67,8 @@ class FinanceManager:
                 self.goals = []
         else:
             self.goals = []
+        self.goals_version += 1
+        self.notify(ChangeEvent(ChangeSource.GOALS, ChangeKind.RELOADED))
     
     def save_data(self):
         """Save transactions to JSON file"""
@@ -70,18 +98,68 @@ class FinanceManager:
         )
         
         self.transactions.append(transaction)
+        self.data_version += 1
+        self._index_names([transaction])
         self.save_data()
+        self.notify(ChangeEvent.for_items(ChangeSource.TRANSACTIONS, ChangeKind.ADDED, [transaction]))
         return transaction
     
+    def add_transactions(self, entries: List[Tuple[str, float, str, TransactionType, datetime]]) -> List[Transaction]:
+        """
+        Add many transactions, each given as (name, amount, category_name,
+        category_type, date), with one save and one change event
+        """
+        return run_to_completion(self.iter_add_transactions(entries))
+    
+    def iter_add_transactions(self, entries: List[Tuple[str, float, str, TransactionType, datetime]],
+                              token: Optional[CancellationToken] = None) -> Operation:
+        """
+        add_transactions as a long operation (see models.long_operation): the
+        transactions are created in chunks, then added and saved at once
+        """
+        transactions = []
+        for start, chunk in chunks(entries, token):
+            transactions.extend(
+                Transaction(
+                    id=str(uuid.uuid4()),
+                    name=name,
+                    amount=amount,
+                    transaction_type=category_type,
+                    category=category_name,
+                    date=date
+                )
+                for name, amount, category_name, category_type, date in chunk
+            )
+            yield Progress(start + len(chunk), len(entries), "Preparing transactions")
+        if not transactions:
+            return []
+        
+        yield Progress(len(entries), len(entries), "Saving transactions")
+        # Last chance to cancel; nothing has been changed yet
+        if token is not None:
+            token.raise_if_cancelled()
+        self.transactions.extend(transactions)
+        self.data_version += 1
+        self._index_names(transactions)
+        self.save_data()
+        self.notify(ChangeEvent.for_items(ChangeSource.TRANSACTIONS, ChangeKind.ADDED, transactions))
+        return transactions
+    
     def remove_transaction(self, transaction_id: str) -> bool:
         """Remove a transaction by ID"""
         for i, transaction in enumerate(self.transactions):
             if transaction.id == transaction_id:
                 del self.transactions[i]
+                self.data_version += 1
                 self.save_data()
+                self.notify(ChangeEvent.for_items(ChangeSource.TRANSACTIONS, ChangeKind.REMOVED, [transaction]))
                 return True
         return False
     
+    def get_transaction(self, transaction_id: str) -> Optional[Transaction]:
+        """Get a transaction by ID"""
+        return next((t for t in self.transactions if t.id == transaction_id), None)
+    
     def get_transactions_by_month(self, year: int, month: int) -> List[Transaction]:
         """Get all transactions for a specific month and year"""
         return [t for t in self.transactions 
@@ -143,6 +221,67 @@ class FinanceManager:
         
         return data_points
     
+    def snapshot(self) -> "FinanceManager":
+        """
+        Get a read-only copy of the current transactions and goals that another
+        thread can read while this manager keeps changing. Never save a snapshot.
+        """
+        snapshot = copy.copy(self)
+        # Transactions are only ever added or removed, so copying the list is enough
+        snapshot.transactions = list(self.transactions)
+        # Goals are edited in place
+        snapshot.goals = [copy.copy(goal) for goal in self.goals]
+        # Subscribers and the name index belong to the live manager
+        snapshot._subscribers = []
+        snapshot._name_index = None
+        return snapshot
+    
+    def get_monthly_aggregate(self) -> MonthlyAggregate:
+        """Get per-month totals with prefix sums, rebuilt only when transactions change"""
+        if self._aggregate is None or self._aggregate_version != self.data_version:
+            self._aggregate = MonthlyAggregate(self.transactions)
+            self._aggregate_version = self.data_version
+        return self._aggregate
+    
+    def get_cumulative_series(self) -> CumulativeSeries:
+        """Get the running totals over the whole history, built once per data version"""
+        version = self.data_version
+        with self._cumulative_lock:
+            series = self._cumulative.get(version)
+        if series is not None:
+            return series
+
+        # Built outside the lock; if another thread stored this version in the
+        # meantime, its series is used so every dataset shares one
+        series = CumulativeSeries(self.transactions)
+        with self._cumulative_lock:
+            cached = self._cumulative.get(version)
+            if cached is not None:
+                return cached
+            # Only the newest version is kept; an older snapshot finishing late
+            # does not replace it
+            if all(cached_version < version for cached_version in self._cumulative):
+                self._cumulative.clear()
+                self._cumulative[version] = series
+        return series
+    
+    def get_name_index(self) -> NameIndex:
+        """
+        Get the prefix index over transaction names. Added transactions are
+        indexed as they come; it is rebuilt after a removal or reload.
+        """
+        if self._name_index is None or self._name_index_version != self.data_version:
+            self._name_index = NameIndex.from_transactions(self.transactions)
+            self._name_index_version = self.data_version
+        return self._name_index
+    
+    def _index_names(self, transactions: List[Transaction]):
+        """Add new transactions to the name index if it is otherwise up to date"""
+        if self._name_index is not None and self._name_index_version == self.data_version - 1:
+            for transaction in transactions:
+                self._name_index.add(transaction)
+            self._name_index_version = self.data_version
+    
     def get_unique_years(self) -> List[int]:
         """Get a list of unique years in the transaction history"""
         years = {t.date.year for t in self.transactions}
@@ -153,25 +292,42 @@ class FinanceManager:
     # Financial Goals Methods
     
     def add_goal(self, name: str, amount: float, goal_type: GoalType, 
-                year: int, month: int) -> FinancialGoal:
-        """Add a new financial goal"""
+                year: int, month: int, end_year: int = None, end_month: int = None,
+                rolling_months: int = None) -> FinancialGoal:
+        """Add a new financial goal, optionally spanning a month range or rolling window"""
         # Create a new goal with a unique ID
         goal = FinancialGoal.create_new(
             name=name,
             amount=amount,
             goal_type=goal_type,
             year=year,
-            month=month
+            month=month,
+            end_year=end_year,
+            end_month=end_month,
+            rolling_months=rolling_months
         )
         
         self.goals.append(goal)
+        self.goals_version += 1
         self.save_goals()
+        self.notify(ChangeEvent(ChangeSource.GOALS, ChangeKind.ADDED, ids=(goal.id,)))
         return goal
     
     def update_goal(self, goal_id: str, name: str = None, amount: float = None, 
                    goal_type: GoalType = None, year: int = None, month: int = None,
-                   active: bool = None) -> bool:
-        """Update an existing goal by ID"""
+                   active: bool = None, end_year: Optional[int] = UNSET,
+                   end_month: Optional[int] = UNSET, rolling_months: Optional[int] = UNSET) -> bool:
+        """
+        Update an existing goal by ID. Fields left None are unchanged, except
+        end_year, end_month and rolling_months: these are unchanged when left
+        UNSET and cleared when None, so a range or rolling goal can become a
+        single-month goal again.
+        """
+        changes = {"name": name, "amount": amount, "goal_type": goal_type, "year": year,
+                   "month": month, "active": active}
+        changed = {k for k, v in changes.items() if v is not None}
+        clearable = {"end_year": end_year, "end_month": end_month, "rolling_months": rolling_months}
+        changed |= {k for k, v in clearable.items() if v is not UNSET}
         for goal in self.goals:
             if goal.id == goal_id:
                 if name is not None:
@@ -186,8 +342,17 @@ class FinanceManager:
                     goal.month = month
                 if active is not None:
                     goal.active = active
+                if end_year is not UNSET:
+                    goal.end_year = end_year
+                if end_month is not UNSET:
+                    goal.end_month = end_month
+                if rolling_months is not UNSET:
+                    goal.rolling_months = rolling_months
                     
+                self.goals_version += 1
                 self.save_goals()
+                self.notify(ChangeEvent(ChangeSource.GOALS, ChangeKind.UPDATED, ids=(goal_id,),
+                                        fields=frozenset(changed)))
                 return True
         return False
     
@@ -196,17 +361,23 @@ class FinanceManager:
         for i, goal in enumerate(self.goals):
             if goal.id == goal_id:
                 del self.goals[i]
+                self.goals_version += 1
                 self.save_goals()
+                self.notify(ChangeEvent(ChangeSource.GOALS, ChangeKind.REMOVED, ids=(goal_id,)))
                 return True
         return False
     
     def get_goals_by_month(self, year: int, month: int) -> List[FinancialGoal]:
-        """Get all active goals for a specific month and year"""
+        """Get all active goals that apply to a specific month and year"""
         return [g for g in self.goals 
-                if g.year == year and g.month == month and g.active]
+                if g.active and g.is_active_in(year, month)]
     
-    def get_goal_progress(self, goal_id: str) -> Dict:
-        """Get progress information for a specific goal"""
+    def get_goal_progress(self, goal_id: str, year: int = None, month: int = None) -> Dict:
+        """
+        Get progress information for a specific goal.
+        Rolling goals are measured over the window ending at year/month,
+        defaulting to the current month clamped to the goal's period.
+        """
         goal = next((g for g in self.goals if g.id == goal_id), None)
         
         if not goal:
@@ -217,21 +388,46 @@ class FinanceManager:
                 "remaining": 0
             }
         
-        # Get transactions for the goal's month
-        transactions = self.get_transactions_by_month(goal.year, goal.month)
+        if year is None or month is None:
+            year, month = self._default_goal_month(goal)
+        
+        return self._calculate_goal_progress(goal, self.get_monthly_aggregate(), year, month)
+    
+    def get_goal_month(self, goal_id: str) -> Optional[Month]:
+        """Get the month get_goal_progress measures a goal at by default, or None if there is no such goal"""
+        goal = next((g for g in self.goals if g.id == goal_id), None)
+        return self._default_goal_month(goal) if goal else None
+    
+    def _default_goal_month(self, goal: FinancialGoal) -> Month:
+        """The current month clamped to the goal's period"""
+        now = datetime.now()
+        index = max(goal.get_start_index(), month_index(now.year, now.month))
+        end = goal.get_end_index()
+        if end is not None:
+            index = min(index, end)
+        return month_from_index(index)
+    
+    def get_goals_progress(self, year: int, month: int) -> List[Dict]:
+        """Get progress information for every active goal in a month from one monthly aggregate"""
+        goals = self.get_goals_by_month(year, month)
+        if not goals:
+            return []
+        
+        aggregate = self.get_monthly_aggregate()
+        return [self._calculate_goal_progress(goal, aggregate, year, month) for goal in goals]
+    
+    def _calculate_goal_progress(self, goal: FinancialGoal, aggregate: MonthlyAggregate,
+                                 year: int, month: int) -> Dict:
+        """Calculate a goal's progress over its window as seen from year/month"""
+        window = goal.get_window(year, month)
+        income, expenses = aggregate.get_range_totals(*window)
         
         # Calculate current amount based on goal type
         if goal.goal_type == GoalType.INCOME:
-            current_amount = sum(t.amount for t in transactions 
-                               if t.transaction_type == TransactionType.INCOME)
+            current_amount = income
         elif goal.goal_type == GoalType.EXPENSE:
-            current_amount = sum(t.amount for t in transactions 
-                               if t.transaction_type == TransactionType.EXPENSE)
+            current_amount = expenses
         elif goal.goal_type == GoalType.SAVINGS:
-            income = sum(t.amount for t in transactions 
-                       if t.transaction_type == TransactionType.INCOME)
-            expenses = sum(t.amount for t in transactions 
-                         if t.transaction_type == TransactionType.EXPENSE)
             current_amount = income - expenses
         
         # Calculate percentage and remaining
@@ -251,7 +447,8 @@ class FinanceManager:
             "goal": goal,
             "current_amount": current_amount,
             "percentage": percentage,
-            "remaining": remaining
+            "remaining": remaining,
+            "window": (month_from_index(window[0]), month_from_index(window[1]))
         }
     
     def get_all_goals(self) -> List[FinancialGoal]:
@@ -1,8 +1,11 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from typing import Optional, Tuple
 import uuid
 
+from .period import month_index
+
 class GoalType(Enum):
     INCOME = "income"
     EXPENSE = "expense"
@@ -14,12 +17,52 @@ class FinancialGoal:
     name: str
     amount: float
     goal_type: GoalType
-    year: int
+    year: int  # first month the goal applies to
     month: int
     active: bool = True
-    
+    end_year: Optional[int] = None  # last month of a multi-month goal
+    end_month: Optional[int] = None
+    rolling_months: Optional[int] = None  # window length for rolling goals
+
+    def is_rolling(self) -> bool:
+        """Check if the goal is evaluated over a rolling window"""
+        return bool(self.rolling_months)
+
+    def is_multi_month(self) -> bool:
+        """Check if the goal spans more than a single month"""
+        return self.is_rolling() or self.end_year is not None
+
+    def get_start_index(self) -> int:
+        return month_index(self.year, self.month)
+
+    def get_end_index(self) -> Optional[int]:
+        """Last month index the goal applies to, or None for open-ended rolling goals"""
+        if self.end_year is not None and self.end_month is not None:
+            return month_index(self.end_year, self.end_month)
+        if self.is_rolling():
+            return None
+        return self.get_start_index()
+
+    def is_active_in(self, year: int, month: int) -> bool:
+        """Check if the goal applies to a specific month"""
+        index = month_index(year, month)
+        end = self.get_end_index()
+        return index >= self.get_start_index() and (end is None or index <= end)
+
+    def get_window(self, year: int, month: int) -> Tuple[int, int]:
+        """
+        Get the (start, end) month indexes the goal is measured over when viewed
+        from a specific month. Rolling goals use the window ending at that month.
+        """
+        if self.is_rolling():
+            end = month_index(year, month)
+            return (end - self.rolling_months + 1, end)
+
+        end = self.get_end_index()
+        return (self.get_start_index(), end)
+
     def to_dict(self):
-        return {
+        data = {
             "id": self.id,
             "name": self.name,
             "amount": self.amount,
@@ -29,6 +72,16 @@ class FinancialGoal:
             "active": self.active
         }
 
+        # Only write range fields for multi-month goals so single-month
+        # goals keep the original file format
+        if self.end_year is not None and self.end_month is not None:
+            data["end_year"] = self.end_year
+            data["end_month"] = self.end_month
+        if self.rolling_months:
+            data["rolling_months"] = self.rolling_months
+
+        return data
+
     @classmethod
     def from_dict(cls, data):
         return cls(
@@ -38,11 +91,15 @@ class FinancialGoal:
             goal_type=GoalType(data["goal_type"]),
             year=data["year"],
             month=data["month"],
-            active=data.get("active", True)
+            active=data.get("active", True),
+            end_year=data.get("end_year", None),
+            end_month=data.get("end_month", None),
+            rolling_months=data.get("rolling_months", None)
         )
-    
+
     @classmethod
-    def create_new(cls, name, amount, goal_type, year, month):
+    def create_new(cls, name, amount, goal_type, year, month,
+                   end_year=None, end_month=None, rolling_months=None):
         """Create a new goal with a unique ID"""
         return cls(
             id=str(uuid.uuid4()),
@@ -50,5 +107,8 @@ class FinancialGoal:
             amount=amount,
             goal_type=goal_type,
             year=year,
-            month=month
-        )
\ No newline at end of file
+            month=month,
+            end_year=end_year,
+            end_month=end_month,
+            rolling_months=rolling_months
+        )
@@ -1,23 +1,32 @@
+import copy
 import json
 import os
 import uuid
 from datetime import datetime
+from itertools import chain
 from typing import List, Dict, Optional, Tuple
 
 from .transaction import Transaction, TransactionType
+from .period import Month, month_index, month_from_index
+from .forecast_recurrence import ForecastRecurrence, month_key
+from .change_event import ChangeEvent, ChangeKind, ChangeNotifier, ChangeSource
+from .long_operation import CancellationToken, Operation, Progress, chunks, run_to_completion
 
 class ForecastTransaction(Transaction):
     """
     Extension of Transaction for forecast data.
     Includes additional fields for notes and actual transaction ID for linking.
+    Forecasts generated from a recurrence rule carry the rule's ID.
     """
     def __init__(self, id: str, name: str, amount: float, transaction_type: TransactionType,
                  date: datetime, category: str = None, notes: str = "", 
-                 actual_transaction_id: str = None, realized: bool = False):
+                 actual_transaction_id: str = None, realized: bool = False,
+                 rule_id: str = None):
         super().__init__(id, name, amount, transaction_type, date, category)
         self.notes = notes
         self.actual_transaction_id = actual_transaction_id
         self.realized = realized
+        self.rule_id = rule_id
         
     @classmethod
     def from_dict(cls, data):
@@ -26,6 +35,7 @@ class ForecastTransaction(Transaction):
         instance.notes = data.get("notes", "")
         instance.actual_transaction_id = data.get("actual_transaction_id", None)
         instance.realized = data.get("realized", False)
+        instance.rule_id = data.get("rule_id", None)
         return instance
     
     def to_dict(self):
@@ -35,15 +45,23 @@ class ForecastTransaction(Transaction):
         data["realized"] = getattr(self, "realized", False)
         if hasattr(self, "actual_transaction_id") and self.actual_transaction_id:
             data["actual_transaction_id"] = self.actual_transaction_id
+        if getattr(self, "rule_id", None):
+            data["rule_id"] = self.rule_id
         return data
 
-class ForecastManager:
+class ForecastManager(ChangeNotifier):
     """Manager for forecast transactions"""
     
-    def __init__(self, file_path="forecast_transactions.json"):
+    def __init__(self, file_path="forecast_transactions.json", rules_path="forecast_rules.json"):
+        super().__init__()
         self.file_path = file_path
+        self.rules_path = rules_path
         self.forecasts = []
+        self.rules = []
+        # Mutation counter so readers can tell when cached results are stale
+        self.data_version = 0
         self.load_data()
+        self.load_rules()
     
     def load_data(self):
         """Load forecast transactions from JSON file"""
@@ -57,12 +75,34 @@ class ForecastManager:
                 self.forecasts = []
         else:
             self.forecasts = []
+        self.data_version += 1
+        self.notify(ChangeEvent(ChangeSource.FORECASTS, ChangeKind.RELOADED))
+    
+    def load_rules(self):
+        """Load forecast recurrence rules from JSON file"""
+        if os.path.exists(self.rules_path):
+            try:
+                with open(self.rules_path, 'r', encoding='utf-8') as file:
+                    data = json.load(file)
+                    self.rules = [ForecastRecurrence.from_dict(item) for item in data]
+            except (json.JSONDecodeError, KeyError) as e:
+                print(f"Error loading forecast rules: {e}")
+                self.rules = []
+        else:
+            self.rules = []
+        self.data_version += 1
+        self.notify(ChangeEvent(ChangeSource.FORECASTS, ChangeKind.RELOADED))
     
     def save_data(self):
         """Save forecast transactions to JSON file"""
         with open(self.file_path, 'w', encoding='utf-8') as file:
             json.dump([t.to_dict() for t in self.forecasts], file, indent=2, ensure_ascii=False)
     
+    def save_rules(self):
+        """Save forecast recurrence rules to JSON file"""
+        with open(self.rules_path, 'w', encoding='utf-8') as file:
+            json.dump([r.to_dict() for r in self.rules], file, indent=2, ensure_ascii=False)
+    
     def add_forecast(self, name: str, amount: float, 
                     category_name: str, category_type: TransactionType, 
                     date: datetime, notes: str = "") -> ForecastTransaction:
@@ -79,57 +119,272 @@ class ForecastManager:
         })
         
         self.forecasts.append(forecast)
+        self.data_version += 1
         self.save_data()
+        self.notify(ChangeEvent.for_items(ChangeSource.FORECASTS, ChangeKind.ADDED, [forecast]))
         return forecast
     
     def remove_forecast(self, forecast_id: str) -> bool:
-        """Remove a forecast transaction by ID"""
+        """Remove a forecast transaction by ID, including a single occurrence of a rule"""
         for i, forecast in enumerate(self.forecasts):
             if forecast.id == forecast_id:
                 del self.forecasts[i]
+                if forecast.rule_id:
+                    # Keep the rule from generating this month again
+                    self._skip_occurrence(forecast_id)
+                self.data_version += 1
                 self.save_data()
+                self.notify(ChangeEvent.for_items(ChangeSource.FORECASTS, ChangeKind.REMOVED, [forecast]))
                 return True
+        
+        occurrence = self._get_occurrence(forecast_id)
+        if self._skip_occurrence(forecast_id):
+            self.data_version += 1
+            if occurrence is not None:
+                self.notify(ChangeEvent.for_items(ChangeSource.FORECASTS, ChangeKind.REMOVED, [occurrence]))
+            else:
+                self.notify(ChangeEvent(ChangeSource.FORECASTS, ChangeKind.REMOVED, ids=(forecast_id,)))
+            return True
         return False
     
     def update_forecast(self, forecast_id: str, name: str = None, amount: float = None,
                        category_name: str = None, category_type: TransactionType = None,
                        date: datetime = None, notes: str = None) -> bool:
         """Update an existing forecast transaction"""
-        for forecast in self.forecasts:
-            if forecast.id == forecast_id:
-                if name is not None:
-                    forecast.name = name
-                if amount is not None:
-                    forecast.amount = amount
-                if category_name is not None:
-                    forecast.category = category_name
-                if category_type is not None:
-                    forecast.transaction_type = category_type
-                if date is not None:
-                    forecast.date = date
-                if notes is not None:
-                    forecast.notes = notes
-                self.save_data()
-                return True
-        return False
+        forecast = self._find_forecast(forecast_id, materialize=True)
+        if forecast is None:
+            return False
+        
+        before = copy.copy(forecast)
+        changes = {"name": name, "amount": amount, "category": category_name,
+                   "transaction_type": category_type, "date": date, "notes": notes}
+        if name is not None:
+            forecast.name = name
+        if amount is not None:
+            forecast.amount = amount
+        if category_name is not None:
+            forecast.category = category_name
+        if category_type is not None:
+            forecast.transaction_type = category_type
+        if date is not None:
+            forecast.date = date
+        if notes is not None:
+            forecast.notes = notes
+        self.data_version += 1
+        self.save_data()
+        self.notify(ChangeEvent.for_items(ChangeSource.FORECASTS, ChangeKind.UPDATED, [before, forecast],
+                                          fields=(k for k, v in changes.items() if v is not None)))
+        return True
     
     def link_to_actual(self, forecast_id: str, actual_id: str) -> bool:
         """Link a forecast transaction to its actual transaction"""
-        for forecast in self.forecasts:
-            if forecast.id == forecast_id:
-                forecast.actual_transaction_id = actual_id
-                self.save_data()
-                return True
-        return False
+        forecast = self._find_forecast(forecast_id, materialize=True)
+        if forecast is None:
+            return False
+        
+        forecast.actual_transaction_id = actual_id
+        self.data_version += 1
+        self.save_data()
+        self.notify(ChangeEvent.for_items(ChangeSource.FORECASTS, ChangeKind.UPDATED, [forecast],
+                                          fields=("actual_transaction_id",)))
+        return True
     
     def get_forecasts_by_month(self, year: int, month: int) -> List[ForecastTransaction]:
-        """Get all forecasts for a specific month and year"""
-        return [f for f in self.forecasts 
-                if f.date.year == year and f.date.month == month]
+        """Get all forecasts for a specific month and year, including rule occurrences"""
+        forecasts = [f for f in self.forecasts 
+                     if f.date.year == year and f.date.month == month]
+        index = month_index(year, month)
+        forecasts.extend(self._expand_rules(index, index))
+        return forecasts
     
     def get_all_forecasts(self) -> List[ForecastTransaction]:
-        """Get all forecast transactions"""
-        return self.forecasts
+        """
+        Get all forecast transactions.
+        Occurrences of open-ended rules are not included since they never end;
+        query them per month with get_forecasts_by_month.
+        """
+        forecasts = list(self.forecasts)
+        for rule in self.rules:
+            if rule.is_bounded():
+                forecasts.extend(self._expand_rule(
+                    rule, month_index(rule.start.year, rule.start.month), rule.get_last_index()))
+        return forecasts
+    
+    # Recurrence rule methods
+    
+    def add_recurring_forecast(self, name: str, amount: float, 
+                               category_name: str, category_type: TransactionType,
+                               start: datetime, installments: int = None,
+                               end_date: datetime = None, interval_months: int = 1,
+                               amount_schedule: List[List] = None,
+                               notes: str = "") -> ForecastRecurrence:
+        """Add a recurrence rule that generates a forecast every interval_months"""
+        rule = ForecastRecurrence.create_new(
+            name=name,
+            amount=amount,
+            transaction_type=category_type,
+            start=start,
+            category=category_name,
+            notes=notes,
+            interval_months=interval_months,
+            installments=installments,
+            end_date=end_date,
+            amount_schedule=amount_schedule
+        )
+        
+        self.rules.append(rule)
+        self.data_version += 1
+        self.save_rules()
+        self.notify(self._rule_change(ChangeKind.ADDED, rule))
+        return rule
+    
+    def remove_recurring_forecast(self, rule_id: str) -> bool:
+        """
+        Remove a recurrence rule. Occurrences that were already materialized
+        (realized or edited individually) are kept as regular forecasts.
+        """
+        for i, rule in enumerate(self.rules):
+            if rule.id == rule_id:
+                del self.rules[i]
+                self.data_version += 1
+                self.save_rules()
+                self.notify(self._rule_change(ChangeKind.REMOVED, rule))
+                return True
+        return False
+    
+    def get_all_rules(self) -> List[ForecastRecurrence]:
+        """Get all forecast recurrence rules"""
+        return self.rules
+    
+    def _get_rule(self, rule_id: str) -> Optional[ForecastRecurrence]:
+        return next((r for r in self.rules if r.id == rule_id), None)
+    
+    def _make_occurrence(self, rule: ForecastRecurrence, occurrence: int,
+                         year: int, month: int) -> ForecastTransaction:
+        """Build the forecast a rule generates for one month"""
+        return ForecastTransaction(
+            id=rule.get_virtual_id(year, month),
+            name=rule.name,
+            amount=rule.get_amount(occurrence),
+            transaction_type=rule.transaction_type,
+            date=rule.get_occurrence_date(year, month),
+            category=rule.category,
+            notes=rule.notes,
+            rule_id=rule.id
+        )
+    
+    def _expand_rule(self, rule: ForecastRecurrence, start_index: int,
+                     end_index: int) -> List[ForecastTransaction]:
+        """Expand one rule into virtual forecasts for a month index range"""
+        occurrences = []
+        for occurrence, index in rule.iter_occurrences(start_index, end_index):
+            year, month = month_from_index(index)
+            key = month_key(year, month)
+            # Materialized months are stored forecasts; skipped ones were deleted
+            if key in rule.materialized or key in rule.skipped:
+                continue
+            occurrences.append(self._make_occurrence(rule, occurrence, year, month))
+        return occurrences
+    
+    def _expand_rules(self, start_index: int, end_index: int) -> List[ForecastTransaction]:
+        """Expand every rule into virtual forecasts for a month index range"""
+        occurrences = []
+        for rule in self.rules:
+            occurrences.extend(self._expand_rule(rule, start_index, end_index))
+        return occurrences
+    
+    def _rule_change(self, kind: ChangeKind, rule: ForecastRecurrence) -> ChangeEvent:
+        """Describe a change of a whole rule; an open-ended rule can touch any month"""
+        months = None
+        if rule.is_bounded():
+            months = frozenset(month_from_index(index) for _, index in rule.iter_occurrences(
+                month_index(rule.start.year, rule.start.month), rule.get_last_index()))
+        return ChangeEvent(ChangeSource.FORECASTS, kind, ids=(rule.id,), months=months,
+                           categories=frozenset([rule.category] if rule.category else []),
+                           types=frozenset([rule.transaction_type]))
+    
+    def _get_occurrence(self, forecast_id: str) -> Optional[ForecastTransaction]:
+        """Build the virtual forecast a rule occurrence ID refers to, without storing it"""
+        parsed = self._parse_virtual_id(forecast_id)
+        if parsed is None:
+            return None
+        
+        rule, year, month = parsed
+        index = month_index(year, month)
+        for occurrence, _ in rule.iter_occurrences(index, index):
+            return self._make_occurrence(rule, occurrence, year, month)
+        return None
+    
+    def _parse_virtual_id(self, forecast_id: str):
+        """Split a rule occurrence ID into (rule, year, month), or None if it is not one"""
+        rule_id, _, key = forecast_id.partition(":")
+        rule = self._get_rule(rule_id) if key else None
+        if rule is None:
+            return None
+        try:
+            year, month = (int(part) for part in key.split("-"))
+        except ValueError:
+            return None
+        return rule, year, month
+    
+    def _find_forecast(self, forecast_id: str, materialize: bool = False,
+                       save: bool = True) -> Optional[ForecastTransaction]:
+        """
+        Find a stored forecast by ID. With materialize=True a virtual rule
+        occurrence is turned into a stored forecast so it can be changed
+        individually; with save=False the caller saves the rules afterwards.
+        """
+        for forecast in self.forecasts:
+            if forecast.id == forecast_id:
+                return forecast
+        
+        parsed = self._parse_virtual_id(forecast_id) if materialize else None
+        if parsed is None:
+            return None
+        
+        rule, year, month = parsed
+        key = month_key(year, month)
+        if key in rule.materialized or key in rule.skipped:
+            return None
+        
+        index = month_index(year, month)
+        for occurrence, _ in rule.iter_occurrences(index, index):
+            forecast = self._make_occurrence(rule, occurrence, year, month)
+            self.forecasts.append(forecast)
+            rule.materialized.append(key)
+            if save:
+                self.save_rules()
+            return forecast
+        return None
+    
+    def _skip_occurrence(self, forecast_id: str) -> bool:
+        """Stop a rule from generating the month referred to by forecast_id"""
+        parsed = self._parse_virtual_id(forecast_id)
+        if parsed is None:
+            return False
+        
+        rule, year, month = parsed
+        key = month_key(year, month)
+        if key in rule.skipped:
+            return False
+        if key in rule.materialized:
+            rule.materialized.remove(key)
+        rule.skipped.append(key)
+        self.save_rules()
+        return True
+    
+    def snapshot(self) -> "ForecastManager":
+        """
+        Get a read-only copy of the current forecasts and rules that another
+        thread can read while this manager keeps changing. Never save a snapshot.
+        """
+        snapshot = copy.copy(self)
+        # Forecasts and rules are edited in place (realized flags, skipped months)
+        snapshot.forecasts = [copy.copy(forecast) for forecast in self.forecasts]
+        snapshot.rules = [copy.deepcopy(rule) for rule in self.rules]
+        # Subscribers belong to the live manager
+        snapshot._subscribers = []
+        return snapshot
     
     def get_monthly_summary(self, year: int, month: int) -> Dict:
         """Get summary of forecast income, expenses and net worth for a month"""
@@ -178,11 +433,16 @@ class ForecastManager:
         # Find forecasts for the same month/year
         forecasts = self.get_forecasts_by_month(transaction.date.year, transaction.date.month)
         
+        return self._closest_forecast(transaction, forecasts)
+    
+    def _closest_forecast(self, transaction: Transaction, forecasts: List[ForecastTransaction],
+                          taken=frozenset()) -> Optional[ForecastTransaction]:
+        """Pick the forecast a transaction realizes, skipping the IDs in taken"""
         # Look for a match on category and transaction type
         matches = []
         for forecast in forecasts:
             # Skip already realized forecasts
-            if getattr(forecast, "realized", False):
+            if getattr(forecast, "realized", False) or forecast.id in taken:
                 continue
                 
             # Check if the category and type match
@@ -202,29 +462,100 @@ class ForecastManager:
             
         return None
     
+    def match_forecasts(self, transactions: List[Transaction]) -> List[Tuple[str, str]]:
+        """
+        Find the forecast each of many new transactions realizes, in one pass:
+        the forecasts of each month are listed once, and a forecast is matched
+        to at most one transaction. Returns (forecast_id, transaction_id) pairs.
+        """
+        return run_to_completion(self.iter_match_forecasts(transactions))
+    
+    def iter_match_forecasts(self, transactions: List[Transaction],
+                             token: Optional[CancellationToken] = None,
+                             forecasts_by_month: Dict = None) -> Operation:
+        """
+        match_forecasts as a long operation (see models.long_operation); it
+        changes nothing. The forecasts listed per month, rule occurrences
+        included, are left in forecasts_by_month if it is given.
+        """
+        if forecasts_by_month is None:
+            forecasts_by_month = {}
+        taken = set()
+        matches = []
+        for start, chunk in chunks(transactions, token):
+            for transaction in chunk:
+                month = (transaction.date.year, transaction.date.month)
+                if month not in forecasts_by_month:
+                    forecasts_by_month[month] = self.get_forecasts_by_month(*month)
+                
+                forecast = self._closest_forecast(transaction, forecasts_by_month[month], taken)
+                if forecast is not None:
+                    taken.add(forecast.id)
+                    matches.append((forecast.id, transaction.id))
+            yield Progress(start + len(chunk), len(transactions), "Matching forecasts")
+        return matches
+    
+    def mark_forecasts_realized(self, matches: List[Tuple[str, str]]) -> int:
+        """Mark many forecasts realized, given (forecast_id, transaction_id) pairs, with one save"""
+        forecasts = []
+        # Materialized rule occurrences are appended to the stored forecasts
+        stored = len(self.forecasts)
+        for forecast_id, transaction_id in matches:
+            forecast = self._find_forecast(forecast_id, materialize=True, save=False)
+            if forecast is None:
+                continue
+            forecast.actual_transaction_id = transaction_id
+            forecast.realized = True
+            forecasts.append(forecast)
+        
+        if len(self.forecasts) != stored:
+            self.save_rules()
+        if forecasts:
+            self.data_version += 1
+            self.save_data()
+            self.notify(ChangeEvent.for_items(ChangeSource.FORECASTS, ChangeKind.UPDATED, forecasts,
+                                              fields=("actual_transaction_id", "realized")))
+        return len(forecasts)
+    
     def mark_forecast_realized(self, forecast_id: str, transaction_id: str) -> bool:
         """Mark a forecast as realized with a specific transaction"""
-        for forecast in self.forecasts:
-            if forecast.id == forecast_id:
-                forecast.actual_transaction_id = transaction_id
-                forecast.realized = True
-                self.save_data()
-                return True
-        return False
+        forecast = self._find_forecast(forecast_id, materialize=True)
+        if forecast is None:
+            return False
+        
+        forecast.actual_transaction_id = transaction_id
+        forecast.realized = True
+        self.data_version += 1
+        self.save_data()
+        self.notify(ChangeEvent.for_items(ChangeSource.FORECASTS, ChangeKind.UPDATED, [forecast],
+                                          fields=("actual_transaction_id", "realized")))
+        return True
     
     def link_to_actual(self, forecast_id: str, actual_id: str) -> bool:
         """Link a forecast transaction to its actual transaction"""
-        for forecast in self.forecasts:
-            if forecast.id == forecast_id:
-                forecast.actual_transaction_id = actual_id
-                forecast.realized = True
-                self.save_data()
-                return True
-        return False
+        forecast = self._find_forecast(forecast_id, materialize=True)
+        if forecast is None:
+            return False
+        
+        forecast.actual_transaction_id = actual_id
+        forecast.realized = True
+        self.data_version += 1
+        self.save_data()
+        self.notify(ChangeEvent.for_items(ChangeSource.FORECASTS, ChangeKind.UPDATED, [forecast],
+                                          fields=("actual_transaction_id", "realized")))
+        return True
     
     def create_forecast_from_transaction(self, transaction: Transaction) -> ForecastTransaction:
         """Create a new forecast based on an existing transaction"""
-        forecast = ForecastTransaction.from_dict({
+        forecast = self._forecast_from_transaction(transaction)
+        self.forecasts.append(forecast)
+        self.data_version += 1
+        self.save_data()
+        self.notify(ChangeEvent.for_items(ChangeSource.FORECASTS, ChangeKind.ADDED, [forecast]))
+        return forecast
+    
+    def _forecast_from_transaction(self, transaction: Transaction) -> ForecastTransaction:
+        return ForecastTransaction.from_dict({
             "id": str(uuid.uuid4()),
             "name": f"[Forecast] {transaction.name}",
             "amount": transaction.amount,
@@ -233,34 +564,62 @@ class ForecastManager:
             "date": transaction.date.isoformat(),
             "notes": f"Created from transaction {transaction.id}"
         })
-        
-        self.forecasts.append(forecast)
-        self.save_data()
-        return forecast
     
     def bulk_convert_to_forecasts(self, transactions: List[Transaction]) -> int:
         """Convert a list of transactions to forecasts and return the count"""
-        count = 0
-        for transaction in transactions:
-            self.create_forecast_from_transaction(transaction)
-            count += 1
-        return count
+        return run_to_completion(self.iter_bulk_convert_to_forecasts(transactions))
+    
+    def iter_bulk_convert_to_forecasts(self, transactions: List[Transaction],
+                                       token: Optional[CancellationToken] = None) -> Operation:
+        """
+        bulk_convert_to_forecasts as a long operation (see models.long_operation):
+        the forecasts are created in chunks, then added with one save and one
+        change event
+        """
+        forecasts = []
+        for start, chunk in chunks(transactions, token):
+            forecasts.extend(self._forecast_from_transaction(transaction) for transaction in chunk)
+            yield Progress(start + len(chunk), len(transactions), "Creating forecasts")
+        if not forecasts:
+            return 0
+        
+        yield Progress(len(transactions), len(transactions), "Saving forecasts")
+        # Last chance to cancel; nothing has been changed yet
+        if token is not None:
+            token.raise_if_cancelled()
+        self.forecasts.extend(forecasts)
+        self.data_version += 1
+        self.save_data()
+        self.notify(ChangeEvent.for_items(ChangeSource.FORECASTS, ChangeKind.ADDED, forecasts))
+        return len(forecasts)
     
     def check_realization_against_actual(self, actual_transactions: List[Transaction]) -> Tuple[int, int]:
         """
         Check which forecasts have been realized by actual transactions
-        Returns a tuple of (matched_count, total_forecasts)
+        Returns a tuple of (matched_count, unrealized_count)
         """
-        unrealized_forecasts = [f for f in self.forecasts if not getattr(f, "realized", False)]
-        
-        matched_count = 0
-        for transaction in actual_transactions:
-            matching_forecast = self.find_matching_forecast(transaction)
-            if matching_forecast:
-                self.mark_forecast_realized(matching_forecast.id, transaction.id)
-                matched_count += 1
-                
-        return (matched_count, len(unrealized_forecasts))
+        return run_to_completion(self.iter_check_realization(actual_transactions))
+    
+    def iter_check_realization(self, actual_transactions: List[Transaction],
+                               token: Optional[CancellationToken] = None) -> Operation:
+        """
+        check_realization_against_actual as a long operation (see
+        models.long_operation): the transactions are matched in chunks and the
+        realized forecasts are marked with one save. The total counts the
+        unrealized forecasts of the transactions' months that matching looked
+        at, rule occurrences included.
+        """
+        forecasts_by_month = {}
+        matches = yield from self.iter_match_forecasts(actual_transactions, token, forecasts_by_month)
+        # Counted before marking, which realizes some of them
+        unrealized_count = sum(1 for forecasts in forecasts_by_month.values() for f in forecasts
+                               if not getattr(f, "realized", False))
+        # Last chance to cancel; nothing has been changed yet
+        if token is not None:
+            token.raise_if_cancelled()
+        matched_count = self.mark_forecasts_realized(matches) if matches else 0
+        
+        return (matched_count, unrealized_count)
     
     def get_monthly_forecast_summary(self, year: int, month: int) -> Dict:
         """Alias for get_monthly_summary"""
@@ -378,109 +737,142 @@ class ForecastManager:
     
     def compare_with_actual(self, finance_manager, year: int, month: int) -> Dict:
         """Compare forecast data with actual data for a specific month"""
-        # Get forecast and actual summaries
-        forecast_summary = self.get_monthly_summary(year, month)
-        actual_summary = finance_manager.get_monthly_summary(year, month)
-        
-        # Get category summaries
-        forecast_categories = self.get_category_summary(year, month)
-        
-        # Get actual transactions for the month
-        actual_transactions = finance_manager.get_transactions_by_month(year, month)
-        
-        # Group actual transactions by category
-        actual_income_categories = {}
-        actual_expense_categories = {}
-        
-        for transaction in actual_transactions:
-            category = transaction.category
-            if transaction.transaction_type == TransactionType.INCOME:
-                if category in actual_income_categories:
-                    actual_income_categories[category] += transaction.amount
-                else:
-                    actual_income_categories[category] = transaction.amount
-            else:
-                if category in actual_expense_categories:
-                    actual_expense_categories[category] += transaction.amount
-                else:
-                    actual_expense_categories[category] = transaction.amount
-        
-        # Calculate variances
-        income_variance = actual_summary["total_income"] - forecast_summary["total_income"]
-        income_variance_pct = (income_variance / forecast_summary["total_income"] * 100) if forecast_summary["total_income"] > 0 else 0
-        
-        expense_variance = actual_summary["total_expenses"] - forecast_summary["total_expenses"]
-        expense_variance_pct = (expense_variance / forecast_summary["total_expenses"] * 100) if forecast_summary["total_expenses"] > 0 else 0
-        
-        net_variance = actual_summary["net_worth"] - forecast_summary["net_worth"]
-        net_variance_pct = (net_variance / abs(forecast_summary["net_worth"]) * 100) if forecast_summary["net_worth"] != 0 else 0
+        comparison_range = self.compare_range(finance_manager, (year, month), (year, month))
+        return comparison_for_month(comparison_range, 0)
+    
+    def compare_range(self, finance_manager, start_month: Month, end_month: Month) -> Dict:
+        """
+        Compare forecast data with actual data for every month from start_month
+        to end_month (inclusive) in a single pass over both ledgers.
+        Returns per-month arrays aligned with the "months" list.
+        """
+        start = month_index(*start_month)
+        span = max(0, month_index(*end_month) - start + 1)
         
-        # Calculate category variances
-        income_category_variances = {}
-        for category, forecast_amount in forecast_categories["income_categories"].items():
-            actual_amount = actual_income_categories.get(category, 0)
-            variance = actual_amount - forecast_amount
-            variance_pct = (variance / forecast_amount * 100) if forecast_amount > 0 else 0
-            income_category_variances[category] = {
-                "forecast": forecast_amount,
-                "actual": actual_amount,
-                "variance": variance,
-                "variance_pct": variance_pct
-            }
+        actual_buckets = new_month_buckets(span)
+        for transaction in finance_manager.get_all_transactions():
+            add_to_month_buckets(actual_buckets,
+                                 month_index(transaction.date.year, transaction.date.month) - start,
+                                 transaction)
         
-        # Add actual categories not in forecast
-        for category, amount in actual_income_categories.items():
-            if category not in income_category_variances:
-                income_category_variances[category] = {
-                    "forecast": 0,
-                    "actual": amount,
-                    "variance": amount,
-                    "variance_pct": 100
-                }
-        
-        expense_category_variances = {}
-        for category, forecast_amount in forecast_categories["expense_categories"].items():
-            actual_amount = actual_expense_categories.get(category, 0)
-            variance = actual_amount - forecast_amount
-            variance_pct = (variance / forecast_amount * 100) if forecast_amount > 0 else 0
-            expense_category_variances[category] = {
-                "forecast": forecast_amount,
-                "actual": actual_amount,
-                "variance": variance,
-                "variance_pct": variance_pct
+        return build_range_comparison(start, self.bucket_forecasts(start, span), actual_buckets)
+    
+    def bucket_forecasts(self, start_index: int, span: int) -> Dict:
+        """Sum forecasts into per-month buckets for span months from start_index"""
+        buckets = new_month_buckets(span)
+        
+        # Stored forecasts plus the rule occurrences that fall inside the range
+        for forecast in chain(self.forecasts, self._expand_rules(start_index, start_index + span - 1)):
+            add_to_month_buckets(buckets,
+                                 month_index(forecast.date.year, forecast.date.month) - start_index,
+                                 forecast)
+        return buckets
+
+
+def new_month_buckets(span: int) -> Dict:
+    """Create empty per-month income/expense totals and category buckets"""
+    return {
+        "income": [0] * span,
+        "expenses": [0] * span,
+        "income_categories": [{} for _ in range(span)],
+        "expense_categories": [{} for _ in range(span)]
+    }
+
+
+def add_to_month_buckets(buckets: Dict, offset: int, transaction: Transaction):
+    """Add a transaction to the bucket at offset, ignoring offsets outside the range"""
+    if offset < 0 or offset >= len(buckets["income"]):
+        return
+    category = transaction.category
+    if transaction.transaction_type == TransactionType.INCOME:
+        buckets["income"][offset] += transaction.amount
+        categories = buckets["income_categories"][offset]
+    else:
+        buckets["expenses"][offset] += transaction.amount
+        categories = buckets["expense_categories"][offset]
+    categories[category] = categories.get(category, 0) + transaction.amount
+
+
+def build_range_comparison(start_index: int, forecast_buckets: Dict, actual_buckets: Dict) -> Dict:
+    """Combine forecast and actual month buckets into a compare_range result"""
+    span = len(forecast_buckets["income"])
+    forecast_net = [i - e for i, e in zip(forecast_buckets["income"], forecast_buckets["expenses"])]
+    actual_net = [i - e for i, e in zip(actual_buckets["income"], actual_buckets["expenses"])]
+    
+    return {
+        "months": [month_from_index(start_index + offset) for offset in range(span)],
+        "summary": {
+            "income": _variance_series(forecast_buckets["income"], actual_buckets["income"]),
+            "expenses": _variance_series(forecast_buckets["expenses"], actual_buckets["expenses"]),
+            "net_worth": _variance_series(forecast_net, actual_net, signed=True)
+        },
+        "income_categories": [
+            _category_variances(forecast_cats, actual_cats)
+            for forecast_cats, actual_cats in zip(forecast_buckets["income_categories"],
+                                                  actual_buckets["income_categories"])
+        ],
+        "expense_categories": [
+            _category_variances(forecast_cats, actual_cats)
+            for forecast_cats, actual_cats in zip(forecast_buckets["expense_categories"],
+                                                  actual_buckets["expense_categories"])
+        ]
+    }
+
+
+def _variance_series(forecast: List[float], actual: List[float], signed: bool = False) -> Dict:
+    """Build forecast/actual/variance arrays for one summary line"""
+    variance = [a - f for f, a in zip(forecast, actual)]
+    if signed:
+        # Net worth can be negative, so compare against its magnitude
+        variance_pct = [(v / abs(f) * 100) if f != 0 else 0 for f, v in zip(forecast, variance)]
+    else:
+        variance_pct = [(v / f * 100) if f > 0 else 0 for f, v in zip(forecast, variance)]
+    
+    return {
+        "forecast": forecast,
+        "actual": actual,
+        "variance": variance,
+        "variance_pct": variance_pct
+    }
+
+
+def _category_variances(forecast_categories: Dict, actual_categories: Dict) -> Dict:
+    """Calculate category variances for a single month"""
+    variances = {}
+    for category, forecast_amount in forecast_categories.items():
+        actual_amount = actual_categories.get(category, 0)
+        variance = actual_amount - forecast_amount
+        variances[category] = {
+            "forecast": forecast_amount,
+            "actual": actual_amount,
+            "variance": variance,
+            "variance_pct": (variance / forecast_amount * 100) if forecast_amount > 0 else 0
+        }
+    
+    # Add actual categories not in forecast
+    for category, amount in actual_categories.items():
+        if category not in variances:
+            variances[category] = {
+                "forecast": 0,
+                "actual": amount,
+                "variance": amount,
+                "variance_pct": 100
             }
-        
-        # Add actual expense categories not in forecast
-        for category, amount in actual_expense_categories.items():
-            if category not in expense_category_variances:
-                expense_category_variances[category] = {
-                    "forecast": 0,
-                    "actual": amount,
-                    "variance": amount,
-                    "variance_pct": 100
-                }
-        
-        return {
-            "summary": {
-                "income": {
-                    "forecast": forecast_summary["total_income"],
-                    "actual": actual_summary["total_income"],
-                    "variance": income_variance,
-                    "variance_pct": income_variance_pct
-                },
-                "expenses": {
-                    "forecast": forecast_summary["total_expenses"],
-                    "actual": actual_summary["total_expenses"],
-                    "variance": expense_variance,
-                    "variance_pct": expense_variance_pct
-                },
-                "net_worth": {
-                    "forecast": forecast_summary["net_worth"],
-                    "actual": actual_summary["net_worth"],
-                    "variance": net_variance,
-                    "variance_pct": net_variance_pct
-                }
-            },
-            "income_categories": income_category_variances,
-            "expense_categories": expense_category_variances
-        }
\ No newline at end of file
+    
+    return variances
+
+
+def comparison_for_month(comparison_range: Dict, position: int) -> Dict:
+    """
+    Extract a single month from a compare_range result in the same shape
+    as ForecastManager.compare_with_actual
+    """
+    summary = {}
+    for key, series in comparison_range["summary"].items():
+        summary[key] = {field: values[position] for field, values in series.items()}
+    
+    return {
+        "summary": summary,
+        "income_categories": comparison_range["income_categories"][position],
+        "expense_categories": comparison_range["expense_categories"][position]
+    }
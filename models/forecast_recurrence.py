@@ -0,0 +1,141 @@
+import calendar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+import uuid
+
+from .transaction import TransactionType
+from .period import month_index
+
+
+def month_key(year: int, month: int) -> str:
+    """Key used to refer to a single occurrence month of a rule"""
+    return f"{year:04d}-{month:02d}"
+
+
+@dataclass
+class ForecastRecurrence:
+    """
+    Rule describing a repeating forecast (e.g. a loan installment).
+    Occurrences are expanded on demand instead of being stored one per month.
+    """
+    id: str  # UUID
+    name: str
+    amount: float
+    transaction_type: TransactionType
+    # Date of the first occurrence; later ones fall on the same day of their
+    # month (or its last day), while the occurrence arithmetic uses the month only
+    start: datetime
+    category: str = None
+    notes: str = ""
+    interval_months: int = 1  # 1 = monthly
+    installments: Optional[int] = None  # number of occurrences, None = unlimited
+    end_date: Optional[datetime] = None  # last month an occurrence may fall in
+    # Amount changes as [occurrence_number, amount] steps, applied from that occurrence on
+    amount_schedule: List[List] = field(default_factory=list)
+    # Occurrence months stored as regular forecasts (realized or edited individually)
+    materialized: List[str] = field(default_factory=list)
+    # Occurrence months removed individually
+    skipped: List[str] = field(default_factory=list)
+
+    def is_bounded(self) -> bool:
+        """Check if the rule has a last occurrence"""
+        return self.installments is not None or self.end_date is not None
+
+    def get_last_index(self) -> Optional[int]:
+        """Month index of the last possible occurrence, or None if unbounded"""
+        last = None
+        if self.installments is not None:
+            last = month_index(self.start.year, self.start.month) + \
+                (self.installments - 1) * self.interval_months
+        if self.end_date is not None:
+            end = month_index(self.end_date.year, self.end_date.month)
+            last = end if last is None else min(last, end)
+        return last
+
+    def get_amount(self, occurrence: int) -> float:
+        """Get the amount for an occurrence number (0-based) from the schedule"""
+        amount = self.amount
+        for start_occurrence, scheduled_amount in sorted(self.amount_schedule):
+            if start_occurrence <= occurrence:
+                amount = scheduled_amount
+            else:
+                break
+        return amount
+
+    def iter_occurrences(self, start_index: int, end_index: int) -> Iterator[Tuple[int, int]]:
+        """Yield (occurrence number, month index) for occurrences within a month range"""
+        first = month_index(self.start.year, self.start.month)
+        last = self.get_last_index()
+        if last is not None:
+            end_index = min(end_index, last)
+
+        # Jump straight to the first occurrence inside the range
+        occurrence = max(0, -(-(start_index - first) // self.interval_months))
+        index = first + occurrence * self.interval_months
+        while index <= end_index:
+            yield occurrence, index
+            occurrence += 1
+            index += self.interval_months
+
+    def get_occurrence_date(self, year: int, month: int) -> datetime:
+        """Date of the occurrence in a month: the start's day, clamped to the month's length"""
+        return datetime(year, month, min(self.start.day, calendar.monthrange(year, month)[1]))
+
+    def get_virtual_id(self, year: int, month: int) -> str:
+        """Stable ID of the forecast generated for a given month"""
+        return f"{self.id}:{month_key(year, month)}"
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "amount": self.amount,
+            "transaction_type": self.transaction_type.value,
+            "start": self.start.isoformat(),
+            "category": self.category,
+            "notes": self.notes,
+            "interval_months": self.interval_months,
+            "installments": self.installments,
+            "end_date": self.end_date.isoformat() if self.end_date else None,
+            "amount_schedule": self.amount_schedule,
+            "materialized": self.materialized,
+            "skipped": self.skipped
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        end_date = data.get("end_date", None)
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            amount=data["amount"],
+            transaction_type=TransactionType(data["transaction_type"]),
+            start=datetime.fromisoformat(data["start"]),
+            category=data.get("category", None),
+            notes=data.get("notes", ""),
+            interval_months=data.get("interval_months", 1),
+            installments=data.get("installments", None),
+            end_date=datetime.fromisoformat(end_date) if end_date else None,
+            amount_schedule=data.get("amount_schedule", []),
+            materialized=data.get("materialized", []),
+            skipped=data.get("skipped", [])
+        )
+
+    @classmethod
+    def create_new(cls, name, amount, transaction_type, start, category=None, notes="",
+                   interval_months=1, installments=None, end_date=None, amount_schedule=None):
+        """Create a new recurrence rule with a unique ID"""
+        return cls(
+            id=str(uuid.uuid4()),
+            name=name,
+            amount=amount,
+            transaction_type=transaction_type,
+            start=datetime(start.year, start.month, start.day),
+            category=category,
+            notes=notes,
+            interval_months=interval_months,
+            installments=installments,
+            end_date=end_date,
+            amount_schedule=amount_schedule or []
+        )
@@ -0,0 +1,69 @@
+import threading
+from dataclasses import dataclass
+from typing import Generator, Iterator, Optional, Sequence, Tuple
+
+# Items a long operation processes between progress reports and cancellation checks
+CHUNK_SIZE = 500
+
+
+class OperationCancelled(Exception):
+    """Raised inside a long operation when its token is cancelled"""
+
+
+class CancellationToken:
+    """
+    Asks a long operation to stop. The operation checks the token between
+    chunks of work, so it can be cancelled from the GUI thread whether the
+    work runs there in chunks or on a worker thread.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise OperationCancelled()
+
+
+@dataclass
+class Progress:
+    """Progress of a long operation; total is 0 when the amount of work is unknown"""
+    done: int
+    total: int
+    message: str = ""
+
+    @property
+    def fraction(self) -> Optional[float]:
+        return min(1.0, self.done / self.total) if self.total else None
+
+
+# A long operation is a generator that yields Progress between chunks of work
+# and returns its result. It checks its token (if any) before each chunk and
+# raises OperationCancelled before changing any data, so a cancelled operation
+# leaves the managers as they were.
+Operation = Generator[Progress, None, object]
+
+
+def chunks(items: Sequence, token: Optional[CancellationToken] = None,
+           size: int = CHUNK_SIZE) -> Iterator[Tuple[int, Sequence]]:
+    """Split items into (start, chunk) pairs, checking the token before each chunk"""
+    for start in range(0, len(items), size):
+        if token is not None:
+            token.raise_if_cancelled()
+        yield start, items[start:start + size]
+
+
+def run_to_completion(operation: Operation):
+    """Run a long operation without yielding to anything and return its result"""
+    while True:
+        try:
+            next(operation)
+        except StopIteration as stop:
+            return stop.value
+
@@ -0,0 +1,57 @@
+from typing import Iterable, Tuple
+
+from .transaction import Transaction, TransactionType
+from .period import month_index
+
+
+class MonthlyAggregate:
+    """
+    Per-month income and expense totals with prefix sums,
+    so the totals for any run of months can be read in O(1).
+    """
+
+    def __init__(self, transactions: Iterable[Transaction]):
+        totals = {}
+        for transaction in transactions:
+            index = month_index(transaction.date.year, transaction.date.month)
+            month_totals = totals.setdefault(index, [0, 0])
+            if transaction.transaction_type == TransactionType.INCOME:
+                month_totals[0] += transaction.amount
+            else:
+                month_totals[1] += transaction.amount
+
+        self.first_index = min(totals) if totals else 0
+        self.last_index = max(totals) if totals else -1
+
+        # Dense per-month totals and their running sums from first_index onwards
+        self._income = []
+        self._expenses = []
+        self._income_prefix = [0]
+        self._expense_prefix = [0]
+        for index in range(self.first_index, self.last_index + 1):
+            income, expenses = totals.get(index, (0, 0))
+            self._income.append(income)
+            self._expenses.append(expenses)
+            self._income_prefix.append(self._income_prefix[-1] + income)
+            self._expense_prefix.append(self._expense_prefix[-1] + expenses)
+
+    def get_month_totals(self, index: int) -> Tuple[float, float]:
+        """Get (income, expenses) for a single month index"""
+        if index < self.first_index or index > self.last_index:
+            return (0, 0)
+        offset = index - self.first_index
+        return (self._income[offset], self._expenses[offset])
+
+    def get_range_totals(self, start_index: int, end_index: int) -> Tuple[float, float]:
+        """Get (income, expenses) summed over the month indexes start_index..end_index inclusive"""
+        if start_index == end_index:
+            return self.get_month_totals(start_index)
+
+        # Clamp the range to the months that actually hold data
+        start = max(start_index, self.first_index) - self.first_index
+        end = min(end_index, self.last_index) - self.first_index
+        if start > end:
+            return (0, 0)
+
+        return (self._income_prefix[end + 1] - self._income_prefix[start],
+                self._expense_prefix[end + 1] - self._expense_prefix[start])
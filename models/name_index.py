@@ -0,0 +1,134 @@
+import unicodedata
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+# Suggestions kept per trie node; lookups can ask for at most this many
+MAX_SUGGESTIONS = 10
+
+
+def name_key(name: str) -> str:
+    """
+    Matching key of a name: case and accents are ignored, so "is bankasi"
+    finds "İş Bankası" and typing with or without Turkish letters gives the
+    same results
+    """
+    decomposed = unicodedata.normalize("NFKD", name.casefold().strip())
+    # The dotless ı has no decomposition, so it is folded by hand; I and İ
+    # already fold to i above
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).replace("ı", "i")
+
+
+@dataclass
+class NameSuggestion:
+    """A transaction name with how often it was used and its most recent amount and category"""
+    name: str
+    count: int
+    amount: float
+    category: Optional[str]
+    date: datetime
+    # Matching key (see name_key)
+    key: str = ""
+
+    def rank(self):
+        # Most used first, then most recently used; the key breaks ties
+        return (-self.count, -self.date.timestamp(), self.key)
+
+
+class _TrieNode:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children = {}
+        # Keys of the best ranked names below this node, best first
+        self.top = []
+
+
+class NameIndex:
+    """
+    Prefix trie over transaction names weighted by use. Every node keeps its
+    best ranked names, so a lookup walks the prefix and reads one short list
+    no matter how much history there is. Counts only grow as transactions are
+    added; after removals the index is rebuilt (see FinanceManager.get_name_index).
+    """
+
+    def __init__(self):
+        self.root = _TrieNode()
+        self.entries: Dict[str, NameSuggestion] = {}
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable) -> "NameIndex":
+        """Build an index over a transaction history"""
+        index = cls()
+        # Names are counted first and each distinct name is put in the trie
+        # once; names repeat, so their keys are only worked out once too
+        keys = {}
+        for transaction in transactions:
+            key = keys.get(transaction.name)
+            if key is None:
+                key = keys[transaction.name] = name_key(transaction.name)
+            index._count(transaction, key)
+        for key in index.entries:
+            index._place(key)
+        return index
+
+    def add(self, transaction):
+        """Count a new transaction's name"""
+        key = name_key(transaction.name)
+        if self._count(transaction, key):
+            self._place(key)
+
+    def suggest(self, prefix: str, limit: int = MAX_SUGGESTIONS) -> List[NameSuggestion]:
+        """Most used names starting with prefix, best first"""
+        node = self.root
+        for char in name_key(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [self.entries[key] for key in node.top[:limit]]
+
+    def _count(self, transaction, key: str) -> bool:
+        """Update the entry of a transaction's name; False for a blank name"""
+        if not key:
+            return False
+
+        entry = self.entries.get(key)
+        if entry is None:
+            self.entries[key] = NameSuggestion(transaction.name, 1, transaction.amount,
+                                               transaction.category, transaction.date, key)
+            return True
+
+        entry.count += 1
+        # The latest use decides the spelling, amount and category shown
+        if transaction.date >= entry.date:
+            entry.name = transaction.name
+            entry.amount = transaction.amount
+            entry.category = transaction.category
+            entry.date = transaction.date
+        return True
+
+    def _place(self, key: str):
+        """Rank a name on every node of its path after its entry changed"""
+        entry = self.entries[key]
+        rank = entry.rank()
+        node = self.root
+        self._rank_in(node, key, rank)
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+            self._rank_in(node, key, rank)
+
+    def _rank_in(self, node: _TrieNode, key: str, rank):
+        top = node.top
+        if key in top:
+            top.remove(key)
+        elif len(top) >= MAX_SUGGESTIONS and rank >= self.entries[top[-1]].rank():
+            return
+        # Lists are short; find the place by a linear scan
+        position = 0
+        while position < len(top) and self.entries[top[position]].rank() <= rank:
+            position += 1
+        top.insert(position, key)
+        del top[MAX_SUGGESTIONS:]
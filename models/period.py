@@ -0,0 +1,19 @@
+from typing import List, Tuple
+
+# A calendar month expressed as a (year, month) pair
+Month = Tuple[int, int]
+
+
+def month_index(year: int, month: int) -> int:
+    """Convert a year/month pair into a running month number"""
+    return year * 12 + (month - 1)
+
+
+def month_from_index(index: int) -> Month:
+    """Convert a running month number back into a (year, month) pair"""
+    return (index // 12, index % 12 + 1)
+
+
+def months_between(start: Month, end: Month) -> List[Month]:
+    """Get every month from start to end inclusive"""
+    return [month_from_index(i) for i in range(month_index(*start), month_index(*end) + 1)]
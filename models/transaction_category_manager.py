@@ -12,6 +12,8 @@ class CategoryManager:
     def __init__(self, file_path="transaction_categories.json"):
         self.file_path = file_path
         self.categories = []
+        # Mutation counter so readers can tell when cached results are stale
+        self.data_version = 0
         self.load_categories()
         
         # Add default categories if none exist
@@ -29,6 +31,7 @@ class CategoryManager:
                 self.categories = []
         else:
             self.categories = []
+        self.data_version += 1
 
     def save_categories(self):
         """Save categories to JSON file"""
@@ -61,6 +64,7 @@ class CategoryManager:
             "type": category_type.value
         })
         
+        self.data_version += 1
         self.save_categories()
         return True
     
@@ -69,6 +73,7 @@ class CategoryManager:
         for i, category in enumerate(self.categories):
             if category["name"] == name:
                 del self.categories[i]
+                self.data_version += 1
                 self.save_categories()
                 return True
         return False
@@ -83,6 +88,7 @@ class CategoryManager:
             if category["name"] == old_name:
                 category["name"] = new_name
                 category["type"] = category_type.value
+                self.data_version += 1
                 self.save_categories()
                 return True
         return False
@@ -95,6 +101,10 @@ class CategoryManager:
         """Get all category names of a specific type"""
         return [c["name"] for c in self.categories if c["type"] == category_type.value]
     
+    def get_category_types(self) -> Dict[str, TransactionType]:
+        """Get the type of every category by name, for checking many names at once"""
+        return {c["name"]: TransactionType(c["type"]) for c in self.categories}
+    
     def get_category_type(self, name: str) -> Optional[TransactionType]:
         """Get the type of a category by name"""
         for category in self.categories:
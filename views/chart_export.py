@@ -0,0 +1,102 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Sequence
+
+from models.dashboard_dataset import DashboardDataset
+from models.period import Month
+
+from .dashboard_charts import (draw_chart,
+                               MonthlySummaryChart, CumulativeChart, CashFlowTrendChart,
+                               ExpenseCategoryChart, MonthlyComparisonChart, CategoryComparisonChart,
+                               ForecastChart, SavingsProjectionChart, ForecastActualSummaryChart,
+                               ForecastActualCategoryChart, ForecastAccuracyChart)
+
+
+# Every dashboard chart with its file name and figure size in inches,
+# in the order the dashboard shows them
+EXPORT_CHARTS = [
+    ("monthly_summary", MonthlySummaryChart, (5, 3)),
+    ("cumulative", CumulativeChart, (5, 3)),
+    ("cash_flow_trend", CashFlowTrendChart, (5, 3)),
+    ("expense_categories", ExpenseCategoryChart, (5, 3)),
+    ("monthly_comparison", MonthlyComparisonChart, (5, 3)),
+    ("category_comparison", CategoryComparisonChart, (5, 3)),
+    ("forecast", ForecastChart, (5, 3)),
+    ("savings_projection", SavingsProjectionChart, (5, 3)),
+    ("forecast_actual_summary", ForecastActualSummaryChart, (5, 3)),
+    ("forecast_actual_categories", ForecastActualCategoryChart, (5, 3)),
+    # Spans both columns on the dashboard
+    ("forecast_accuracy", ForecastAccuracyChart, (10, 3)),
+]
+
+CHART_NAMES = [name for name, _, _ in EXPORT_CHARTS]
+
+# Datasets and settings of a worker process, set once by _init_worker
+_worker_state = {}
+
+
+def build_export_datasets(controller, first: Month, last: Month) -> Dict[Month, DashboardDataset]:
+    """
+    Build the dashboard dataset of every month in a range from one snapshot of
+    the data and one pass over it. The months share their buckets and the
+    cumulative series, so those are only pickled once per worker.
+    """
+    return controller.prepare_dashboard_datasets(first, last)()
+
+
+def _init_worker(datasets: Dict[Month, DashboardDataset], output_dir: str, dpi: int):
+    _worker_state["datasets"] = datasets
+    _worker_state["output_dir"] = output_dir
+    _worker_state["dpi"] = dpi
+
+
+def _render(year: int, month: int, name: str, fmt: str) -> str:
+    """Draw one chart of one month and save it, returning the file path"""
+    _, chart_class, (width, height) = EXPORT_CHARTS[CHART_NAMES.index(name)]
+    dataset = _worker_state["datasets"][(year, month)]
+
+    fig = draw_chart(chart_class, dataset, width, height, _worker_state["dpi"])
+    directory = os.path.join(_worker_state["output_dir"], f"{year}-{month:02d}")
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{name}.{fmt}")
+    fig.savefig(path, format=fmt)
+    return path
+
+
+def export_charts(datasets: Dict[Month, DashboardDataset], output_dir: str,
+                  formats: Sequence[str] = ("png",), chart_names: Sequence[str] = None,
+                  workers: int = None, dpi: int = 100, progress=None) -> List[str]:
+    """
+    Render charts of every month in datasets to output_dir/YYYY-MM/<chart>.<format>
+    across a process pool. Each worker receives the datasets once when it starts.
+    With workers=1 everything is drawn in this process. progress, if given, is
+    called with (done, total) after each file. Returns the written paths.
+    """
+    chart_names = list(chart_names or CHART_NAMES)
+    tasks = [(year, month, name, fmt)
+             for (year, month) in sorted(datasets)
+             for name in chart_names
+             for fmt in formats]
+    paths = []
+
+    if workers == 1:
+        _init_worker(datasets, output_dir, dpi)
+        for task in tasks:
+            paths.append(_render(*task))
+            if progress:
+                progress(len(paths), len(tasks))
+        return paths
+
+    if not tasks:
+        return paths
+
+    workers = workers or os.cpu_count() or 1
+    # Several tasks per round trip keep the pool busy without long tails
+    chunksize = max(1, len(tasks) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(datasets, output_dir, dpi)) as executor:
+        for path in executor.map(_render, *zip(*tasks), chunksize=chunksize):
+            paths.append(path)
+            if progress:
+                progress(len(paths), len(tasks))
+    return paths
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+from PyQt5.QtGui import QImage
+
+# Default memory cap for rendered chart images
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def buffer_to_image(buffer, device_pixel_ratio: float = 1.0) -> QImage:
+    """Copy an Agg RGBA buffer (rows x columns x 4) into a QImage"""
+    height, width = buffer.shape[:2]
+    # copy() so the image owns its pixels instead of borrowing the buffer
+    image = QImage(bytes(buffer), width, height, QImage.Format_RGBA8888).copy()
+    image.setDevicePixelRatio(device_pixel_ratio)
+    return image
+
+
+class ChartImageCache:
+    """
+    LRU cache of rendered chart images, bounded by total image size.
+    Keys are (chart, year, month, data versions, pixel size), so an image is
+    only reused for exactly the data and canvas size it was drawn with.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._images = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[QImage]:
+        """Get the image for key, or None on a miss"""
+        image = self._images.get(key)
+        if image is None:
+            self.misses += 1
+            return None
+
+        self._images.move_to_end(key)
+        self.hits += 1
+        return image
+
+    def contains(self, key: Hashable) -> bool:
+        """Check for an image without counting a lookup"""
+        return key in self._images
+
+    def put(self, key: Hashable, image: QImage):
+        """Store an image, evicting the least recently used ones over the memory cap"""
+        if key in self._images:
+            self.size_bytes -= self._images.pop(key).sizeInBytes()
+
+        self._images[key] = image
+        self.size_bytes += image.sizeInBytes()
+
+        while self.size_bytes > self.max_bytes and len(self._images) > 1:
+            _, evicted = self._images.popitem(last=False)
+            self.size_bytes -= evicted.sizeInBytes()
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all images (statistics are kept)"""
+        self._images.clear()
+        self.size_bytes = 0
+
+    def get_stats(self) -> Dict:
+        """Get hit/miss statistics and memory use"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "images": len(self._images),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": (self.hits / lookups * 100) if lookups > 0 else 0
+        }
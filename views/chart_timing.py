@@ -0,0 +1,144 @@
+import csv
+import json
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from PyQt5.QtCore import Qt, QRectF
+from PyQt5.QtGui import QColor, QFont, QPainter
+
+# Phases of drawing a chart, in order: extracting its values from the
+# dataset, building or updating the artists, tight_layout and drawing
+PHASES = ["data", "artists", "layout", "draw"]
+
+# Refreshes kept for the export
+MAX_REFRESHES = 200
+
+
+def new_timings() -> Dict:
+    """Timings (ms) of one chart render; cached is set when an image was blitted"""
+    timings = dict.fromkeys(PHASES, 0.0)
+    timings["cached"] = False
+    return timings
+
+
+def format_timings(timings: Dict) -> List[str]:
+    """Overlay lines for a chart's timings"""
+    if timings.get("cached"):
+        return ["cached image"]
+    total = sum(timings[phase] for phase in PHASES)
+    return [" · ".join(f"{phase} {timings[phase]:.1f}" for phase in PHASES), f"total {total:.1f} ms"]
+
+
+def paint_timing_overlay(painter: QPainter, rect: QRectF, timings: Dict):
+    """Paint a chart's timings in the top right corner of rect"""
+    lines = format_timings(timings)
+    font = QFont()
+    font.setPointSize(8)
+
+    painter.save()
+    painter.resetTransform()
+    painter.setFont(font)
+    # Measured as drawn on the painter's device (its resolution and font
+    # fallbacks can differ from the screen's)
+    text = "\n".join(lines)
+    size = painter.boundingRect(QRectF(), Qt.AlignCenter, text).size()
+    width, height = size.width() + 12, size.height() + 6
+    box = QRectF(rect.right() - width - 4, rect.top() + 4, width, height)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(33, 37, 41, 190))
+    painter.drawRoundedRect(box, 4, 4)
+    painter.setPen(Qt.white)
+    painter.drawText(box, Qt.AlignCenter, text)
+    painter.restore()
+
+
+@dataclass
+class RefreshTiming:
+    """
+    Timings of one dashboard redraw: loading the dataset (from the refresh
+    request until the worker thread delivered it; None when the redraw was
+    only a sub-tab switch), the wall time of rendering the charts and each
+    rendered chart's phases
+    """
+    number: int
+    time: datetime
+    year: int
+    month: int
+    tab: str
+    load_ms: Optional[float]
+    render_ms: float
+    # Chart class name -> timings dict (see new_timings); painted charts fill
+    # in their draw time when the paint happens
+    charts: Dict[str, Dict] = field(default_factory=dict)
+
+    def get_chart_total(self) -> float:
+        return sum(timings[phase] for timings in self.charts.values() for phase in PHASES)
+
+
+class ChartTimingLog:
+    """Recent dashboard redraw timings, exportable as CSV or JSON"""
+
+    def __init__(self, max_refreshes: int = MAX_REFRESHES):
+        self.refreshes = deque(maxlen=max_refreshes)
+        self.count = 0
+
+    def add(self, year: int, month: int, tab: str, load_ms: Optional[float],
+            render_ms: float, charts: Dict[str, Dict]) -> RefreshTiming:
+        self.count += 1
+        refresh = RefreshTiming(self.count, datetime.now(), year, month, tab,
+                                load_ms, render_ms, charts)
+        self.refreshes.append(refresh)
+        return refresh
+
+    def get_last(self) -> Optional[RefreshTiming]:
+        return self.refreshes[-1] if self.refreshes else None
+
+    def get_chart_averages(self) -> Dict[str, Dict]:
+        """Mean of each phase per chart over the drawn (not cached) renders"""
+        sums = {}
+        for refresh in self.refreshes:
+            for name, timings in refresh.charts.items():
+                if timings["cached"]:
+                    continue
+                entry = sums.setdefault(name, {**dict.fromkeys(PHASES, 0.0), "renders": 0})
+                entry["renders"] += 1
+                for phase in PHASES:
+                    entry[phase] += timings[phase]
+        for entry in sums.values():
+            for phase in PHASES:
+                entry[phase] /= entry["renders"]
+        return sums
+
+    def export_csv(self, path: str):
+        """Write one row per rendered chart per refresh"""
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["refresh", "time", "year", "month", "tab", "load_ms", "render_ms",
+                             "chart", *PHASES, "cached"])
+            for refresh in self.refreshes:
+                for name, timings in refresh.charts.items():
+                    writer.writerow([refresh.number, refresh.time.isoformat(timespec="milliseconds"),
+                                     refresh.year, refresh.month, refresh.tab,
+                                     "" if refresh.load_ms is None else round(refresh.load_ms, 2),
+                                     round(refresh.render_ms, 2), name,
+                                     *(round(timings[phase], 2) for phase in PHASES), timings["cached"]])
+
+    def export_json(self, path: str):
+        """Write every refresh with its charts and the per chart averages"""
+        refreshes = []
+        for refresh in self.refreshes:
+            entry = asdict(refresh)
+            entry["time"] = refresh.time.isoformat(timespec="milliseconds")
+            entry["chart_total_ms"] = refresh.get_chart_total()
+            refreshes.append(entry)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"refreshes": refreshes, "averages": self.get_chart_averages()}, file, indent=2)
+
+    def export(self, path: str):
+        """Export as JSON for a .json path, CSV otherwise"""
+        if path.lower().endswith(".json"):
+            self.export_json(path)
+        else:
+            self.export_csv(path)
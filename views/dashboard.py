@@ -1,55 +1,98 @@
-import matplotlib
-matplotlib.use('Qt5Agg')
-
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QComboBox, 
-                           QLabel, QSizePolicy, QFrame, QGridLayout, QTabWidget)
-from PyQt5.QtCore import Qt, pyqtSignal
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+                           QLabel, QFrame, QGridLayout, QTabWidget, QPushButton,
+                           QFileDialog, QMessageBox)
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from collections import deque
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
 import calendar
-from collections import defaultdict
+import time
 import numpy as np
 
-class MplCanvas(FigureCanvas):
-    def __init__(self, width=5, height=3, dpi=100):
-        # Create figure with modern styling
-        self.fig = Figure(figsize=(width, height), dpi=dpi, facecolor='#ffffff')
-        self.fig.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.15)
-        
-        # Add subplot with grid
-        self.axes = self.fig.add_subplot(111)
-        self.axes.grid(True, linestyle='--', alpha=0.3, color='#cccccc')
-        
-        # Style improvements
-        self.axes.spines['top'].set_visible(False)
-        self.axes.spines['right'].set_visible(False)
-        self.axes.spines['left'].set_alpha(0.3)
-        self.axes.spines['bottom'].set_alpha(0.3)
-        
-        # Font styling
-        self.axes.tick_params(labelsize=8)
-        self.axes.xaxis.label.set_color('#495057')
-        self.axes.xaxis.label.set_fontsize(10)
-        self.axes.yaxis.label.set_color('#495057')
-        self.axes.yaxis.label.set_fontsize(10)
-        self.axes.title.set_color('#212529')
-        self.axes.title.set_fontsize(12)
-        
-        # Tick styling
-        self.axes.tick_params(colors='#6c757d', direction='out', length=4, width=1, grid_alpha=0.3)
-        
-        super(MplCanvas, self).__init__(self.fig)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.updateGeometry()
+from models.dashboard_dataset import DashboardDataset
+from models.change_event import ChangeEvent, ChangeKind, ChangeSource
+from diagnostics import startup_profiler
+from .refresh_scheduler import RefreshScheduler
+from .dataset_loader import DashboardDataLoader
+from .chart_image_cache import ChartImageCache
+from .chart_timing import ChartTimingLog
+from .dashboard_charts import (MonthlySummaryChart, CumulativeChart, CashFlowTrendChart,
+                               ExpenseCategoryChart, MonthlyComparisonChart, CategoryComparisonChart,
+                               ForecastChart, SavingsProjectionChart, ForecastActualSummaryChart,
+                               ForecastActualCategoryChart, ForecastAccuracyChart)
+from .painter_charts import PAINTER_CHARTS, PainterChartWidget
+
+# Backends a dashboard chart can be drawn with; every chart uses matplotlib
+# unless the Dashboard is given another backend for its class
+MATPLOTLIB_BACKEND = "matplotlib"
+QPAINTER_BACKEND = "qpainter"
+
+# Sub-tabs of the dashboard with their charts: the Dashboard attribute that
+# holds the canvas, the chart class and the canvas's grid position
+CHART_TABS = [
+    ("Overview", [
+        ("monthly_canvas", MonthlySummaryChart, (0, 0)),
+        ("cumulative_canvas", CumulativeChart, (0, 1)),
+    ]),
+    ("Insights", [
+        ("trend_canvas", CashFlowTrendChart, (0, 0)),
+        ("category_canvas", ExpenseCategoryChart, (0, 1)),
+    ]),
+    ("Monthly Comparison", [
+        ("comparison_canvas", MonthlyComparisonChart, (0, 0)),
+        ("category_comparison_canvas", CategoryComparisonChart, (0, 1)),
+    ]),
+    ("Financial Forecast", [
+        ("forecast_canvas", ForecastChart, (0, 0)),
+        ("savings_forecast_canvas", SavingsProjectionChart, (0, 1)),
+    ]),
+    ("Forecast Analysis", [
+        ("forecast_actual_summary_canvas", ForecastActualSummaryChart, (0, 0)),
+        ("forecast_actual_category_canvas", ForecastActualCategoryChart, (0, 1)),
+        # Spans both columns
+        ("forecast_accuracy_canvas", ForecastAccuracyChart, (1, 0, 1, 2)),
+    ]),
+]
 
 class Dashboard(QWidget):
-    def __init__(self, controller):
+    def __init__(self, controller, chart_backends=None):
         super().__init__()
         self.controller = controller
+        # Backend per chart class, e.g. {CashFlowTrendChart: QPAINTER_BACKEND};
+        # charts not listed are drawn with matplotlib
+        self.chart_backends = dict(chart_backends or {})
+        for chart_class, backend in self.chart_backends.items():
+            if backend not in (MATPLOTLIB_BACKEND, QPAINTER_BACKEND):
+                raise ValueError(f"Unknown chart backend: {backend}")
+            if backend == QPAINTER_BACKEND and chart_class not in PAINTER_CHARTS:
+                raise ValueError(f"{chart_class.__name__} has no QPainter version")
+        # Date changes and data changes arriving together cause one refresh
+        self.refresh_scheduler = RefreshScheduler(lambda regions: self.refresh_charts(), parent=self)
+        # Chart data is aggregated off the GUI thread; stale results are dropped
+        self.dataset_loader = DashboardDataLoader(controller, parent=self)
+        self.dataset_loader.loaded.connect(self.on_dataset_loaded)
+        self.dataset_loader.prefetched.connect(self.on_dataset_prefetched)
+        
+        # Rendered chart images; the months next to the selection are
+        # pre-rendered while idle so stepping to them is a blit
+        self.chart_cache = ChartImageCache()
+        self.prerender_queue = deque()
+        self.prerender_timer = QTimer(self)
+        self.prerender_timer.setSingleShot(True)
+        self.prerender_timer.setInterval(0)
+        self.prerender_timer.timeout.connect(self.process_prerender_queue)
+        self.prerendered = 0
+        
+        # Canvases touched by data changes since the last load; None redraws all
+        self.changed_canvases = None
+        self.changes_applied = 0
+        self.changes_ignored = 0
+        
+        # Phase timings of every redraw; the overlay shows them on the charts
+        self.timing_log = ChartTimingLog()
+        self.show_timings = False
+        self.load_started = None
+        self.load_ms = None
+        
         self.init_ui()
         
     def init_ui(self):
@@ -86,6 +129,20 @@ class Dashboard(QWidget):
         top_layout.addWidget(self.month_combo)
         top_layout.addStretch()
         
+        # Performance overlay: per chart timings on the charts, redraw totals here
+        self.timings_label = QLabel()
+        self.timings_label.setStyleSheet("font-size: 12px; color: #6c757d;")
+        self.timings_label.setVisible(False)
+        self.export_timings_btn = QPushButton("Export Timings")
+        self.export_timings_btn.setVisible(False)
+        self.export_timings_btn.clicked.connect(self.export_timings)
+        self.timings_btn = QPushButton("Chart Timings")
+        self.timings_btn.setCheckable(True)
+        self.timings_btn.toggled.connect(self.set_timing_overlay)
+        top_layout.addWidget(self.timings_label)
+        top_layout.addWidget(self.export_timings_btn)
+        top_layout.addWidget(self.timings_btn)
+        
         main_layout.addLayout(top_layout)
         
         # Summary values - three cards in one row
@@ -178,17 +235,27 @@ class Dashboard(QWidget):
         main_layout.addLayout(cards_layout)
         
         # Create tab widget for charts
-        charts_tab = self.update_dashboard_tab_widget()
+        self.charts_tab = self.update_dashboard_tab_widget()
         
         # Add charts tab to main layout with stretch
-        main_layout.addWidget(charts_tab, 1)
+        main_layout.addWidget(self.charts_tab, 1)
         
         # Connect signals
         self.year_combo.currentIndexChanged.connect(self.on_date_changed)
         self.month_combo.currentIndexChanged.connect(self.on_date_changed)
+        self.charts_tab.currentChanged.connect(self.render_visible_charts)
         
-        # Initial refresh
-        self.refresh_charts()
+        # Initial refresh, once the event loop runs: the window is shown
+        # first and the charts (and matplotlib) are loaded when the data is in
+        self.schedule_refresh()
+        
+    def create_chart_canvas(self, chart_class, width=5, height=3):
+        """Create the widget for a dashboard chart with the backend chosen for it"""
+        if self.chart_backends.get(chart_class, MATPLOTLIB_BACKEND) == QPAINTER_BACKEND:
+            return PainterChartWidget(width=width, height=height, chart_class=PAINTER_CHARTS[chart_class])
+        # matplotlib is loaded with the first chart that needs it
+        from .mpl_canvas import MplCanvas
+        return MplCanvas(width=width, height=height, chart_class=chart_class, image_cache=self.chart_cache)
         
     def update_dashboard_tab_widget(self):
         """Update tab widget to add forecast comparison tab"""
@@ -196,92 +263,39 @@ class Dashboard(QWidget):
         charts_tab = QTabWidget()
         charts_tab.setDocumentMode(True)
         
-        # Tab 1: Main Charts (Monthly and Cumulative)
-        main_charts_widget = QWidget()
-        main_charts_layout = QGridLayout(main_charts_widget)
-        main_charts_layout.setContentsMargins(5, 5, 5, 5)
-        main_charts_layout.setSpacing(10)
-        
-        # Monthly chart
-        self.monthly_canvas = MplCanvas(width=5, height=3)
-        main_charts_layout.addWidget(self.monthly_canvas, 0, 0)
-        
-        # Cumulative chart
-        self.cumulative_canvas = MplCanvas(width=5, height=3)
-        main_charts_layout.addWidget(self.cumulative_canvas, 0, 1)
-        
-        charts_tab.addTab(main_charts_widget, "Overview")
-        
-        # Tab 2: Additional Charts
-        additional_charts_widget = QWidget()
-        additional_charts_layout = QGridLayout(additional_charts_widget)
-        additional_charts_layout.setContentsMargins(5, 5, 5, 5)
-        additional_charts_layout.setSpacing(10)
-        
-        # Trend Chart
-        self.trend_canvas = MplCanvas(width=5, height=3)
-        additional_charts_layout.addWidget(self.trend_canvas, 0, 0)
-        
-        # Category Chart
-        self.category_canvas = MplCanvas(width=5, height=3)
-        additional_charts_layout.addWidget(self.category_canvas, 0, 1)
-        
-        charts_tab.addTab(additional_charts_widget, "Insights")
-
-        # Tab 3: Monthly Comparison 
-        comparison_widget = QWidget()
-        comparison_layout = QGridLayout(comparison_widget)
-        comparison_layout.setContentsMargins(5, 5, 5, 5)
-        comparison_layout.setSpacing(10)
-        
-        # Monthly Comparison Chart
-        self.comparison_canvas = MplCanvas(width=5, height=3)
-        comparison_layout.addWidget(self.comparison_canvas, 0, 0)
-        
-        # Category Comparison Chart
-        self.category_comparison_canvas = MplCanvas(width=5, height=3)
-        comparison_layout.addWidget(self.category_comparison_canvas, 0, 1)
-        
-        charts_tab.addTab(comparison_widget, "Monthly Comparison")
-        
-        # Tab 4: Financial Forecast
-        forecast_widget = QWidget()
-        forecast_layout = QGridLayout(forecast_widget)
-        forecast_layout.setContentsMargins(5, 5, 5, 5)
-        forecast_layout.setSpacing(10)
-        
-        # Forecast Chart
-        self.forecast_canvas = MplCanvas(width=5, height=3)
-        forecast_layout.addWidget(self.forecast_canvas, 0, 0)
-        
-        # Savings Forecast Chart
-        self.savings_forecast_canvas = MplCanvas(width=5, height=3)
-        forecast_layout.addWidget(self.savings_forecast_canvas, 0, 1)
-        
-        charts_tab.addTab(forecast_widget, "Financial Forecast")
-        
-        # NEW Tab 5: Forecast vs Actual Comparison
-        forecast_actual_widget = QWidget()
-        forecast_actual_layout = QGridLayout(forecast_actual_widget)
-        forecast_actual_layout.setContentsMargins(5, 5, 5, 5)
-        forecast_actual_layout.setSpacing(10)
-        
-        # Forecast vs Actual Summary Chart
-        self.forecast_actual_summary_canvas = MplCanvas(width=5, height=3)
-        forecast_actual_layout.addWidget(self.forecast_actual_summary_canvas, 0, 0)
-        
-        # Forecast vs Actual Category Chart
-        self.forecast_actual_category_canvas = MplCanvas(width=5, height=3)
-        forecast_actual_layout.addWidget(self.forecast_actual_category_canvas, 0, 1)
-        
-        # Forecast Accuracy Timeline Chart
-        self.forecast_accuracy_canvas = MplCanvas(width=5, height=3)
-        forecast_actual_layout.addWidget(self.forecast_accuracy_canvas, 1, 0, 1, 2)  # Span two columns
-        
-        charts_tab.addTab(forecast_actual_widget, "Forecast Analysis")
+        # Each sub-tab starts as an empty page; its charts are created the
+        # first time it is drawn (see build_chart_tab)
+        for title, _ in CHART_TABS:
+            page = QWidget()
+            page_layout = QGridLayout(page)
+            page_layout.setContentsMargins(5, 5, 5, 5)
+            page_layout.setSpacing(10)
+            charts_tab.addTab(page, title)
+        
+        # Canvases of each sub-tab (by tab index), None until it is built.
+        # Only the visible sub-tab is redrawn; the others are marked dirty
+        # and redrawn when they are shown.
+        self.tab_canvases = [None] * len(CHART_TABS)
+        self.canvases = []
+        self.dataset = None
         
         return charts_tab
     
+    def build_chart_tab(self, index):
+        """Create the canvases of a sub-tab and add them to its page"""
+        page_layout = self.charts_tab.widget(index).layout()
+        canvases = []
+        for name, chart_class, position in CHART_TABS[index][1]:
+            canvas = self.create_chart_canvas(chart_class)
+            canvas.show_timings = self.show_timings
+            page_layout.addWidget(canvas, *position)
+            setattr(self, name, canvas)
+            canvases.append(canvas)
+        
+        self.tab_canvases[index] = canvases
+        self.canvases.extend(canvases)
+        return canvases
+    
     def update_year_combo(self):
         """Update the years in the combo box based on transaction history"""
         self.year_combo.clear()
@@ -301,7 +315,36 @@ class Dashboard(QWidget):
         
     def on_date_changed(self):
         """Handle date selection change"""
-        self.refresh_charts()
+        self.changed_canvases = None
+        self.schedule_refresh()
+    
+    def apply_change(self, event: ChangeEvent) -> bool:
+        """
+        Reload the dataset if a change touches the summary cards or any chart of
+        the selected month; only the touched charts are redrawn when it arrives
+        """
+        if self.dataset is None or event.kind == ChangeKind.RELOADED:
+            self.changed_canvases = None
+            self.schedule_refresh()
+            return True
+        
+        year, month = self.dataset.year, self.dataset.month
+        affected = [canvas for canvas in self.canvases
+                    if canvas.chart_class.is_affected_by(event, year, month)]
+        cards = event.source == ChangeSource.TRANSACTIONS and event.touches_month(year, month)
+        if not affected and not cards:
+            self.changes_ignored += 1
+            return True
+        
+        self.changes_applied += 1
+        if self.changed_canvases is not None:
+            self.changed_canvases.update(affected)
+        self.schedule_refresh()
+        return True
+    
+    def schedule_refresh(self):
+        """Refresh the charts on the next event loop pass, merged with other requests"""
+        self.refresh_scheduler.request("charts")
         
     def refresh_charts(self):
         """Refresh all charts and summary data"""
@@ -312,8 +355,20 @@ class Dashboard(QWidget):
         if year is None or month is None:
             return
             
+        # The dataset is built on a worker thread; on_dataset_loaded draws it
+        startup_profiler.mark("first dashboard refresh")
+        self.load_started = time.perf_counter()
+        self.dataset_loader.load(year, month)
+        
+    def on_dataset_loaded(self, dataset: DashboardDataset):
+        """Show a dataset built for the current selection"""
+        year, month = dataset.year, dataset.month
+        if self.load_started is not None:
+            self.load_ms = (time.perf_counter() - self.load_started) * 1000
+            self.load_started = None
+        
         # Update summary values
-        summary = self.controller.get_monthly_summary(year, month)
+        summary = dataset.get_summary(year, month)
         self.income_value.setText(f"{summary['total_income']:.2f} ₺")
         self.expenses_value.setText(f"{summary['total_expenses']:.2f} ₺")
         
@@ -325,1385 +380,132 @@ class Dashboard(QWidget):
             self.net_value.setStyleSheet("font-size: 16px; font-weight: bold; color: #c62828;")
         self.net_value.setText(f"{net_worth:.2f} ₺")
         
-        # Update all original charts
-        self.update_monthly_chart(year)
-        self.update_cumulative_chart()
-        self.update_trend_chart(year)
-        self.update_category_chart(year, month)
-        
-        # Update comparison charts
-        self.update_comparison_chart(year, month)
-        self.update_category_comparison_chart(year, month)
-        self.update_forecast_chart(year, month)
-        self.update_savings_forecast_chart(year, month)
-        
-        # Update new forecast comparison charts
-        self.update_forecast_actual_charts()
-        
-    def update_forecast_actual_charts(self):
-        """Update the forecast vs actual comparison charts"""
-        # Get selected year and month
-        year = self.year_combo.currentData()
-        month = self.month_combo.currentData()
-        
-        if year is None or month is None:
+        # After a data change only the charts it touched are stale; a new
+        # selection makes every chart stale. Only the visible sub-tab is redrawn.
+        changed = self.changed_canvases
+        if self.dataset is None or (self.dataset.year, self.dataset.month) != (year, month):
+            changed = None
+        self.changed_canvases = set()
+        
+        self.dataset = dataset
+        for canvas in self.canvases:
+            if changed is None or canvas in changed:
+                canvas.dirty = True
+            elif canvas.dataset is not None:
+                # Same data as before for this chart; keep its drawing
+                canvas.dataset = dataset
+        with startup_profiler.measure("dashboard", "draw charts"):
+            self.render_visible_charts()
+        
+    def render_visible_charts(self):
+        """Redraw the stale charts on the currently visible sub-tab"""
+        if self.dataset is None:
             return
-            
-        # Get comparison data
-        comparison_data = self.controller.compare_forecast_vs_actual(year, month)
-        
-        # Update the charts
-        self.update_forecast_actual_summary_chart(comparison_data, year, month)
-        self.update_forecast_actual_category_chart(comparison_data, year, month)
-        self.update_forecast_accuracy_chart(year, month)
-        
-    def update_monthly_chart(self, year):
-        """Update the monthly breakdown chart - IMPROVED VERSION"""
-        monthly_data = self.controller.get_monthly_data_for_year(year)
-        
-        # Clear previous plot
-        self.monthly_canvas.axes.clear()
-        
-        months = list(range(1, 13))
-        income_values = [monthly_data[m]['total_income'] for m in months]
-        expense_values = [monthly_data[m]['total_expenses'] for m in months]
-        net_values = [monthly_data[m]['net_worth'] for m in months]
-        
-        # Set up X axis for months
-        x = range(len(months))
-        month_names = [calendar.month_abbr[m] for m in months]
-        
-        # Create stacked bar chart showing income and expenses
-        # with net worth as a point on top
-        
-        # Income as positive values
-        self.monthly_canvas.axes.bar(x, income_values, 
-                                    color='#4CAF50', alpha=0.8, 
-                                    label='Income',
-                                    width=0.6,
-                                    edgecolor='white', linewidth=0.5)
-        
-        # Expenses as negative values
-        self.monthly_canvas.axes.bar(x, [-val for val in expense_values], 
-                                    color='#F44336', alpha=0.8, 
-                                    label='Expenses',
-                                    width=0.6,
-                                    edgecolor='white', linewidth=0.5)
-        
-        # Net worth as marker points
-        self.monthly_canvas.axes.plot(x, net_values, 'o-', 
-                                    color='#2196F3', linewidth=2, 
-                                    markersize=6, label='Net Worth')
         
-        # Add zero line
-        self.monthly_canvas.axes.axhline(y=0, color='#888888', linestyle='-', alpha=0.3, linewidth=1)
-        
-        # Add labels
-        self.monthly_canvas.axes.set_title(f'Financial Summary ({year})', 
-                                          fontsize=11, fontweight='bold', pad=8)
-        self.monthly_canvas.axes.set_xlabel('Month', fontsize=9, labelpad=5)
-        self.monthly_canvas.axes.set_ylabel('Amount (₺)', fontsize=9, labelpad=5)
-        
-        # Set x-axis ticks and labels
-        self.monthly_canvas.axes.set_xticks(x)
-        self.monthly_canvas.axes.set_xticklabels(month_names)
-        
-        # Add a single-column legend at the top-right
-        legend = self.monthly_canvas.axes.legend(loc='upper right', frameon=True, 
-                                              fancybox=True, framealpha=0.9, 
-                                              shadow=True, fontsize=8)
-        legend.get_frame().set_edgecolor('#cccccc')
-        
-        # Add data labels for current month
-        current_month = self.month_combo.currentData() - 1  # Adjust to 0-based index
-        if current_month >= 0 and current_month < len(x):
-            # Income label
-            self.monthly_canvas.axes.annotate(
-                f"{income_values[current_month]:,.0f} ₺",
-                xy=(x[current_month], income_values[current_month]),
-                xytext=(0, 5), textcoords="offset points",
-                ha='center', va='bottom',
-                fontsize=8, fontweight='bold', color='#2e7d32'
-            )
-            
-            # Expense label
-            self.monthly_canvas.axes.annotate(
-                f"{expense_values[current_month]:,.0f} ₺",
-                xy=(x[current_month], -expense_values[current_month]),
-                xytext=(0, -12), textcoords="offset points",
-                ha='center', va='top',
-                fontsize=8, fontweight='bold', color='#c62828'
-            )
-            
-            # Net worth label
-            self.monthly_canvas.axes.annotate(
-                f"{net_values[current_month]:,.0f} ₺",
-                xy=(x[current_month], net_values[current_month]),
-                xytext=(0, 10), textcoords="offset points",
-                ha='center', va='bottom',
-                fontsize=8, fontweight='bold', color='#1565c0'
-            )
-            
-            # Highlight current month
-            self.monthly_canvas.axes.axvline(x=x[current_month], color='#888888', 
-                                         linestyle='--', alpha=0.3, linewidth=1)
-        
-        self.monthly_canvas.fig.tight_layout()
-        self.monthly_canvas.draw()
-        
-    def update_cumulative_chart(self):
-        """Update the cumulative overview chart - IMPROVED VERSION"""
-        cumulative_data = self.controller.get_cumulative_data()
-        
-        if not cumulative_data:
-            # No data to display
-            self.cumulative_canvas.axes.clear()
-            self.cumulative_canvas.axes.text(0.5, 0.5, 'No transaction data available',
-                                           horizontalalignment='center',
-                                           verticalalignment='center',
-                                           fontsize=9,
-                                           transform=self.cumulative_canvas.axes.transAxes)
-            self.cumulative_canvas.draw()
+        index = self.charts_tab.currentIndex()
+        if index < 0 or index >= len(self.tab_canvases):
             return
         
-        # Extract data for plotting
-        dates = [d['date'] for d in cumulative_data]
-        income = [d['cumulative_income'] for d in cumulative_data]
-        expenses = [d['cumulative_expenses'] for d in cumulative_data]
-        net = [d['cumulative_net'] for d in cumulative_data]
-        
-        # Determine if we have enough data points for a sophisticated chart
-        if len(dates) < 2:
-            # Not enough data points, use simpler presentation
-            self.cumulative_canvas.axes.clear()
-            
-            # Create a horizontal stacked bar chart
-            labels = ['Current Status']
-            width = 0.5
-            
-            # Calculate the current values
-            current_income = income[-1] if income else 0
-            current_expenses = expenses[-1] if expenses else 0
-            current_net = net[-1] if net else 0
-            
-            # Create stacked bars
-            self.cumulative_canvas.axes.barh(labels, [current_income], 
-                                           color='#4CAF50', alpha=0.8, 
-                                           height=width, edgecolor='white',
-                                           label='Income')
-            
-            self.cumulative_canvas.axes.barh(labels, [-current_expenses], left=[current_income],
-                                           color='#F44336', alpha=0.8, 
-                                           height=width, edgecolor='white',
-                                           label='Expenses')
-            
-            # Add labels for each value
-            self.cumulative_canvas.axes.text(current_income/2, 0, f"{current_income:,.0f} ₺", 
-                                           ha='center', va='center', color='white', 
-                                           fontweight='bold', fontsize=9)
-            
-            self.cumulative_canvas.axes.text(current_income - current_expenses/2, 0, 
-                                           f"{current_expenses:,.0f} ₺", 
-                                           ha='center', va='center', color='white', 
-                                           fontweight='bold', fontsize=9)
-            
-            # Add net worth indicator
-            self.cumulative_canvas.axes.annotate(
-                f"Net Worth: {current_net:,.0f} ₺",
-                xy=(current_income - current_expenses, 0),
-                xytext=(0, 20), textcoords="offset points",
-                ha='center', va='bottom',
-                fontsize=10, fontweight='bold', 
-                color='#1565c0',
-                bbox=dict(boxstyle="round,pad=0.3", fc="#e3f2fd", ec="#1565c0", alpha=0.8)
-            )
-            
-            self.cumulative_canvas.axes.set_title('Current Financial Status', 
-                                                fontsize=11, fontweight='bold', pad=8)
-        else:
-            # Clear previous plot
-            self.cumulative_canvas.axes.clear()
-            
-            # Create area chart for income and expenses
-            self.cumulative_canvas.axes.fill_between(dates, income, 
-                                                 color='#4CAF50', alpha=0.3, 
-                                                 label='Income')
-            
-            self.cumulative_canvas.axes.fill_between(dates, expenses, 
-                                                 color='#F44336', alpha=0.3, 
-                                                 label='Expenses')
-            
-            # Add line for net worth
-            self.cumulative_canvas.axes.plot(dates, net, '-', 
-                                         color='#1565c0', linewidth=2.5, 
-                                         marker='o', markersize=5,
-                                         label='Net Worth')
-            
-            # Add labels for final values
-            final_date = dates[-1]
-            final_income = income[-1]
-            final_expenses = expenses[-1]
-            final_net = net[-1]
-            
-            # Income label
-            self.cumulative_canvas.axes.annotate(
-                f"{final_income:,.0f} ₺",
-                xy=(final_date, final_income),
-                xytext=(5, 0), textcoords="offset points",
-                ha='left', va='center',
-                fontsize=8, fontweight='bold', color='#2e7d32'
-            )
-            
-            # Expense label
-            self.cumulative_canvas.axes.annotate(
-                f"{final_expenses:,.0f} ₺",
-                xy=(final_date, final_expenses),
-                xytext=(5, 0), textcoords="offset points",
-                ha='left', va='center',
-                fontsize=8, fontweight='bold', color='#c62828'
-            )
-            
-            # Net worth label
-            self.cumulative_canvas.axes.annotate(
-                f"{final_net:,.0f} ₺",
-                xy=(final_date, final_net),
-                xytext=(5, 0), textcoords="offset points",
-                ha='left', va='center',
-                fontsize=8, fontweight='bold', color='#1565c0'
-            )
-            
-            self.cumulative_canvas.axes.set_title('Financial Growth Over Time', 
-                                              fontsize=11, fontweight='bold', pad=8)
-            self.cumulative_canvas.axes.set_xlabel('Date', fontsize=9, labelpad=5)
-            self.cumulative_canvas.axes.set_ylabel('Amount (₺)', fontsize=9, labelpad=5)
-            
-            # Format the dates on x-axis
-            self.cumulative_canvas.axes.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-            self.cumulative_canvas.axes.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-            
-            # Rotate date labels for better readability
-            plt.setp(self.cumulative_canvas.axes.get_xticklabels(), rotation=45, ha='right')
-        
-        # Add legend
-        legend = self.cumulative_canvas.axes.legend(loc='upper left', frameon=True, 
-                                                 fancybox=True, framealpha=0.9, 
-                                                 shadow=True, fontsize=8)
-        legend.get_frame().set_edgecolor('#cccccc')
-        
-        self.cumulative_canvas.fig.tight_layout()
-        self.cumulative_canvas.draw()
-        
-    def update_trend_chart(self, year):
-        """Update the income vs expense trend chart - IMPROVED VERSION"""
-        monthly_data = self.controller.get_monthly_data_for_year(year)
-        
-        # Clear previous plot
-        self.trend_canvas.axes.clear()
-        
-        months = list(range(1, 13))
-        income_values = [monthly_data[m]['total_income'] for m in months]
-        expense_values = [monthly_data[m]['total_expenses'] for m in months]
-        net_values = [monthly_data[m]['net_worth'] for m in months]
-        
-        # Set up month positions
-        x = np.arange(len(months))
-        
-        # Calculate ranges for shading
-        max_value = max(max(income_values), max(expense_values)) * 1.1
-        
-        # Create area chart for positive and negative cash flow
-        for i in range(len(months)):
-            # Skip months with no data
-            if income_values[i] == 0 and expense_values[i] == 0:
-                continue
-                
-            # Green for positive cash flow
-            if net_values[i] > 0:
-                self.trend_canvas.axes.fill_between([x[i]-0.4, x[i]+0.4], [0, 0], [net_values[i], net_values[i]], 
-                                                 color='#4CAF50', alpha=0.2)
-            # Red for negative cash flow
-            elif net_values[i] < 0:
-                self.trend_canvas.axes.fill_between([x[i]-0.4, x[i]+0.4], [0, 0], [net_values[i], net_values[i]], 
-                                                 color='#F44336', alpha=0.2)
-        
-        # Draw lines for income and expenses
-        self.trend_canvas.axes.plot(x, income_values, '-o', color='#4CAF50', 
-                                  linewidth=2, markersize=6, label='Income')
-        self.trend_canvas.axes.plot(x, expense_values, '-o', color='#F44336', 
-                                  linewidth=2, markersize=6, label='Expenses')
-        
-        # Highlight the balance point with a horizontal line
-        self.trend_canvas.axes.axhline(y=0, color='#444444', linestyle='-', alpha=0.3)
-        
-        # Add savings/deficit markers at each point
-        for i, (inc, exp, net) in enumerate(zip(income_values, expense_values, net_values)):
-            # Skip months with no data
-            if inc == 0 and exp == 0:
-                continue
-                
-            # Add net value text
-            if net > 0:
-                color = '#4CAF50'  # Green for positive
-                y_offset = 10
-                va = 'bottom'
-                prefix = '+'
-            else:
-                color = '#F44336'  # Red for negative
-                y_offset = -10
-                va = 'top'
-                prefix = ''
-            
-            # Add text label for the net value
-            self.trend_canvas.axes.annotate(
-                f"{prefix}{net:,.0f} ₺",
-                xy=(x[i], (inc + exp) / 2),
-                xytext=(0, y_offset), textcoords="offset points",
-                ha='center', va=va,
-                fontsize=8, fontweight='bold', color=color
-            )
-        
-        # Add labels and formatting
-        self.trend_canvas.axes.set_title(f'Monthly Cash Flow ({year})', 
-                                      fontsize=11, fontweight='bold', pad=8)
-        self.trend_canvas.axes.set_xlabel('Month', fontsize=9, labelpad=5)
-        self.trend_canvas.axes.set_ylabel('Amount (₺)', fontsize=9, labelpad=5)
-        
-        # Set x-axis ticks and labels
-        self.trend_canvas.axes.set_xticks(x)
-        self.trend_canvas.axes.set_xticklabels([calendar.month_abbr[m] for m in months])
-        
-        # Add a legend
-        legend = self.trend_canvas.axes.legend(loc='upper right', fontsize=8)
-        
-        # Get the current month
-        current_month = self.month_combo.currentData() - 1  # Adjust to 0-based index
-        if current_month >= 0 and current_month < len(x):
-            # Highlight current month
-            self.trend_canvas.axes.axvline(x=x[current_month], color='#888888', 
-                                        linestyle='--', alpha=0.5, linewidth=1)
-        
-        self.trend_canvas.fig.tight_layout()
-        self.trend_canvas.draw()
-        
-    def update_category_chart(self, year, month):
-        """Update the expense category breakdown pie chart using transaction categories"""
-        # Get transactions for the selected month
-        transactions = self.controller.finance_manager.get_transactions_by_month(year, month)
-        
-        # Clear previous plot
-        self.category_canvas.axes.clear()
-        
-        if not transactions:
-            self.category_canvas.axes.text(0.5, 0.5, 'No transactions for this month',
-                                          horizontalalignment='center',
-                                          verticalalignment='center',
-                                          fontsize=9,
-                                          transform=self.category_canvas.axes.transAxes)
-            self.category_canvas.draw()
+        canvases = self.tab_canvases[index] or self.build_chart_tab(index)
+        started = time.perf_counter()
+        timings = {}
+        for canvas in canvases:
+            if canvas.dirty:
+                canvas.render_chart(self.dataset)
+                canvas.dirty = False
+                timings[canvas.chart_class.__name__] = canvas.timings
+        if timings:
+            self.record_timings(index, (time.perf_counter() - started) * 1000, timings)
+        
+        self.prefetch_neighbors(self.dataset)
+        
+    def record_timings(self, index, render_ms, timings):
+        """Log the timings of a redraw and show its totals"""
+        refresh = self.timing_log.add(self.dataset.year, self.dataset.month, CHART_TABS[index][0],
+                                      self.load_ms, render_ms, timings)
+        # The load belongs to the first redraw after it only
+        self.load_ms = None
+        
+        cached = sum(1 for chart in timings.values() if chart["cached"])
+        text = f"Last redraw: {refresh.render_ms:.0f} ms for {len(timings)} charts"
+        if cached:
+            text += f" ({cached} cached)"
+        if refresh.load_ms is not None:
+            text += f", data load {refresh.load_ms:.0f} ms"
+        self.timings_label.setText(text)
+        
+    def set_timing_overlay(self, enabled):
+        """Show or hide the per chart timings and the redraw totals"""
+        self.show_timings = enabled
+        self.timings_label.setVisible(enabled)
+        self.export_timings_btn.setVisible(enabled)
+        for canvas in self.canvases:
+            canvas.show_timings = enabled
+            canvas.update()
+        
+    def export_timings(self):
+        """Save the logged redraw timings as CSV or JSON"""
+        path, _ = QFileDialog.getSaveFileName(self, "Export Chart Timings", "chart_timings.csv",
+                                              "CSV Files (*.csv);;JSON Files (*.json)")
+        if not path:
             return
-        
-        # Filter for expenses only
-        expense_transactions = [t for t in transactions if t.transaction_type.value == 'expense']
-        
-        if not expense_transactions:
-            self.category_canvas.axes.text(0.5, 0.5, 'No expense transactions for this month',
-                                          horizontalalignment='center',
-                                          verticalalignment='center',
-                                          fontsize=9,
-                                          transform=self.category_canvas.axes.transAxes)
-            self.category_canvas.draw()
-            return
-        
-        # Group transactions by category
-        categories = defaultdict(float)
-        
-        for transaction in expense_transactions:
-            # Use transaction category if available, otherwise use name as fallback
-            category = transaction.category if transaction.category else transaction.name
-            categories[category] += transaction.amount
-        
-        # Sort by amount and get top categories
-        sorted_categories = dict(sorted(categories.items(), key=lambda x: x[1], reverse=True))
-        
-        # Limit to top 6 categories and group the rest as "Other"
-        if len(sorted_categories) > 6:
-            top_categories = dict(list(sorted_categories.items())[:5])
-            other_amount = sum(list(sorted_categories.values())[5:])
-            top_categories["Other"] = other_amount
-            sorted_categories = top_categories
-        
-        # Prepare data for donut chart
-        labels = list(sorted_categories.keys())
-        sizes = list(sorted_categories.values())
-        
-        # Calculate percentages
-        total = sum(sizes)
-        percentages = [(size/total)*100 for size in sizes]
-        
-        # Set an aspect ratio for the pie chart
-        self.category_canvas.axes.set_aspect('equal')
-        
-        # Create donut chart with custom colors
-        colors = ['#42A5F5', '#66BB6A', '#FFA726', '#EF5350', '#AB47BC', '#7E57C2', '#78909C']
-        
-        # Create wedges with auto-pct text
-        wedges, texts, autotexts = self.category_canvas.axes.pie(
-            sizes, 
-            labels=None,  # We'll add custom labels
-            colors=colors[:len(labels)],
-            autopct='%1.1f%%',
-            pctdistance=0.85,
-            wedgeprops={'width': 0.4, 'edgecolor': 'w', 'linewidth': 2},
-            textprops={'fontsize': 9, 'color': '#333333'},
-            startangle=90
-        )
-        
-        # Style percentage texts
-        for autotext in autotexts:
-            autotext.set_fontsize(8)
-            autotext.set_fontweight('bold')
-        
-        # Create center circle for donut chart
-        circle = plt.Circle((0, 0), 0.4, fc='white')
-        self.category_canvas.axes.add_artist(circle)
-        
-        # Display total amount in center
-        self.category_canvas.axes.text(0, 0, f"{total:,.0f} ₺",
-                                     ha='center', va='center',
-                                     fontsize=11, fontweight='bold')
-        
-        self.category_canvas.axes.text(0, -0.15, "Total Expenses",
-                                     ha='center', va='center',
-                                     fontsize=8, color='#555555')
-        
-        # Create legend with categories and values
-        legend_labels = [f"{label} ({value:,.0f} ₺)" for label, value in zip(labels, sizes)]
-        self.category_canvas.axes.legend(wedges, legend_labels,
-                                       loc="center left",
-                                       bbox_to_anchor=(1, 0.5),
-                                       fontsize=8)
-        
-        # Add title
-        self.category_canvas.axes.set_title(f'Expense Breakdown by Category - {calendar.month_name[month]} {year}', 
-                                          fontsize=11, fontweight='bold', pad=8)
-        
-        self.category_canvas.fig.tight_layout()
-        self.category_canvas.draw()
-        
-    def update_comparison_chart(self, year, month):
-        """Monthly Comparison Chart that compares expenses with previous and next month"""
-        # Clear previous plot
-        self.comparison_canvas.axes.clear()
-        
-        # Get previous, current and next month
-        current_date = datetime(year, month, 1)
-        prev_date = current_date - relativedelta(months=1)
-        next_date = current_date + relativedelta(months=1)
-        
-        # Get data for all three months
-        current_summary = self.controller.get_monthly_summary(current_date.year, current_date.month)
-        prev_summary = self.controller.get_monthly_summary(prev_date.year, prev_date.month)
-        next_summary = self.controller.get_monthly_summary(next_date.year, next_date.month)
-        
-        # Prepare data for plotting
-        months = [prev_date.strftime('%b %Y'), current_date.strftime('%b %Y'), next_date.strftime('%b %Y')]
-        income_values = [prev_summary['total_income'], current_summary['total_income'], next_summary['total_income']]
-        expense_values = [prev_summary['total_expenses'], current_summary['total_expenses'], next_summary['total_expenses']]
-        net_values = [prev_summary['net_worth'], current_summary['net_worth'], next_summary['net_worth']]
-        
-        # Set up month positions
-        x = np.arange(len(months))
-        width = 0.35  # width of the bars
-        
-        # Create grouped bar chart
-        self.comparison_canvas.axes.bar(x - width/2, income_values, width, color='#4CAF50', alpha=0.8, label='Income')
-        self.comparison_canvas.axes.bar(x + width/2, expense_values, width, color='#F44336', alpha=0.8, label='Expenses')
-        
-        # Add net worth as line
-        self.comparison_canvas.axes.plot(x, net_values, 'o-', color='#2196F3', linewidth=2, markersize=8, label='Net Worth')
-        
-        # Add zero line
-        self.comparison_canvas.axes.axhline(y=0, color='#888888', linestyle='-', alpha=0.3, linewidth=1)
-        
-        # Add data labels
-        for i, (inc, exp, net) in enumerate(zip(income_values, expense_values, net_values)):
-            # Income label
-            self.comparison_canvas.axes.annotate(
-                f"{inc:,.0f} ₺",
-                xy=(x[i] - width/2, inc),
-                xytext=(0, 5), textcoords="offset points",
-                ha='center', va='bottom',
-                fontsize=8, fontweight='bold', color='#2e7d32'
-            )
-            
-            # Expense label
-            self.comparison_canvas.axes.annotate(
-                f"{exp:,.0f} ₺",
-                xy=(x[i] + width/2, exp),
-                xytext=(0, 5), textcoords="offset points",
-                ha='center', va='bottom',
-                fontsize=8, fontweight='bold', color='#c62828'
-            )
-            
-            # Net worth label with arrow indicator
-            arrow_char = ''
-            if i == 1:  # Current month
-                # Compare with previous month
-                if net > net_values[0]:
-                    arrow_char = '↑ '  # Up arrow
-                    net_color = '#4CAF50'  # Green
-                elif net < net_values[0]:
-                    arrow_char = '↓ '  # Down arrow
-                    net_color = '#F44336'  # Red
-                else:
-                    arrow_char = '→ '  # Right arrow
-                    net_color = '#2196F3'  # Blue
-                
-                # Add percent change
-                if net_values[0] != 0:
-                    pct_change = ((net - net_values[0]) / abs(net_values[0])) * 100
-                    arrow_char += f"{pct_change:+.1f}% "
+        try:
+            self.timing_log.export(path)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Failed to export timings: {str(e)}")
+        
+    def get_neighbor_months(self, dataset: DashboardDataset):
+        """Get the months reachable with one step of the month selector"""
+        return [(dataset.year, m) for m in (dataset.month - 1, dataset.month + 1) if 1 <= m <= 12]
+        
+    def prefetch_neighbors(self, dataset: DashboardDataset):
+        """Pre-render the visible charts for the neighboring months, building their data if needed"""
+        self.prerender_queue.clear()
+        for year, month in self.get_neighbor_months(dataset):
+            neighbor = self.controller.peek_dashboard_dataset(year, month)
+            if neighbor is not None:
+                self.queue_prerender(neighbor)
             else:
-                net_color = '#2196F3'  # Blue
-            
-            self.comparison_canvas.axes.annotate(
-                f"{arrow_char}{net:,.0f} ₺",
-                xy=(x[i], net),
-                xytext=(0, 10), textcoords="offset points",
-                ha='center', va='bottom',
-                fontsize=8, fontweight='bold', color=net_color
-            )
-        
-        # Highlight current month with vertical line and background
-        self.comparison_canvas.axes.axvspan(x[1]-0.4, x[1]+0.4, alpha=0.15, color='#2196F3')
-        
-        # Set x-axis ticks and labels
-        self.comparison_canvas.axes.set_xticks(x)
-        self.comparison_canvas.axes.set_xticklabels(months)
-        
-        # Add a legend
-        legend = self.comparison_canvas.axes.legend(loc='upper right', fontsize=8)
-        
-        # Add title and labels
-        self.comparison_canvas.axes.set_title('Monthly Financial Comparison', 
-                                          fontsize=11, fontweight='bold', pad=8)
-        self.comparison_canvas.axes.set_xlabel('Month', fontsize=9, labelpad=5)
-        self.comparison_canvas.axes.set_ylabel('Amount (₺)', fontsize=9, labelpad=5)
+                self.dataset_loader.prefetch(year, month)
         
-        self.comparison_canvas.fig.tight_layout()
-        self.comparison_canvas.draw()
-        
-    def update_category_comparison_chart(self, year, month):
-        """Compare expense categories between current, previous, and next month"""
-        # Clear previous plot
-        self.category_comparison_canvas.axes.clear()
-        
-        # Get previous, current, and next month dates
-        current_date = datetime(year, month, 1)
-        prev_date = current_date - relativedelta(months=1)
-        next_date = current_date + relativedelta(months=1)
-        
-        # Get transactions for all three months
-        current_transactions = self.controller.finance_manager.get_transactions_by_month(
-            current_date.year, current_date.month)
-        prev_transactions = self.controller.finance_manager.get_transactions_by_month(
-            prev_date.year, prev_date.month)
-        next_transactions = self.controller.finance_manager.get_transactions_by_month(
-            next_date.year, next_date.month)
-        
-        # Filter for expense transactions only
-        current_expenses = [t for t in current_transactions if t.transaction_type.value == 'expense']
-        prev_expenses = [t for t in prev_transactions if t.transaction_type.value == 'expense']
-        next_expenses = [t for t in next_transactions if t.transaction_type.value == 'expense']
-        
-        if not current_expenses and not prev_expenses and not next_expenses:
-            self.category_comparison_canvas.axes.text(0.5, 0.5, 'No expense transactions to compare',
-                                                    horizontalalignment='center',
-                                                    verticalalignment='center',
-                                                    fontsize=9,
-                                                    transform=self.category_comparison_canvas.axes.transAxes)
-            self.category_comparison_canvas.draw()
+    def on_dataset_prefetched(self, dataset: DashboardDataset):
+        """Pre-render a prefetched dataset if it is still next to the selection"""
+        if self.dataset is None:
             return
+        if (dataset.year, dataset.month) in self.get_neighbor_months(self.dataset):
+            self.queue_prerender(dataset)
         
-        # Group transactions by category for each month
-        def group_by_category(transactions):
-            categories = defaultdict(float)
-            for t in transactions:
-                category = t.category if t.category else t.name
-                categories[category] += t.amount
-            return categories
-        
-        prev_categories = group_by_category(prev_expenses)
-        current_categories = group_by_category(current_expenses)
-        next_categories = group_by_category(next_expenses)
-        
-        # Get all unique categories across all three months
-        all_categories = set(list(prev_categories.keys()) + 
-                             list(current_categories.keys()) + 
-                             list(next_categories.keys()))
-        
-        # Sort categories by current month amount (or previous if current doesn't exist)
-        def get_category_value(category):
-            if category in current_categories:
-                return current_categories[category]
-            elif category in prev_categories:
-                return prev_categories[category]
-            else:
-                return next_categories.get(category, 0)
-        
-        sorted_categories = sorted(all_categories, key=get_category_value, reverse=True)
-        
-        # Limit to top 5 categories
-        if len(sorted_categories) > 5:
-            top_categories = sorted_categories[:5]
-            
-            # Add an "Other" category for the rest
-            other_prev = sum(prev_categories.get(cat, 0) for cat in sorted_categories[5:])
-            other_current = sum(current_categories.get(cat, 0) for cat in sorted_categories[5:])
-            other_next = sum(next_categories.get(cat, 0) for cat in sorted_categories[5:])
-            
-            prev_categories["Other"] = other_prev
-            current_categories["Other"] = other_current
-            next_categories["Other"] = other_next
-            
-            sorted_categories = top_categories + ["Other"]
-        
-        # Prepare data for grouped bar chart
-        x = np.arange(len(sorted_categories))
-        width = 0.25  # width of bars
-        
-        # Extract values maintaining the sort order
-        prev_values = [prev_categories.get(cat, 0) for cat in sorted_categories]
-        current_values = [current_categories.get(cat, 0) for cat in sorted_categories]
-        next_values = [next_categories.get(cat, 0) for cat in sorted_categories]
-        
-        # Create grouped bar chart
-        self.category_comparison_canvas.axes.bar(x - width, prev_values, width, 
-                                               color='#78909C', alpha=0.8, 
-                                               label=prev_date.strftime('%b %Y'))
-        self.category_comparison_canvas.axes.bar(x, current_values, width, 
-                                               color='#F44336', alpha=0.8, 
-                                               label=current_date.strftime('%b %Y'))
-        self.category_comparison_canvas.axes.bar(x + width, next_values, width, 
-                                               color='#FFA726', alpha=0.8, 
-                                               label=next_date.strftime('%b %Y'))
-        
-        # Add data labels for current month
-        for i, value in enumerate(current_values):
-            if value > 0:
-                self.category_comparison_canvas.axes.text(
-                    x[i], value, f"{value:,.0f}", 
-                    ha='center', va='bottom', fontsize=7, fontweight='bold',
-                    rotation=45 if value > max(current_values) * 0.8 else 0
-                )
-        
-        # Add title and labels
-        self.category_comparison_canvas.axes.set_title('Expense Categories Comparison', 
-                                                     fontsize=11, fontweight='bold', pad=8)
-        self.category_comparison_canvas.axes.set_xlabel('Category', fontsize=9, labelpad=5)
-        self.category_comparison_canvas.axes.set_ylabel('Amount (₺)', fontsize=9, labelpad=5)
-        
-        # Set x-axis ticks and labels
-        self.category_comparison_canvas.axes.set_xticks(x)
-        
-        # Rotate labels for better readability
-        self.category_comparison_canvas.axes.set_xticklabels(sorted_categories, rotation=25, ha='right')
-        
-        # Add legend
-        self.category_comparison_canvas.axes.legend(loc='upper right', fontsize=8)
-        
-        self.category_comparison_canvas.fig.tight_layout()
-        self.category_comparison_canvas.draw()
-        
-    def update_forecast_chart(self, year, month):
-        """Financial forecast chart for next 6 months based on past trends"""
-        # Clear previous plot
-        self.forecast_canvas.axes.clear()
-        
-        # Get historical data for the last 6 months (including current)
-        current_date = datetime(year, month, 1)
-        historical_data = []
-        
-        for i in range(5, -1, -1):  # Get 6 months of historical data (including current)
-            hist_date = current_date - relativedelta(months=i)
-            summary = self.controller.get_monthly_summary(hist_date.year, hist_date.month)
-            historical_data.append({
-                'date': hist_date,
-                'income': summary['total_income'],
-                'expenses': summary['total_expenses'],
-                'net_worth': summary['net_worth']
-            })
-        
-        # Project next 6 months
-        forecast_data = []
-        
-        # Simple forecasting using average of last 3 months for trend
-        if len(historical_data) >= 3:
-            # Calculate average monthly change for income and expenses
-            avg_income_change = 0
-            avg_expense_change = 0
-            
-            for i in range(len(historical_data) - 1, 0, -1):
-                income_change = historical_data[i]['income'] - historical_data[i-1]['income']
-                expense_change = historical_data[i]['expenses'] - historical_data[i-1]['expenses']
-                
-                # Weight recent months more heavily
-                weight = 1.0
-                if i >= len(historical_data) - 3:  # Last 3 months
-                    weight = 2.0
-                
-                avg_income_change += income_change * weight
-                avg_expense_change += expense_change * weight
-            
-            # Normalize by sum of weights (1.0 for older months, 2.0 for last 3)
-            weights_sum = len(historical_data) - 1 + min(3, len(historical_data) - 1)
-            if weights_sum > 0:
-                avg_income_change /= weights_sum
-                avg_expense_change /= weights_sum
-            
-            # Generate forecasts for next 6 months
-            last_income = historical_data[-1]['income']
-            last_expense = historical_data[-1]['expenses']
-            
-            for i in range(1, 7):  # Next 6 months
-                forecast_date = current_date + relativedelta(months=i)
-                forecast_income = max(0, last_income + (avg_income_change * i))
-                forecast_expense = max(0, last_expense + (avg_expense_change * i))
-                forecast_net = forecast_income - forecast_expense
-                
-                forecast_data.append({
-                    'date': forecast_date,
-                    'income': forecast_income,
-                    'expenses': forecast_expense,
-                    'net_worth': forecast_net
-                })
-        
-        # Combine historical and forecast data
-        all_data = historical_data + forecast_data
-        
-        # Prepare data for plotting
-        dates = [d['date'] for d in all_data]
-        incomes = [d['income'] for d in all_data]
-        expenses = [d['expenses'] for d in all_data]
-        net_worths = [d['net_worth'] for d in all_data]
-        
-        # Create plot
-        # Historical data - solid lines
-        hist_dates = dates[:len(historical_data)]
-        hist_incomes = incomes[:len(historical_data)]
-        hist_expenses = expenses[:len(historical_data)]
-        hist_nets = net_worths[:len(historical_data)]
-        
-        self.forecast_canvas.axes.plot(hist_dates, hist_incomes, 'o-', color='#4CAF50', 
-                                     linewidth=2, markersize=5, label='Income (Actual)')
-        self.forecast_canvas.axes.plot(hist_dates, hist_expenses, 'o-', color='#F44336', 
-                                     linewidth=2, markersize=5, label='Expenses (Actual)')
-        self.forecast_canvas.axes.plot(hist_dates, hist_nets, 'o-', color='#2196F3', 
-                                     linewidth=2, markersize=5, label='Net Worth (Actual)')
-        
-        # Forecast data - dashed lines
-        if forecast_data:
-            forecast_dates = dates[len(historical_data):]
-            forecast_incomes = incomes[len(historical_data):]
-            forecast_expenses = expenses[len(historical_data):]
-            forecast_nets = net_worths[len(historical_data):]
-            
-            # Add vertical line separating actual from forecast
-            self.forecast_canvas.axes.axvline(x=current_date, color='#888888', 
-                                           linestyle='--', alpha=0.5)
-            
-            # Add "Forecast starts" text
-            self.forecast_canvas.axes.text(current_date, max(max(incomes), max(expenses)) * 0.9,
-                                        ' Forecast →', 
-                                        ha='left', va='top',
-                                        fontsize=8, fontweight='bold',
-                                        bbox=dict(facecolor='white', alpha=0.8, boxstyle='round,pad=0.3'))
-            
-            # Plot forecast data with dashed lines
-            self.forecast_canvas.axes.plot(forecast_dates, forecast_incomes, '--', color='#4CAF50', 
-                                        linewidth=2, label='Income (Forecast)')
-            self.forecast_canvas.axes.plot(forecast_dates, forecast_expenses, '--', color='#F44336', 
-                                        linewidth=2, label='Expenses (Forecast)')
-            self.forecast_canvas.axes.plot(forecast_dates, forecast_nets, '--', color='#2196F3', 
-                                        linewidth=2, label='Net Worth (Forecast)')
-            
-            # Add labels for the final forecast point
-            self.forecast_canvas.axes.annotate(
-                f"{forecast_incomes[-1]:,.0f} ₺",
-                xy=(forecast_dates[-1], forecast_incomes[-1]),
-                xytext=(5, 0), textcoords="offset points",
-                ha='left', va='center',
-                fontsize=8, fontweight='bold', color='#4CAF50'
-            )
-            
-            self.forecast_canvas.axes.annotate(
-                f"{forecast_expenses[-1]:,.0f} ₺",
-                xy=(forecast_dates[-1], forecast_expenses[-1]),
-                xytext=(5, 0), textcoords="offset points",
-                ha='left', va='center',
-                fontsize=8, fontweight='bold', color='#F44336'
-            )
-            
-            self.forecast_canvas.axes.annotate(
-                f"{forecast_nets[-1]:,.0f} ₺",
-                xy=(forecast_dates[-1], forecast_nets[-1]),
-                xytext=(5, 0), textcoords="offset points",
-                ha='left', va='center',
-                fontsize=8, fontweight='bold', color='#2196F3'
-            )
-        
-        # Add title and labels
-        self.forecast_canvas.axes.set_title('6-Month Financial Forecast', 
-                                         fontsize=11, fontweight='bold', pad=8)
-        self.forecast_canvas.axes.set_xlabel('Month', fontsize=9, labelpad=5)
-        self.forecast_canvas.axes.set_ylabel('Amount (₺)', fontsize=9, labelpad=5)
-        
-        # Format x-axis dates
-        self.forecast_canvas.axes.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-        if len(dates) > 8:
-            self.forecast_canvas.axes.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
-        else:
-            self.forecast_canvas.axes.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-        
-        # Rotate date labels for better readability
-        plt.setp(self.forecast_canvas.axes.get_xticklabels(), rotation=45, ha='right')
-        
-        # Add legend
-        self.forecast_canvas.axes.legend(loc='upper left', fontsize=8)
-        
-        # Add horizontal line at zero
-        self.forecast_canvas.axes.axhline(y=0, color='#888888', linestyle='-', alpha=0.3)
-        
-        self.forecast_canvas.fig.tight_layout()
-        self.forecast_canvas.draw()
-        
-    def update_savings_forecast_chart(self, year, month):
-        """Savings and financial goals simulation chart"""
-        # Clear previous plot
-        self.savings_forecast_canvas.axes.clear()
-        
-        # Current date based on selection
-        current_date = datetime(year, month, 1)
-        
-        # Get current monthly summary
-        current_summary = self.controller.get_monthly_summary(year, month)
-        current_income = current_summary['total_income']
-        current_expenses = current_summary['total_expenses']
-        current_savings = current_income - current_expenses
-        
-        # Get active financial goals
-        goals = self.controller.get_goals_by_month(year, month)
-        
-        # If we have no data, show a message
-        if current_income == 0 and current_expenses == 0 and not goals:
-            self.savings_forecast_canvas.axes.text(0.5, 0.5, 'No financial data or goals available',
-                                                 horizontalalignment='center',
-                                                 verticalalignment='center',
-                                                 fontsize=9,
-                                                 transform=self.savings_forecast_canvas.axes.transAxes)
-            self.savings_forecast_canvas.draw()
+    def queue_prerender(self, dataset: DashboardDataset):
+        """Queue the charts of the visible sub-tab for off-screen rendering"""
+        index = self.charts_tab.currentIndex()
+        if index < 0 or index >= len(self.tab_canvases) or self.tab_canvases[index] is None:
             return
         
-        # Create savings projection scenarios
-        # Best case: Income increases by 5%, expenses decrease by 3%
-        # Normal case: Income and expenses stay constant
-        # Worst case: Income decreases by 3%, expenses increase by 5%
-        
-        months = 12  # Project for next 12 months
-        dates = [current_date + relativedelta(months=i) for i in range(months)]
-        
-        # Initialize savings scenarios
-        best_case = [0] * months
-        normal_case = [0] * months
-        worst_case = [0] * months
-        
-        # Calculate cumulative savings for each scenario
-        for i in range(months):
-            # Best case
-            if i == 0:
-                best_case[i] = current_savings
-            else:
-                income_growth = current_income * (1 + 0.05) ** i
-                expense_reduction = current_expenses * (1 - 0.03) ** i
-                best_case[i] = best_case[i-1] + (income_growth - expense_reduction)
-            
-            # Normal case
-            if i == 0:
-                normal_case[i] = current_savings
-            else:
-                normal_case[i] = normal_case[i-1] + current_savings
-            
-            # Worst case
-            if i == 0:
-                worst_case[i] = current_savings
-            else:
-                income_decline = current_income * (1 - 0.03) ** i
-                expense_growth = current_expenses * (1 + 0.05) ** i
-                worst_case[i] = worst_case[i-1] + (income_decline - expense_growth)
-        
-        # Create cumulative savings projection chart
-        self.savings_forecast_canvas.axes.plot(dates, best_case, '-', color='#4CAF50', 
-                                          linewidth=2, label='Best Case')
-        self.savings_forecast_canvas.axes.plot(dates, normal_case, '-', color='#2196F3', 
-                                          linewidth=2, label='Expected Case')
-        self.savings_forecast_canvas.axes.plot(dates, worst_case, '-', color='#F44336', 
-                                          linewidth=2, label='Worst Case')
-        
-        # Fill between the scenarios to show range
-        self.savings_forecast_canvas.axes.fill_between(dates, best_case, normal_case, 
-                                                  color='#4CAF50', alpha=0.2)
-        self.savings_forecast_canvas.axes.fill_between(dates, normal_case, worst_case, 
-                                                  color='#F44336', alpha=0.2)
-        
-        # Add goal lines if goals exist
-        for goal in goals:
-            if goal.goal_type.value == 'savings':
-                # Draw horizontal line for savings goal
-                self.savings_forecast_canvas.axes.axhline(y=goal.amount, color='#9C27B0', 
-                                                     linestyle='--', linewidth=1.5)
-                
-                # Add goal label
-                self.savings_forecast_canvas.axes.text(
-                    dates[0], goal.amount, 
-                    f"Goal: {goal.name} ({goal.amount:,.0f} ₺)", 
-                    ha='left', va='bottom',
-                    fontsize=8, fontweight='bold', color='#9C27B0',
-                    bbox=dict(facecolor='white', alpha=0.8, boxstyle='round,pad=0.2')
-                )
-                
-                # Calculate goal achievement timeline
-                if current_savings > 0:
-                    # Find intersection with normal case
-                    for i, savings in enumerate(normal_case):
-                        if savings >= goal.amount:
-                            # Mark the intersection point
-                            self.savings_forecast_canvas.axes.plot(
-                                dates[i], goal.amount, 'o', 
-                                color='#9C27B0', markersize=8
-                            )
-                            
-                            # Add achievement date text
-                            self.savings_forecast_canvas.axes.text(
-                                dates[i], goal.amount,
-                                f"Goal reached: {dates[i].strftime('%b %Y')}",
-                                ha='right', va='top',
-                                fontsize=8, fontweight='bold', color='#9C27B0',
-                                bbox=dict(facecolor='white', alpha=0.8, boxstyle='round,pad=0.2')
-                            )
-                            break
-        
-        # Add title and labels
-        self.savings_forecast_canvas.axes.set_title('Savings Projection (Next 12 Months)', 
-                                               fontsize=11, fontweight='bold', pad=8)
-        self.savings_forecast_canvas.axes.set_xlabel('Month', fontsize=9, labelpad=5)
-        self.savings_forecast_canvas.axes.set_ylabel('Cumulative Savings (₺)', fontsize=9, labelpad=5)
-        
-        # Format x-axis dates
-        self.savings_forecast_canvas.axes.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-        self.savings_forecast_canvas.axes.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
-        
-        # Rotate date labels for better readability
-        plt.setp(self.savings_forecast_canvas.axes.get_xticklabels(), rotation=45, ha='right')
-        
-        # Add horizontal line at zero
-        self.savings_forecast_canvas.axes.axhline(y=0, color='#888888', linestyle='-', alpha=0.3)
-        
-        # Add scenario descriptions
-        scenario_text = """
-        Scenarios:
-        • Best: Income +5%/mo, Expenses -3%/mo
-        • Expected: Current rates maintained
-        • Worst: Income -3%/mo, Expenses +5%/mo
-        """
-        
-        self.savings_forecast_canvas.axes.text(
-            0.02, 0.02, scenario_text,
-            transform=self.savings_forecast_canvas.axes.transAxes,
-            fontsize=7, va='bottom', ha='left',
-            bbox=dict(facecolor='white', alpha=0.8, boxstyle='round,pad=0.3')
-        )
-        
-        # Add starting points annotations
-        self.savings_forecast_canvas.axes.annotate(
-            f"Start: {current_savings:,.0f} ₺",
-            xy=(dates[0], current_savings),
-            xytext=(5, 0), textcoords="offset points",
-            ha='left', va='center',
-            fontsize=8, fontweight='bold', color='#2196F3'
-        )
-        
-        # Add final values annotations
-        self.savings_forecast_canvas.axes.annotate(
-            f"{best_case[-1]:,.0f} ₺",
-            xy=(dates[-1], best_case[-1]),
-            xytext=(-5, 0), textcoords="offset points",
-            ha='right', va='center',
-            fontsize=8, fontweight='bold', color='#4CAF50'
-        )
-        
-        self.savings_forecast_canvas.axes.annotate(
-            f"{normal_case[-1]:,.0f} ₺",
-            xy=(dates[-1], normal_case[-1]),
-            xytext=(-5, 0), textcoords="offset points",
-            ha='right', va='center',
-            fontsize=8, fontweight='bold', color='#2196F3'
-        )
+        for canvas in self.tab_canvases[index]:
+            self.prerender_queue.append((canvas, dataset))
+        self.prerender_timer.start()
         
-        self.savings_forecast_canvas.axes.annotate(
-            f"{worst_case[-1]:,.0f} ₺",
-            xy=(dates[-1], worst_case[-1]),
-            xytext=(-5, 0), textcoords="offset points",
-            ha='right', va='center',
-            fontsize=8, fontweight='bold', color='#F44336'
-        )
-        
-        # Add legend
-        self.savings_forecast_canvas.axes.legend(loc='upper left', fontsize=8)
-        
-        self.savings_forecast_canvas.fig.tight_layout()
-        self.savings_forecast_canvas.draw()
-
-    def update_forecast_actual_summary_chart(self, comparison_data, year, month):
-        """Update the forecast vs actual summary chart"""
-        # Clear previous plot
-        self.forecast_actual_summary_canvas.axes.clear()
-        
-        # Extract data
-        income_data = comparison_data['summary']['income']
-        expense_data = comparison_data['summary']['expenses']
-        net_data = comparison_data['summary']['net_worth']
-        
-        # Set positions for bars
-        x = np.arange(3)  # 3 categories: Income, Expenses, Net
-        width = 0.35      # Width of bars
-        
-        # Create grouped bar chart
-        self.forecast_actual_summary_canvas.axes.bar(
-            x - width/2, 
-            [income_data['forecast'], expense_data['forecast'], net_data['forecast']], 
-            width, 
-            color=['#81c784', '#e57373', '#64b5f6'], 
-            alpha=0.7,
-            label='Forecast'
-        )
-        
-        self.forecast_actual_summary_canvas.axes.bar(
-            x + width/2, 
-            [income_data['actual'], expense_data['actual'], net_data['actual']], 
-            width, 
-            color=['#2e7d32', '#c62828', '#1565c0'], 
-            alpha=0.9,
-            label='Actual'
-        )
-        
-        # Add data labels
-        for i, (forecast, actual) in enumerate(zip(
-            [income_data['forecast'], expense_data['forecast'], net_data['forecast']],
-            [income_data['actual'], expense_data['actual'], net_data['actual']]
-        )):
-            # Forecast label
-            self.forecast_actual_summary_canvas.axes.text(
-                x[i] - width/2, forecast, 
-                f"{forecast:,.0f}",
-                ha='center', va='bottom',
-                fontsize=8, fontweight='bold',
-                color='#333333'
-            )
-            
-            # Actual label
-            self.forecast_actual_summary_canvas.axes.text(
-                x[i] + width/2, actual, 
-                f"{actual:,.0f}",
-                ha='center', va='bottom',
-                fontsize=8, fontweight='bold',
-                color='#333333'
-            )
-            
-            # Add variance label
-            variance = income_data['variance'] if i == 0 else expense_data['variance'] if i == 1 else net_data['variance']
-            variance_pct = income_data['variance_pct'] if i == 0 else expense_data['variance_pct'] if i == 1 else net_data['variance_pct']
-            
-            # Determine color based on whether the variance is good or bad
-            if (i == 0 and variance >= 0) or (i == 1 and variance <= 0) or (i == 2 and variance >= 0):
-                variance_color = '#2e7d32'  # Green for positive
-            else:
-                variance_color = '#c62828'  # Red for negative
-            
-            self.forecast_actual_summary_canvas.axes.text(
-                x[i], min(forecast, actual) / 2,
-                f"{variance:+,.0f} ({variance_pct:+.1f}%)",
-                ha='center', va='center',
-                fontsize=8, fontweight='bold',
-                color=variance_color,
-                bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="lightgrey", alpha=0.8)
-            )
-        
-        # Add labels and title
-        self.forecast_actual_summary_canvas.axes.set_title(
-            f'Forecast vs Actual Summary - {calendar.month_name[month]} {year}',
-            fontsize=11, fontweight='bold', pad=8
-        )
-        
-        self.forecast_actual_summary_canvas.axes.set_xticks(x)
-        self.forecast_actual_summary_canvas.axes.set_xticklabels(['Income', 'Expenses', 'Net Worth'])
-        self.forecast_actual_summary_canvas.axes.set_ylabel('Amount (₺)', fontsize=9)
-        
-        # Add zero line
-        self.forecast_actual_summary_canvas.axes.axhline(y=0, color='grey', linestyle='-', alpha=0.3, linewidth=1)
-        
-        # Add legend
-        self.forecast_actual_summary_canvas.axes.legend(fontsize=8)
-        
-        # Update layout
-        self.forecast_actual_summary_canvas.fig.tight_layout()
-        self.forecast_actual_summary_canvas.draw()
-
-    def update_forecast_actual_category_chart(self, comparison_data, year, month):
-        """Update the forecast vs actual category chart"""
-        # Clear previous plot
-        self.forecast_actual_category_canvas.axes.clear()
-        
-        # We'll create separate charts for income and expenses
-        # First, let's prepare the data
-        income_categories = comparison_data['income_categories']
-        expense_categories = comparison_data['expense_categories']
-        
-        # For this example, we'll focus on expense categories
-        # Sort categories by actual amount
-        sorted_expense_categories = sorted(
-            expense_categories.items(),
-            key=lambda x: x[1]['actual'],
-            reverse=True
-        )
-        
-        # Limit to top 6 categories
-        if len(sorted_expense_categories) > 6:
-            top_categories = sorted_expense_categories[:5]
-            
-            # Create an "Other" category for the rest
-            other_forecast = sum(cat[1]['forecast'] for cat in sorted_expense_categories[5:])
-            other_actual = sum(cat[1]['actual'] for cat in sorted_expense_categories[5:])
-            
-            top_categories.append((
-                'Other',
-                {
-                    'forecast': other_forecast,
-                    'actual': other_actual,
-                    'variance': other_actual - other_forecast,
-                    'variance_pct': ((other_actual - other_forecast) / other_forecast * 100) if other_forecast > 0 else 0
-                }
-            ))
-        else:
-            top_categories = sorted_expense_categories
-        
-        # Extract data for plotting
-        categories = [cat[0] for cat in top_categories]
-        forecast_values = [cat[1]['forecast'] for cat in top_categories]
-        actual_values = [cat[1]['actual'] for cat in top_categories]
-        
-        # Set positions for bars
-        x = np.arange(len(categories))
-        width = 0.35
-        
-        # Create grouped bar chart
-        self.forecast_actual_category_canvas.axes.bar(
-            x - width/2,
-            forecast_values,
-            width,
-            color='#e57373',
-            alpha=0.7,
-            label='Forecast'
-        )
-        
-        self.forecast_actual_category_canvas.axes.bar(
-            x + width/2,
-            actual_values,
-            width,
-            color='#c62828',
-            alpha=0.9,
-            label='Actual'
-        )
-        
-        # Add data labels for large values
-        for i, (forecast, actual) in enumerate(zip(forecast_values, actual_values)):
-            # Only add labels if the value is significant
-            if forecast > max(forecast_values) * 0.1:
-                self.forecast_actual_category_canvas.axes.text(
-                    x[i] - width/2, forecast,
-                    f"{forecast:,.0f}",
-                    ha='center', va='bottom',
-                    fontsize=7, rotation=90 if forecast > max(forecast_values) * 0.7 else 0
-                )
-            
-            if actual > max(actual_values) * 0.1:
-                self.forecast_actual_category_canvas.axes.text(
-                    x[i] + width/2, actual,
-                    f"{actual:,.0f}",
-                    ha='center', va='bottom',
-                    fontsize=7, rotation=90 if actual > max(actual_values) * 0.7 else 0
-                )
-        
-        # Add labels and title
-        self.forecast_actual_category_canvas.axes.set_title(
-            f'Top Expense Categories: Forecast vs Actual - {calendar.month_name[month]} {year}',
-            fontsize=11, fontweight='bold', pad=8
-        )
-        
-        self.forecast_actual_category_canvas.axes.set_xticks(x)
-        self.forecast_actual_category_canvas.axes.set_xticklabels(categories, rotation=45, ha='right')
-        self.forecast_actual_category_canvas.axes.set_ylabel('Amount (₺)', fontsize=9)
-        
-        # Add legend
-        self.forecast_actual_category_canvas.axes.legend(fontsize=8)
-        
-        # Update layout
-        self.forecast_actual_category_canvas.fig.tight_layout()
-        self.forecast_actual_category_canvas.draw()
-
-    def update_forecast_accuracy_chart(self, year, month):
-        """Update the forecast accuracy timeline chart"""
-        # Clear previous plot
-        self.forecast_accuracy_canvas.axes.clear()
-        
-        # We'll create a chart showing forecast accuracy over the last 6 months
-        # including the current month
-        
-        # Calculate range of months to show
-        end_date = datetime(year, month, 1)
-        dates = []
-        accuracy_income = []
-        accuracy_expense = []
-        accuracy_net = []
-        
-        # Get data for last 6 months
-        for i in range(5, -1, -1):
-            # Calculate the month to display
-            display_date = end_date - relativedelta(months=i)
-            display_year = display_date.year
-            display_month = display_date.month
-            
-            # Get comparison data for this month
-            comparison_data = self.controller.compare_forecast_vs_actual(display_year, display_month)
-            
-            # Check if we have both forecast and actual data
-            has_forecast_income = comparison_data['summary']['income']['forecast'] > 0
-            has_forecast_expense = comparison_data['summary']['expenses']['forecast'] > 0
-            
-            # If we have data, calculate accuracy
-            if has_forecast_income:
-                income_accuracy = 100 - abs(comparison_data['summary']['income']['variance_pct'])
-                income_accuracy = max(0, min(100, income_accuracy))  # Clamp between 0-100%
-            else:
-                income_accuracy = None
-                
-            if has_forecast_expense:
-                expense_accuracy = 100 - abs(comparison_data['summary']['expenses']['variance_pct'])
-                expense_accuracy = max(0, min(100, expense_accuracy))  # Clamp between 0-100%
-            else:
-                expense_accuracy = None
-            
-            if has_forecast_income and has_forecast_expense:
-                net_accuracy = 100 - abs(comparison_data['summary']['net_worth']['variance_pct'])
-                net_accuracy = max(0, min(100, net_accuracy))  # Clamp between 0-100%
-            else:
-                net_accuracy = None
-            
-            # Add to lists
-            dates.append(display_date)
-            accuracy_income.append(income_accuracy)
-            accuracy_expense.append(expense_accuracy)
-            accuracy_net.append(net_accuracy)
-        
-        # Create the line chart
-        # Plot income accuracy
-        self.forecast_accuracy_canvas.axes.plot(
-            dates, accuracy_income, 'o-',
-            color='#4CAF50', linewidth=2, marker='o', markersize=6,
-            label='Income Accuracy'
-        )
-        
-        # Plot expense accuracy
-        self.forecast_accuracy_canvas.axes.plot(
-            dates, accuracy_expense, 'o-',
-            color='#F44336', linewidth=2, marker='o', markersize=6,
-            label='Expense Accuracy'
-        )
-        
-        # Plot net worth accuracy
-        self.forecast_accuracy_canvas.axes.plot(
-            dates, accuracy_net, 'o-',
-            color='#2196F3', linewidth=2, marker='o', markersize=6,
-            label='Net Worth Accuracy'
-        )
-        
-        # Add target line at 100%
-        self.forecast_accuracy_canvas.axes.axhline(
-            y=100, color='grey', linestyle='--', alpha=0.5, 
-            linewidth=1, label='Perfect Accuracy'
-        )
-        
-        # Add colored zones
-        self.forecast_accuracy_canvas.axes.axhspan(
-            90, 100, color='#4CAF50', alpha=0.1, label='Excellent'
-        )
-        self.forecast_accuracy_canvas.axes.axhspan(
-            75, 90, color='#FFEB3B', alpha=0.1, label='Good'
-        )
-        self.forecast_accuracy_canvas.axes.axhspan(
-            0, 75, color='#F44336', alpha=0.1, label='Needs Improvement'
-        )
-        
-        # Add labels for the current month's accuracy
-        current_idx = len(dates) - 1
-        
-        if accuracy_income[current_idx] is not None:
-            self.forecast_accuracy_canvas.axes.annotate(
-                f"{accuracy_income[current_idx]:.1f}%",
-                xy=(dates[current_idx], accuracy_income[current_idx]),
-                xytext=(5, 0), textcoords="offset points",
-                fontsize=8, fontweight='bold', color='#4CAF50'
-            )
-        
-        if accuracy_expense[current_idx] is not None:
-            self.forecast_accuracy_canvas.axes.annotate(
-                f"{accuracy_expense[current_idx]:.1f}%",
-                xy=(dates[current_idx], accuracy_expense[current_idx]),
-                xytext=(5, 0), textcoords="offset points",
-                fontsize=8, fontweight='bold', color='#F44336'
-            )
-        
-        if accuracy_net[current_idx] is not None:
-            self.forecast_accuracy_canvas.axes.annotate(
-                f"{accuracy_net[current_idx]:.1f}%",
-                xy=(dates[current_idx], accuracy_net[current_idx]),
-                xytext=(5, 0), textcoords="offset points",
-                fontsize=8, fontweight='bold', color='#2196F3'
-            )
-        
-        # Add title and labels
-        self.forecast_accuracy_canvas.axes.set_title(
-            'Forecast Accuracy Trend (Last 6 Months)',
-            fontsize=11, fontweight='bold', pad=8
-        )
-        self.forecast_accuracy_canvas.axes.set_xlabel('Month', fontsize=9)
-        self.forecast_accuracy_canvas.axes.set_ylabel('Accuracy (%)', fontsize=9)
-        
-        # Set y-axis range
-        self.forecast_accuracy_canvas.axes.set_ylim(0, 105)
+    def process_prerender_queue(self):
+        """Render one queued chart, then yield to the event loop"""
+        if not self.prerender_queue:
+            return
         
-        # Format x-axis dates
-        self.forecast_accuracy_canvas.axes.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
+        canvas, dataset = self.prerender_queue.popleft()
+        if canvas.prerender(dataset):
+            self.prerendered += 1
         
-        # Rotate date labels
-        plt.setp(self.forecast_accuracy_canvas.axes.get_xticklabels(), rotation=45, ha='right')
+        if self.prerender_queue:
+            self.prerender_timer.start()
         
-        # Add legend
-        self.forecast_accuracy_canvas.axes.legend(fontsize=8, loc='lower left')
+    def get_chart_cache_stats(self):
+        """Get chart image cache, pre-render and background build statistics"""
+        stats = self.chart_cache.get_stats()
+        stats["prerendered"] = self.prerendered
+        stats["changes_applied"] = self.changes_applied
+        stats["changes_ignored"] = self.changes_ignored
+        stats["loader"] = self.dataset_loader.get_stats()
+        return stats
         
-        # Update layout
-        self.forecast_accuracy_canvas.fig.tight_layout()
-        self.forecast_accuracy_canvas.draw()
-
     def update_forecast_variance_chart(self, comparison_data, year, month):
         """Update the forecast variance chart - showing where forecasts were off"""
         # Clear previous plot
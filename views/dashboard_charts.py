@@ -0,0 +1,1798 @@
+import calendar
+import time
+from datetime import datetime
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+from models.forecast_manager import comparison_for_month
+from models.change_event import ChangeEvent, ChangeSource
+from models.dashboard_dataset import HISTORY_MONTHS
+from models.period import month_index
+
+from .decimation import lttb_indices
+
+# matplotlib is imported by the functions that draw, so that the chart classes
+# (their is_affected_by rules and the QPainter versions) load without it
+
+# Data ranges at most this fraction of their values wide are treated as flat
+FLAT_SPAN = 1e-9
+
+
+def create_chart_figure(width=5, height=3, dpi=100):
+    """Create a styled figure with a single axes for a dashboard chart"""
+    from matplotlib.figure import Figure
+    # Create figure with modern styling
+    fig = Figure(figsize=(width, height), dpi=dpi, facecolor='#ffffff')
+    fig.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.15)
+
+    # Add subplot with grid
+    axes = fig.add_subplot(111)
+    axes.grid(True, linestyle='--', alpha=0.3, color='#cccccc')
+
+    # Style improvements
+    axes.spines['top'].set_visible(False)
+    axes.spines['right'].set_visible(False)
+    axes.spines['left'].set_alpha(0.3)
+    axes.spines['bottom'].set_alpha(0.3)
+
+    # Font styling
+    axes.tick_params(labelsize=8)
+    axes.xaxis.label.set_color('#495057')
+    axes.xaxis.label.set_fontsize(10)
+    axes.yaxis.label.set_color('#495057')
+    axes.yaxis.label.set_fontsize(10)
+    axes.title.set_color('#212529')
+    axes.title.set_fontsize(12)
+
+    # Tick styling
+    axes.tick_params(colors='#6c757d', direction='out', length=4, width=1, grid_alpha=0.3)
+
+    return fig, axes
+
+
+def draw_chart(chart_class, dataset, width=5, height=3, dpi=100):
+    """Draw a chart for a dataset on a new Agg figure, without any widget"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig, axes = create_chart_figure(width, height, dpi)
+    FigureCanvasAgg(fig)
+    chart = chart_class(fig, axes)
+    chart.update(dataset)
+    fig.tight_layout()
+    return fig
+
+
+class DashboardChart:
+    """
+    A dashboard chart drawn on one matplotlib axes.
+    The artists are created once and updated in place on later refreshes;
+    the axes are only cleared and rebuilt when the chart's shape changes
+    (e.g. a different number of categories or an empty-data message).
+    """
+
+    # Data the chart is drawn from; changes to other sources never affect it
+    sources = (ChangeSource.TRANSACTIONS,)
+
+    def __init__(self, figure, axes):
+        self.figure = figure
+        self.axes = axes
+        self.artists = {}
+        self.shape = None
+        self.data = None
+        # True when the last update rebuilt the axes, so the layout is stale
+        self.rebuilt = False
+        # Time (ms) the last update spent extracting data and on the artists
+        self.timings = {"data": 0.0, "artists": 0.0}
+
+    @classmethod
+    def get_month_range(cls, year: int, month: int):
+        """Month index range (first, last) the chart reads for a selected month; None for all months"""
+        return month_index(year, 1), month_index(year, 12)
+
+    @classmethod
+    def is_affected_by(cls, event: ChangeEvent, year: int, month: int) -> bool:
+        """Check if a change can alter what the chart shows for a selected month"""
+        if event.source not in cls.sources:
+            return False
+        month_range = cls.get_month_range(year, month)
+        return month_range is None or event.touches_range(*month_range)
+
+    def update(self, dataset) -> bool:
+        """Update the chart from a dashboard dataset; returns False if nothing changed"""
+        started = time.perf_counter()
+        data = self.get_data(dataset)
+        shape = self.get_shape(data)
+        extracted = time.perf_counter()
+        self.timings = {"data": (extracted - started) * 1000, "artists": 0.0}
+
+        self.rebuilt = shape != self.shape
+        if not self.rebuilt and data == self.data:
+            return False
+
+        if self.rebuilt:
+            self.axes.clear()
+            self.artists = {}
+            self.build(data)
+            self.shape = shape
+        self.refresh(data)
+        self.data = data
+        self.timings["artists"] = (time.perf_counter() - extracted) * 1000
+        return True
+
+    def get_data(self, dataset):
+        """Extract the values the chart plots from the dataset"""
+        raise NotImplementedError
+
+    def get_shape(self, data):
+        """Describe the artists the data needs; a different shape forces a rebuild"""
+        raise NotImplementedError
+
+    def build(self, data):
+        """Create the artists on cleared axes"""
+        raise NotImplementedError
+
+    def refresh(self, data):
+        """Update the existing artists with new values"""
+        raise NotImplementedError
+
+    def show_message(self, message):
+        """Show a centered message instead of a chart"""
+        self.artists["message"] = self.axes.text(0.5, 0.5, message,
+                                                 horizontalalignment='center',
+                                                 verticalalignment='center',
+                                                 fontsize=9,
+                                                 transform=self.axes.transAxes)
+
+    def get_pixel_width(self) -> int:
+        """Width of the axes in display pixels"""
+        return max(1, int(self.axes.bbox.width))
+
+    def rescale(self, extra_points=None):
+        """
+        Recompute the data limits after artists were moved. Nothing of the
+        previous data is kept, so updating in place ends with the limits a
+        fresh draw of the same data gets.
+        """
+        axes = self.axes
+        # relim starts from empty limits; hidden artists (e.g. an unreached
+        # goal marker) must not widen them
+        axes.relim(visible_only=True)
+        # Points relim does not cover: fill_between areas on older matplotlib,
+        # or the dates of lines that are all gaps
+        if extra_points:
+            axes.update_datalim(extra_points)
+
+        # Values that should cancel out (or months without data) leave a flat
+        # series a rounding error wide; it is shown around its rounded value,
+        # as a series of equal values would be, instead of on a collapsed axis
+        low, high = axes.dataLim.intervaly
+        if np.isfinite(low) and np.isfinite(high) and high - low <= FLAT_SPAN * max(abs(low), abs(high), 1.0):
+            value = round((low + high) / 2, 6)
+            axes.dataLim.intervaly = (value, value)
+        axes.autoscale_view()
+
+
+def _set_area(area, x, upper, lower=None):
+    """Move a fill_between area to the region between two curves (or the curve and zero)"""
+    if lower is None:
+        lower = [0] * len(x)
+    # Since matplotlib 3.10 an area keeps its curves and takes its data
+    # limits from them, so they must be replaced rather than the vertices
+    if hasattr(area, "set_data"):
+        area.set_data(x, upper, lower)
+    else:
+        area.set_verts([_area_vertices(x, upper, lower)])
+
+
+def _area_vertices(x, upper, lower=None):
+    """Polygon vertices of the area between two curves (or the curve and zero)"""
+    if lower is None:
+        lower = [0] * len(x)
+    return list(zip(x, upper)) + list(zip(reversed(x), reversed(lower)))
+
+
+def _month_locator(first_date, last_date, max_ticks):
+    """Month or year ticks spaced so that at most about max_ticks labels are shown"""
+    import matplotlib.dates as mdates
+    months = (last_date.year - first_date.year) * 12 + last_date.month - first_date.month + 1
+    for interval in (1, 2, 3, 6):
+        if months / interval <= max_ticks:
+            return mdates.MonthLocator(bymonth=range(1, 13, interval))
+    return mdates.YearLocator(base=max(1, int(np.ceil(months / 12 / max_ticks))))
+
+
+def _month_values(summaries, months):
+    """Split month summaries into income, expense and net worth lists"""
+    return ([summaries[m]['total_income'] for m in months],
+            [summaries[m]['total_expenses'] for m in months],
+            [summaries[m]['net_worth'] for m in months])
+
+
+class MonthlySummaryChart(DashboardChart):
+    """Income and expense bars with net worth for every month of the selected year"""
+
+    def get_data(self, dataset):
+        income, expenses, net = _month_values(dataset.get_year_summaries(), range(1, 13))
+        return {
+            "year": dataset.year,
+            "current": dataset.month - 1,  # 0-based index of the selected month
+            "income": income,
+            "expenses": expenses,
+            "net": net
+        }
+
+    def get_shape(self, data):
+        return ("months", len(data["income"]))
+
+    def build(self, data):
+        axes = self.axes
+        months = list(range(1, 13))
+        x = range(len(months))
+        zeros = [0] * len(months)
+
+        # Income as positive values
+        self.artists["income"] = axes.bar(x, zeros,
+                                          color='#4CAF50', alpha=0.8,
+                                          label='Income',
+                                          width=0.6,
+                                          edgecolor='white', linewidth=0.5)
+
+        # Expenses as negative values
+        self.artists["expenses"] = axes.bar(x, zeros,
+                                            color='#F44336', alpha=0.8,
+                                            label='Expenses',
+                                            width=0.6,
+                                            edgecolor='white', linewidth=0.5)
+
+        # Net worth as marker points
+        self.artists["net"], = axes.plot(x, zeros, 'o-',
+                                         color='#2196F3', linewidth=2,
+                                         markersize=6, label='Net Worth')
+
+        # Add zero line
+        axes.axhline(y=0, color='#888888', linestyle='-', alpha=0.3, linewidth=1)
+
+        # Add labels
+        self.artists["title"] = axes.set_title('', fontsize=11, fontweight='bold', pad=8)
+        axes.set_xlabel('Month', fontsize=9, labelpad=5)
+        axes.set_ylabel('Amount (₺)', fontsize=9, labelpad=5)
+
+        # Set x-axis ticks and labels
+        axes.set_xticks(x)
+        axes.set_xticklabels([calendar.month_abbr[m] for m in months])
+
+        # Add a single-column legend at the top-right
+        legend = axes.legend(loc='upper right', frameon=True,
+                             fancybox=True, framealpha=0.9,
+                             shadow=True, fontsize=8)
+        legend.get_frame().set_edgecolor('#cccccc')
+
+        # Data labels for the selected month
+        self.artists["income_label"] = axes.annotate(
+            "", xy=(0, 0), xytext=(0, 5), textcoords="offset points",
+            ha='center', va='bottom',
+            fontsize=8, fontweight='bold', color='#2e7d32'
+        )
+        self.artists["expense_label"] = axes.annotate(
+            "", xy=(0, 0), xytext=(0, -12), textcoords="offset points",
+            ha='center', va='top',
+            fontsize=8, fontweight='bold', color='#c62828'
+        )
+        self.artists["net_label"] = axes.annotate(
+            "", xy=(0, 0), xytext=(0, 10), textcoords="offset points",
+            ha='center', va='bottom',
+            fontsize=8, fontweight='bold', color='#1565c0'
+        )
+
+        # Highlight current month
+        self.artists["current_line"] = axes.axvline(x=0, color='#888888',
+                                                    linestyle='--', alpha=0.3, linewidth=1)
+
+    def refresh(self, data):
+        income, expenses, net = data["income"], data["expenses"], data["net"]
+
+        for bar, value in zip(self.artists["income"], income):
+            bar.set_height(value)
+        for bar, value in zip(self.artists["expenses"], expenses):
+            bar.set_height(-value)
+        self.artists["net"].set_ydata(net)
+
+        self.artists["title"].set_text(f'Financial Summary ({data["year"]})')
+
+        # Move the labels and marker to the selected month
+        current = data["current"]
+        self.artists["income_label"].set_text(f"{income[current]:,.0f} ₺")
+        self.artists["income_label"].xy = (current, income[current])
+        self.artists["expense_label"].set_text(f"{expenses[current]:,.0f} ₺")
+        self.artists["expense_label"].xy = (current, -expenses[current])
+        self.artists["net_label"].set_text(f"{net[current]:,.0f} ₺")
+        self.artists["net_label"].xy = (current, net[current])
+        self.artists["current_line"].set_xdata([current, current])
+
+        self.rescale()
+
+
+class CumulativeChart(DashboardChart):
+    """
+    Cumulative income, expenses and net worth over the whole history.
+    Long histories are decimated to about one point per pixel of the axes
+    width, so drawing time does not grow with the number of transactions.
+    """
+
+    # Net worth markers are only drawn while they do not overlap
+    MAX_MARKERS = 60
+    # Minimum horizontal space for a date label, in pixels
+    TICK_SPACING = 50
+
+    def __init__(self, figure, axes):
+        super().__init__(figure, axes)
+        # Decimated series for (data versions, axes width); the history is the
+        # same for every selected month
+        self.series_key = None
+        self.series = None
+
+    @classmethod
+    def get_month_range(cls, year: int, month: int):
+        return None
+
+    def get_data(self, dataset):
+        width = self.get_pixel_width()
+        key = (dataset.versions, width)
+        if dataset.versions is not None and key == self.series_key:
+            return self.series
+
+        cumulative = dataset.cumulative
+        dates, income, expenses, net = cumulative.dates, cumulative.income, cumulative.expenses, cumulative.net
+
+        # Net worth goes up and down, so it picks the points; income and
+        # expenses only grow and are sampled at the same dates
+        if len(dates) > width:
+            # Day numbers are enough to place the points (and much faster than date2num)
+            x = np.fromiter((d.toordinal() for d in dates), dtype=float, count=len(dates))
+            keep = lttb_indices(x, net, width)
+            dates = [dates[i] for i in keep]
+            income = [income[i] for i in keep]
+            expenses = [expenses[i] for i in keep]
+            net = [net[i] for i in keep]
+
+        series = {
+            "dates": dates,
+            "income": income,
+            "expenses": expenses,
+            "net": net,
+            "max_ticks": max(2, width // self.TICK_SPACING)
+        }
+        self.series_key = key
+        self.series = series
+        return series
+
+    def get_shape(self, data):
+        if not data["dates"]:
+            return ("empty",)
+        # With fewer than two points a status bar replaces the area chart
+        if len(data["dates"]) < 2:
+            return ("status",)
+        return ("growth",)
+
+    def build(self, data):
+        import matplotlib.dates as mdates
+        from matplotlib.artist import setp
+        axes = self.axes
+
+        if self.get_shape(data) == ("empty",):
+            # No data to display
+            self.show_message('No transaction data available')
+            return
+
+        if self.get_shape(data) == ("status",):
+            # Create a horizontal stacked bar chart
+            labels = ['Current Status']
+            width = 0.5
+
+            self.artists["income_bar"] = axes.barh(labels, [0],
+                                                   color='#4CAF50', alpha=0.8,
+                                                   height=width, edgecolor='white',
+                                                   label='Income')[0]
+
+            self.artists["expense_bar"] = axes.barh(labels, [0], left=[0],
+                                                    color='#F44336', alpha=0.8,
+                                                    height=width, edgecolor='white',
+                                                    label='Expenses')[0]
+
+            # Labels for each value
+            self.artists["income_text"] = axes.text(0, 0, "",
+                                                    ha='center', va='center', color='white',
+                                                    fontweight='bold', fontsize=9)
+            self.artists["expense_text"] = axes.text(0, 0, "",
+                                                     ha='center', va='center', color='white',
+                                                     fontweight='bold', fontsize=9)
+
+            # Net worth indicator
+            self.artists["net_label"] = axes.annotate(
+                "", xy=(0, 0),
+                xytext=(0, 20), textcoords="offset points",
+                ha='center', va='bottom',
+                fontsize=10, fontweight='bold',
+                color='#1565c0',
+                bbox=dict(boxstyle="round,pad=0.3", fc="#e3f2fd", ec="#1565c0", alpha=0.8)
+            )
+
+            axes.set_title('Current Financial Status',
+                           fontsize=11, fontweight='bold', pad=8)
+        else:
+            dates = data["dates"]
+
+            # Area chart for income and expenses
+            self.artists["income_area"] = axes.fill_between(dates, data["income"],
+                                                            color='#4CAF50', alpha=0.3,
+                                                            label='Income')
+
+            self.artists["expense_area"] = axes.fill_between(dates, data["expenses"],
+                                                             color='#F44336', alpha=0.3,
+                                                             label='Expenses')
+
+            # Line for net worth
+            self.artists["net"], = axes.plot(dates, data["net"], '-',
+                                             color='#1565c0', linewidth=2.5,
+                                             marker='o', markersize=5,
+                                             label='Net Worth')
+
+            # Labels for final values
+            for name, color in (("income_label", '#2e7d32'),
+                                ("expense_label", '#c62828'),
+                                ("net_label", '#1565c0')):
+                self.artists[name] = axes.annotate(
+                    "", xy=(dates[-1], 0),
+                    xytext=(5, 0), textcoords="offset points",
+                    ha='left', va='center',
+                    fontsize=8, fontweight='bold', color=color
+                )
+
+            axes.set_title('Financial Growth Over Time',
+                           fontsize=11, fontweight='bold', pad=8)
+            axes.set_xlabel('Date', fontsize=9, labelpad=5)
+            axes.set_ylabel('Amount (₺)', fontsize=9, labelpad=5)
+
+            # Format the dates on x-axis; the locator is chosen for the date span in refresh
+            axes.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
+
+            # Rotate date labels for better readability
+            setp(axes.get_xticklabels(), rotation=45, ha='right')
+
+        # Add legend
+        legend = axes.legend(loc='upper left', frameon=True,
+                             fancybox=True, framealpha=0.9,
+                             shadow=True, fontsize=8)
+        legend.get_frame().set_edgecolor('#cccccc')
+
+    def refresh(self, data):
+        import matplotlib.dates as mdates
+        shape = self.get_shape(data)
+        if shape == ("empty",):
+            return
+
+        income, expenses, net = data["income"], data["expenses"], data["net"]
+
+        if shape == ("status",):
+            current_income = income[-1]
+            current_expenses = expenses[-1]
+            current_net = net[-1]
+
+            # Expenses are stacked backwards from the end of the income bar
+            self.artists["income_bar"].set_width(current_income)
+            self.artists["expense_bar"].set_x(current_income)
+            self.artists["expense_bar"].set_width(-current_expenses)
+
+            self.artists["income_text"].set_position((current_income / 2, 0))
+            self.artists["income_text"].set_text(f"{current_income:,.0f} ₺")
+            self.artists["expense_text"].set_position((current_income - current_expenses / 2, 0))
+            self.artists["expense_text"].set_text(f"{current_expenses:,.0f} ₺")
+
+            self.artists["net_label"].xy = (current_income - current_expenses, 0)
+            self.artists["net_label"].set_text(f"Net Worth: {current_net:,.0f} ₺")
+
+            self.rescale()
+            return
+
+        dates = data["dates"]
+        x = mdates.date2num(dates)
+
+        _set_area(self.artists["income_area"], x, income)
+        _set_area(self.artists["expense_area"], x, expenses)
+        self.artists["net"].set_data(dates, net)
+        self.artists["net"].set_marker('o' if len(dates) <= self.MAX_MARKERS else 'None')
+
+        # Fewer, wider spaced ticks as the history grows
+        self.axes.xaxis.set_major_locator(_month_locator(dates[0], dates[-1], data["max_ticks"]))
+
+        final_date = dates[-1]
+        for name, value in (("income_label", income[-1]),
+                            ("expense_label", expenses[-1]),
+                            ("net_label", net[-1])):
+            self.artists[name].xy = (final_date, value)
+            self.artists[name].set_text(f"{value:,.0f} ₺")
+
+        self.rescale(list(zip(x, income)) + list(zip(x, expenses)) + [(x[0], 0)])
+
+
+class CashFlowTrendChart(DashboardChart):
+    """Monthly income and expense lines with the net cash flow shaded per month"""
+
+    def get_data(self, dataset):
+        income, expenses, net = _month_values(dataset.get_year_summaries(), range(1, 13))
+        return {
+            "year": dataset.year,
+            "current": dataset.month - 1,  # 0-based index of the selected month
+            "income": income,
+            "expenses": expenses,
+            "net": net
+        }
+
+    def get_shape(self, data):
+        # Months without data get no shading or label; the sign of the net
+        # value picks the shading color and where its label goes
+        return ("months", tuple(
+            None if inc == 0 and exp == 0 else (net > 0) - (net < 0)
+            for inc, exp, net in zip(data["income"], data["expenses"], data["net"])
+        ))
+
+    def build(self, data):
+        axes = self.axes
+        months = list(range(1, 13))
+        signs = self.get_shape(data)[1]
+
+        # Set up month positions
+        x = np.arange(len(months))
+        zeros = [0] * len(months)
+
+        # Shaded areas for positive and negative cash flow
+        self.artists["areas"] = {}
+        for i, sign in enumerate(signs):
+            # Skip months with no data or no cash flow
+            if not sign:
+                continue
+            color = '#4CAF50' if sign > 0 else '#F44336'
+            self.artists["areas"][i] = axes.fill_between([x[i]-0.4, x[i]+0.4], [0, 0], [0, 0],
+                                                         color=color, alpha=0.2)
+
+        # Draw lines for income and expenses
+        self.artists["income"], = axes.plot(x, zeros, '-o', color='#4CAF50',
+                                            linewidth=2, markersize=6, label='Income')
+        self.artists["expenses"], = axes.plot(x, zeros, '-o', color='#F44336',
+                                              linewidth=2, markersize=6, label='Expenses')
+
+        # Highlight the balance point with a horizontal line
+        axes.axhline(y=0, color='#444444', linestyle='-', alpha=0.3)
+
+        # Savings/deficit labels at each month with data
+        self.artists["labels"] = {}
+        for i, sign in enumerate(signs):
+            if sign is None:
+                continue
+
+            if sign > 0:
+                color = '#4CAF50'  # Green for positive
+                y_offset = 10
+                va = 'bottom'
+            else:
+                color = '#F44336'  # Red for negative
+                y_offset = -10
+                va = 'top'
+
+            self.artists["labels"][i] = axes.annotate(
+                "", xy=(x[i], 0),
+                xytext=(0, y_offset), textcoords="offset points",
+                ha='center', va=va,
+                fontsize=8, fontweight='bold', color=color
+            )
+
+        # Add labels and formatting
+        self.artists["title"] = axes.set_title('', fontsize=11, fontweight='bold', pad=8)
+        axes.set_xlabel('Month', fontsize=9, labelpad=5)
+        axes.set_ylabel('Amount (₺)', fontsize=9, labelpad=5)
+
+        # Set x-axis ticks and labels
+        axes.set_xticks(x)
+        axes.set_xticklabels([calendar.month_abbr[m] for m in months])
+
+        # Add a legend
+        axes.legend(loc='upper right', fontsize=8)
+
+        # Highlight current month
+        self.artists["current_line"] = axes.axvline(x=0, color='#888888',
+                                                    linestyle='--', alpha=0.5, linewidth=1)
+
+    def refresh(self, data):
+        income, expenses, net = data["income"], data["expenses"], data["net"]
+
+        self.artists["income"].set_ydata(income)
+        self.artists["expenses"].set_ydata(expenses)
+
+        extra_points = []
+        for i, area in self.artists["areas"].items():
+            _set_area(area, [i-0.4, i+0.4], [net[i], net[i]])
+            extra_points.append((i, net[i]))
+
+        for i, label in self.artists["labels"].items():
+            prefix = '+' if net[i] > 0 else ''
+            label.set_text(f"{prefix}{net[i]:,.0f} ₺")
+            label.xy = (i, (income[i] + expenses[i]) / 2)
+
+        self.artists["title"].set_text(f'Monthly Cash Flow ({data["year"]})')
+        self.artists["current_line"].set_xdata([data["current"], data["current"]])
+
+        self.rescale(extra_points)
+
+
+class ExpenseCategoryChart(DashboardChart):
+    """Donut chart of the selected month's expenses by category"""
+
+    # Colors for the category wedges, in order
+    COLORS = ['#42A5F5', '#66BB6A', '#FFA726', '#EF5350', '#AB47BC', '#7E57C2', '#78909C']
+
+    @classmethod
+    def get_month_range(cls, year: int, month: int):
+        current = month_index(year, month)
+        return current, current
+
+    def get_data(self, dataset):
+        year, month = dataset.year, dataset.month
+
+        if not dataset.get_transaction_count(year, month):
+            return {"message": 'No transactions for this month'}
+
+        # Expenses grouped by category (name as fallback)
+        categories = dataset.get_expense_labels(year, month)
+        if not categories:
+            return {"message": 'No expense transactions for this month'}
+
+        # Sort by amount and get top categories
+        sorted_categories = dict(sorted(categories.items(), key=lambda x: x[1], reverse=True))
+
+        # Limit to top 6 categories and group the rest as "Other"
+        if len(sorted_categories) > 6:
+            top_categories = dict(list(sorted_categories.items())[:5])
+            other_amount = sum(list(sorted_categories.values())[5:])
+            top_categories["Other"] = other_amount
+            sorted_categories = top_categories
+
+        return {
+            "message": None,
+            "year": year,
+            "month": month,
+            "labels": list(sorted_categories.keys()),
+            "sizes": list(sorted_categories.values())
+        }
+
+    def get_shape(self, data):
+        if data["message"]:
+            return ("message", data["message"])
+        return ("donut", len(data["labels"]))
+
+    def build(self, data):
+        from matplotlib.patches import Circle
+        if data["message"]:
+            self.show_message(data["message"])
+            return
+
+        axes = self.axes
+        labels, sizes = data["labels"], data["sizes"]
+
+        # Set an aspect ratio for the pie chart
+        axes.set_aspect('equal')
+
+        # Create wedges with auto-pct text
+        wedges, texts, autotexts = axes.pie(
+            sizes,
+            labels=None,  # We'll add custom labels
+            colors=self.COLORS[:len(labels)],
+            autopct='%1.1f%%',
+            pctdistance=0.85,
+            wedgeprops={'width': 0.4, 'edgecolor': 'w', 'linewidth': 2},
+            textprops={'fontsize': 9, 'color': '#333333'},
+            startangle=90
+        )
+
+        # Style percentage texts
+        for autotext in autotexts:
+            autotext.set_fontsize(8)
+            autotext.set_fontweight('bold')
+
+        self.artists["wedges"] = wedges
+        self.artists["percentages"] = autotexts
+
+        # Create center circle for donut chart
+        axes.add_artist(Circle((0, 0), 0.4, fc='white'))
+
+        # Display total amount in center
+        self.artists["total"] = axes.text(0, 0, "",
+                                          ha='center', va='center',
+                                          fontsize=11, fontweight='bold')
+
+        axes.text(0, -0.15, "Total Expenses",
+                  ha='center', va='center',
+                  fontsize=8, color='#555555')
+
+        # Create legend with categories and values
+        self.artists["legend"] = axes.legend(wedges, labels,
+                                             loc="center left",
+                                             bbox_to_anchor=(1, 0.5),
+                                             fontsize=8)
+
+        # Add title
+        self.artists["title"] = axes.set_title('', fontsize=11, fontweight='bold', pad=8)
+
+    def refresh(self, data):
+        if data["message"]:
+            return
+
+        labels, sizes = data["labels"], data["sizes"]
+        total = sum(sizes)
+
+        # Same geometry as Axes.pie: counterclockwise from 90 degrees
+        theta1 = 90.0
+        for wedge, percentage, size in zip(self.artists["wedges"], self.artists["percentages"], sizes):
+            theta2 = theta1 + 360.0 * size / total
+            wedge.set_theta1(theta1)
+            wedge.set_theta2(theta2)
+
+            middle = np.deg2rad((theta1 + theta2) / 2)
+            percentage.set_position((0.85 * np.cos(middle), 0.85 * np.sin(middle)))
+            percentage.set_text(f"{size / total * 100:1.1f}%")
+            theta1 = theta2
+
+        self.artists["total"].set_text(f"{total:,.0f} ₺")
+
+        for text, label, value in zip(self.artists["legend"].get_texts(), labels, sizes):
+            text.set_text(f"{label} ({value:,.0f} ₺)")
+
+        self.artists["title"].set_text(
+            f'Expense Breakdown by Category - {calendar.month_name[data["month"]]} {data["year"]}')
+
+
+class MonthlyComparisonChart(DashboardChart):
+    """Income, expenses and net worth of the selected month next to the months around it"""
+
+    @classmethod
+    def get_month_range(cls, year: int, month: int):
+        current = month_index(year, month)
+        return current - 1, current + 1
+
+    def get_data(self, dataset):
+        # Get previous, current and next month
+        current_date = datetime(dataset.year, dataset.month, 1)
+        dates = [current_date - relativedelta(months=1), current_date,
+                 current_date + relativedelta(months=1)]
+
+        summaries = {i: dataset.get_summary(d.year, d.month) for i, d in enumerate(dates)}
+        income, expenses, net = _month_values(summaries, range(len(dates)))
+        return {
+            "months": [d.strftime('%b %Y') for d in dates],
+            "income": income,
+            "expenses": expenses,
+            "net": net
+        }
+
+    def get_shape(self, data):
+        return ("months", len(data["months"]))
+
+    def build(self, data):
+        axes = self.axes
+
+        # Set up month positions
+        x = np.arange(len(data["months"]))
+        width = 0.35  # width of the bars
+        zeros = [0] * len(x)
+
+        # Create grouped bar chart
+        self.artists["income"] = axes.bar(x - width/2, zeros, width, color='#4CAF50', alpha=0.8, label='Income')
+        self.artists["expenses"] = axes.bar(x + width/2, zeros, width, color='#F44336', alpha=0.8, label='Expenses')
+
+        # Add net worth as line
+        self.artists["net"], = axes.plot(x, zeros, 'o-', color='#2196F3', linewidth=2, markersize=8, label='Net Worth')
+
+        # Add zero line
+        axes.axhline(y=0, color='#888888', linestyle='-', alpha=0.3, linewidth=1)
+
+        # Data labels for each month
+        self.artists["income_labels"] = []
+        self.artists["expense_labels"] = []
+        self.artists["net_labels"] = []
+        for i in range(len(x)):
+            self.artists["income_labels"].append(axes.annotate(
+                "", xy=(x[i] - width/2, 0),
+                xytext=(0, 5), textcoords="offset points",
+                ha='center', va='bottom',
+                fontsize=8, fontweight='bold', color='#2e7d32'
+            ))
+
+            self.artists["expense_labels"].append(axes.annotate(
+                "", xy=(x[i] + width/2, 0),
+                xytext=(0, 5), textcoords="offset points",
+                ha='center', va='bottom',
+                fontsize=8, fontweight='bold', color='#c62828'
+            ))
+
+            self.artists["net_labels"].append(axes.annotate(
+                "", xy=(x[i], 0),
+                xytext=(0, 10), textcoords="offset points",
+                ha='center', va='bottom',
+                fontsize=8, fontweight='bold', color='#2196F3'
+            ))
+
+        # Highlight current month with vertical line and background
+        axes.axvspan(x[1]-0.4, x[1]+0.4, alpha=0.15, color='#2196F3')
+
+        # Set x-axis ticks
+        axes.set_xticks(x)
+
+        # Add a legend
+        axes.legend(loc='upper right', fontsize=8)
+
+        # Add title and labels
+        axes.set_title('Monthly Financial Comparison',
+                       fontsize=11, fontweight='bold', pad=8)
+        axes.set_xlabel('Month', fontsize=9, labelpad=5)
+        axes.set_ylabel('Amount (₺)', fontsize=9, labelpad=5)
+
+    def refresh(self, data):
+        income, expenses, net = data["income"], data["expenses"], data["net"]
+
+        for bar, value in zip(self.artists["income"], income):
+            bar.set_height(value)
+        for bar, value in zip(self.artists["expenses"], expenses):
+            bar.set_height(value)
+        self.artists["net"].set_ydata(net)
+
+        for i, (inc, exp, net_value) in enumerate(zip(income, expenses, net)):
+            income_label = self.artists["income_labels"][i]
+            income_label.set_text(f"{inc:,.0f} ₺")
+            income_label.xy = (income_label.xy[0], inc)
+
+            expense_label = self.artists["expense_labels"][i]
+            expense_label.set_text(f"{exp:,.0f} ₺")
+            expense_label.xy = (expense_label.xy[0], exp)
+
+            # Net worth label with arrow indicator
+            arrow_char = ''
+            net_color = '#2196F3'  # Blue
+            if i == 1:  # Current month
+                # Compare with previous month
+                if net_value > net[0]:
+                    arrow_char = '↑ '  # Up arrow
+                    net_color = '#4CAF50'  # Green
+                elif net_value < net[0]:
+                    arrow_char = '↓ '  # Down arrow
+                    net_color = '#F44336'  # Red
+                else:
+                    arrow_char = '→ '  # Right arrow
+
+                # Add percent change
+                if net[0] != 0:
+                    pct_change = ((net_value - net[0]) / abs(net[0])) * 100
+                    arrow_char += f"{pct_change:+.1f}% "
+
+            net_label = self.artists["net_labels"][i]
+            net_label.set_text(f"{arrow_char}{net_value:,.0f} ₺")
+            net_label.set_color(net_color)
+            net_label.xy = (i, net_value)
+
+        self.axes.set_xticklabels(data["months"])
+
+        self.rescale()
+
+
+class CategoryComparisonChart(DashboardChart):
+    """Expense categories of the selected month next to the months around it"""
+
+    @classmethod
+    def get_month_range(cls, year: int, month: int):
+        current = month_index(year, month)
+        return current - 1, current + 1
+
+    def get_data(self, dataset):
+        # Get previous, current, and next month dates
+        current_date = datetime(dataset.year, dataset.month, 1)
+        prev_date = current_date - relativedelta(months=1)
+        next_date = current_date + relativedelta(months=1)
+
+        # Expenses grouped by category for all three months (copied, since
+        # the dataset is shared and "Other" is added below)
+        current_categories = dict(dataset.get_expense_labels(current_date.year, current_date.month))
+        prev_categories = dict(dataset.get_expense_labels(prev_date.year, prev_date.month))
+        next_categories = dict(dataset.get_expense_labels(next_date.year, next_date.month))
+
+        if not current_categories and not prev_categories and not next_categories:
+            return {"message": 'No expense transactions to compare'}
+
+        # Get all unique categories across all three months
+        all_categories = set(list(prev_categories.keys()) +
+                             list(current_categories.keys()) +
+                             list(next_categories.keys()))
+
+        # Sort categories by current month amount (or previous if current doesn't exist)
+        def get_category_value(category):
+            if category in current_categories:
+                return current_categories[category]
+            elif category in prev_categories:
+                return prev_categories[category]
+            else:
+                return next_categories.get(category, 0)
+
+        sorted_categories = sorted(all_categories, key=get_category_value, reverse=True)
+
+        # Limit to top 5 categories
+        if len(sorted_categories) > 5:
+            top_categories = sorted_categories[:5]
+
+            # Add an "Other" category for the rest
+            other_prev = sum(prev_categories.get(cat, 0) for cat in sorted_categories[5:])
+            other_current = sum(current_categories.get(cat, 0) for cat in sorted_categories[5:])
+            other_next = sum(next_categories.get(cat, 0) for cat in sorted_categories[5:])
+
+            prev_categories["Other"] = other_prev
+            current_categories["Other"] = other_current
+            next_categories["Other"] = other_next
+
+            sorted_categories = top_categories + ["Other"]
+
+        return {
+            "message": None,
+            "months": [prev_date.strftime('%b %Y'), current_date.strftime('%b %Y'),
+                       next_date.strftime('%b %Y')],
+            "categories": sorted_categories,
+            # Values maintaining the sort order
+            "prev": [prev_categories.get(cat, 0) for cat in sorted_categories],
+            "current": [current_categories.get(cat, 0) for cat in sorted_categories],
+            "next": [next_categories.get(cat, 0) for cat in sorted_categories]
+        }
+
+    def get_shape(self, data):
+        if data["message"]:
+            return ("message",)
+        return ("categories", len(data["categories"]))
+
+    def build(self, data):
+        if data["message"]:
+            self.show_message(data["message"])
+            return
+
+        axes = self.axes
+
+        # Prepare positions for grouped bar chart
+        x = np.arange(len(data["categories"]))
+        width = 0.25  # width of bars
+        zeros = [0] * len(x)
+
+        # Create grouped bar chart
+        self.artists["prev"] = axes.bar(x - width, zeros, width,
+                                        color='#78909C', alpha=0.8,
+                                        label=data["months"][0])
+        self.artists["current"] = axes.bar(x, zeros, width,
+                                           color='#F44336', alpha=0.8,
+                                           label=data["months"][1])
+        self.artists["next"] = axes.bar(x + width, zeros, width,
+                                        color='#FFA726', alpha=0.8,
+                                        label=data["months"][2])
+
+        # Data labels for current month, shown for non-zero values
+        self.artists["labels"] = [
+            axes.text(x[i], 0, "", ha='center', va='bottom', fontsize=7, fontweight='bold')
+            for i in range(len(x))
+        ]
+
+        # Add title and labels
+        axes.set_title('Expense Categories Comparison',
+                       fontsize=11, fontweight='bold', pad=8)
+        axes.set_xlabel('Category', fontsize=9, labelpad=5)
+        axes.set_ylabel('Amount (₺)', fontsize=9, labelpad=5)
+
+        # Set x-axis ticks
+        axes.set_xticks(x)
+
+        # Add legend
+        self.artists["legend"] = axes.legend(loc='upper right', fontsize=8)
+
+    def refresh(self, data):
+        if data["message"]:
+            return
+
+        for key in ("prev", "current", "next"):
+            for bar, value in zip(self.artists[key], data[key]):
+                bar.set_height(value)
+
+        current_values = data["current"]
+        for i, (label, value) in enumerate(zip(self.artists["labels"], current_values)):
+            label.set_visible(value > 0)
+            label.set_position((i, value))
+            label.set_text(f"{value:,.0f}")
+            label.set_rotation(45 if value > max(current_values) * 0.8 else 0)
+
+        # Rotate labels for better readability
+        self.axes.set_xticklabels(data["categories"], rotation=25, ha='right')
+
+        for text, month in zip(self.artists["legend"].get_texts(), data["months"]):
+            text.set_text(month)
+
+        self.rescale()
+
+
+class ForecastChart(DashboardChart):
+    """Financial forecast for the next 6 months based on the last 6 months' trend"""
+
+    @classmethod
+    def get_month_range(cls, year: int, month: int):
+        current = month_index(year, month)
+        return current - HISTORY_MONTHS + 1, current
+
+    def get_data(self, dataset):
+        current_date = datetime(dataset.year, dataset.month, 1)
+
+        # Historical data for the last 6 months (including current)
+        historical_data = []
+        for hist_year, hist_month in dataset.get_history_months():
+            summary = dataset.get_summary(hist_year, hist_month)
+            historical_data.append({
+                'date': datetime(hist_year, hist_month, 1),
+                'income': summary['total_income'],
+                'expenses': summary['total_expenses'],
+                'net_worth': summary['net_worth']
+            })
+
+        # Project next 6 months
+        forecast_data = []
+
+        # Simple forecasting using average of last 3 months for trend
+        if len(historical_data) >= 3:
+            # Calculate average monthly change for income and expenses
+            avg_income_change = 0
+            avg_expense_change = 0
+
+            for i in range(len(historical_data) - 1, 0, -1):
+                income_change = historical_data[i]['income'] - historical_data[i-1]['income']
+                expense_change = historical_data[i]['expenses'] - historical_data[i-1]['expenses']
+
+                # Weight recent months more heavily
+                weight = 1.0
+                if i >= len(historical_data) - 3:  # Last 3 months
+                    weight = 2.0
+
+                avg_income_change += income_change * weight
+                avg_expense_change += expense_change * weight
+
+            # Normalize by sum of weights (1.0 for older months, 2.0 for last 3)
+            weights_sum = len(historical_data) - 1 + min(3, len(historical_data) - 1)
+            if weights_sum > 0:
+                avg_income_change /= weights_sum
+                avg_expense_change /= weights_sum
+
+            # Generate forecasts for next 6 months
+            last_income = historical_data[-1]['income']
+            last_expense = historical_data[-1]['expenses']
+
+            for i in range(1, 7):  # Next 6 months
+                forecast_date = current_date + relativedelta(months=i)
+                forecast_income = max(0, last_income + (avg_income_change * i))
+                forecast_expense = max(0, last_expense + (avg_expense_change * i))
+                forecast_net = forecast_income - forecast_expense
+
+                forecast_data.append({
+                    'date': forecast_date,
+                    'income': forecast_income,
+                    'expenses': forecast_expense,
+                    'net_worth': forecast_net
+                })
+
+        # Combine historical and forecast data
+        all_data = historical_data + forecast_data
+        return {
+            "current_date": current_date,
+            "history_length": len(historical_data),
+            "dates": [d['date'] for d in all_data],
+            "income": [d['income'] for d in all_data],
+            "expenses": [d['expenses'] for d in all_data],
+            "net": [d['net_worth'] for d in all_data]
+        }
+
+    def get_shape(self, data):
+        return ("forecast", data["history_length"], len(data["dates"]))
+
+    def build(self, data):
+        import matplotlib.dates as mdates
+        from matplotlib.artist import setp
+        axes = self.axes
+        hist = data["history_length"]
+        dates = data["dates"]
+
+        # Historical data - solid lines
+        self.artists["hist_income"], = axes.plot(dates[:hist], data["income"][:hist], 'o-', color='#4CAF50',
+                                                 linewidth=2, markersize=5, label='Income (Actual)')
+        self.artists["hist_expenses"], = axes.plot(dates[:hist], data["expenses"][:hist], 'o-', color='#F44336',
+                                                   linewidth=2, markersize=5, label='Expenses (Actual)')
+        self.artists["hist_net"], = axes.plot(dates[:hist], data["net"][:hist], 'o-', color='#2196F3',
+                                              linewidth=2, markersize=5, label='Net Worth (Actual)')
+
+        # Forecast data - dashed lines
+        if len(dates) > hist:
+            # Vertical line separating actual from forecast
+            self.artists["separator"] = axes.axvline(x=data["current_date"], color='#888888',
+                                                     linestyle='--', alpha=0.5)
+
+            # "Forecast starts" text
+            self.artists["separator_text"] = axes.text(data["current_date"], 0,
+                                                       ' Forecast →',
+                                                       ha='left', va='top',
+                                                       fontsize=8, fontweight='bold',
+                                                       bbox=dict(facecolor='white', alpha=0.8, boxstyle='round,pad=0.3'))
+
+            forecast_dates = dates[hist:]
+            self.artists["income"], = axes.plot(forecast_dates, data["income"][hist:], '--', color='#4CAF50',
+                                                linewidth=2, label='Income (Forecast)')
+            self.artists["expenses"], = axes.plot(forecast_dates, data["expenses"][hist:], '--', color='#F44336',
+                                                  linewidth=2, label='Expenses (Forecast)')
+            self.artists["net"], = axes.plot(forecast_dates, data["net"][hist:], '--', color='#2196F3',
+                                             linewidth=2, label='Net Worth (Forecast)')
+
+            # Labels for the final forecast point
+            for name, color in (("income_label", '#4CAF50'),
+                                ("expense_label", '#F44336'),
+                                ("net_label", '#2196F3')):
+                self.artists[name] = axes.annotate(
+                    "", xy=(forecast_dates[-1], 0),
+                    xytext=(5, 0), textcoords="offset points",
+                    ha='left', va='center',
+                    fontsize=8, fontweight='bold', color=color
+                )
+
+        # Add title and labels
+        axes.set_title('6-Month Financial Forecast',
+                       fontsize=11, fontweight='bold', pad=8)
+        axes.set_xlabel('Month', fontsize=9, labelpad=5)
+        axes.set_ylabel('Amount (₺)', fontsize=9, labelpad=5)
+
+        # Format x-axis dates
+        axes.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
+        if len(dates) > 8:
+            axes.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
+        else:
+            axes.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
+
+        # Rotate date labels for better readability
+        setp(axes.get_xticklabels(), rotation=45, ha='right')
+
+        # Add legend
+        axes.legend(loc='upper left', fontsize=8)
+
+        # Add horizontal line at zero
+        axes.axhline(y=0, color='#888888', linestyle='-', alpha=0.3)
+
+    def refresh(self, data):
+        hist = data["history_length"]
+        dates, income, expenses, net = data["dates"], data["income"], data["expenses"], data["net"]
+
+        self.artists["hist_income"].set_data(dates[:hist], income[:hist])
+        self.artists["hist_expenses"].set_data(dates[:hist], expenses[:hist])
+        self.artists["hist_net"].set_data(dates[:hist], net[:hist])
+
+        if len(dates) > hist:
+            current_date = data["current_date"]
+            self.artists["separator"].set_xdata([current_date, current_date])
+            self.artists["separator_text"].set_position(
+                (current_date, max(max(income), max(expenses)) * 0.9))
+
+            forecast_dates = dates[hist:]
+            self.artists["income"].set_data(forecast_dates, income[hist:])
+            self.artists["expenses"].set_data(forecast_dates, expenses[hist:])
+            self.artists["net"].set_data(forecast_dates, net[hist:])
+
+            for name, value in (("income_label", income[-1]),
+                                ("expense_label", expenses[-1]),
+                                ("net_label", net[-1])):
+                self.artists[name].xy = (forecast_dates[-1], value)
+                self.artists[name].set_text(f"{value:,.0f} ₺")
+
+        self.rescale()
+
+
+class SavingsProjectionChart(DashboardChart):
+    """Savings scenarios for the next 12 months with savings goals marked"""
+
+    sources = (ChangeSource.TRANSACTIONS, ChangeSource.GOALS)
+
+    # Number of months to project
+    MONTHS = 12
+
+    @classmethod
+    def get_month_range(cls, year: int, month: int):
+        current = month_index(year, month)
+        return current, current
+
+    def get_data(self, dataset):
+        # Current date based on selection
+        current_date = datetime(dataset.year, dataset.month, 1)
+
+        # Get current monthly summary
+        current_summary = dataset.get_summary(dataset.year, dataset.month)
+        current_income = current_summary['total_income']
+        current_expenses = current_summary['total_expenses']
+        current_savings = current_income - current_expenses
+
+        # Get active financial goals
+        goals = [progress["goal"] for progress in dataset.goals_progress]
+
+        # If we have no data, show a message
+        if current_income == 0 and current_expenses == 0 and not goals:
+            return {"message": 'No financial data or goals available'}
+
+        # Create savings projection scenarios
+        # Best case: Income increases by 5%, expenses decrease by 3%
+        # Normal case: Income and expenses stay constant
+        # Worst case: Income decreases by 3%, expenses increase by 5%
+        months = self.MONTHS
+        dates = [current_date + relativedelta(months=i) for i in range(months)]
+
+        # Initialize savings scenarios
+        best_case = [0] * months
+        normal_case = [0] * months
+        worst_case = [0] * months
+
+        # Calculate cumulative savings for each scenario
+        for i in range(months):
+            # Best case
+            if i == 0:
+                best_case[i] = current_savings
+            else:
+                income_growth = current_income * (1 + 0.05) ** i
+                expense_reduction = current_expenses * (1 - 0.03) ** i
+                best_case[i] = best_case[i-1] + (income_growth - expense_reduction)
+
+            # Normal case
+            if i == 0:
+                normal_case[i] = current_savings
+            else:
+                normal_case[i] = normal_case[i-1] + current_savings
+
+            # Worst case
+            if i == 0:
+                worst_case[i] = current_savings
+            else:
+                income_decline = current_income * (1 - 0.03) ** i
+                expense_growth = current_expenses * (1 + 0.05) ** i
+                worst_case[i] = worst_case[i-1] + (income_decline - expense_growth)
+
+        # Savings goals with the month the expected case reaches them (if any)
+        savings_goals = []
+        for goal in goals:
+            if goal.goal_type.value != 'savings':
+                continue
+            reached = None
+            if current_savings > 0:
+                reached = next((i for i, savings in enumerate(normal_case)
+                                if savings >= goal.amount), None)
+            savings_goals.append((goal.name, goal.amount, reached))
+
+        return {
+            "message": None,
+            "dates": dates,
+            "current_savings": current_savings,
+            "best": best_case,
+            "normal": normal_case,
+            "worst": worst_case,
+            "goals": savings_goals
+        }
+
+    def get_shape(self, data):
+        if data["message"]:
+            return ("message",)
+        return ("projection", len(data["goals"]))
+
+    def build(self, data):
+        import matplotlib.dates as mdates
+        from matplotlib.artist import setp
+        if data["message"]:
+            self.show_message(data["message"])
+            return
+
+        axes = self.axes
+        dates = data["dates"]
+
+        # Cumulative savings projection lines
+        self.artists["best"], = axes.plot(dates, data["best"], '-', color='#4CAF50',
+                                          linewidth=2, label='Best Case')
+        self.artists["normal"], = axes.plot(dates, data["normal"], '-', color='#2196F3',
+                                            linewidth=2, label='Expected Case')
+        self.artists["worst"], = axes.plot(dates, data["worst"], '-', color='#F44336',
+                                           linewidth=2, label='Worst Case')
+
+        # Fill between the scenarios to show range
+        self.artists["upper_range"] = axes.fill_between(dates, data["best"], data["normal"],
+                                                        color='#4CAF50', alpha=0.2)
+        self.artists["lower_range"] = axes.fill_between(dates, data["normal"], data["worst"],
+                                                        color='#F44336', alpha=0.2)
+
+        # Goal lines, labels and achievement markers
+        self.artists["goals"] = []
+        for _ in data["goals"]:
+            line = axes.axhline(y=0, color='#9C27B0', linestyle='--', linewidth=1.5)
+            label = axes.text(
+                dates[0], 0, "",
+                ha='left', va='bottom',
+                fontsize=8, fontweight='bold', color='#9C27B0',
+                bbox=dict(facecolor='white', alpha=0.8, boxstyle='round,pad=0.2')
+            )
+            marker, = axes.plot(dates[0], 0, 'o', color='#9C27B0', markersize=8)
+            reached_text = axes.text(
+                dates[0], 0, "",
+                ha='right', va='top',
+                fontsize=8, fontweight='bold', color='#9C27B0',
+                bbox=dict(facecolor='white', alpha=0.8, boxstyle='round,pad=0.2')
+            )
+            self.artists["goals"].append((line, label, marker, reached_text))
+
+        # Add title and labels
+        axes.set_title('Savings Projection (Next 12 Months)',
+                       fontsize=11, fontweight='bold', pad=8)
+        axes.set_xlabel('Month', fontsize=9, labelpad=5)
+        axes.set_ylabel('Cumulative Savings (₺)', fontsize=9, labelpad=5)
+
+        # Format x-axis dates
+        axes.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
+        axes.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
+
+        # Rotate date labels for better readability
+        setp(axes.get_xticklabels(), rotation=45, ha='right')
+
+        # Add horizontal line at zero
+        axes.axhline(y=0, color='#888888', linestyle='-', alpha=0.3)
+
+        # Add scenario descriptions
+        scenario_text = """
+        Scenarios:
+        • Best: Income +5%/mo, Expenses -3%/mo
+        • Expected: Current rates maintained
+        • Worst: Income -3%/mo, Expenses +5%/mo
+        """
+
+        axes.text(
+            0.02, 0.02, scenario_text,
+            transform=axes.transAxes,
+            fontsize=7, va='bottom', ha='left',
+            bbox=dict(facecolor='white', alpha=0.8, boxstyle='round,pad=0.3')
+        )
+
+        # Starting point and final value annotations
+        self.artists["start_label"] = axes.annotate(
+            "", xy=(dates[0], 0),
+            xytext=(5, 0), textcoords="offset points",
+            ha='left', va='center',
+            fontsize=8, fontweight='bold', color='#2196F3'
+        )
+        for name, color in (("best_label", '#4CAF50'),
+                            ("normal_label", '#2196F3'),
+                            ("worst_label", '#F44336')):
+            self.artists[name] = axes.annotate(
+                "", xy=(dates[-1], 0),
+                xytext=(-5, 0), textcoords="offset points",
+                ha='right', va='center',
+                fontsize=8, fontweight='bold', color=color
+            )
+
+        # Add legend
+        axes.legend(loc='upper left', fontsize=8)
+
+    def refresh(self, data):
+        import matplotlib.dates as mdates
+        if data["message"]:
+            return
+
+        dates = data["dates"]
+        best, normal, worst = data["best"], data["normal"], data["worst"]
+
+        self.artists["best"].set_data(dates, best)
+        self.artists["normal"].set_data(dates, normal)
+        self.artists["worst"].set_data(dates, worst)
+
+        x = mdates.date2num(dates)
+        _set_area(self.artists["upper_range"], x, best, normal)
+        _set_area(self.artists["lower_range"], x, normal, worst)
+
+        for (line, label, marker, reached_text), (name, amount, reached) in zip(self.artists["goals"],
+                                                                              data["goals"]):
+            line.set_ydata([amount, amount])
+            label.set_position((dates[0], amount))
+            label.set_text(f"Goal: {name} ({amount:,.0f} ₺)")
+
+            # Mark where the expected case reaches the goal
+            marker.set_visible(reached is not None)
+            reached_text.set_visible(reached is not None)
+            if reached is not None:
+                marker.set_data([dates[reached]], [amount])
+                reached_text.set_position((dates[reached], amount))
+                reached_text.set_text(f"Goal reached: {dates[reached].strftime('%b %Y')}")
+
+        current_savings = data["current_savings"]
+        self.artists["start_label"].xy = (dates[0], current_savings)
+        self.artists["start_label"].set_text(f"Start: {current_savings:,.0f} ₺")
+
+        for name, values in (("best_label", best), ("normal_label", normal), ("worst_label", worst)):
+            self.artists[name].xy = (dates[-1], values[-1])
+            self.artists[name].set_text(f"{values[-1]:,.0f} ₺")
+
+        self.rescale()
+
+
+class ForecastActualSummaryChart(DashboardChart):
+    """Forecast and actual income, expenses and net worth of the selected month"""
+
+    sources = (ChangeSource.TRANSACTIONS, ChangeSource.FORECASTS)
+
+    @classmethod
+    def get_month_range(cls, year: int, month: int):
+        current = month_index(year, month)
+        return current, current
+
+    def get_data(self, dataset):
+        summary = comparison_for_month(dataset.forecast_comparison, -1)['summary']
+        return {
+            "year": dataset.year,
+            "month": dataset.month,
+            "summary": [summary['income'], summary['expenses'], summary['net_worth']]
+        }
+
+    def get_shape(self, data):
+        return ("summary",)
+
+    def build(self, data):
+        axes = self.axes
+
+        # Set positions for bars
+        x = np.arange(3)  # 3 categories: Income, Expenses, Net
+        width = 0.35      # Width of bars
+        zeros = [0] * len(x)
+
+        # Create grouped bar chart
+        self.artists["forecast"] = axes.bar(
+            x - width/2,
+            zeros,
+            width,
+            color=['#81c784', '#e57373', '#64b5f6'],
+            alpha=0.7,
+            label='Forecast'
+        )
+
+        self.artists["actual"] = axes.bar(
+            x + width/2,
+            zeros,
+            width,
+            color=['#2e7d32', '#c62828', '#1565c0'],
+            alpha=0.9,
+            label='Actual'
+        )
+
+        # Value and variance labels
+        self.artists["forecast_labels"] = []
+        self.artists["actual_labels"] = []
+        self.artists["variance_labels"] = []
+        for i in range(len(x)):
+            self.artists["forecast_labels"].append(axes.text(
+                x[i] - width/2, 0, "",
+                ha='center', va='bottom',
+                fontsize=8, fontweight='bold',
+                color='#333333'
+            ))
+
+            self.artists["actual_labels"].append(axes.text(
+                x[i] + width/2, 0, "",
+                ha='center', va='bottom',
+                fontsize=8, fontweight='bold',
+                color='#333333'
+            ))
+
+            self.artists["variance_labels"].append(axes.text(
+                x[i], 0, "",
+                ha='center', va='center',
+                fontsize=8, fontweight='bold',
+                bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="lightgrey", alpha=0.8)
+            ))
+
+        # Add labels and title
+        self.artists["title"] = axes.set_title('', fontsize=11, fontweight='bold', pad=8)
+
+        axes.set_xticks(x)
+        axes.set_xticklabels(['Income', 'Expenses', 'Net Worth'])
+        axes.set_ylabel('Amount (₺)', fontsize=9)
+
+        # Add zero line
+        axes.axhline(y=0, color='grey', linestyle='-', alpha=0.3, linewidth=1)
+
+        # Add legend
+        axes.legend(fontsize=8)
+
+    def refresh(self, data):
+        for i, line in enumerate(data["summary"]):
+            forecast, actual = line['forecast'], line['actual']
+            variance, variance_pct = line['variance'], line['variance_pct']
+
+            self.artists["forecast"][i].set_height(forecast)
+            self.artists["actual"][i].set_height(actual)
+
+            forecast_label = self.artists["forecast_labels"][i]
+            forecast_label.set_y(forecast)
+            forecast_label.set_text(f"{forecast:,.0f}")
+
+            actual_label = self.artists["actual_labels"][i]
+            actual_label.set_y(actual)
+            actual_label.set_text(f"{actual:,.0f}")
+
+            # Determine color based on whether the variance is good or bad
+            if (i == 0 and variance >= 0) or (i == 1 and variance <= 0) or (i == 2 and variance >= 0):
+                variance_color = '#2e7d32'  # Green for positive
+            else:
+                variance_color = '#c62828'  # Red for negative
+
+            variance_label = self.artists["variance_labels"][i]
+            variance_label.set_y(min(forecast, actual) / 2)
+            variance_label.set_text(f"{variance:+,.0f} ({variance_pct:+.1f}%)")
+            variance_label.set_color(variance_color)
+
+        self.artists["title"].set_text(
+            f'Forecast vs Actual Summary - {calendar.month_name[data["month"]]} {data["year"]}')
+
+        self.rescale()
+
+
+class ForecastActualCategoryChart(DashboardChart):
+    """Forecast and actual amounts of the selected month's top expense categories"""
+
+    sources = (ChangeSource.TRANSACTIONS, ChangeSource.FORECASTS)
+
+    @classmethod
+    def get_month_range(cls, year: int, month: int):
+        current = month_index(year, month)
+        return current, current
+
+    def get_data(self, dataset):
+        expense_categories = comparison_for_month(dataset.forecast_comparison, -1)['expense_categories']
+
+        # Sort categories by actual amount
+        sorted_expense_categories = sorted(
+            expense_categories.items(),
+            key=lambda x: x[1]['actual'],
+            reverse=True
+        )
+
+        # Limit to top 6 categories
+        if len(sorted_expense_categories) > 6:
+            top_categories = sorted_expense_categories[:5]
+
+            # Create an "Other" category for the rest
+            other_forecast = sum(cat[1]['forecast'] for cat in sorted_expense_categories[5:])
+            other_actual = sum(cat[1]['actual'] for cat in sorted_expense_categories[5:])
+            top_categories.append(('Other', {'forecast': other_forecast, 'actual': other_actual}))
+        else:
+            top_categories = sorted_expense_categories
+
+        return {
+            "year": dataset.year,
+            "month": dataset.month,
+            "categories": [cat[0] for cat in top_categories],
+            "forecast": [cat[1]['forecast'] for cat in top_categories],
+            "actual": [cat[1]['actual'] for cat in top_categories]
+        }
+
+    def get_shape(self, data):
+        return ("categories", len(data["categories"]))
+
+    def build(self, data):
+        axes = self.axes
+
+        # Set positions for bars
+        x = np.arange(len(data["categories"]))
+        width = 0.35
+        zeros = [0] * len(x)
+
+        # Create grouped bar chart
+        self.artists["forecast"] = axes.bar(
+            x - width/2,
+            zeros,
+            width,
+            color='#e57373',
+            alpha=0.7,
+            label='Forecast'
+        )
+
+        self.artists["actual"] = axes.bar(
+            x + width/2,
+            zeros,
+            width,
+            color='#c62828',
+            alpha=0.9,
+            label='Actual'
+        )
+
+        # Data labels, shown only for significant values
+        self.artists["forecast_labels"] = [
+            axes.text(x[i] - width/2, 0, "", ha='center', va='bottom', fontsize=7)
+            for i in range(len(x))
+        ]
+        self.artists["actual_labels"] = [
+            axes.text(x[i] + width/2, 0, "", ha='center', va='bottom', fontsize=7)
+            for i in range(len(x))
+        ]
+
+        # Add labels and title
+        self.artists["title"] = axes.set_title('', fontsize=11, fontweight='bold', pad=8)
+
+        axes.set_xticks(x)
+        axes.set_ylabel('Amount (₺)', fontsize=9)
+
+        # Add legend
+        axes.legend(fontsize=8)
+
+    def refresh(self, data):
+        for key in ("forecast", "actual"):
+            values = data[key]
+            for bar, label, value in zip(self.artists[key], self.artists[f"{key}_labels"], values):
+                bar.set_height(value)
+
+                # Only label values that are significant
+                label.set_visible(value > max(values) * 0.1)
+                label.set_y(value)
+                label.set_text(f"{value:,.0f}")
+                label.set_rotation(90 if value > max(values) * 0.7 else 0)
+
+        self.axes.set_xticklabels(data["categories"], rotation=45, ha='right')
+
+        self.artists["title"].set_text(
+            f'Top Expense Categories: Forecast vs Actual - '
+            f'{calendar.month_name[data["month"]]} {data["year"]}')
+
+        self.rescale()
+
+
+class ForecastAccuracyChart(DashboardChart):
+    """Forecast accuracy over the last 6 months"""
+
+    sources = (ChangeSource.TRANSACTIONS, ChangeSource.FORECASTS)
+
+    @classmethod
+    def get_month_range(cls, year: int, month: int):
+        current = month_index(year, month)
+        return current - HISTORY_MONTHS + 1, current
+
+    def get_data(self, dataset):
+        comparison_range = dataset.forecast_comparison
+
+        # Accuracy over the months in the comparison range
+        # (the last 6 months including the current one)
+        dates = [datetime(y, m, 1) for y, m in comparison_range['months']]
+        income = comparison_range['summary']['income']
+        expenses = comparison_range['summary']['expenses']
+        net = comparison_range['summary']['net_worth']
+
+        accuracy_income = []
+        accuracy_expense = []
+        accuracy_net = []
+
+        for i in range(len(dates)):
+            # Check if we have both forecast and actual data
+            has_forecast_income = income['forecast'][i] > 0
+            has_forecast_expense = expenses['forecast'][i] > 0
+
+            # If we have data, calculate accuracy
+            if has_forecast_income:
+                income_accuracy = 100 - abs(income['variance_pct'][i])
+                income_accuracy = max(0, min(100, income_accuracy))  # Clamp between 0-100%
+            else:
+                income_accuracy = None
+
+            if has_forecast_expense:
+                expense_accuracy = 100 - abs(expenses['variance_pct'][i])
+                expense_accuracy = max(0, min(100, expense_accuracy))  # Clamp between 0-100%
+            else:
+                expense_accuracy = None
+
+            if has_forecast_income and has_forecast_expense:
+                net_accuracy = 100 - abs(net['variance_pct'][i])
+                net_accuracy = max(0, min(100, net_accuracy))  # Clamp between 0-100%
+            else:
+                net_accuracy = None
+
+            # Add to lists
+            accuracy_income.append(income_accuracy)
+            accuracy_expense.append(expense_accuracy)
+            accuracy_net.append(net_accuracy)
+
+        return {
+            "dates": dates,
+            "income": accuracy_income,
+            "expenses": accuracy_expense,
+            "net": accuracy_net
+        }
+
+    def get_shape(self, data):
+        return ("months", len(data["dates"]))
+
+    def build(self, data):
+        import matplotlib.dates as mdates
+        from matplotlib.artist import setp
+        axes = self.axes
+        dates = data["dates"]
+        empty = [np.nan] * len(dates)
+
+        # Accuracy lines for income, expenses and net worth
+        self.artists["income"], = axes.plot(
+            dates, empty, 'o-',
+            color='#4CAF50', linewidth=2, marker='o', markersize=6,
+            label='Income Accuracy'
+        )
+        self.artists["expenses"], = axes.plot(
+            dates, empty, 'o-',
+            color='#F44336', linewidth=2, marker='o', markersize=6,
+            label='Expense Accuracy'
+        )
+        self.artists["net"], = axes.plot(
+            dates, empty, 'o-',
+            color='#2196F3', linewidth=2, marker='o', markersize=6,
+            label='Net Worth Accuracy'
+        )
+
+        # Add target line at 100%
+        axes.axhline(
+            y=100, color='grey', linestyle='--', alpha=0.5,
+            linewidth=1, label='Perfect Accuracy'
+        )
+
+        # Add colored zones
+        axes.axhspan(90, 100, color='#4CAF50', alpha=0.1, label='Excellent')
+        axes.axhspan(75, 90, color='#FFEB3B', alpha=0.1, label='Good')
+        axes.axhspan(0, 75, color='#F44336', alpha=0.1, label='Needs Improvement')
+
+        # Labels for the current month's accuracy
+        for name, color in (("income_label", '#4CAF50'),
+                            ("expense_label", '#F44336'),
+                            ("net_label", '#2196F3')):
+            self.artists[name] = axes.annotate(
+                "", xy=(dates[-1], 0),
+                xytext=(5, 0), textcoords="offset points",
+                fontsize=8, fontweight='bold', color=color
+            )
+
+        # Add title and labels
+        axes.set_title('Forecast Accuracy Trend (Last 6 Months)',
+                       fontsize=11, fontweight='bold', pad=8)
+        axes.set_xlabel('Month', fontsize=9)
+        axes.set_ylabel('Accuracy (%)', fontsize=9)
+
+        # Set y-axis range
+        axes.set_ylim(0, 105)
+
+        # Format x-axis dates
+        axes.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
+
+        # Rotate date labels
+        setp(axes.get_xticklabels(), rotation=45, ha='right')
+
+        # Add legend
+        axes.legend(fontsize=8, loc='lower left')
+
+    def refresh(self, data):
+        dates = data["dates"]
+
+        for key, label_name in (("income", "income_label"),
+                                ("expenses", "expense_label"),
+                                ("net", "net_label")):
+            values = data[key]
+            # Months without a forecast leave a gap in the line
+            self.artists[key].set_data(dates, [np.nan if v is None else v for v in values])
+
+            label = self.artists[label_name]
+            label.set_visible(values[-1] is not None)
+            if values[-1] is not None:
+                label.xy = (dates[-1], values[-1])
+                label.set_text(f"{values[-1]:.1f}%")
+
+        # The y range is fixed, so only the dates need rescaling; they are
+        # passed along since months without forecasts plot no points
+        import matplotlib.dates as mdates
+        self.rescale([(x, 100) for x in mdates.date2num(dates)])
@@ -0,0 +1,186 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from models.long_operation import CancellationToken
+from diagnostics import startup_profiler
+
+
+class DatasetTaskSignals(QObject):
+    """Signals of a DatasetTask (QRunnable itself cannot emit signals)"""
+    finished = pyqtSignal(object, object)
+    failed = pyqtSignal(object, str)
+
+
+class DatasetTask(QRunnable):
+    """Runs a prepared dashboard dataset build on a pool thread"""
+
+    def __init__(self, generation: int, build, cancel_token: CancellationToken, month=None):
+        super().__init__()
+        self.generation = generation
+        # (year, month) of a prefetch task
+        self.month = month
+        self.build = build
+        self.cancel_token = cancel_token
+        self.signals = DatasetTaskSignals()
+
+    def run(self):
+        # A newer selection was made while this task waited in the queue
+        if self.cancel_token.is_cancelled():
+            self.signals.finished.emit(self, None)
+            return
+
+        try:
+            with startup_profiler.measure("dashboard", "dataset build"):
+                dataset = self.build()
+        except Exception as e:
+            self.signals.failed.emit(self, str(e))
+            return
+        self.signals.finished.emit(self, dataset)
+
+
+class DashboardDataLoader(QObject):
+    """
+    Builds dashboard datasets off the GUI thread.
+    Each load gets a new generation number; the previous build is cancelled
+    and any result that arrives for an older generation is dropped, so only
+    the latest (year, month) selection is ever drawn.
+    """
+
+    # Emitted on the GUI thread with the dataset of the latest selection
+    loaded = pyqtSignal(object)
+    # Emitted on the GUI thread with a dataset built ahead for a neighboring month
+    prefetched = pyqtSignal(object)
+
+    def __init__(self, controller, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+
+        # One build at a time; a queued stale build exits as soon as it starts
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+        self.generation = 0
+        self.cancel_token = None
+        # Tasks are kept alive (with their signals objects) until they report back
+        self.tasks = set()
+        # Prefetch builds by (year, month); cancelled whenever a load starts
+        self.prefetch_tasks = {}
+
+        self.started = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.dropped = 0
+        self.cache_hits = 0
+        self.prefetches = 0
+
+    def load(self, year: int, month: int):
+        """Start loading the dataset for a month, superseding any load in progress"""
+        self.generation += 1
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+            self.cancel_token = None
+        # Prefetches must not hold up the selected month in the single-thread pool
+        for task in self.prefetch_tasks.values():
+            task.cancel_token.cancel()
+        self.prefetch_tasks = {}
+
+        # Already built for the current data: no need for a worker
+        dataset = self.controller.peek_dashboard_dataset(year, month)
+        if dataset is not None:
+            self.cache_hits += 1
+            self.loaded.emit(dataset)
+            return
+
+        # The snapshot is taken here, on the GUI thread
+        cancel_token = CancellationToken()
+        build = self.controller.prepare_dashboard_dataset(year, month, cancel_token)
+
+        task = DatasetTask(self.generation, build, cancel_token)
+        task.setAutoDelete(False)
+        task.signals.finished.connect(self.on_task_finished)
+        task.signals.failed.connect(self.on_task_failed)
+        self.tasks.add(task)
+
+        self.cancel_token = cancel_token
+        self.started += 1
+        self.pool.start(task)
+
+    def prefetch(self, year: int, month: int):
+        """Build the dataset for a month ahead of time, unless it is cached or being built"""
+        if (year, month) in self.prefetch_tasks:
+            return
+        if self.controller.peek_dashboard_dataset(year, month) is not None:
+            return
+
+        cancel_token = CancellationToken()
+        build = self.controller.prepare_dashboard_dataset(year, month, cancel_token)
+
+        task = DatasetTask(0, build, cancel_token, (year, month))
+        task.setAutoDelete(False)
+        task.signals.finished.connect(self.on_prefetch_finished)
+        task.signals.failed.connect(self.on_task_failed)
+        self.tasks.add(task)
+        self.prefetch_tasks[(year, month)] = task
+
+        self.prefetches += 1
+        # Lower priority than loads already queued
+        self.pool.start(task, -1)
+
+    def on_prefetch_finished(self, task: DatasetTask, dataset):
+        """Cache a prefetched dataset on the GUI thread"""
+        self.tasks.discard(task)
+        if self.prefetch_tasks.get(task.month) is task:
+            del self.prefetch_tasks[task.month]
+
+        if dataset is None:
+            self.cancelled += 1
+            return
+
+        self.controller.store_dashboard_dataset(dataset)
+        self.completed += 1
+        self.prefetched.emit(dataset)
+
+    def on_task_finished(self, task: DatasetTask, dataset):
+        """Handle a build result on the GUI thread"""
+        self.tasks.discard(task)
+
+        if dataset is None:
+            self.cancelled += 1
+            return
+
+        # Results for older selections are still valid for their month
+        self.controller.store_dashboard_dataset(dataset)
+        self.completed += 1
+
+        if task.generation != self.generation:
+            self.dropped += 1
+            return
+
+        self.cancel_token = None
+        self.loaded.emit(dataset)
+
+    def on_task_failed(self, task: DatasetTask, message: str):
+        """Handle a build error on the GUI thread"""
+        self.tasks.discard(task)
+        if self.prefetch_tasks.get(task.month) is task:
+            del self.prefetch_tasks[task.month]
+        print(f"Error building dashboard data: {message}")
+
+    def shutdown(self):
+        """Cancel the running build and wait for the pool to finish"""
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+        for task in self.tasks:
+            task.cancel_token.cancel()
+        self.pool.waitForDone()
+
+    def get_stats(self):
+        """Get counts of started, prefetched, completed, cancelled and dropped builds"""
+        return {
+            "started": self.started,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "dropped": self.dropped,
+            "cache_hits": self.cache_hits,
+            "prefetches": self.prefetches,
+            "pending": len(self.tasks)
+        }
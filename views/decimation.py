@@ -0,0 +1,45 @@
+import numpy as np
+
+
+def lttb_indices(x, y, threshold: int) -> np.ndarray:
+    """
+    Indices of the points kept by largest-triangle-three-buckets downsampling.
+    The points between the first and the last are split into threshold - 2
+    buckets; from each bucket the point forming the largest triangle with the
+    previously kept point and the average of the next bucket is kept, which
+    preserves peaks and turning points. Series with at most threshold points
+    are kept whole.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # Bucket boundaries; every bucket has at least one point since n > threshold
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+
+    indices = np.empty(threshold, dtype=int)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    kept = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+
+        # Average point of the next bucket (the last point after the final bucket)
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Twice the triangle areas; the constant factor does not change the argmax
+        areas = np.abs((x[kept] - avg_x) * (y[start:end] - y[kept]) -
+                       (x[kept] - x[start:end]) * (avg_y - y[kept]))
+        kept = start + int(np.argmax(areas))
+        indices[bucket + 1] = kept
+
+    return indices
@@ -1,10 +1,16 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, 
                            QLabel, QLineEdit, QComboBox, QPushButton, 
-                           QDateEdit, QMessageBox, QGridLayout)
+                           QDateEdit, QMessageBox, QGridLayout, QTabWidget,
+                           QTableWidget, QTableWidgetItem, QHeaderView,
+                           QApplication, QShortcut)
 from PyQt5.QtCore import Qt, pyqtSignal, QDate
+from PyQt5.QtGui import QColor, QKeySequence
 
 from datetime import datetime
 from models.transaction import TransactionType
+from models.batch_entry import BATCH_COLUMNS, AMOUNT_COLUMN, parse_tsv
+from .name_completer import NameCompleter
+from .long_operation import run_operation
 
 class EntryForm(QWidget):
     # Signal emitted when a transaction is added
@@ -13,11 +19,24 @@ class EntryForm(QWidget):
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
+        # Runs batch imports in slices with status bar progress (see set_operation_runner)
+        self.operations = None
         self.init_ui()
         
+    def set_operation_runner(self, runner):
+        self.operations = runner
+        
     def init_ui(self):
+        # Single entry and batch entry are pages of a tab widget
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+        self.mode_tabs = QTabWidget()
+        self.mode_tabs.setDocumentMode(True)
+        outer_layout.addWidget(self.mode_tabs)
+        
         # Single main layout with everything properly sized
-        main_layout = QVBoxLayout(self)
+        single_page = QWidget()
+        main_layout = QVBoxLayout(single_page)
         main_layout.setContentsMargins(15, 15, 15, 15)
         main_layout.setSpacing(10)
         
@@ -42,6 +61,10 @@ class EntryForm(QWidget):
         form_grid.addWidget(name_label, 0, 0)
         form_grid.addWidget(self.name_edit, 0, 1)
         
+        # Names from the transaction history; picking one fills in its last amount and category
+        self.name_completer = NameCompleter(self.controller, self.name_edit)
+        self.name_completer.suggestion_picked.connect(self.apply_suggestion)
+        
         # Amount
         amount_label = QLabel("Amount (₺):")
         amount_label.setStyleSheet("font-weight: 500;")
@@ -115,6 +138,77 @@ class EntryForm(QWidget):
         # Initial styling update
         self.update_category_style()
         
+        self.mode_tabs.addTab(single_page, "Single Entry")
+        self.batch_page = self.create_batch_page()
+        self.mode_tabs.addTab(self.batch_page, "Batch Entry")
+        
+    def create_batch_page(self):
+        """Create the grid that takes pasted statement lines"""
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(10)
+        
+        header_label = QLabel("Paste Statement Lines")
+        header_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #3a4f9b;")
+        header_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(header_label)
+        
+        hint_label = QLabel("Paste tab-separated rows (Date, Name, Category, Amount) copied from a "
+                            "spreadsheet. Rows without a date go to the month below. "
+                            "Cells can be edited; rows with errors are highlighted.")
+        hint_label.setWordWrap(True)
+        hint_label.setStyleSheet("color: #6c757d;")
+        layout.addWidget(hint_label)
+        
+        # Month used for rows without a date
+        date_layout = QHBoxLayout()
+        date_layout.addWidget(QLabel("Default month:"))
+        self.batch_date_edit = QDateEdit()
+        self.batch_date_edit.setDisplayFormat("MMMM yyyy")
+        self.batch_date_edit.setDate(QDate.currentDate())
+        self.batch_date_edit.setCalendarPopup(True)
+        self.batch_date_edit.dateChanged.connect(self.validate_batch)
+        date_layout.addWidget(self.batch_date_edit)
+        date_layout.addStretch()
+        layout.addLayout(date_layout)
+        
+        self.batch_table = QTableWidget(0, len(BATCH_COLUMNS))
+        self.batch_table.setHorizontalHeaderLabels(BATCH_COLUMNS)
+        self.batch_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.batch_table.itemChanged.connect(self.on_batch_item_changed)
+        QShortcut(QKeySequence.Paste, self.batch_table, self.paste_rows, context=Qt.WidgetWithChildrenShortcut)
+        layout.addWidget(self.batch_table, 1)
+        
+        self.batch_status = QLabel("No rows")
+        layout.addWidget(self.batch_status)
+        
+        buttons_layout = QHBoxLayout()
+        buttons_layout.setSpacing(15)
+        
+        clear_btn = QPushButton("Clear")
+        clear_btn.clicked.connect(self.clear_batch)
+        clear_btn.setFixedHeight(35)
+        
+        paste_btn = QPushButton("Paste Rows")
+        paste_btn.clicked.connect(self.paste_rows)
+        paste_btn.setFixedHeight(35)
+        
+        self.add_batch_btn = QPushButton("Add Transactions")
+        self.add_batch_btn.setObjectName("primaryButton")
+        self.add_batch_btn.clicked.connect(self.add_batch)
+        self.add_batch_btn.setFixedHeight(35)
+        self.add_batch_btn.setEnabled(False)
+        
+        buttons_layout.addWidget(clear_btn)
+        buttons_layout.addWidget(paste_btn)
+        buttons_layout.addWidget(self.add_batch_btn)
+        layout.addLayout(buttons_layout)
+        
+        # Parsed rows, one per table row, from the last validation
+        self.batch_rows = []
+        return page
+        
     def refresh_categories(self):
         """Refresh the categories in the combobox"""
         # Save the current selection if any
@@ -140,6 +234,13 @@ class EntryForm(QWidget):
             if index >= 0:
                 self.category_combo.setCurrentIndex(index)
         
+    def apply_suggestion(self, suggestion):
+        """Fill in the last amount and category used with a picked name"""
+        self.amount_edit.setText(f"{suggestion.amount:.2f}")
+        index = self.category_combo.findData(suggestion.category)
+        if index >= 0:
+            self.category_combo.setCurrentIndex(index)
+        
     def update_category_style(self):
         """Update background color based on whether selected category is income or expense"""
         if self.category_combo.count() == 0:
@@ -229,4 +330,124 @@ class EntryForm(QWidget):
         """Show the category manager dialog"""
         # This will be implemented in the main window to show the category manager tab
         # We'll emit a signal that the main window will connect to
-        self.transaction_added.emit()  # Reuse the same signal to trigger UI updates
\ No newline at end of file
+        self.transaction_added.emit()  # Reuse the same signal to trigger UI updates
+            
+    def paste_rows(self):
+        """Append the tab-separated rows on the clipboard to the grid"""
+        rows = parse_tsv(QApplication.clipboard().text())
+        if rows:
+            self.append_batch_rows(rows)
+            
+    def append_batch_rows(self, rows):
+        """Add rows of cells to the grid and validate the whole grid"""
+        # One validation pass after filling, not one per cell
+        self.batch_table.blockSignals(True)
+        start = self.batch_table.rowCount()
+        self.batch_table.setRowCount(start + len(rows))
+        for offset, cells in enumerate(rows):
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column == AMOUNT_COLUMN:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.batch_table.setItem(start + offset, column, item)
+        self.batch_table.blockSignals(False)
+        self.validate_batch()
+        
+    def get_row_cells(self, row):
+        """Text of the cells of a grid row"""
+        table = self.batch_table
+        return [table.item(row, column).text() if table.item(row, column) else ""
+                for column in range(table.columnCount())]
+        
+    def get_batch_cells(self):
+        """Text of every grid cell, row by row"""
+        return [self.get_row_cells(row) for row in range(self.batch_table.rowCount())]
+        
+    def get_batch_default_date(self):
+        qdate = self.batch_date_edit.date()
+        return datetime(qdate.year(), qdate.month(), 1)
+        
+    def validate_batch(self):
+        """Check every grid row against the categories in one pass and mark the errors"""
+        self.batch_rows = self.controller.validate_batch(self.get_batch_cells(), self.get_batch_default_date())
+        self.batch_table.blockSignals(True)
+        for row, batch_row in enumerate(self.batch_rows):
+            self.show_row_errors(row, batch_row)
+        self.batch_table.blockSignals(False)
+        self.update_batch_status()
+        
+    def on_batch_item_changed(self, item):
+        """Re-check the edited row only"""
+        row = item.row()
+        if row >= len(self.batch_rows):
+            return
+        cells = self.get_row_cells(row)
+        self.batch_rows[row] = self.controller.validate_batch([cells], self.get_batch_default_date())[0]
+        self.batch_table.blockSignals(True)
+        self.show_row_errors(row, self.batch_rows[row])
+        self.batch_table.blockSignals(False)
+        self.update_batch_status()
+        
+    def show_row_errors(self, row, batch_row):
+        """Tint a row with errors and show each error on its cell"""
+        errors = dict(batch_row.errors)
+        for column in range(self.batch_table.columnCount()):
+            item = self.batch_table.item(row, column)
+            if item is None:
+                item = QTableWidgetItem("")
+                self.batch_table.setItem(row, column, item)
+            if column in errors:
+                item.setBackground(QColor("#ef9a9a"))
+                item.setToolTip(errors[column])
+            elif errors:
+                item.setBackground(QColor("#ffebee"))
+                item.setToolTip("")
+            else:
+                item.setBackground(QColor(Qt.transparent))
+                item.setToolTip("")
+        
+    def update_batch_status(self):
+        """Show the row and error counts and enable adding when every row is valid"""
+        total = len(self.batch_rows)
+        invalid = sum(1 for batch_row in self.batch_rows if not batch_row.is_valid())
+        if total == 0:
+            self.batch_status.setText("No rows")
+        elif invalid:
+            self.batch_status.setText(f"{total} rows, {invalid} with errors")
+        else:
+            amount = sum(batch_row.amount for batch_row in self.batch_rows)
+            self.batch_status.setText(f"{total} rows ready, {amount:,.2f} ₺ in total")
+        self.add_batch_btn.setEnabled(total > 0 and invalid == 0)
+        
+    def clear_batch(self):
+        """Remove every row from the grid"""
+        self.batch_table.setRowCount(0)
+        self.batch_rows = []
+        self.update_batch_status()
+        
+    def add_batch(self):
+        """Add every grid row as a transaction in one batch"""
+        if not self.batch_rows or not all(batch_row.is_valid() for batch_row in self.batch_rows):
+            QMessageBox.warning(self, "Input Error", "Please fix the highlighted rows first.")
+            return
+        
+        # The grid is locked while the rows are added
+        self.set_batch_busy(True)
+        rows = list(self.batch_rows)
+        run_operation(self.operations, f"Adding {len(rows)} transactions",
+                      lambda token: self.controller.iter_add_transactions(rows, token),
+                      self.on_batch_added, lambda: self.set_batch_busy(False))
+        
+    def on_batch_added(self, count):
+        self.set_batch_busy(False)
+        if count == 0:
+            QMessageBox.critical(self, "Error", "Failed to add the transactions.")
+            return
+        
+        QMessageBox.information(self, "Success", f"{count} transactions added successfully!")
+        self.clear_batch()
+        self.transaction_added.emit()
+        
+    def set_batch_busy(self, busy):
+        """Lock or unlock the batch grid and its buttons while rows are being added"""
+        self.batch_page.setEnabled(not busy)
@@ -1,15 +1,19 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, 
                            QLabel, QLineEdit, QComboBox, QPushButton, 
                            QDateEdit, QMessageBox, QGridLayout, QTabWidget,
-                           QTableWidget, QTableWidgetItem, QHeaderView,
+                           QTableWidget, QTableWidgetItem, QTableView, QHeaderView,
                            QAbstractItemView, QTextEdit, QSplitter,
-                           QFrame, QSizePolicy)
+                           QFrame, QSizePolicy, QSpinBox)
 from PyQt5.QtCore import Qt, pyqtSignal, QDate
 from PyQt5.QtGui import QColor, QFont
 
 import calendar
 from datetime import datetime
 from models.transaction import TransactionType
+from models.change_event import ChangeEvent, ChangeKind, ChangeSource
+from .forecast_table_model import ForecastTableModel, create_forecast_index
+from .name_completer import NameCompleter
+from .long_operation import run_operation
 
 class ForecastEntryForm(QWidget):
     """Form for entering new forecast transactions"""
@@ -47,6 +51,10 @@ class ForecastEntryForm(QWidget):
         form_grid.addWidget(name_label, 0, 0)
         form_grid.addWidget(self.name_edit, 0, 1)
         
+        # Names from the transaction history; picking one fills in its last amount and category
+        self.name_completer = NameCompleter(self.controller, self.name_edit)
+        self.name_completer.suggestion_picked.connect(self.apply_suggestion)
+        
         # Amount
         amount_label = QLabel("Amount (₺):")
         amount_label.setStyleSheet("font-weight: 500;")
@@ -84,6 +92,19 @@ class ForecastEntryForm(QWidget):
         form_grid.addWidget(date_label, 3, 0)
         form_grid.addWidget(self.date_edit, 3, 1)
         
+        # Repeat (number of monthly installments, 1 = one-off forecast)
+        repeat_label = QLabel("Repeat:")
+        repeat_label.setStyleSheet("font-weight: 500;")
+        self.repeat_spin = QSpinBox()
+        self.repeat_spin.setRange(1, 360)
+        self.repeat_spin.setValue(1)
+        self.repeat_spin.setSuffix(" month(s)")
+        self.repeat_spin.setToolTip("Number of monthly installments starting at the selected date")
+        self.repeat_spin.setFixedHeight(30)
+        
+        form_grid.addWidget(repeat_label, 4, 0)
+        form_grid.addWidget(self.repeat_spin, 4, 1)
+        
         # Notes
         notes_label = QLabel("Notes:")
         notes_label.setStyleSheet("font-weight: 500;")
@@ -91,8 +112,8 @@ class ForecastEntryForm(QWidget):
         self.notes_edit.setPlaceholderText("Add notes or assumptions about this forecast")
         self.notes_edit.setMaximumHeight(80)
         
-        form_grid.addWidget(notes_label, 4, 0, Qt.AlignTop)
-        form_grid.addWidget(self.notes_edit, 4, 1)
+        form_grid.addWidget(notes_label, 5, 0, Qt.AlignTop)
+        form_grid.addWidget(self.notes_edit, 5, 1)
         
         # Add form grid to main layout
         main_layout.addLayout(form_grid)
@@ -149,6 +170,13 @@ class ForecastEntryForm(QWidget):
             if index >= 0:
                 self.category_combo.setCurrentIndex(index)
     
+    def apply_suggestion(self, suggestion):
+        """Fill in the last amount and category used with a picked name"""
+        self.amount_edit.setText(f"{suggestion.amount:.2f}")
+        index = self.category_combo.findData(suggestion.category)
+        if index >= 0:
+            self.category_combo.setCurrentIndex(index)
+        
     def update_category_style(self):
         """Update background color based on whether selected category is income or expense"""
         if self.category_combo.count() == 0:
@@ -187,6 +215,7 @@ class ForecastEntryForm(QWidget):
         if self.category_combo.count() > 0:
             self.category_combo.setCurrentIndex(0)
         self.date_edit.setDate(QDate.currentDate())
+        self.repeat_spin.setValue(1)
         self.notes_edit.clear()
     
     def add_forecast(self):
@@ -226,7 +255,14 @@ class ForecastEntryForm(QWidget):
         try:
             # The updated controller method signature only accepts name, amount, category_name, date
             # and handles notes separately
-            self.controller.add_forecast(name, amount, category_name, date)
+            installments = self.repeat_spin.value()
+            if installments > 1:
+                # Stored as a single rule that expands into one forecast per month
+                if not self.controller.add_recurring_forecast(name, amount, category_name, date,
+                                                              installments=installments, notes=notes):
+                    raise ValueError("Could not create the recurring forecast")
+            else:
+                self.controller.add_forecast(name, amount, category_name, date)
             
             # Show success message
             QMessageBox.information(self, "Success", "Forecast transaction added successfully!")
@@ -245,9 +281,16 @@ class ForecastList(QWidget):
     """Widget to display forecast transactions"""
     forecast_updated = pyqtSignal()
     
+    # Forecast attributes shown in the tables
+    DISPLAYED_FIELDS = ("name", "amount", "category", "transaction_type", "date", "notes")
+    
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
+        # Sort permutations and filter keys of the selected month's forecasts, shared by both tables
+        self.sort_index = create_forecast_index()
+        # Runs conversions and reconciliation in slices with status bar progress
+        self.operations = None
         self.init_ui()
         
     def init_ui(self):
@@ -287,11 +330,21 @@ class ForecastList(QWidget):
         self.refresh_btn = QPushButton("Refresh")
         self.refresh_btn.clicked.connect(self.refresh_data)
         
+        # Bulk operations; they run in the background with progress in the status bar
+        self.convert_month_btn = QPushButton("Copy Month's Transactions")
+        self.convert_month_btn.setToolTip("Create a forecast from every transaction of the selected period")
+        self.convert_month_btn.clicked.connect(self.convert_month)
+        self.reconcile_btn = QPushButton("Reconcile with Actuals")
+        self.reconcile_btn.setToolTip("Mark forecasts realized by transactions that are not linked yet")
+        self.reconcile_btn.clicked.connect(self.reconcile)
+        
         filter_layout.addWidget(period_label)
         filter_layout.addWidget(self.month_combo)
         filter_layout.addWidget(self.year_combo)
         filter_layout.addWidget(self.refresh_btn)
         filter_layout.addStretch()
+        filter_layout.addWidget(self.convert_month_btn)
+        filter_layout.addWidget(self.reconcile_btn)
         
         main_layout.addLayout(filter_layout)
         
@@ -307,7 +360,9 @@ class ForecastList(QWidget):
         income_header.setStyleSheet("font-size: 14px; font-weight: bold; color: #2e7d32;")
         income_layout.addWidget(income_header)
         
-        self.income_table = QTableWidget()
+        self.income_model = ForecastTableModel(self.sort_index, TransactionType.INCOME, self)
+        self.income_table = QTableView()
+        self.income_table.setModel(self.income_model)
         self.income_table.setAlternatingRowColors(True)
         self.income_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.income_table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -353,7 +408,9 @@ class ForecastList(QWidget):
         expense_header.setStyleSheet("font-size: 14px; font-weight: bold; color: #c62828;")
         expense_layout.addWidget(expense_header)
         
-        self.expense_table = QTableWidget()
+        self.expense_model = ForecastTableModel(self.sort_index, TransactionType.EXPENSE, self)
+        self.expense_table = QTableView()
+        self.expense_table.setModel(self.expense_model)
         self.expense_table.setAlternatingRowColors(True)
         self.expense_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.expense_table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -405,30 +462,18 @@ class ForecastList(QWidget):
         self.refresh_data()
     
     def setup_tables(self):
-        """Set up the table headers and columns"""
-        headers = ["ID", "Date", "Name", "Category", "Amount (₺)", "Notes"]
-        
-        # Income table
-        self.income_table.setColumnCount(len(headers))
-        self.income_table.setHorizontalHeaderLabels(headers)
-        
-        # Hide ID column
-        self.income_table.setColumnHidden(0, True)
-        
-        # Set all columns to stretch equally
-        for i in range(1, len(headers)):
-            self.income_table.horizontalHeader().setSectionResizeMode(i, QHeaderView.Stretch)
-        
-        # Expense table
-        self.expense_table.setColumnCount(len(headers))
-        self.expense_table.setHorizontalHeaderLabels(headers)
-        
-        # Hide ID column
-        self.expense_table.setColumnHidden(0, True)
-        
-        # Set all columns to stretch equally
-        for i in range(1, len(headers)):
-            self.expense_table.horizontalHeader().setSectionResizeMode(i, QHeaderView.Stretch)
+        """Set up the table columns"""
+        for table in (self.income_table, self.expense_table):
+            # Hide ID column
+            table.setColumnHidden(0, True)
+            
+            # Set all columns to stretch equally
+            for i in range(1, len(ForecastTableModel.HEADERS)):
+                table.horizontalHeader().setSectionResizeMode(i, QHeaderView.Stretch)
+            
+            # Header clicks sort through the model's index; unsorted until then
+            table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+            table.setSortingEnabled(True)
     
     def refresh_data(self):
         """Refresh the forecast data for the selected period"""
@@ -438,116 +483,44 @@ class ForecastList(QWidget):
         if year is None or month is None:
             return
         
-        # Get forecasts for the selected month
-        forecasts = self.controller.get_forecasts_by_month(year, month)
+        # Get forecasts for the selected month; each table picks its type from the index
+        self.sort_index.set_items(self.controller.get_forecasts_by_month(year, month))
+        self.income_model.refresh()
+        self.expense_model.refresh()
+    
+    def apply_change(self, event: ChangeEvent) -> bool:
+        """
+        Re-select the tables of the selected month after a forecast change.
+        Returns False if the tables must be reloaded instead.
+        """
+        if event.source != ChangeSource.FORECASTS:
+            return True
+        if event.kind == ChangeKind.RELOADED:
+            return False
         
-        # Split by type
-        income_forecasts = [f for f in forecasts if f.transaction_type.value == 'income']
-        expense_forecasts = [f for f in forecasts if f.transaction_type.value == 'expense']
+        year = self.year_combo.currentData()
+        month = self.month_combo.currentData()
+        if year is None or month is None or not event.touches_month(year, month):
+            return True
         
-        # Update tables
-        self.update_table(self.income_table, income_forecasts)
-        self.update_table(self.expense_table, expense_forecasts)
-    
-    def update_table(self, table, forecasts):
-        """Update the table with forecast data"""
-        table.setRowCount(0)  # Clear existing rows
+        # e.g. a forecast marked realized, which the tables do not show
+        if event.kind == ChangeKind.UPDATED and not event.touches_fields(self.DISPLAYED_FIELDS):
+            return True
         
-        for forecast in forecasts:
-            row_position = table.rowCount()
-            table.insertRow(row_position)
-            
-            # ID column (hidden)
-            id_item = QTableWidgetItem(forecast.id)
-            table.setItem(row_position, 0, id_item)
-            
-            # Date column
-            date_item = QTableWidgetItem(forecast.date.strftime("%b %Y"))
-            date_item.setTextAlignment(Qt.AlignCenter)
-            table.setItem(row_position, 1, date_item)
-            
-            # Name column
-            name_item = QTableWidgetItem(forecast.name)
-            name_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            table.setItem(row_position, 2, name_item)
-            
-            # Category column
-            category_text = forecast.category if forecast.category else "N/A"
-            category_item = QTableWidgetItem(category_text)
-            category_item.setTextAlignment(Qt.AlignCenter)
-            
-            # Style the category
-            font = QFont()
-            font.setBold(True)
-            category_item.setFont(font)
-            
-            # Colorize category based on transaction type
-            if forecast.transaction_type.value == 'income':
-                category_item.setForeground(QColor("#2e7d32"))  # Green for income
-            else:
-                category_item.setForeground(QColor("#c62828"))  # Red for expense
-                
-            table.setItem(row_position, 3, category_item)
-            
-            # Amount column
-            amount_item = QTableWidgetItem(f"{forecast.amount:,.2f}")
-            amount_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            
-            # Make amount bold
-            amount_item.setFont(font)
-            
-            # Colorize amount
-            if forecast.transaction_type.value == 'income':
-                amount_item.setForeground(QColor("#2e7d32"))  # Green for income
-            else:
-                amount_item.setForeground(QColor("#c62828"))  # Red for expense
-                
-            table.setItem(row_position, 4, amount_item)
-            
-            # Notes column
-            notes_text = getattr(forecast, "notes", "")
-            notes_item = QTableWidgetItem(notes_text)
-            notes_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            table.setItem(row_position, 5, notes_item)
-        
-        # Add summary row
-        self.add_summary_row(table, forecasts)
-    
-    def add_summary_row(self, table, forecasts):
-        """Add a summary row at the bottom of the table"""
-        if not forecasts:
-            return
+        if not event.types:
+            return False
         
-        row_position = table.rowCount()
-        table.insertRow(row_position)
-        
-        # First cell - "TOTAL"
-        total_label = QTableWidgetItem("TOTAL")
-        total_label.setFont(QFont("", weight=QFont.Bold))
-        total_label.setTextAlignment(Qt.AlignCenter)
-        total_label.setBackground(QColor("#f0f0f0"))
-        table.setItem(row_position, 1, total_label)
-        
-        # Empty cells with background
-        for col in [2, 3, 5]:
-            empty_item = QTableWidgetItem("")
-            empty_item.setBackground(QColor("#f0f0f0"))
-            table.setItem(row_position, col, empty_item)
-        
-        # Total amount
-        total_amount = sum(f.amount for f in forecasts)
-        total_item = QTableWidgetItem(f"{total_amount:,.2f}")
-        total_item.setFont(QFont("", weight=QFont.Bold))
-        total_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        total_item.setBackground(QColor("#f0f0f0"))
-        
-        # Set color based on transaction type
-        if forecasts and forecasts[0].transaction_type.value == 'income':
-            total_item.setForeground(QColor("#2e7d32"))  # Green for income
-        else:
-            total_item.setForeground(QColor("#c62828"))  # Red for expense
-            
-        table.setItem(row_position, 4, total_item)
+        # Re-select only the tables of the changed transaction types
+        self.sort_index.set_items(self.controller.get_forecasts_by_month(year, month))
+        for transaction_type in event.types:
+            self.get_model(transaction_type).refresh()
+        return True
+    
+    def get_model(self, transaction_type):
+        """Get the model that lists forecasts of a type"""
+        if transaction_type == TransactionType.INCOME:
+            return self.income_model
+        return self.expense_model
     
     def edit_forecast(self, table):
         """Edit the selected forecast transaction"""
@@ -556,16 +529,15 @@ class ForecastList(QWidget):
             QMessageBox.warning(self, "No Selection", "Please select a forecast to edit.")
             return
         
-        # Get the ID from the first column (hidden)
-        row = selected_rows[0].row()
+        forecast = table.model().item_at(selected_rows[0].row())
         
         # Don't allow editing the summary row
-        if row == table.rowCount() - 1 and table.item(row, 0) is None:
+        if forecast is None:
             QMessageBox.warning(self, "Invalid Selection", "Cannot edit the summary row.")
             return
         
-        forecast_id = table.item(row, 0).text()
-        forecast_name = table.item(row, 2).text()
+        forecast_id = forecast.id
+        forecast_name = forecast.name
         
         # Implement the edit dialog (similar to the entry form but pre-filled)
         # For simplicity, we'll just show a message for now
@@ -582,16 +554,15 @@ class ForecastList(QWidget):
             QMessageBox.warning(self, "No Selection", "Please select a forecast to delete.")
             return
         
-        # Get the ID from the first column (hidden)
-        row = selected_rows[0].row()
+        forecast = table.model().item_at(selected_rows[0].row())
         
         # Don't allow deleting the summary row
-        if row == table.rowCount() - 1 and table.item(row, 0) is None:
+        if forecast is None:
             QMessageBox.warning(self, "Invalid Selection", "Cannot delete the summary row.")
             return
         
-        forecast_id = table.item(row, 0).text()
-        forecast_name = table.item(row, 2).text()
+        forecast_id = forecast.id
+        forecast_name = forecast.name
         
         # Ask for confirmation
         reply = QMessageBox.question(self, "Confirm Deletion", 
@@ -601,11 +572,54 @@ class ForecastList(QWidget):
         if reply == QMessageBox.Yes:
             # Delete the forecast
             if self.controller.remove_forecast(forecast_id):
+                # The row was already removed when the change was reported
                 QMessageBox.information(self, "Success", f"Forecast '{forecast_name}' has been deleted.")
-                self.refresh_data()
                 self.forecast_updated.emit()
             else:
                 QMessageBox.critical(self, "Error", f"Failed to delete forecast '{forecast_name}'.")
+    
+    def convert_month(self):
+        """Create a forecast from every transaction of the selected period"""
+        year = self.year_combo.currentData()
+        month = self.month_combo.currentData()
+        period = f"{calendar.month_name[month]} {year}"
+        
+        reply = QMessageBox.question(self, "Confirm Conversion",
+                                     f"Create a forecast from every transaction of {period}?",
+                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if reply != QMessageBox.Yes:
+            return
+        
+        self.set_busy(True)
+        run_operation(self.operations, f"Converting {period}",
+                      lambda token: self.controller.iter_convert_month_to_forecasts(year, month, token),
+                      lambda count: self.on_converted(period, count), lambda: self.set_busy(False))
+    
+    def on_converted(self, period, count):
+        self.set_busy(False)
+        QMessageBox.information(self, "Success", f"{count} forecasts created from the transactions of {period}.")
+        if count:
+            self.forecast_updated.emit()
+    
+    def reconcile(self):
+        """Link unrealized forecasts to the transactions that realize them"""
+        self.set_busy(True)
+        run_operation(self.operations, "Reconciling forecasts", self.controller.iter_reconcile_forecasts,
+                      self.on_reconciled, lambda: self.set_busy(False))
+    
+    def on_reconciled(self, result):
+        self.set_busy(False)
+        matched, unrealized = result
+        QMessageBox.information(self, "Reconciliation",
+                                f"{matched} of {unrealized} unrealized forecasts in months with transactions "
+                                f"were matched to transactions.")
+        if matched:
+            self.forecast_updated.emit()
+    
+    def set_busy(self, busy):
+        """Disable the bulk operation buttons while one runs"""
+        self.convert_month_btn.setEnabled(not busy)
+        self.reconcile_btn.setEnabled(not busy)
 
 
 class ForecastComparison(QWidget):
@@ -994,6 +1008,9 @@ class ForecastManagement(QWidget):
         self.controller = controller
         self.init_ui()
         
+    def set_operation_runner(self, runner):
+        self.forecast_list.operations = runner
+        
     def init_ui(self):
         # Main layout with tabs
         main_layout = QVBoxLayout(self)
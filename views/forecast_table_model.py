@@ -0,0 +1,64 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
+
+from models.transaction import TransactionType
+from .indexed_table_model import IndexedTableModel
+from .sort_index import SortIndex
+
+
+def create_forecast_index() -> SortIndex:
+    """Index over forecasts with the keys their tables sort and filter by"""
+    return SortIndex({
+        "date": lambda f: f.date,
+        "name": lambda f: f.name.casefold(),
+        "category": lambda f: (f.category or "N/A").casefold(),
+        "amount": lambda f: f.amount,
+        "notes": lambda f: getattr(f, "notes", "").casefold(),
+        # Filters
+        "income": lambda f: f.transaction_type == TransactionType.INCOME,
+    }, date_keys=["date"])
+
+
+class ForecastTableModel(IndexedTableModel):
+    """Forecasts of one type with a hidden ID column and a TOTAL row at the bottom"""
+
+    HEADERS = ["ID", "Date", "Name", "Category", "Amount (₺)", "Notes"]
+    SORT_KEYS = [None, "date", "name", "category", "amount", "notes"]
+    TOTAL_LABEL_COLUMN = 1
+    TOTAL_COLUMN = 4
+
+    def __init__(self, sort_index: SortIndex, transaction_type: TransactionType, parent=None):
+        is_income = transaction_type == TransactionType.INCOME
+        super().__init__(sort_index, {"income": (is_income, is_income)}, parent)
+        self.transaction_type = transaction_type
+        self.color = QColor("#2e7d32" if is_income else "#c62828")
+
+    def cell_data(self, forecast, column, role):
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return forecast.id
+            if column == 1:
+                return forecast.date.strftime("%b %Y")
+            if column == 2:
+                return forecast.name
+            if column == 3:
+                return forecast.category if forecast.category else "N/A"
+            if column == 4:
+                return f"{forecast.amount:,.2f}"
+            return getattr(forecast, "notes", "")
+
+        if role == Qt.TextAlignmentRole:
+            if column in (2, 5):
+                return Qt.AlignLeft | Qt.AlignVCenter
+            if column == 4:
+                return Qt.AlignRight | Qt.AlignVCenter
+            if column in (1, 3):
+                return Qt.AlignCenter
+            return None
+
+        # Category and amount are bold and colored by transaction type
+        if role == Qt.FontRole and column in (3, 4):
+            return self.bold_font
+        if role == Qt.ForegroundRole and column in (3, 4):
+            return self.color
+        return None
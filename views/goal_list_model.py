@@ -0,0 +1,201 @@
+import calendar
+
+from PyQt5.QtWidgets import QStyledItemDelegate
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QRectF, QSize
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen
+
+from models.financial_goal import GoalType
+from models.period import month_index
+
+# Text and indicator color per goal type
+GOAL_COLORS = {
+    GoalType.INCOME: "#2e7d32",
+    GoalType.EXPENSE: "#c62828",
+    GoalType.SAVINGS: "#1565c0",
+}
+
+
+def describe_goal_period(goal, window):
+    """Describe the months a goal's progress is measured over"""
+    (start_year, start_month), (end_year, end_month) = window
+    start_text = f"{calendar.month_abbr[start_month]} {start_year}"
+    end_text = f"{calendar.month_abbr[end_month]} {end_year}"
+
+    if goal.is_rolling():
+        return f"rolling {goal.rolling_months} months ({start_text} - {end_text})"
+    if goal.is_multi_month():
+        return f"{start_text} - {end_text}"
+    return f"{calendar.month_name[goal.month]} {goal.year}"
+
+
+def get_bar_color(progress_data) -> str:
+    """Progress bar color; expense budgets turn orange and red as they fill up"""
+    goal_type = progress_data["goal"].goal_type
+    if goal_type == GoalType.INCOME:
+        return "#81c784"
+    if goal_type == GoalType.EXPENSE:
+        if progress_data["percentage"] < 75:
+            return "#81c784"  # Green - good, under budget
+        if progress_data["percentage"] < 90:
+            return "#ffb74d"  # Orange - warning, approaching budget
+        return "#e57373"  # Red - danger, at or over budget
+    return "#64b5f6"
+
+
+def get_window_range(progress_data):
+    """Month index range (first, last) a goal's progress is measured over"""
+    start, end = progress_data["window"]
+    return month_index(*start), month_index(*end)
+
+
+class GoalListModel(QAbstractListModel):
+    """Progress of the goals of a month, one row per goal, in display order"""
+
+    # Role returning a row's progress dict as built by get_goals_progress
+    ProgressRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.goals_progress = []
+
+    def set_goals(self, goals_progress):
+        """Replace all rows"""
+        self.beginResetModel()
+        self.goals_progress = list(goals_progress)
+        self.endResetModel()
+
+    def goal_ids(self):
+        return [progress_data["goal"].id for progress_data in self.goals_progress]
+
+    def update_goal(self, progress_data):
+        """Show new progress for a listed goal; only its row is repainted"""
+        goal_id = progress_data["goal"].id
+        for row, shown in enumerate(self.goals_progress):
+            if shown["goal"].id == goal_id:
+                self.goals_progress[row] = progress_data
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+                return True
+        return False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.goals_progress)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        progress_data = self.goals_progress[index.row()]
+        if role == self.ProgressRole:
+            return progress_data
+        if role == Qt.DisplayRole:
+            return progress_data["goal"].name
+        return None
+
+
+class GoalProgressDelegate(QStyledItemDelegate):
+    """
+    Paints a goal's progress card (title, period, progress bar and amounts)
+    for the rows the view shows, instead of keeping widgets for every goal
+    """
+
+    PADDING = 15
+    SPACING = 10
+    CARD_SPACING = 10
+    TITLE_HEIGHT = 20
+    TEXT_HEIGHT = 16
+    BAR_HEIGHT = 20
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.title_font = QFont()
+        self.title_font.setPixelSize(14)
+        self.title_font.setBold(True)
+        self.text_font = QFont()
+        self.text_font.setPixelSize(12)
+
+    def sizeHint(self, option, index):
+        height = (2 * self.PADDING + self.TITLE_HEIGHT + 2 * self.TEXT_HEIGHT + self.BAR_HEIGHT
+                  + 3 * self.SPACING + self.CARD_SPACING)
+        return QSize(option.rect.width(), height)
+
+    def paint(self, painter, option, index):
+        progress_data = index.data(GoalListModel.ProgressRole)
+        if progress_data is None:
+            return
+        goal = progress_data["goal"]
+        color = QColor(GOAL_COLORS.get(goal.goal_type, "#1565c0"))
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Card background
+        card = QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -self.CARD_SPACING - 0.5)
+        painter.setPen(QPen(QColor(0, 0, 0, 26), 1))
+        painter.setBrush(QColor("white"))
+        painter.drawRoundedRect(card, 8, 8)
+
+        content = card.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        top = content.top()
+
+        # Type indicator, name and target amount
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(color)
+        painter.drawEllipse(QRectF(content.left(), top + 2, 16, 16))
+        painter.setBrush(Qt.NoBrush)
+
+        painter.setFont(self.title_font)
+        painter.setPen(color)
+        title_rect = QRectF(content.left() + 24, top, content.width() - 24, self.TITLE_HEIGHT)
+        painter.drawText(title_rect, Qt.AlignRight | Qt.AlignVCenter, f"{goal.amount:,.2f} ₺")
+        amount_width = painter.fontMetrics().width(f"{goal.amount:,.2f} ₺") + self.SPACING
+        name = painter.fontMetrics().elidedText(goal.name, Qt.ElideRight,
+                                                int(title_rect.width() - amount_width))
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter, name)
+        top += self.TITLE_HEIGHT + self.SPACING
+
+        # Description
+        period = describe_goal_period(goal, progress_data["window"])
+        if goal.goal_type == GoalType.INCOME:
+            description = f"Income goal for {period}"
+        elif goal.goal_type == GoalType.EXPENSE:
+            description = f"Expense budget for {period}"
+        else:
+            description = f"Savings target for {period}"
+        painter.setFont(self.text_font)
+        painter.setPen(QColor("#6c757d"))
+        painter.drawText(QRectF(content.left(), top, content.width(), self.TEXT_HEIGHT),
+                         Qt.AlignLeft | Qt.AlignVCenter, description)
+        top += self.TEXT_HEIGHT + self.SPACING
+
+        # Progress bar with the percentage in the middle
+        bar = QRectF(content.left(), top, content.width(), self.BAR_HEIGHT)
+        painter.setPen(QPen(QColor("#e0e0e0"), 1))
+        painter.setBrush(QColor("#f5f5f5"))
+        painter.drawRoundedRect(bar, 4, 4)
+        percentage = int(progress_data["percentage"])
+        if percentage > 0:
+            chunk = bar.adjusted(1, 1, -1, -1)
+            chunk.setWidth(chunk.width() * min(percentage, 100) / 100)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(get_bar_color(progress_data)))
+            painter.drawRoundedRect(chunk, 3, 3)
+        painter.setBrush(Qt.NoBrush)
+        painter.setPen(QColor("#212529"))
+        painter.drawText(bar, Qt.AlignCenter, f"{percentage}%")
+        top += self.BAR_HEIGHT + self.SPACING
+
+        # Current and remaining amounts, with different wording for expense goals
+        if goal.goal_type == GoalType.EXPENSE:
+            if progress_data["remaining"] > 0:
+                remaining_text = f"Remaining Budget: {progress_data['remaining']:,.2f} ₺"
+            else:
+                remaining_text = f"Over Budget: {-progress_data['remaining']:,.2f} ₺"
+        else:
+            remaining_text = f"To Goal: {progress_data['remaining']:,.2f} ₺"
+        amounts_rect = QRectF(content.left(), top, content.width(), self.TEXT_HEIGHT)
+        painter.drawText(amounts_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                         f"Current: {progress_data['current_amount']:,.2f} ₺")
+        painter.drawText(amounts_rect, Qt.AlignRight | Qt.AlignVCenter, remaining_text)
+
+        painter.restore()
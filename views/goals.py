@@ -3,166 +3,17 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
                              QDateEdit, QMessageBox, QGridLayout, QFrame,
                              QTableWidget, QTableWidgetItem, QHeaderView,
                              QAbstractItemView, QSplitter, QProgressBar,
-                             QSpacerItem, QSizePolicy, QScrollArea)
+                             QSpacerItem, QSizePolicy, QScrollArea, QSpinBox,
+                             QListView)
 from PyQt5.QtCore import Qt, pyqtSignal, QDate
 from PyQt5.QtGui import QFont, QColor, QIcon
 
 import calendar
 from datetime import datetime
 from models.financial_goal import GoalType
-
-class GoalProgressWidget(QFrame):
-    """Widget to display progress for a single goal"""
-    def __init__(self, goal_data):
-        super().__init__()
-        self.goal_data = goal_data
-        self.setObjectName("goalCard")
-        self.setStyleSheet("""
-            #goalCard {
-                background-color: white;
-                border-radius: 8px;
-                padding: 10px;
-                border: 1px solid rgba(0, 0, 0, 0.1);
-            }
-        """)
-        self.init_ui()
-        
-    def init_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(10)
-        
-        goal = self.goal_data["goal"]
-        
-        # Goal title with type indicator
-        title_layout = QHBoxLayout()
-        
-        # Icon/color indicator based on goal type
-        type_indicator = QLabel()
-        type_indicator.setFixedSize(16, 16)
-        
-        if goal.goal_type.value == "income":
-            type_indicator.setStyleSheet("background-color: #2e7d32; border-radius: 8px;")
-            color_style = "color: #2e7d32;"
-        elif goal.goal_type.value == "expense":
-            type_indicator.setStyleSheet("background-color: #c62828; border-radius: 8px;")
-            color_style = "color: #c62828;"
-        else:  # savings
-            type_indicator.setStyleSheet("background-color: #1565c0; border-radius: 8px;")
-            color_style = "color: #1565c0;"
-        
-        title_layout.addWidget(type_indicator)
-        
-        # Goal name
-        goal_title = QLabel(goal.name)
-        goal_title.setStyleSheet(f"font-size: 14px; font-weight: bold; {color_style}")
-        title_layout.addWidget(goal_title)
-        title_layout.addStretch()
-        
-        # Goal target amount
-        goal_amount = QLabel(f"{goal.amount:,.2f} ₺")
-        goal_amount.setStyleSheet(f"font-size: 14px; font-weight: bold; {color_style}")
-        title_layout.addWidget(goal_amount)
-        
-        layout.addLayout(title_layout)
-        
-        # Description label
-        description = ""
-        if goal.goal_type.value == "income":
-            description = f"Income goal for {calendar.month_name[goal.month]} {goal.year}"
-        elif goal.goal_type.value == "expense":
-            description = f"Expense budget for {calendar.month_name[goal.month]} {goal.year}"
-        else:  # savings
-            description = f"Savings target for {calendar.month_name[goal.month]} {goal.year}"
-            
-        desc_label = QLabel(description)
-        desc_label.setStyleSheet("color: #6c757d; font-size: 12px;")
-        layout.addWidget(desc_label)
-        
-        # Progress bar
-        progress_bar = QProgressBar()
-        progress_bar.setMinimum(0)
-        progress_bar.setMaximum(100)
-        progress_bar.setValue(int(self.goal_data["percentage"]))
-        
-        # Style progress bar based on type and progress
-        if goal.goal_type.value == "income":
-            progress_bar.setStyleSheet("""
-                QProgressBar {
-                    border: 1px solid #e0e0e0;
-                    border-radius: 4px;
-                    text-align: center;
-                    height: 20px;
-                    background-color: #f5f5f5;
-                }
-                QProgressBar::chunk {
-                    background-color: #81c784;
-                    border-radius: 3px;
-                }
-            """)
-        elif goal.goal_type.value == "expense":
-            # For expenses, we want to show warning as we approach the limit
-            if self.goal_data["percentage"] < 75:
-                bar_color = "#81c784"  # Green - good, under budget
-            elif self.goal_data["percentage"] < 90:
-                bar_color = "#ffb74d"  # Orange - warning, approaching budget
-            else:
-                bar_color = "#e57373"  # Red - danger, at or over budget
-                
-            progress_bar.setStyleSheet(f"""
-                QProgressBar {{
-                    border: 1px solid #e0e0e0;
-                    border-radius: 4px;
-                    text-align: center;
-                    height: 20px;
-                    background-color: #f5f5f5;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {bar_color};
-                    border-radius: 3px;
-                }}
-            """)
-        else:  # savings
-            progress_bar.setStyleSheet("""
-                QProgressBar {
-                    border: 1px solid #e0e0e0;
-                    border-radius: 4px;
-                    text-align: center;
-                    height: 20px;
-                    background-color: #f5f5f5;
-                }
-                QProgressBar::chunk {
-                    background-color: #64b5f6;
-                    border-radius: 3px;
-                }
-            """)
-            
-        layout.addWidget(progress_bar)
-        
-        # Current amount and remaining
-        amount_layout = QHBoxLayout()
-        
-        # Current amount
-        current_label = QLabel(f"Current: {self.goal_data['current_amount']:,.2f} ₺")
-        current_label.setStyleSheet("font-size: 12px;")
-        amount_layout.addWidget(current_label)
-        
-        amount_layout.addStretch()
-        
-        # Remaining amount - with different wording for expense goals
-        if goal.goal_type.value == "expense":
-            if self.goal_data["remaining"] > 0:
-                remaining_text = f"Remaining Budget: {self.goal_data['remaining']:,.2f} ₺"
-            else:
-                remaining_text = f"Over Budget: {-self.goal_data['remaining']:,.2f} ₺"
-        else:
-            remaining_text = f"To Goal: {self.goal_data['remaining']:,.2f} ₺"
-            
-        remaining_label = QLabel(remaining_text)
-        remaining_label.setStyleSheet("font-size: 12px;")
-        amount_layout.addWidget(remaining_label)
-        
-        layout.addLayout(amount_layout)
+from models.period import month_index, month_from_index
+from models.change_event import ChangeEvent, ChangeKind, ChangeSource
+from .goal_list_model import GoalListModel, GoalProgressDelegate, describe_goal_period, get_window_range
 
 
 class AddGoalWidget(QFrame):
@@ -242,6 +93,24 @@ class AddGoalWidget(QFrame):
         
         form_layout.addRow("Period:", date_layout)
         
+        # Span - single month, a fixed range of months or a rolling window
+        span_layout = QHBoxLayout()
+        
+        self.span_combo = QComboBox()
+        self.span_combo.addItem("Single Month", "single")
+        self.span_combo.addItem("Month Range", "range")
+        self.span_combo.addItem("Rolling Window", "rolling")
+        self.span_combo.currentIndexChanged.connect(self.update_span_controls)
+        span_layout.addWidget(self.span_combo)
+        
+        self.span_months_spin = QSpinBox()
+        self.span_months_spin.setRange(2, 120)
+        self.span_months_spin.setValue(3)
+        self.span_months_spin.setSuffix(" months")
+        span_layout.addWidget(self.span_months_spin)
+        
+        form_layout.addRow("Span:", span_layout)
+        
         layout.addLayout(form_layout)
         
         # Buttons
@@ -258,11 +127,19 @@ class AddGoalWidget(QFrame):
         
         layout.addLayout(button_layout)
         
+        self.update_span_controls()
+        
+    def update_span_controls(self):
+        """Only offer a month count for multi-month goals"""
+        self.span_months_spin.setEnabled(self.span_combo.currentData() != "single")
+        
     def clear_form(self):
         """Clear all form fields"""
         self.name_edit.clear()
         self.amount_edit.clear()
         self.type_combo.setCurrentIndex(0)
+        self.span_combo.setCurrentIndex(0)
+        self.span_months_spin.setValue(3)
         
         # Reset to current month/year
         current_date = datetime.now()
@@ -297,9 +174,19 @@ class AddGoalWidget(QFrame):
         month = self.month_combo.currentData()
         year = self.year_combo.currentData()
         
+        # Work out the goal's span
+        span = self.span_combo.currentData()
+        span_months = self.span_months_spin.value()
+        end_year = end_month = rolling_months = None
+        if span == "range":
+            end_year, end_month = month_from_index(month_index(year, month) + span_months - 1)
+        elif span == "rolling":
+            rolling_months = span_months
+        
         # Add goal
         try:
-            self.controller.add_goal(name, amount, goal_type, year, month)
+            self.controller.add_goal(name, amount, goal_type, year, month,
+                                     end_year, end_month, rolling_months)
             
             # Show success message
             QMessageBox.information(self, "Success", "Financial goal added successfully!")
@@ -378,24 +265,28 @@ class GoalsTab(QWidget):
         
         goals_layout.addLayout(filter_layout)
         
-        # Scrollable area for goals
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameShape(QFrame.NoFrame)
-        
-        # Container widget for goal cards
-        self.goals_container = QWidget()
-        self.goals_container_layout = QVBoxLayout(self.goals_container)
-        self.goals_container_layout.setContentsMargins(0, 0, 0, 0)
-        self.goals_container_layout.setSpacing(10)
-        self.goals_container_layout.addStretch()
-        
-        scroll_area.setWidget(self.goals_container)
-        goals_layout.addWidget(scroll_area)
-        
-        # Right side - Add new goal
+        # Goal cards are painted by a delegate for the visible rows only
+        self.goal_model = GoalListModel(self)
+        self.goal_list = QListView()
+        self.goal_list.setModel(self.goal_model)
+        self.goal_list.setItemDelegate(GoalProgressDelegate(self.goal_list))
+        self.goal_list.setUniformItemSizes(True)
+        self.goal_list.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.goal_list.setSelectionMode(QAbstractItemView.NoSelection)
+        self.goal_list.setFocusPolicy(Qt.NoFocus)
+        self.goal_list.setFrameShape(QFrame.NoFrame)
+        self.goal_list.setStyleSheet("QListView { background: transparent; }")
+        goals_layout.addWidget(self.goal_list)
+        
+        # No goals message
+        self.no_goals_label = QLabel("No goals set for this period. Create a new goal to get started!")
+        self.no_goals_label.setStyleSheet("font-size: 13px; color: #6c757d; font-style: italic;")
+        self.no_goals_label.setAlignment(Qt.AlignCenter)
+        self.no_goals_label.hide()
+        goals_layout.addWidget(self.no_goals_label)
+        
+        # Right side - Add new goal (the new goal's card arrives as a change event)
         self.add_goal_widget = AddGoalWidget(self.controller)
-        self.add_goal_widget.goal_added.connect(self.refresh_goals)
         
         # Add widgets to splitter
         splitter.addWidget(goals_widget)
@@ -415,35 +306,57 @@ class GoalsTab(QWidget):
         
     def refresh_goals(self):
         """Refresh the list of goals"""
-        # Clear existing goals
-        while self.goals_container_layout.count() > 1:
-            item = self.goals_container_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-                
         # Get selected month and year
         month = self.month_combo.currentData()
         year = self.year_combo.currentData()
         
         if not month or not year:
+            self.show_goals([])
             return
             
-        # Get goals for the selected period
-        goals = self.controller.get_goals_by_month(year, month)
-        
-        if not goals:
-            # No goals message
-            no_goals_label = QLabel("No goals set for this period. Create a new goal to get started!")
-            no_goals_label.setStyleSheet("font-size: 13px; color: #6c757d; font-style: italic;")
-            no_goals_label.setAlignment(Qt.AlignCenter)
-            self.goals_container_layout.insertWidget(0, no_goals_label)
-            return
-            
-        # Add goals in reverse order (newest first)
-        for goal in reversed(goals):
-            # Get progress data
-            progress_data = self.controller.get_goal_progress(goal.id)
+        # Get progress for every goal in the selected period
+        self.show_goals(self.controller.get_goals_progress(year, month))
+        
+    def show_goals(self, goals_progress):
+        """Show a month's goals, or the no goals message when there are none"""
+        self.goal_model.set_goals(goals_progress)
+        self.goal_list.setVisible(bool(goals_progress))
+        self.no_goals_label.setVisible(not goals_progress)
             
-            # Create and add goal widget
-            goal_widget = GoalProgressWidget(progress_data)
-            self.goals_container_layout.insertWidget(0, goal_widget)
\ No newline at end of file
+    def apply_change(self, event: ChangeEvent) -> bool:
+        """
+        Repaint only the goal rows a change touches. Returns False if the list
+        must be reloaded instead.
+        """
+        if event.source == ChangeSource.FORECASTS:
+            return True
+        if event.kind == ChangeKind.RELOADED:
+            return False
+        
+        if event.source == ChangeSource.TRANSACTIONS:
+            # A transaction only moves the goals whose window contains its month
+            changed = {p["goal"].id for p in self.goal_model.goals_progress
+                       if event.touches_range(*get_window_range(p))}
+            if not changed:
+                return True
+        else:
+            changed = set(event.ids)
+        
+        month = self.month_combo.currentData()
+        year = self.year_combo.currentData()
+        if not month or not year:
+            return True
+        
+        goals_progress = self.controller.get_goals_progress(year, month)
+        goal_ids = [p["goal"].id for p in goals_progress]
+        
+        if goal_ids != self.goal_model.goal_ids():
+            # Goals were added to or removed from the period; resetting the
+            # model costs no more than repainting the visible rows
+            self.show_goals(goals_progress)
+            return True
+        
+        for progress_data in goals_progress:
+            if progress_data["goal"].id in changed:
+                self.goal_model.update_goal(progress_data)
+        return True
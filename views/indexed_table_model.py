@@ -0,0 +1,148 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor, QFont
+
+from .sort_index import SortIndex
+
+
+class IndexedTableModel(QAbstractTableModel):
+    """
+    Proxy table over a SortIndex: the rows are the indexed items that pass
+    the filters, in the order of the sorted column, followed by a TOTAL row.
+    Sorting or filtering only re-selects item positions from the index's
+    cached permutations; cells are formatted on demand in data(), and rows
+    are handed to the view a page at a time through fetchMore.
+    Subclasses define the columns.
+    """
+
+    HEADERS = []
+    # Index key each column sorts by; None for columns that are not sortable
+    SORT_KEYS = []
+    # Column holding the TOTAL label and the column holding the total amount
+    TOTAL_LABEL_COLUMN = 0
+    TOTAL_COLUMN = 0
+    PAGE_SIZE = 500
+
+    def __init__(self, sort_index: SortIndex, filters=None, parent=None):
+        super().__init__(parent)
+        self.sort_index = sort_index
+        # Index key -> inclusive (low, high) range rows must fall in
+        self.filters = dict(filters or {})
+        self.sort_key = None
+        self.descending = False
+
+        # Positions in the index's items in row order, and how many of them
+        # the view has fetched. The items array is kept with the positions so
+        # rows stay valid after the index moves on to changed data.
+        self.items = sort_index.item_array
+        self.rows = sort_index.select()
+        self.loaded = 0
+        self.total = 0.0
+
+        # Shared by every cell instead of one copy per item; color is set by
+        # subclasses for tables that list one transaction type
+        self.color = None
+        self.bold_font = QFont()
+        self.bold_font.setBold(True)
+        self.summary_font = QFont("", weight=QFont.Bold)
+        self.summary_background = QColor("#f0f0f0")
+
+    def refresh(self, total: float = None):
+        """
+        Re-select the rows from the index, e.g. after the indexed items changed.
+        Pages the view already fetched stay fetched. Without a total the
+        amounts of the rows are summed.
+        """
+        self.beginResetModel()
+        self.items = self.sort_index.item_array
+        self.rows = self.sort_index.select(self.sort_key, self.descending, self.filters)
+        self.loaded = min(max(self.loaded, self.PAGE_SIZE), len(self.rows))
+        self.total = total if total is not None else self.get_total()
+        self.endResetModel()
+
+    def set_filter(self, key: str, low=None, high=None, total: float = None):
+        """Limit the rows to items whose key is within low..high"""
+        self.filters[key] = (low, high)
+        self.loaded = 0
+        self.refresh(total)
+
+    def get_total(self) -> float:
+        """Sum of the amounts of the rows"""
+        return sum(self.items[position].amount for position in self.rows)
+
+    def item_at(self, row: int):
+        """Get the item shown in a row, or None for the TOTAL row"""
+        return self.items[self.rows[row]] if 0 <= row < self.loaded else None
+
+    def cell_data(self, item, column: int, role):
+        """Data of one cell of an item's row"""
+        raise NotImplementedError
+
+    def summary_data(self, column: int, role):
+        """Cells of the TOTAL row"""
+        if role == Qt.DisplayRole:
+            if column == self.TOTAL_LABEL_COLUMN:
+                return "TOTAL"
+            if column == self.TOTAL_COLUMN:
+                return f"{self.total:,.2f}"
+            return ""
+        if role == Qt.BackgroundRole:
+            return self.summary_background
+        if role == Qt.FontRole and column in (self.TOTAL_LABEL_COLUMN, self.TOTAL_COLUMN):
+            return self.summary_font
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignRight | Qt.AlignVCenter if column == self.TOTAL_COLUMN else Qt.AlignCenter
+        if role == Qt.ForegroundRole and column == self.TOTAL_COLUMN:
+            return self.color
+        return None
+
+    # QAbstractTableModel interface
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        # Fetched rows plus the TOTAL row when there is anything to sum
+        return self.loaded + 1 if len(self.rows) else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loaded < len(self.rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.PAGE_SIZE, len(self.rows) - self.loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.loaded, self.loaded + count - 1)
+        self.loaded += count
+        self.endInsertRows()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Order the rows by a column; column -1 restores the item order"""
+        if column >= 0 and self.SORT_KEYS[column] is None:
+            return
+        sort_key = self.SORT_KEYS[column] if column >= 0 else None
+        descending = order == Qt.DescendingOrder
+        # The view asks again when its sort indicator changes
+        if (sort_key, descending) == (self.sort_key, self.descending):
+            return
+        self.sort_key = sort_key
+        self.descending = descending
+        # The totals do not depend on the order
+        self.refresh(self.total)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if index.row() >= self.loaded:
+            return self.summary_data(index.column(), role)
+        return self.cell_data(self.items[self.rows[index.row()]], index.column(), role)
@@ -0,0 +1,238 @@
+import time
+
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QProgressBar, QPushButton, QSizePolicy
+from PyQt5.QtCore import Qt, QObject, QTimer, QAbstractListModel, QModelIndex, pyqtSignal
+
+from models.long_operation import CancellationToken, OperationCancelled, Progress, run_to_completion
+
+# Time an operation runs before it hands control back to the event loop
+TIME_SLICE_MS = 15
+
+
+class LongOperation(QObject):
+    """
+    Runs a long operation (see models.long_operation) on the GUI thread in
+    slices: each timer tick advances the generator for up to TIME_SLICE_MS
+    and then returns to the event loop, so the window keeps repainting and
+    the Cancel button keeps working while it runs
+    """
+
+    progressed = pyqtSignal(object)
+    # Emitted with the operation's result
+    finished = pyqtSignal(object)
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, title: str, start_operation, parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.token = CancellationToken()
+        # start_operation(token) creates the generator; nothing runs until start()
+        self.operation = start_operation(self.token)
+        self.progress = Progress(0, 0, "Starting")
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.run_slice)
+
+    def start(self):
+        self.timer.start()
+
+    def cancel(self):
+        """Ask the operation to stop; it does so at its next cancellation check"""
+        self.token.cancel()
+
+    def run_slice(self):
+        """Advance the operation until its time slice is used up"""
+        deadline = time.perf_counter() + TIME_SLICE_MS / 1000
+        try:
+            while True:
+                self.progress = next(self.operation)
+                if time.perf_counter() >= deadline:
+                    break
+        except StopIteration as stop:
+            self.finished.emit(stop.value)
+            return
+        except OperationCancelled:
+            self.cancelled.emit()
+            return
+        except Exception as e:
+            print(f"Error in {self.title}: {e}")
+            self.failed.emit(str(e))
+            return
+
+        self.progressed.emit(self.progress)
+        self.timer.start()
+
+
+class OperationListModel(QAbstractListModel):
+    """Running long operations, oldest first, with their latest progress"""
+
+    # Role returning a row's LongOperation
+    OperationRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.operations = []
+
+    def add(self, operation: LongOperation):
+        row = len(self.operations)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.operations.append(operation)
+        self.endInsertRows()
+        operation.progressed.connect(lambda progress: self.on_progressed(operation))
+
+    def remove(self, operation: LongOperation):
+        if operation not in self.operations:
+            return
+        row = self.operations.index(operation)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.operations[row]
+        self.endRemoveRows()
+
+    def on_progressed(self, operation: LongOperation):
+        if operation in self.operations:
+            index = self.index(self.operations.index(operation))
+            self.dataChanged.emit(index, index)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.operations)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        operation = self.operations[index.row()]
+        if role == Qt.DisplayRole:
+            progress = operation.progress
+            if progress.total:
+                return f"{operation.title}: {progress.message} ({progress.done:,}/{progress.total:,})"
+            return f"{operation.title}: {progress.message}"
+        if role == self.OperationRole:
+            return operation
+        return None
+
+
+class OperationRunner(QObject):
+    """
+    Starts long operations and keeps them in an OperationListModel while
+    they run. Views that start long operations are given the window's runner;
+    without one (runner None) they run them to completion directly.
+    """
+
+    # Emitted with a one-line outcome when an operation ends
+    operation_ended = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.model = OperationListModel(self)
+
+    def run(self, title: str, start_operation, on_finished=None, on_stopped=None) -> LongOperation:
+        """
+        Run start_operation(token) in slices on the GUI thread. on_finished is
+        called with the result; on_stopped (if given) is called instead when
+        the operation is cancelled or fails.
+        """
+        operation = LongOperation(title, start_operation, self)
+        operation.finished.connect(lambda result: self.end(operation, "finished", on_finished, result))
+        operation.cancelled.connect(lambda: self.end(operation, "cancelled", on_stopped))
+        operation.failed.connect(lambda message: self.end(operation, f"failed: {message}", on_stopped))
+        self.model.add(operation)
+        operation.start()
+        return operation
+
+    def end(self, operation: LongOperation, outcome: str, callback=None, *args):
+        self.model.remove(operation)
+        operation.deleteLater()
+        self.operation_ended.emit(f"{operation.title} {outcome}")
+        if callback is not None:
+            callback(*args)
+
+    def cancel_all(self):
+        for operation in self.model.operations:
+            operation.cancel()
+
+
+def run_operation(runner, title: str, start_operation, on_finished, on_stopped=None):
+    """Run a long operation through runner, or to completion right away if there is none"""
+    if runner is not None:
+        runner.run(title, start_operation, on_finished, on_stopped)
+        return
+    try:
+        result = run_to_completion(start_operation(None))
+    except Exception as e:
+        print(f"Error in {title}: {e}")
+        if on_stopped is not None:
+            on_stopped()
+        return
+    on_finished(result)
+
+
+class OperationProgressWidget(QWidget):
+    """
+    Non-modal progress display for the status bar: the newest running
+    operation with its progress bar and a Cancel button, hidden while
+    nothing runs
+    """
+
+    def __init__(self, model: OperationListModel, parent=None):
+        super().__init__(parent)
+        self.model = model
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(6)
+
+        self.label = QLabel()
+        self.label.setStyleSheet("font-size: 12px; color: #495057;")
+        self.label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFixedWidth(160)
+        self.progress_bar.setMaximumHeight(14)
+        self.progress_bar.setTextVisible(False)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setStyleSheet("min-height: 18px; padding: 1px 8px; font-size: 12px;")
+        self.cancel_btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.cancel_btn.clicked.connect(self.cancel_current)
+
+        layout.addWidget(self.label)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.cancel_btn)
+
+        model.rowsInserted.connect(self.update_display)
+        model.rowsRemoved.connect(self.update_display)
+        model.dataChanged.connect(self.update_display)
+        self.update_display()
+
+    def current_operation(self):
+        """The newest running operation, or None"""
+        rows = self.model.rowCount()
+        return self.model.index(rows - 1).data(OperationListModel.OperationRole) if rows else None
+
+    def update_display(self):
+        operation = self.current_operation()
+        self.setVisible(operation is not None)
+        if operation is None:
+            return
+
+        text = self.model.index(self.model.rowCount() - 1).data()
+        others = self.model.rowCount() - 1
+        if others:
+            text += f"  (+{others} more)"
+        self.label.setText(text)
+
+        fraction = operation.progress.fraction
+        if fraction is None:
+            # Unknown amount of work: a busy indicator
+            self.progress_bar.setRange(0, 0)
+        else:
+            self.progress_bar.setRange(0, 1000)
+            self.progress_bar.setValue(int(fraction * 1000))
+        # A cancelled operation may still be finishing its current chunk
+        self.cancel_btn.setEnabled(not operation.token.is_cancelled())
+
+    def cancel_current(self):
+        operation = self.current_operation()
+        if operation is not None:
+            operation.cancel()
+            self.cancel_btn.setEnabled(False)
@@ -8,12 +8,32 @@ from .transaction_list import TransactionList
 from .goals import GoalsTab
 from .category_manager import CategoryManagerView
 from .forecast_management import ForecastManagement  # Import the new ForecastManagement widget
+from .refresh_scheduler import RefreshScheduler
+from .long_operation import OperationRunner, OperationProgressWidget
+from models.change_event import ChangeEvent
+from diagnostics import startup_profiler
+
+# Tabs after the dashboard, in order: MainWindow attribute, title and view class
+LAZY_TABS = [
+    ("transaction_list", "Transactions", TransactionList),
+    ("goals_tab", "Financial Goals", GoalsTab),
+    ("forecast_tab", "Forecasts", ForecastManagement),
+    ("entry_form", "Add Transaction", EntryForm),
+    ("category_manager", "Manage Categories", CategoryManagerView),
+]
 
 class MainWindow(QMainWindow):
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
+        # Full reloads of the list views requested by several changes are merged
+        self.refresh_scheduler = RefreshScheduler(self.refresh_views, parent=self)
+        # Long operations (batch imports, bulk conversions, reconciliation)
+        # run in slices and show their progress in the status bar
+        self.operations = OperationRunner(self)
         self.init_ui()
+        # Every model change is passed to the views, which patch what it touches
+        self.controller.subscribe(self.on_data_changed)
         
     def init_ui(self):
         self.setWindowTitle("Personal Finance Manager")
@@ -49,50 +69,90 @@ class MainWindow(QMainWindow):
             }
         """)
         
-        # Create dashboard tab
-        self.dashboard = Dashboard(self.controller)
+        # Create dashboard tab, the only one built at startup
+        with startup_profiler.measure("tab", "Dashboard"):
+            self.dashboard = Dashboard(self.controller)
         tab_widget.addTab(self.dashboard, "Dashboard")
         
-        # Create transactions list tab
-        self.transaction_list = TransactionList(self.controller)
-        tab_widget.addTab(self.transaction_list, "Transactions")
+        # The other tabs get an empty page and are built the first time they
+        # are shown; until then their attribute is None
+        self.lazy_tabs = {}
+        for attribute, title, view_class in LAZY_TABS:
+            setattr(self, attribute, None)
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.lazy_tabs[tab_widget.addTab(page, title)] = (attribute, view_class)
+        tab_widget.currentChanged.connect(self.build_tab)
+        self.tab_widget = tab_widget
         
-        # Create goals tab
-        self.goals_tab = GoalsTab(self.controller)
-        tab_widget.addTab(self.goals_tab, "Financial Goals")
+        # Add tab widget with stretch priority
+        main_layout.addWidget(tab_widget, 1)
         
-        # Create forecast management tab
-        self.forecast_tab = ForecastManagement(self.controller)
-        tab_widget.addTab(self.forecast_tab, "Forecasts")
+        # Progress of running long operations; the outcome is shown for a few seconds
+        self.statusBar().addPermanentWidget(OperationProgressWidget(self.operations.model))
+        self.operations.operation_ended.connect(lambda text: self.statusBar().showMessage(text, 5000))
         
-        # Create entry form tab
-        self.entry_form = EntryForm(self.controller)
-        tab_widget.addTab(self.entry_form, "Add Transaction")
+    def build_tab(self, index):
+        """Build the view of a tab the first time it is shown"""
+        if index not in self.lazy_tabs:
+            return
+        attribute, view_class = self.lazy_tabs.pop(index)
         
-        # Create category manager tab
-        self.category_manager = CategoryManagerView(self.controller)
-        tab_widget.addTab(self.category_manager, "Manage Categories")
+        # A new view reads the current data, so no changes are pending for it
+        with startup_profiler.measure("tab", self.tab_widget.tabText(index)):
+            view = view_class(self.controller)
+        self.tab_widget.widget(index).layout().addWidget(view)
+        setattr(self, attribute, view)
         
-        # Add tab widget with stretch priority
-        main_layout.addWidget(tab_widget, 1)
+        # Views that start long operations run them through the window's runner
+        if hasattr(view, "set_operation_runner"):
+            view.set_operation_runner(self.operations)
         
         # Connect signals
-        self.entry_form.transaction_added.connect(self.on_transaction_added)
-        self.category_manager.categories_changed.connect(self.on_categories_changed)
-        self.forecast_tab.forecast_changed.connect(self.on_forecast_changed)
-        
-    def on_transaction_added(self):
-        # Refresh views when a transaction is added
-        self.dashboard.refresh_charts()
-        self.transaction_list.refresh_data()
-        self.goals_tab.refresh_goals()
+        if attribute == "category_manager":
+            self.category_manager.categories_changed.connect(self.on_categories_changed)
         
     def on_categories_changed(self):
         # Refresh the entry form's and forecast form's category lists
-        self.entry_form.refresh_categories()
-        self.forecast_tab.forecast_entry.refresh_categories()
-        
-    def on_forecast_changed(self):
-        # Refresh views when a forecast is added, updated, or deleted
-        self.dashboard.refresh_charts()
-        self.forecast_tab.forecast_list.refresh_data()
\ No newline at end of file
+        if self.entry_form is not None:
+            self.entry_form.refresh_categories()
+        if self.forecast_tab is not None:
+            self.forecast_tab.forecast_entry.refresh_categories()
+        
+    def on_data_changed(self, event: ChangeEvent):
+        """Let each view patch the rows, cards and charts a change touches"""
+        # The dashboard schedules its own reload
+        self.dashboard.apply_change(event)
+        
+        # Views that cannot patch themselves are reloaded once, after all changes.
+        # Tabs that were not built yet will read the data when they are.
+        if self.transaction_list is not None and not self.transaction_list.apply_change(event):
+            self.refresh_scheduler.request("transactions")
+        if self.goals_tab is not None and not self.goals_tab.apply_change(event):
+            self.refresh_scheduler.request("goals")
+        if self.forecast_tab is not None and not self.forecast_tab.forecast_list.apply_change(event):
+            self.refresh_scheduler.request("forecasts")
+        
+    def refresh_views(self, regions):
+        """Refresh each requested view once"""
+        if "transactions" in regions and self.transaction_list is not None:
+            self.transaction_list.refresh_data()
+        if "goals" in regions and self.goals_tab is not None:
+            self.goals_tab.refresh_goals()
+        if "forecasts" in regions and self.forecast_tab is not None:
+            self.forecast_tab.forecast_list.refresh_data()
+            
+    def closeEvent(self, event):
+        # Stop the dashboard's background build before the window goes away
+        self.controller.unsubscribe(self.on_data_changed)
+        self.operations.cancel_all()
+        self.dashboard.dataset_loader.shutdown()
+        super().closeEvent(event)
+            
+    def get_refresh_stats(self):
+        """Get refresh scheduling statistics for the dashboard and the other views"""
+        return {
+            "dashboard": self.dashboard.refresh_scheduler.get_stats(),
+            "views": self.refresh_scheduler.get_stats()
+        }
\ No newline at end of file
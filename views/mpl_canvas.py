@@ -0,0 +1,144 @@
+import time
+
+import matplotlib
+matplotlib.use('Qt5Agg')
+
+from PyQt5.QtWidgets import QSizePolicy
+from PyQt5.QtCore import QRectF
+from PyQt5.QtGui import QPainter
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from .chart_image_cache import buffer_to_image
+from .chart_timing import new_timings, paint_timing_overlay
+from .dashboard_charts import create_chart_figure
+
+class MplCanvas(FigureCanvas):
+    def __init__(self, width=5, height=3, dpi=100, chart_class=None, image_cache=None):
+        self.fig, self.axes = create_chart_figure(width, height, dpi)
+        
+        super(MplCanvas, self).__init__(self.fig)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.updateGeometry()
+        
+        # Set when the data changed but the figure has not been redrawn yet
+        self.dirty = True
+        
+        # Chart that keeps its artists on the axes and updates them in place
+        self.chart_class = chart_class
+        self.chart = chart_class(self.fig, self.axes) if chart_class else None
+        
+        # tight_layout only runs after a resize or when the chart was rebuilt
+        self.needs_layout = True
+        
+        # Rendered images shared by all canvases; a hit is painted instead of drawing
+        self.image_cache = image_cache
+        self.cached_image = None
+        self.dataset = None
+        
+        # Off-screen figure used to pre-render other months (created on first use)
+        self.offscreen = None
+        
+        # Phase timings of the last render, painted over the chart when show_timings is set
+        self.timings = new_timings()
+        self.show_timings = False
+        
+    def get_image_key(self, dataset):
+        """Key of the rendered image for a dataset at the current canvas size, or None"""
+        if self.image_cache is None or dataset.versions is None:
+            return None
+        width, height = self.get_width_height(physical=True)
+        return (self.chart_class.__name__, dataset.year, dataset.month, dataset.versions,
+                width, height)
+        
+    def render_chart(self, dataset):
+        """Show the chart for a dashboard dataset, from the image cache if possible"""
+        self.dataset = dataset
+        key = self.get_image_key(dataset)
+        timings = new_timings()
+        self.timings = timings
+        
+        image = self.image_cache.get(key) if key is not None else None
+        if image is not None:
+            # Blit the pre-rendered image; the live figure is brought up to
+            # date only when it is needed again (cache miss or resize)
+            self.cached_image = image
+            timings["cached"] = True
+            self.update()
+            return
+        
+        showing_image = self.cached_image is not None
+        self.cached_image = None
+        
+        if self.chart.update(dataset):
+            timings.update(self.chart.timings)
+            if self.chart.rebuilt:
+                self.needs_layout = True
+            self.draw_chart(timings)
+            if key is not None:
+                self.image_cache.put(key, buffer_to_image(self.buffer_rgba(), self.device_pixel_ratio))
+        elif showing_image:
+            # The live figure already shows this data; repaint it instead of the image
+            self.update()
+            
+    def prerender(self, dataset) -> bool:
+        """Render the chart for a dataset off-screen into the image cache"""
+        key = self.get_image_key(dataset)
+        if key is None or self.image_cache.contains(key):
+            return False
+        
+        width_inches, height_inches = self.fig.get_size_inches()
+        if self.offscreen is None:
+            fig, axes = create_chart_figure(width_inches, height_inches, self.fig.dpi)
+            self.offscreen = (FigureCanvasAgg(fig), self.chart_class(fig, axes))
+        canvas, chart = self.offscreen
+        
+        resized = (tuple(canvas.figure.get_size_inches()) != (width_inches, height_inches)
+                   or canvas.figure.dpi != self.fig.dpi)
+        if resized:
+            canvas.figure.set_dpi(self.fig.dpi)
+            canvas.figure.set_size_inches(width_inches, height_inches)
+        
+        # Same layout rule as the live canvas
+        changed = chart.update(dataset)
+        if resized or (changed and chart.rebuilt):
+            canvas.figure.tight_layout()
+        canvas.draw()
+        
+        self.image_cache.put(key, buffer_to_image(canvas.buffer_rgba(), self.device_pixel_ratio))
+        return True
+        
+    def paintEvent(self, event):
+        if self.cached_image is None:
+            super().paintEvent(event)
+            painter = QPainter(self)
+        else:
+            painter = QPainter(self)
+            painter.drawImage(0, 0, self.cached_image)
+        if self.show_timings:
+            paint_timing_overlay(painter, QRectF(self.rect()), self.timings)
+        painter.end()
+        
+    def resizeEvent(self, event):
+        self.needs_layout = True
+        # A cached image no longer fits; draw the shown data live at the new size
+        if self.cached_image is not None:
+            self.cached_image = None
+            self.chart.update(self.dataset)
+        super().resizeEvent(event)
+        
+    def draw(self):
+        # Redraws not started by render_chart (e.g. after a resize) are timed on their own
+        self.draw_chart(new_timings())
+        
+    def draw_chart(self, timings):
+        """Draw the figure, recording the tight_layout and draw times in timings"""
+        started = time.perf_counter()
+        if self.needs_layout:
+            self.fig.tight_layout()
+            self.needs_layout = False
+        laid_out = time.perf_counter()
+        super().draw()
+        timings["layout"] = (laid_out - started) * 1000
+        timings["draw"] = (time.perf_counter() - laid_out) * 1000
+        self.timings = timings
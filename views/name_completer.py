@@ -0,0 +1,76 @@
+from PyQt5.QtWidgets import QCompleter
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
+
+
+class NameSuggestionModel(QAbstractListModel):
+    """Suggestions for the typed prefix; the popup shows the last amount and category"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.suggestions = []
+
+    def set_suggestions(self, suggestions):
+        self.beginResetModel()
+        self.suggestions = list(suggestions)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.suggestions)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        suggestion = self.suggestions[index.row()]
+        # The edit role is what the completer puts in the line edit
+        if role == Qt.EditRole:
+            return suggestion.name
+        if role == Qt.DisplayRole:
+            category = suggestion.category or "N/A"
+            return f"{suggestion.name}   ·   {suggestion.amount:,.2f} ₺   ·   {category}"
+        if role == Qt.ToolTipRole:
+            return f"Used {suggestion.count} times, last in {suggestion.date.strftime('%b %Y')}"
+        return None
+
+
+class NameCompleter(QCompleter):
+    """
+    Completes a name line edit from the transaction history. Matching is done
+    by the controller's name index rather than by QCompleter, so the popup
+    lists whatever the index returns for the typed prefix.
+    """
+
+    # Emitted with the NameSuggestion the user picked
+    suggestion_picked = pyqtSignal(object)
+
+    def __init__(self, controller, line_edit, limit=8):
+        super().__init__(line_edit)
+        self.controller = controller
+        self.line_edit = line_edit
+        self.limit = limit
+
+        self.suggestion_model = NameSuggestionModel(self)
+        self.setModel(self.suggestion_model)
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        # Attached with setWidget rather than setCompleter so the line edit
+        # does not filter or complete on its own
+        self.setWidget(line_edit)
+
+        # Only typing asks for suggestions; text set by the program does not
+        line_edit.textEdited.connect(self.update_suggestions)
+        self.activated[QModelIndex].connect(self.on_activated)
+
+    def update_suggestions(self, text):
+        """Look up the typed prefix and show the matches"""
+        suggestions = self.controller.suggest_names(text, self.limit) if text.strip() else []
+        self.suggestion_model.set_suggestions(suggestions)
+        if suggestions:
+            self.complete()
+        else:
+            self.popup().hide()
+
+    def on_activated(self, index):
+        row = index.row()
+        if 0 <= row < len(self.suggestion_model.suggestions):
+            suggestion = self.suggestion_model.suggestions[row]
+            self.line_edit.setText(suggestion.name)
+            self.suggestion_picked.emit(suggestion)
@@ -0,0 +1,452 @@
+import calendar
+import math
+import time
+
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtCore import Qt, QPointF, QRectF, QSize
+from PyQt5.QtGui import QPainter, QColor, QFont, QFontMetricsF, QPen
+
+from .chart_timing import new_timings, paint_timing_overlay
+from .dashboard_charts import MonthlySummaryChart, CashFlowTrendChart, MonthlyComparisonChart
+
+
+def _color(name, alpha=1.0):
+    color = QColor(name)
+    color.setAlphaF(alpha)
+    return color
+
+
+def _font(point_size, bold=False):
+    font = QFont()
+    font.setPointSizeF(point_size)
+    font.setBold(bold)
+    return font
+
+
+def _nice_ticks(low, high, max_ticks=8):
+    """Round tick values (steps of 1, 2, 2.5 or 5 times a power of ten) within low..high"""
+    raw_step = (high - low) / max_ticks
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    for step in (1, 2, 2.5, 5, 10):
+        if raw_step <= step * magnitude:
+            break
+    step *= magnitude
+
+    first = math.ceil(low / step)
+    last = math.floor(high / step)
+    return [i * step for i in range(first, last + 1)], step
+
+
+class PainterChart:
+    """
+    A dashboard chart painted directly with QPainter instead of matplotlib.
+    Mixed in before a DashboardChart subclass, whose get_data, sources and
+    month range are reused; only updating and drawing are replaced. Suited
+    to simple bar and line charts that do not need matplotlib's layout engine.
+    """
+
+    def __init__(self):
+        self.data = None
+        # Kept for the DashboardChart interface; there are no artists to rebuild
+        self.rebuilt = False
+        # Time (ms) the last update spent extracting data; there are no artists
+        self.timings = {"data": 0.0, "artists": 0.0}
+        # Plot area and data limits of the last paint
+        self.plot = QRectF()
+        self.x_limits = (0, 1)
+        self.y_limits = (0, 1)
+        self.scale = 1.0
+
+    def update(self, dataset) -> bool:
+        """Take the values of a dashboard dataset; returns False if nothing changed"""
+        started = time.perf_counter()
+        data = self.get_data(dataset)
+        self.timings = {"data": (time.perf_counter() - started) * 1000, "artists": 0.0}
+        if data == self.data:
+            return False
+        self.data = data
+        return True
+
+    def paint(self, painter: QPainter, rect: QRectF):
+        """Draw the chart for the current data into rect"""
+        raise NotImplementedError
+
+    # Coordinate mapping
+
+    def to_x(self, value) -> float:
+        low, high = self.x_limits
+        return self.plot.left() + (value - low) / (high - low) * self.plot.width()
+
+    def to_y(self, value) -> float:
+        low, high = self.y_limits
+        return self.plot.bottom() - (value - low) / (high - low) * self.plot.height()
+
+    def points(self, value) -> float:
+        """Convert typographic points to device pixels"""
+        return value * self.scale
+
+    # Axes furniture
+
+    def set_up_axes(self, painter, rect, title, x_label, y_label, x_range, y_values,
+                    x_ticks, x_tick_labels):
+        """
+        Work out the plot area and data limits, then draw the title, axis labels,
+        grid and tick labels. The y range always includes zero and both ranges
+        get a 5% margin like matplotlib's autoscaling.
+        """
+        self.scale = painter.device().logicalDpiY() / 72
+
+        # Data limits with margins
+        x_low, x_high = x_range
+        x_margin = (x_high - x_low) * 0.05
+        self.x_limits = (x_low - x_margin, x_high + x_margin)
+
+        y_low, y_high = min(0, min(y_values)), max(0, max(y_values))
+        if y_high == y_low:
+            y_low, y_high = -1, 1
+        y_margin = (y_high - y_low) * 0.05
+        self.y_limits = (y_low - y_margin, y_high + y_margin)
+        y_ticks, y_step = _nice_ticks(*self.y_limits)
+        y_format = "{:,.0f}" if y_step >= 1 else "{:g}"
+        y_tick_labels = [y_format.format(tick) for tick in y_ticks]
+
+        title_font, label_font, tick_font = _font(11, bold=True), _font(9), _font(8)
+        title_height = QFontMetricsF(title_font).height()
+        label_height = QFontMetricsF(label_font).height()
+        tick_metrics = QFontMetricsF(tick_font)
+        tick_width = max(tick_metrics.width(label) for label in y_tick_labels)
+        pad = self.points(5)
+
+        # Plot area inside the room needed for the text around it
+        self.plot = QRectF(
+            rect.left() + pad + label_height + pad + tick_width + pad,
+            rect.top() + pad + title_height + self.points(8),
+            0, 0
+        )
+        self.plot.setRight(rect.right() - self.points(10))
+        self.plot.setBottom(rect.bottom() - pad - label_height - pad - tick_metrics.height() - pad)
+        if self.plot.width() <= 0 or self.plot.height() <= 0:
+            return False
+
+        # Title and axis labels
+        painter.setPen(QColor('#212529'))
+        painter.setFont(title_font)
+        painter.drawText(QRectF(rect.left(), rect.top() + pad, rect.width(), title_height),
+                         Qt.AlignCenter, title)
+
+        painter.setPen(QColor('#495057'))
+        painter.setFont(label_font)
+        painter.drawText(QRectF(self.plot.left(), rect.bottom() - pad - label_height,
+                                self.plot.width(), label_height),
+                         Qt.AlignCenter, x_label)
+        painter.save()
+        painter.translate(rect.left() + pad, self.plot.center().y())
+        painter.rotate(-90)
+        painter.drawText(QRectF(-self.plot.height() / 2, 0, self.plot.height(), label_height),
+                         Qt.AlignCenter, y_label)
+        painter.restore()
+
+        # Dashed grid at the ticks
+        grid_pen = QPen(_color('#cccccc', 0.3), 1, Qt.DashLine)
+        painter.setPen(grid_pen)
+        for tick in y_ticks:
+            painter.drawLine(QPointF(self.plot.left(), self.to_y(tick)),
+                             QPointF(self.plot.right(), self.to_y(tick)))
+        for tick in x_ticks:
+            painter.drawLine(QPointF(self.to_x(tick), self.plot.top()),
+                             QPointF(self.to_x(tick), self.plot.bottom()))
+
+        # Left and bottom spines
+        painter.setPen(QPen(_color('#000000', 0.3), 1))
+        painter.drawLine(self.plot.topLeft(), self.plot.bottomLeft())
+        painter.drawLine(self.plot.bottomLeft(), self.plot.bottomRight())
+
+        # Tick labels
+        painter.setFont(tick_font)
+        painter.setPen(QColor('#6c757d'))
+        for tick, label in zip(y_ticks, y_tick_labels):
+            y = self.to_y(tick)
+            painter.drawText(QRectF(self.plot.left() - pad - tick_width, y - tick_metrics.height() / 2,
+                                    tick_width, tick_metrics.height()),
+                             Qt.AlignRight | Qt.AlignVCenter, label)
+        for tick, label in zip(x_ticks, x_tick_labels):
+            x = self.to_x(tick)
+            painter.drawText(QRectF(x - 50, self.plot.bottom() + pad, 100, tick_metrics.height()),
+                             Qt.AlignHCenter | Qt.AlignTop, label)
+        return True
+
+    # Plot elements
+
+    def draw_hline(self, painter, y, color, alpha, style=Qt.SolidLine):
+        painter.setPen(QPen(_color(color, alpha), 1, style))
+        painter.drawLine(QPointF(self.plot.left(), self.to_y(y)), QPointF(self.plot.right(), self.to_y(y)))
+
+    def draw_vline(self, painter, x, color, alpha, style=Qt.SolidLine):
+        painter.setPen(QPen(_color(color, alpha), 1, style))
+        painter.drawLine(QPointF(self.to_x(x), self.plot.top()), QPointF(self.to_x(x), self.plot.bottom()))
+
+    def draw_box(self, painter, left, right, bottom, top, color, alpha, edge=None):
+        """Fill the data-space rectangle left..right x bottom..top"""
+        box = QRectF(QPointF(self.to_x(left), self.to_y(top)),
+                     QPointF(self.to_x(right), self.to_y(bottom))).normalized()
+        painter.setPen(QPen(QColor(edge), 0.5) if edge else Qt.NoPen)
+        painter.setBrush(_color(color, alpha))
+        painter.drawRect(box)
+        painter.setBrush(Qt.NoBrush)
+
+    def draw_bars(self, painter, xs, heights, width, color, alpha=0.8, edge=None):
+        for x, height in zip(xs, heights):
+            self.draw_box(painter, x - width / 2, x + width / 2, 0, height, color, alpha, edge)
+
+    def draw_line(self, painter, xs, ys, color, marker_size):
+        """Polyline with round markers; marker_size is the diameter in points"""
+        points = [QPointF(self.to_x(x), self.to_y(y)) for x, y in zip(xs, ys)]
+        painter.setPen(QPen(QColor(color), self.points(2), Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+        painter.drawPolyline(*points)
+
+        radius = self.points(marker_size) / 2
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(color))
+        for point in points:
+            painter.drawEllipse(point, radius, radius)
+        painter.setBrush(Qt.NoBrush)
+
+    def draw_label(self, painter, x, y, text, color, offset, align):
+        """
+        Bold value label anchored at a data point and moved offset points up
+        (negative for down); align is Qt.AlignBottom to put it above the anchor
+        """
+        painter.setFont(_font(8, bold=True))
+        painter.setPen(QColor(color))
+        metrics = painter.fontMetrics()
+        width, height = metrics.width(text) + 2, metrics.height()
+        anchor_y = self.to_y(y) - self.points(offset)
+        top = anchor_y - height if align == Qt.AlignBottom else anchor_y
+        painter.drawText(QRectF(self.to_x(x) - width / 2, top, width, height),
+                         Qt.AlignCenter, text)
+
+    def draw_legend(self, painter, entries):
+        """Legend box in the upper right corner; entries are (label, color, 'bar' or 'line')"""
+        painter.setFont(_font(8))
+        metrics = painter.fontMetrics()
+        row_height = metrics.height() + self.points(2)
+        swatch = self.points(16)
+        pad = self.points(4)
+        width = pad + swatch + pad + max(metrics.width(label) for label, _, _ in entries) + pad
+        height = pad + row_height * len(entries) + pad
+
+        box = QRectF(self.plot.right() - width - pad, self.plot.top() + pad, width, height)
+        painter.setPen(QPen(QColor('#cccccc'), 1))
+        painter.setBrush(_color('#ffffff', 0.9))
+        painter.drawRoundedRect(box, 3, 3)
+
+        for row, (label, color, kind) in enumerate(entries):
+            center_y = box.top() + pad + row_height * (row + 0.5)
+            left = box.left() + pad
+            if kind == 'bar':
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(_color(color, 0.8))
+                painter.drawRect(QRectF(left, center_y - row_height / 4, swatch, row_height / 2))
+            else:
+                painter.setPen(QPen(QColor(color), self.points(2)))
+                painter.drawLine(QPointF(left, center_y), QPointF(left + swatch, center_y))
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(QColor(color))
+                painter.drawEllipse(QPointF(left + swatch / 2, center_y), self.points(3), self.points(3))
+            painter.setBrush(Qt.NoBrush)
+            painter.setPen(QColor('#212529'))
+            painter.drawText(QRectF(left + swatch + pad, center_y - row_height / 2,
+                                    box.right() - left - swatch - pad, row_height),
+                             Qt.AlignLeft | Qt.AlignVCenter, label)
+
+
+class PainterMonthlySummaryChart(PainterChart, MonthlySummaryChart):
+    """QPainter version of MonthlySummaryChart"""
+
+    def paint(self, painter, rect):
+        data = self.data
+        income, expenses, net = data["income"], data["expenses"], data["net"]
+        x = range(len(income))
+
+        if not self.set_up_axes(painter, rect, f'Financial Summary ({data["year"]})',
+                                'Month', 'Amount (₺)', (-0.3, len(income) - 0.7),
+                                income + [-value for value in expenses] + net,
+                                x, [calendar.month_abbr[m] for m in range(1, 13)]):
+            return
+
+        # Income as positive and expenses as negative bars, net worth as a line
+        self.draw_bars(painter, x, income, 0.6, '#4CAF50', edge='#ffffff')
+        self.draw_bars(painter, x, [-value for value in expenses], 0.6, '#F44336', edge='#ffffff')
+        self.draw_hline(painter, 0, '#888888', 0.3)
+        self.draw_line(painter, x, net, '#2196F3', 6)
+
+        # Highlight and label the selected month
+        current = data["current"]
+        self.draw_vline(painter, current, '#888888', 0.3, Qt.DashLine)
+        self.draw_label(painter, current, income[current], f"{income[current]:,.0f} ₺",
+                        '#2e7d32', 5, Qt.AlignBottom)
+        self.draw_label(painter, current, -expenses[current], f"{expenses[current]:,.0f} ₺",
+                        '#c62828', -12, Qt.AlignTop)
+        self.draw_label(painter, current, net[current], f"{net[current]:,.0f} ₺",
+                        '#1565c0', 10, Qt.AlignBottom)
+
+        # Lines are listed before bars, as in matplotlib legends
+        self.draw_legend(painter, [('Net Worth', '#2196F3', 'line'),
+                                   ('Income', '#4CAF50', 'bar'),
+                                   ('Expenses', '#F44336', 'bar')])
+
+
+class PainterCashFlowTrendChart(PainterChart, CashFlowTrendChart):
+    """QPainter version of CashFlowTrendChart"""
+
+    def paint(self, painter, rect):
+        data = self.data
+        income, expenses, net = data["income"], data["expenses"], data["net"]
+        x = range(len(income))
+
+        if not self.set_up_axes(painter, rect, f'Monthly Cash Flow ({data["year"]})',
+                                'Month', 'Amount (₺)', (-0.4, len(income) - 0.6),
+                                income + expenses + net,
+                                x, [calendar.month_abbr[m] for m in range(1, 13)]):
+            return
+
+        # Net cash flow shaded for each month with data
+        for i, (inc, exp, value) in enumerate(zip(income, expenses, net)):
+            if (inc or exp) and value:
+                color = '#4CAF50' if value > 0 else '#F44336'
+                self.draw_box(painter, i - 0.4, i + 0.4, 0, value, color, 0.2)
+
+        self.draw_line(painter, x, income, '#4CAF50', 6)
+        self.draw_line(painter, x, expenses, '#F44336', 6)
+        self.draw_hline(painter, 0, '#444444', 0.3)
+
+        # Savings/deficit labels between the two lines
+        for i, (inc, exp, value) in enumerate(zip(income, expenses, net)):
+            if inc == 0 and exp == 0:
+                continue
+            prefix = '+' if value > 0 else ''
+            if value > 0:
+                self.draw_label(painter, i, (inc + exp) / 2, f"{prefix}{value:,.0f} ₺",
+                                '#4CAF50', 10, Qt.AlignBottom)
+            else:
+                self.draw_label(painter, i, (inc + exp) / 2, f"{prefix}{value:,.0f} ₺",
+                                '#F44336', -10, Qt.AlignTop)
+
+        self.draw_vline(painter, data["current"], '#888888', 0.5, Qt.DashLine)
+        self.draw_legend(painter, [('Income', '#4CAF50', 'line'),
+                                   ('Expenses', '#F44336', 'line')])
+
+
+class PainterMonthlyComparisonChart(PainterChart, MonthlyComparisonChart):
+    """QPainter version of MonthlyComparisonChart"""
+
+    def paint(self, painter, rect):
+        data = self.data
+        income, expenses, net = data["income"], data["expenses"], data["net"]
+        x = range(len(data["months"]))
+        width = 0.35
+
+        if not self.set_up_axes(painter, rect, 'Monthly Financial Comparison',
+                                'Month', 'Amount (₺)', (-0.4, len(x) - 0.6),
+                                income + expenses + net, x, data["months"]):
+            return
+
+        # Highlight the selected month
+        self.draw_box(painter, 0.6, 1.4, *self.y_limits, '#2196F3', 0.15)
+
+        # Grouped bars with net worth as a line
+        self.draw_bars(painter, [i - width / 2 for i in x], income, width, '#4CAF50')
+        self.draw_bars(painter, [i + width / 2 for i in x], expenses, width, '#F44336')
+        self.draw_hline(painter, 0, '#888888', 0.3)
+        self.draw_line(painter, x, net, '#2196F3', 8)
+
+        for i, (inc, exp, net_value) in enumerate(zip(income, expenses, net)):
+            self.draw_label(painter, i - width / 2, inc, f"{inc:,.0f} ₺", '#2e7d32', 5, Qt.AlignBottom)
+            self.draw_label(painter, i + width / 2, exp, f"{exp:,.0f} ₺", '#c62828', 5, Qt.AlignBottom)
+
+            # Net worth label with an arrow comparing the selected month to the previous one
+            arrow_char = ''
+            net_color = '#2196F3'
+            if i == 1:
+                if net_value > net[0]:
+                    arrow_char = '↑ '
+                    net_color = '#4CAF50'
+                elif net_value < net[0]:
+                    arrow_char = '↓ '
+                    net_color = '#F44336'
+                else:
+                    arrow_char = '→ '
+
+                if net[0] != 0:
+                    pct_change = ((net_value - net[0]) / abs(net[0])) * 100
+                    arrow_char += f"{pct_change:+.1f}% "
+            self.draw_label(painter, i, net_value, f"{arrow_char}{net_value:,.0f} ₺",
+                            net_color, 10, Qt.AlignBottom)
+
+        # Lines are listed before bars, as in matplotlib legends
+        self.draw_legend(painter, [('Net Worth', '#2196F3', 'line'),
+                                   ('Income', '#4CAF50', 'bar'),
+                                   ('Expenses', '#F44336', 'bar')])
+
+
+# QPainter versions of the matplotlib charts that have one
+PAINTER_CHARTS = {
+    MonthlySummaryChart: PainterMonthlySummaryChart,
+    CashFlowTrendChart: PainterCashFlowTrendChart,
+    MonthlyComparisonChart: PainterMonthlyComparisonChart,
+}
+
+
+class PainterChartWidget(QWidget):
+    """
+    Chart widget with the same interface as MplCanvas that paints a
+    PainterChart. There is no figure to keep in sync, so nothing is cached
+    or pre-rendered: a paint costs about as much as blitting an image.
+    """
+
+    def __init__(self, width=5, height=3, dpi=100, chart_class=None):
+        super().__init__()
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.preferred_size = QSize(int(width * dpi), int(height * dpi))
+
+        # Set when the data changed but the chart has not been shown yet
+        self.dirty = True
+
+        self.chart_class = chart_class
+        self.chart = chart_class()
+        self.dataset = None
+        
+        # Phase timings of the last render (the paint fills in draw), painted
+        # over the chart when show_timings is set
+        self.timings = new_timings()
+        self.show_timings = False
+
+    def sizeHint(self):
+        return self.preferred_size
+
+    def render_chart(self, dataset):
+        """Show the chart for a dashboard dataset"""
+        self.dataset = dataset
+        changed = self.chart.update(dataset)
+        self.timings = new_timings()
+        self.timings.update(self.chart.timings)
+        if changed:
+            self.update()
+
+    def prerender(self, dataset) -> bool:
+        """Nothing to pre-render; painting is already cheap"""
+        return False
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.fillRect(self.rect(), Qt.white)
+        if self.chart.data is not None:
+            started = time.perf_counter()
+            self.chart.paint(painter, QRectF(self.rect()))
+            self.timings["draw"] = (time.perf_counter() - started) * 1000
+        if self.show_timings:
+            paint_timing_overlay(painter, QRectF(self.rect()), self.timings)
+        painter.end()
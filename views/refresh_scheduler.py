@@ -0,0 +1,51 @@
+from typing import Callable, Set
+
+from PyQt5.QtCore import QObject, QTimer
+
+
+class RefreshScheduler(QObject):
+    """
+    Coalesces refresh requests into a single refresh.
+    Every request made before the timer fires is merged: the refresh callback
+    runs once with the union of the requested regions.
+    """
+
+    def __init__(self, refresh: Callable[[Set[str]], None], delay_ms: int = 0, parent=None):
+        super().__init__(parent)
+        self.refresh = refresh
+        self.pending = set()
+
+        # Single-shot timer; a delay of 0 fires on the next event loop pass
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.flush)
+
+        self.requests = 0
+        self.refreshes = 0
+
+    def request(self, *regions: str):
+        """Schedule a refresh of the given regions"""
+        self.requests += 1
+        self.pending.update(regions)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        """Run the pending refresh now, if there is one"""
+        self.timer.stop()
+        if not self.pending:
+            return
+
+        regions = self.pending
+        self.pending = set()
+        self.refreshes += 1
+        self.refresh(regions)
+
+    def get_stats(self):
+        """Get request/refresh counts and how many refreshes were avoided"""
+        return {
+            "requests": self.requests,
+            "refreshes": self.refreshes,
+            "avoided": self.requests - self.refreshes - (1 if self.pending else 0)
+        }
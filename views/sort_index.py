@@ -0,0 +1,102 @@
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class SortIndex:
+    """
+    Sort permutations and filter keys over a list of items (transactions or
+    forecasts), built on first use and cached until the list or its data
+    version changes. Picking, filtering and ordering rows is then a few numpy
+    operations, so re-sorting a table by another column or switching a filter
+    does not touch the items again.
+    """
+
+    def __init__(self, keys: Dict[str, Callable], date_keys: Iterable[str] = ()):
+        # Key functions by name; each maps an item to a sortable or filterable value
+        self.keys = keys
+        # Keys whose values are datetimes, stored as datetime64
+        self.date_keys = set(date_keys)
+        # The list last passed to set_items and the snapshot of it that is indexed
+        self.source = None
+        self.items = []
+        self.version = None
+        self.item_array = np.empty(0, dtype=object)
+        self._values = {}
+        self._orders = {}
+
+    def set_items(self, items: Sequence, version=None):
+        """Index another list of items; the caches are kept if it is the same version of the same list"""
+        if items is self.source and version is not None and version == self.version:
+            return
+        # A copy, so a list that grows in place (such as the manager's
+        # transactions) cannot get ahead of the cached key arrays
+        self.source = items
+        self.items = list(items)
+        self.version = version
+        self.item_array = np.empty(len(self.items), dtype=object)
+        self.item_array[:] = self.items
+        self._values = {}
+        self._orders = {}
+
+    def get_values(self, key: str) -> np.ndarray:
+        """Values of a key for every item, in item order"""
+        values = self._values.get(key)
+        if values is None:
+            values = np.array([self.keys[key](item) for item in self.items])
+            # Datetimes come out as Python objects; numpy sorts them far faster as datetime64
+            if key in self.date_keys:
+                values = values.astype('datetime64[us]')
+            self._values[key] = values
+        return values
+
+    def get_order(self, key: str, descending: bool = False) -> np.ndarray:
+        """
+        Item positions sorted by a key. The sort is stable in both directions,
+        so ties keep their item order as Python's sort(reverse=True) would.
+        """
+        order = self._orders.get((key, descending))
+        if order is None:
+            values = self.get_values(key)
+            if values.dtype == object:
+                # Values numpy cannot sort (e.g. mixed with None) are sorted by
+                # Python, None after every value; reverse=True keeps ties in item order
+                order = np.array(sorted(range(len(values)), reverse=descending,
+                                        key=lambda i: (values[i] is None, values[i])), dtype=np.intp)
+            elif descending:
+                # Stable ascending sort of the reversed values, read backwards
+                order = len(values) - 1 - np.argsort(values[::-1], kind='stable')[::-1]
+            else:
+                order = np.argsort(values, kind='stable')
+            self._orders[(key, descending)] = order
+        return order
+
+    def select(self, sort_key: Optional[str] = None, descending: bool = False,
+               filters: Dict[str, Tuple] = None) -> np.ndarray:
+        """
+        Positions in item_array of the items passing every filter, ordered by
+        sort_key (item order if None). filters maps a key to an inclusive
+        (low, high) range; None leaves that side open. set_items replaces
+        item_array rather than changing it, so the positions stay valid for
+        the array they were selected from.
+        """
+        if sort_key is None:
+            order = np.arange(len(self.items))
+        else:
+            order = self.get_order(sort_key, descending)
+
+        # Masks are combined in item order, then looked up once through the order
+        mask = None
+        for key, (low, high) in (filters or {}).items():
+            if low is None and high is None:
+                continue
+            values = self.get_values(key)
+            passes = np.ones(len(values), dtype=bool)
+            if low is not None:
+                passes &= values >= low
+            if high is not None:
+                passes &= values <= high
+            mask = passes if mask is None else mask & passes
+        if mask is not None:
+            order = order[mask[order]]
+        return order
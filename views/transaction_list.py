@@ -1,16 +1,22 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
-                             QTableWidgetItem, QLabel, QComboBox, QHeaderView,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                             QLabel, QComboBox, QHeaderView,
                              QSplitter, QAbstractItemView, QFrame)
 from PyQt5.QtCore import Qt, QDate
-from PyQt5.QtGui import QColor, QFont
 
 import calendar
 from datetime import datetime
 
+from models.change_event import ChangeEvent, ChangeKind, ChangeSource
+from models.transaction import TransactionType
+from models.period import month_index
+from .transaction_table_model import TransactionTableModel, create_transaction_index
+
 class TransactionList(QWidget):
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
+        # Sort permutations and filter keys shared by both tables
+        self.sort_index = create_transaction_index()
         self.init_ui()
         
     def init_ui(self):
@@ -53,7 +59,9 @@ class TransactionList(QWidget):
         income_header.setStyleSheet("font-size: 14px; font-weight: bold; color: #2e7d32;")
         income_layout.addWidget(income_header)
         
-        self.income_table = QTableWidget()
+        self.income_model = TransactionTableModel(self.sort_index, TransactionType.INCOME, self)
+        self.income_table = QTableView()
+        self.income_table.setModel(self.income_model)
         self.income_table.setAlternatingRowColors(True)
         self.income_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.income_table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -85,7 +93,9 @@ class TransactionList(QWidget):
         expense_header.setStyleSheet("font-size: 14px; font-weight: bold; color: #c62828;")
         expense_layout.addWidget(expense_header)
         
-        self.expense_table = QTableWidget()
+        self.expense_model = TransactionTableModel(self.sort_index, TransactionType.EXPENSE, self)
+        self.expense_table = QTableView()
+        self.expense_table.setModel(self.expense_model)
         self.expense_table.setAlternatingRowColors(True)
         self.expense_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.expense_table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -119,163 +129,102 @@ class TransactionList(QWidget):
         self.refresh_data()
         
     def setup_tables(self):
-        """Set up the table headers and columns"""
-        headers = ["Date", "Name", "Category", "Amount (₺)"]  # Added Category column
-        
-        # Income table
-        self.income_table.setColumnCount(len(headers))
-        self.income_table.setHorizontalHeaderLabels(headers)
-        
-        # Set all columns to equal size
-        for i in range(len(headers)):
-            self.income_table.horizontalHeader().setSectionResizeMode(i, QHeaderView.Stretch)
-        
-        # Expense table
-        self.expense_table.setColumnCount(len(headers))
-        self.expense_table.setHorizontalHeaderLabels(headers)
-        
-        # Set all columns to equal size
-        for i in range(len(headers)):
-            self.expense_table.horizontalHeader().setSectionResizeMode(i, QHeaderView.Stretch)
+        """Set up the table columns"""
+        for table in (self.income_table, self.expense_table):
+            # Set all columns to equal size
+            for i in range(len(TransactionTableModel.HEADERS)):
+                table.horizontalHeader().setSectionResizeMode(i, QHeaderView.Stretch)
+            
+            # Uniform row heights spare the view from measuring every row
+            table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            
+            # Header clicks sort through the model's index; newest first by default
+            table.setSortingEnabled(True)
+            table.sortByColumn(0, Qt.DescendingOrder)
         
     def refresh_data(self):
         """Refresh the table data based on selected period"""
-        period = self.period_combo.currentData()
-        transactions = self.get_transactions_by_period(period)
-        
-        # Split transactions by type
-        income_transactions = [t for t in transactions if t.transaction_type.value == 'income']
-        expense_transactions = [t for t in transactions if t.transaction_type.value == 'expense']
-        
-        # Sort transactions by date (newest first)
-        income_transactions.sort(key=lambda x: x.date, reverse=True)
-        expense_transactions.sort(key=lambda x: x.date, reverse=True)
-        
-        # Update income table
-        self.update_table(self.income_table, income_transactions)
-        
-        # Update expense table
-        self.update_table(self.expense_table, expense_transactions)
-        
-    def update_table(self, table, transactions):
-        """Update table with transaction data"""
-        table.setRowCount(0)  # Clear existing rows
-        
-        for transaction in transactions:
-            row_position = table.rowCount()
-            table.insertRow(row_position)
-            
-            # Date column
-            date_item = QTableWidgetItem(transaction.date.strftime("%b %Y"))
-            date_item.setTextAlignment(Qt.AlignCenter)
-            table.setItem(row_position, 0, date_item)
-            
-            # Name column
-            name_item = QTableWidgetItem(transaction.name)
-            name_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            table.setItem(row_position, 1, name_item)
-            
-            # Category column
-            category_text = transaction.category if transaction.category else "N/A"
-            category_item = QTableWidgetItem(category_text)
-            category_item.setTextAlignment(Qt.AlignCenter)
-            
-            # Style the category item
-            font = QFont()
-            font.setBold(True)
-            category_item.setFont(font)
-            
-            # Colorize category based on transaction type
-            if transaction.transaction_type.value == 'income':
-                category_item.setForeground(QColor("#2e7d32"))  # Green for income
-            else:
-                category_item.setForeground(QColor("#c62828"))  # Red for expense
-                
-            table.setItem(row_position, 2, category_item)
-            
-            # Amount column
-            amount_item = QTableWidgetItem(f"{transaction.amount:,.2f}")
-            amount_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            
-            # Set font to make amount bold
-            amount_font = QFont()
-            amount_font.setBold(True)
-            amount_item.setFont(amount_font)
-            
-            # Colorize amount based on transaction type
-            if transaction.transaction_type.value == 'income':
-                amount_item.setForeground(QColor("#2e7d32"))  # Green for income
-            else:
-                amount_item.setForeground(QColor("#c62828"))  # Red for expense
-                
-            table.setItem(row_position, 3, amount_item)
-            
-        # Add summary row
-        self.add_summary_row(table, transactions)
-            
-    def add_summary_row(self, table, transactions):
-        """Add a summary row at the bottom of the table"""
-        if not transactions:
-            return
-            
-        row_position = table.rowCount()
-        table.insertRow(row_position)
-        
-        # First cell - "TOTAL"
-        total_label = QTableWidgetItem("TOTAL")
-        total_label.setFont(QFont("", weight=QFont.Bold))
-        total_label.setTextAlignment(Qt.AlignCenter)
-        total_label.setBackground(QColor("#f0f0f0"))
-        table.setItem(row_position, 0, total_label)
-        
-        # Second cell - empty with background
-        empty_item = QTableWidgetItem("")
-        empty_item.setBackground(QColor("#f0f0f0"))
-        table.setItem(row_position, 1, empty_item)
-        
-        # Third cell (Category) - empty with background
-        empty_category_item = QTableWidgetItem("")
-        empty_category_item.setBackground(QColor("#f0f0f0"))
-        table.setItem(row_position, 2, empty_category_item)
-        
-        # Fourth cell - total amount
-        total_amount = sum(t.amount for t in transactions)
-        total_item = QTableWidgetItem(f"{total_amount:,.2f}")
-        total_item.setFont(QFont("", weight=QFont.Bold))
-        total_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        total_item.setBackground(QColor("#f0f0f0"))
-        
-        # Set color based on transaction type
-        if transactions and transactions[0].transaction_type.value == 'income':
-            total_item.setForeground(QColor("#2e7d32"))  # Green for income
-        else:
-            total_item.setForeground(QColor("#c62828"))  # Red for expense
-            
-        table.setItem(row_position, 3, total_item)
+        finance_manager = self.controller.finance_manager
+        # The index keeps its sort permutations while the data version is unchanged
+        self.sort_index.set_items(finance_manager.get_all_transactions(), finance_manager.data_version)
         
-    def get_transactions_by_period(self, period):
-        """Get transactions filtered by the selected period"""
-        all_transactions = self.controller.finance_manager.get_all_transactions()
+        period = self.period_combo.currentData()
+        period_range = self.get_period_range(period) or (None, None)
+        
+        # Totals come from the monthly aggregate instead of summing the rows
+        income_total, expense_total = self.get_period_totals(period)
+        self.income_model.set_filter("month", *period_range, total=income_total)
+        self.expense_model.set_filter("month", *period_range, total=expense_total)
+        
+    def apply_change(self, event: ChangeEvent) -> bool:
+        """
+        Re-select the rows of the tables an added or removed transaction in the
+        selected period belongs to. Returns False if the tables must be reloaded instead.
+        """
+        if event.source != ChangeSource.TRANSACTIONS:
+            return True
+        if event.kind not in (ChangeKind.ADDED, ChangeKind.REMOVED):
+            return False
+        
+        # Re-indexed on every change, so the index never lags behind the
+        # transactions even when the tables are left as they are
+        finance_manager = self.controller.finance_manager
+        self.sort_index.set_items(finance_manager.get_all_transactions(), finance_manager.data_version)
+        
+        # Rows hold the transactions themselves, so changes outside the
+        # selected period leave the tables as they are
+        period = self.period_combo.currentData()
+        period_range = self.get_period_range(period)
+        if period_range is not None and not event.touches_range(*period_range):
+            return True
+        
+        income_total, expense_total = self.get_period_totals(period)
+        totals = {TransactionType.INCOME: income_total, TransactionType.EXPENSE: expense_total}
+        for transaction_type in event.types:
+            self.get_model(transaction_type).refresh(totals[transaction_type])
+        return True
+        
+    def get_model(self, transaction_type):
+        """Get the model that lists transactions of a type"""
+        if transaction_type == TransactionType.INCOME:
+            return self.income_model
+        return self.expense_model
+        
+    def get_period_totals(self, period):
+        """Get (income, expenses) of a period from the monthly aggregate"""
+        aggregate = self.controller.finance_manager.get_monthly_aggregate()
+        period_range = self.get_period_range(period)
+        if period_range is None:
+            period_range = (aggregate.first_index, aggregate.last_index)
+        return aggregate.get_range_totals(*period_range)
+        
+    def get_period_range(self, period):
+        """Get the (first, last) month index range of a period, or None for all time"""
         now = datetime.now()
+        current = month_index(now.year, now.month)
         
         if period == "current_month":
-            return [t for t in all_transactions 
-                    if t.date.year == now.year and t.date.month == now.month]
+            return current, current
         
         elif period == "previous_month":
-            prev_month = now.month - 1
-            year = now.year
-            if prev_month == 0:
-                prev_month = 12
-                year -= 1
-            return [t for t in all_transactions 
-                    if t.date.year == year and t.date.month == prev_month]
+            return current - 1, current - 1
         
         elif period == "current_year":
-            return [t for t in all_transactions if t.date.year == now.year]
+            return month_index(now.year, 1), month_index(now.year, 12)
         
         elif period == "previous_year":
-            return [t for t in all_transactions if t.date.year == now.year - 1]
+            return month_index(now.year - 1, 1), month_index(now.year - 1, 12)
         
         else:  # "all_time"
-            return all_transactions
\ No newline at end of file
+            return None
+        
+    def get_transactions_by_period(self, period):
+        """Get transactions filtered by the selected period"""
+        all_transactions = self.controller.finance_manager.get_all_transactions()
+        period_range = self.get_period_range(period)
+        if period_range is None:
+            return all_transactions
+        
+        first, last = period_range
+        return [t for t in all_transactions
+                if first <= month_index(t.date.year, t.date.month) <= last]
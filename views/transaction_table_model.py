@@ -0,0 +1,59 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
+
+from models.transaction import TransactionType
+from models.period import month_index
+from .indexed_table_model import IndexedTableModel
+from .sort_index import SortIndex
+
+
+def create_transaction_index() -> SortIndex:
+    """Index over transactions with the keys their tables sort and filter by"""
+    return SortIndex({
+        "date": lambda t: t.date,
+        "name": lambda t: t.name.casefold(),
+        "category": lambda t: (t.category or "N/A").casefold(),
+        "amount": lambda t: t.amount,
+        # Filters
+        "month": lambda t: month_index(t.date.year, t.date.month),
+        "income": lambda t: t.transaction_type == TransactionType.INCOME,
+    }, date_keys=["date"])
+
+
+class TransactionTableModel(IndexedTableModel):
+    """Transactions of one type with a TOTAL row at the bottom"""
+
+    HEADERS = ["Date", "Name", "Category", "Amount (₺)"]
+    SORT_KEYS = ["date", "name", "category", "amount"]
+    TOTAL_LABEL_COLUMN = 0
+    TOTAL_COLUMN = 3
+
+    def __init__(self, sort_index: SortIndex, transaction_type: TransactionType, parent=None):
+        is_income = transaction_type == TransactionType.INCOME
+        super().__init__(sort_index, {"income": (is_income, is_income)}, parent)
+        self.transaction_type = transaction_type
+        self.color = QColor("#2e7d32" if is_income else "#c62828")
+
+    def cell_data(self, transaction, column, role):
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return transaction.date.strftime("%b %Y")
+            if column == 1:
+                return transaction.name
+            if column == 2:
+                return transaction.category if transaction.category else "N/A"
+            return f"{transaction.amount:,.2f}"
+
+        if role == Qt.TextAlignmentRole:
+            if column == 1:
+                return Qt.AlignLeft | Qt.AlignVCenter
+            if column == 3:
+                return Qt.AlignRight | Qt.AlignVCenter
+            return Qt.AlignCenter
+
+        # Category and amount are bold and colored by transaction type
+        if role == Qt.FontRole and column >= 2:
+            return self.bold_font
+        if role == Qt.ForegroundRole and column >= 2:
+            return self.color
+        return None